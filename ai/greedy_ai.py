@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+
+# Imports
+import random
+
+# Core Imports
+from core.game_engine import GameEngine, Action, PASS_ACTION
+
+# AI Imports
+from ai.lethal_solver import LethalSolver
+from ai.trade_optimizer import TradeOptimizer
+
+# Enum Imports
+from enums.turn_phase_enum import TurnPhase
+
+# Class
+class GreedyAI:
+    """
+    Fast bot playing a lethal turn when there is one, the best trades during the attack phase,
+    and a random legal action otherwise.
+
+    Attributes:
+        rng (random.Random): The random generator used outside of the attack phase.
+        lethal (LethalSolver): The solver finding the turns where the opponent can be killed.
+        trades (TradeOptimizer): The optimizer choosing the attacks.
+    """
+
+    def __init__(self, seed: int | str = None) -> None:
+        """
+        Initializes the bot.
+
+        Args:
+            seed (int | str, optional): Seed of the bot's random generator. Defaults to None.
+        """
+        self.rng = random.Random(seed)
+        self.lethal = LethalSolver()
+        self.trades = TradeOptimizer()
+
+    def choose_action(self, engine: GameEngine) -> Action:
+        """
+        Chooses the next action of the engine's current player.
+
+        Args:
+            engine (GameEngine): The game being played.
+
+        Returns:
+            Action: One of the engine's legal actions.
+        """
+        plan = self.lethal.find_lethal(engine)
+        if plan is not None:
+            return plan[0]
+        if engine.phase == TurnPhase.ATTACK:
+            attacks = self.trades.suggest(engine)
+            return attacks[0] if attacks else PASS_ACTION
+        return self.rng.choice(engine.legal_actions())
@@ -0,0 +1,235 @@
+#!/usr/bin/python3
+
+# Core Imports
+from core.game_engine import (
+     GameEngine,
+     Action,
+     PHASE_ORDER,
+     PASS_ACTION,
+     USE_HERO_POWER_ACTION,
+     PLAY_CARD_ACTIONS,
+     ATTACK_ACTIONS,
+     HERO_ATTACK_ACTIONS
+)
+
+# Modules Imports
+from modules.spell_mod import Spell
+
+# Utils Imports
+from utils.constants import BOARD_LIMIT, CARD_MAXIMUM_ATTACK, HERO_POWER_COST, HERO_POWER_ATTACK
+
+# Enum Imports
+from enums.turn_phase_enum import TurnPhase
+
+# Class
+class LethalSolver:
+    """
+    Exact solver answering whether the current player can kill the opponent before the end of their turn.
+
+    The search follows the phases of the engine: playing a card (a spell cast on the hero or a unit
+    adds its attack, see `apply_effects`), using the hero power, attacking with the units and attacking
+    with the hero. Attacking an enemy unit never brings the opponent closer to death, so every attack
+    goes face and the order of the attacks does not matter.
+
+    A branch is cut as soon as the damage it can still deal, bounded by the mana left, is below the
+    damage needed. Results are memoized by the abstract state of the turn, so identical cards in hand
+    and transpositions are only searched once.
+
+    Attributes:
+        nodes (int): The number of states searched by the last call to `find_lethal`.
+    """
+    __slots__ = ("nodes", "_hand", "_max_attack", "_memo")
+
+    def __init__(self) -> None:
+        """
+        Initializes the solver.
+        """
+        self.nodes = 0
+        self._hand: list[tuple[int, bool, int]] = []  # (cost, is spell, attack) of each card in hand
+        self._max_attack: int | None = None
+        self._memo: dict[tuple, tuple[Action, ...] | None] = {}
+
+    def find_lethal(self, engine: GameEngine) -> list[Action] | None:
+        """
+        Searches the actions killing the opponent during the current turn.
+
+        Args:
+            engine (GameEngine): The game, at any point of the current player's turn.
+
+        Returns:
+            list[Action] | None: The actions to apply in order, the last one killing the opponent,
+                or None if the opponent cannot be killed this turn.
+        """
+        self.nodes = 0
+        if engine.is_terminal():
+            return None
+
+        player, opponent = engine.current_player, engine.opponent
+        self._hand = [(card.cost, isinstance(card, Spell), card.attack) for card in player.deck.hand]
+        self._max_attack = player.max_attack
+        self._memo = {}
+        attacks = tuple(card.attack for card in player.deck.board)
+        plan = self.search(PHASE_ORDER.index(engine.phase), player.mana, player.attack, engine.played_card, engine.played_hero_power, attacks, opponent.health + opponent.armor)
+        self._memo = {}
+        return list(plan) if plan is not None else None
+
+    def has_lethal(self, engine: GameEngine) -> bool:
+        """
+        Checks if the current player can kill the opponent during the current turn.
+
+        Args:
+            engine (GameEngine): The game, at any point of the current player's turn.
+
+        Returns:
+            bool: True if a lethal sequence of actions exists.
+        """
+        return self.find_lethal(engine) is not None
+
+    def upper_bound(self, phase_index: int, mana: int, hero_attack: int, played_card: bool, played_hero_power: bool, attacks: tuple[int, ...]) -> int:
+        """
+        Returns an upper bound of the damage the current player can still deal this turn.
+
+        Args:
+            phase_index (int): Index in PHASE_ORDER of the current phase.
+            mana (int): The mana left.
+            hero_attack (int): The attack of the hero.
+            played_card (bool): Whether a card was played this turn.
+            played_hero_power (bool): Whether the hero power was used this turn.
+            attacks (tuple[int, ...]): The attack of each unit on the board, in board order.
+
+        Returns:
+            int: The damage bound.
+        """
+        bonus = 0  # Attack a card or the hero power can still add
+        if phase_index == 0 and not played_card:
+            bonus = max((attack for cost, spell, attack in self._hand if spell and cost <= mana), default=0)
+        if phase_index <= 1 and mana >= HERO_POWER_COST:
+            bonus += HERO_POWER_ATTACK
+
+        bound = bonus
+        if phase_index <= 2 and not played_card:
+            bound += sum(attack for attack in attacks if attack > 0)
+        if not played_hero_power:
+            bound += max(hero_attack, 0)
+        return bound
+
+    def search(self, phase_index: int, mana: int, hero_attack: int, played_card: bool, played_hero_power: bool, attacks: tuple[int, ...], needed: int) -> tuple[Action, ...] | None:
+        """
+        Searches the actions dealing at least `needed` damage to the opponent from a state of the turn.
+
+        Args:
+            phase_index (int): Index in PHASE_ORDER of the current phase.
+            mana (int): The mana left.
+            hero_attack (int): The attack of the hero.
+            played_card (bool): Whether a card was played this turn.
+            played_hero_power (bool): Whether the hero power was used this turn.
+            attacks (tuple[int, ...]): The attack of each unit on the board, in board order.
+            needed (int): The damage still needed, the opponent's armor included.
+
+        Returns:
+            tuple[Action, ...] | None: The actions dealing the damage, or None if there are none.
+        """
+        if needed <= 0:
+            return ()
+        if phase_index >= len(PHASE_ORDER) or self.upper_bound(phase_index, mana, hero_attack, played_card, played_hero_power, attacks) < needed:
+            return None
+
+        key = (phase_index, mana, hero_attack, played_card, played_hero_power, attacks, needed)
+        if key in self._memo:
+            return self._memo[key]
+        self.nodes += 1
+
+        plan = None
+        phase = PHASE_ORDER[phase_index]
+        next_phase_index = phase_index + 1
+        if phase == TurnPhase.PLAY_CARD:
+            can_act = len(attacks) < BOARD_LIMIT and any(cost <= mana for cost, spell, attack in self._hand)
+            if can_act:
+                plan = self.play_card(next_phase_index, mana, hero_attack, played_hero_power, attacks, needed)
+        elif phase == TurnPhase.HERO_POWER:
+            can_act = mana >= HERO_POWER_COST
+            if can_act:
+                powered_attack = hero_attack + HERO_POWER_ATTACK
+                if self._max_attack is not None:
+                    powered_attack = min(powered_attack, self._max_attack)
+                rest = self.search(next_phase_index, mana - HERO_POWER_COST, powered_attack, played_card, True, attacks, needed)
+                if rest is not None:
+                    plan = (USE_HERO_POWER_ACTION,) + rest
+        elif phase == TurnPhase.ATTACK:
+            attackers = [index for index, attack in enumerate(attacks) if attack > 0] if not played_card else []
+            can_act = bool(attackers)
+            if can_act:
+                # The last units attack first so that the board indices of the others do not move
+                plan = []
+                for index in reversed(attackers):
+                    plan.append(ATTACK_ACTIONS[index][0])
+                    needed -= attacks[index]
+                    if needed <= 0:
+                        break
+                rest = self.search(next_phase_index, mana, hero_attack, played_card, played_hero_power, tuple(attack for attack in attacks if attack <= 0), needed)
+                plan = tuple(plan) + rest if rest is not None else None
+            else:
+                plan = self.search(next_phase_index, mana, hero_attack, played_card, played_hero_power, attacks, needed)
+        else:
+            can_act = not played_hero_power and hero_attack > 0
+            if can_act and hero_attack >= needed:
+                plan = (HERO_ATTACK_ACTIONS[0],)
+
+        if plan is None and phase != TurnPhase.ATTACK:
+            # Skip the phase, passing only if the engine would have offered a choice (attacking never hurts, so ATTACK is not skipped)
+            rest = self.search(next_phase_index, mana, hero_attack, played_card, played_hero_power, attacks, needed)
+            if rest is not None:
+                plan = (PASS_ACTION,) + rest if can_act else rest
+
+        self._memo[key] = plan
+        return plan
+
+    def play_card(self, next_phase_index: int, mana: int, hero_attack: int, played_hero_power: bool, attacks: tuple[int, ...], needed: int) -> tuple[Action, ...] | None:
+        """
+        Searches the lethal sequences starting with a card played from the hand.
+
+        Args:
+            next_phase_index (int): Index in PHASE_ORDER of the phase after PLAY_CARD.
+            mana (int): The mana left.
+            hero_attack (int): The attack of the hero.
+            played_hero_power (bool): Whether the hero power was used this turn.
+            attacks (tuple[int, ...]): The attack of each unit on the board, in board order.
+            needed (int): The damage still needed.
+
+        Returns:
+            tuple[Action, ...] | None: The actions dealing the damage, or None if no card leads to lethal.
+        """
+        tried = set()  # Cards with the same cost, type and attack lead to the same states
+        for index, card in enumerate(self._hand):
+            cost, spell, attack = card
+            if cost > mana or card in tried:
+                continue
+            tried.add(card)
+
+            if not spell:
+                outcomes = [(0, hero_attack, attacks + (attack,))]  # The unit joins the end of the board
+            else:
+                outcomes = [(0, self.boost(hero_attack, attack), attacks)]
+                outcomes.extend((target + 1, hero_attack, attacks[:target] + (self.boost(attacks[target], attack),) + attacks[target + 1:]) for target in range(len(attacks)))
+
+            for target, new_hero_attack, new_attacks in outcomes:
+                rest = self.search(next_phase_index, mana - cost, new_hero_attack, True, played_hero_power, new_attacks, needed)
+                if rest is not None:
+                    return (PLAY_CARD_ACTIONS[index][target],) + rest
+        return None
+
+    def boost(self, attack: int, spell_attack: int) -> int:
+        """
+        Returns an attack after a spell's effects were applied, as `apply_effects` does.
+
+        Args:
+            attack (int): The attack of the hero or unit.
+            spell_attack (int): The attack of the spell.
+
+        Returns:
+            int: The new attack.
+        """
+        if spell_attack <= 0:
+            return attack
+        attack += spell_attack
+        return min(attack, CARD_MAXIMUM_ATTACK) if CARD_MAXIMUM_ATTACK is not None else attack
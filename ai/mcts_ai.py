@@ -0,0 +1,366 @@
+#!/usr/bin/python3
+
+# Imports
+import math
+import random
+import time
+from multiprocessing import Pool
+
+# Core Imports
+from core.game_engine import GameEngine, Action
+
+# AI Imports
+from ai.transposition_table import TranspositionTable
+from ai.lethal_solver import LethalSolver
+
+# Modules Imports
+from modules.player_mod import Player
+
+# Utils Imports
+from utils.constants import MCTS_TIME_LIMIT, MCTS_EXPLORATION, MCTS_ROLLOUT_TURNS, MCTS_WORKERS
+from utils.zobrist_utils import zobrist_key
+
+# Functions
+def player_number(engine: GameEngine, player: Player) -> int:
+    """
+    Returns the number of a player in a game, which stays the same in the game's clones.
+
+    Args:
+        engine (GameEngine): The game.
+        player (Player): One of the game's players.
+
+    Returns:
+        int: 1 for the game's first player, 2 for the second one.
+    """
+    return 1 if player is engine.logic.player_1 else 2
+
+def evaluate(engine: GameEngine) -> float:
+    """
+    Estimates the chances of the first player to win a game.
+
+    Args:
+        engine (GameEngine): The game to evaluate.
+
+    Returns:
+        float: 1 if the first player won, 0 if they lost, otherwise a score between 0 and 1
+            comparing the health of both players and of their boards.
+    """
+    winner = engine.winner()
+    if winner is not None:
+        return 1.0 if winner is engine.logic.player_1 else 0.0
+
+    scores = []
+    for player in (engine.logic.player_1, engine.logic.player_2):
+        scores.append(max(player.health, 0) + sum(card.attack + card.health for card in player.deck.board))
+    total = scores[0] + scores[1]
+    return scores[0] / total if total else 0.5
+
+def search_root(engine: GameEngine, seed: int, iterations: int | None, time_limit: float | None, deadline: float | None, exploration: float, rollout_turns: int, transpositions: bool) -> dict[Action, tuple[int, float]]:
+    """
+    Grows a new search tree from a game in a worker process, for the root-parallel search.
+
+    Args:
+        engine (GameEngine): The game being played.
+        seed (int): Seed of the worker's random generator.
+        iterations (int | None): The number of iterations (None for no limit).
+        time_limit (float | None): The number of seconds per decision of the parent bot.
+        deadline (float | None): The `time.time()` at which the search stops, shared by all workers (None for no limit).
+        exploration (float): The exploration constant of the UCB1 formula.
+        rollout_turns (int): The number of turns played by a rollout.
+        transpositions (bool): Whether positions reached by different action orders share their node.
+
+    Returns:
+        dict[Action, tuple[int, float]]: The visits and value of each explored action of the root.
+    """
+    bot = MCTSAI(seed, iterations, time_limit, exploration, rollout_turns, transpositions=transpositions)
+    root = MCTSNode()
+    bot.grow(engine, root, deadline)
+    return {action: (child.visits, child.value) for action, child in root.children.items()}
+
+# Class
+class MCTSNode:
+    """
+    Node of the search graph, reached by playing an action from one or several parents.
+
+    Attributes:
+        player (int): The number of the player who played the action leading to this node.
+        children (dict[Action, MCTSNode]): The explored children, by action.
+        visits (int): The number of iterations that went through this node.
+        value (float): The sum of the rewards of those iterations, for `player`.
+    """
+    __slots__ = ("player", "children", "visits", "value")
+
+    def __init__(self, player: int = 0) -> None:
+        """
+        Initializes an unvisited node.
+
+        Args:
+            player (int): The number of the player who played the action leading to this node.
+        """
+        self.player = player
+        self.children: dict[Action, MCTSNode] = {}
+        self.visits = 0
+        self.value = 0.0
+
+class MCTSAI:
+    """
+    Bot choosing its actions with a Monte Carlo Tree Search over the engine's actions.
+
+    Each iteration searches a clone of the game where the order of both decks is shuffled,
+    since the bot cannot know which cards will be drawn. Rollouts play random actions for a few
+    turns and are then evaluated. The subtree of the chosen action is kept for the bot's
+    next decision of the same turn. Positions reached by different action orders, such as
+    attacks made in another order, are found by their Zobrist hash in a transposition table
+    and share a single node.
+
+    With several workers, the search is root-parallel: each worker process grows its own tree
+    from the same game for the same deadline, and the visits of the root's actions are summed
+    before the most visited action is played. Subtrees are then not kept between decisions.
+    Call `close()` to stop the workers once the bot is no longer needed.
+
+    Attributes:
+        rng (random.Random): The random generator used by the search.
+        iterations (int | None): The number of iterations per decision (None for no limit).
+        time_limit (float | None): The number of seconds per decision (None for no limit).
+        exploration (float): The exploration constant of the UCB1 formula.
+        rollout_turns (int): The number of turns played by a rollout before it is evaluated.
+        workers (int): The number of processes searching each decision.
+        table (TranspositionTable | None): The nodes by position, None if transpositions are disabled.
+        lethal (LethalSolver): The solver finding the turns where the opponent can be killed, which are played without searching.
+        root (MCTSNode | None): The subtree kept from the previous decision.
+        statistics (dict[Action, tuple[int, float]]): The visits and value of each action at the last decision.
+    """
+
+    def __init__(self, seed: int | str = None, iterations: int = None, time_limit: float = MCTS_TIME_LIMIT, exploration: float = MCTS_EXPLORATION, rollout_turns: int = MCTS_ROLLOUT_TURNS, workers: int = MCTS_WORKERS, transpositions: bool = True) -> None:
+        """
+        Initializes the bot. The search of a decision stops when any of its budgets is exhausted.
+        With several workers, the iteration budget applies to each worker.
+
+        Args:
+            seed (int | str, optional): Seed of the bot's random generator. Defaults to None.
+            iterations (int, optional): The number of iterations per decision. Defaults to None.
+            time_limit (float, optional): The number of seconds per decision. Defaults to `MCTS_TIME_LIMIT`.
+            exploration (float): The exploration constant. Defaults to `MCTS_EXPLORATION`.
+            rollout_turns (int): The number of turns played by a rollout. Defaults to `MCTS_ROLLOUT_TURNS`.
+            workers (int): The number of processes searching each decision. Defaults to `MCTS_WORKERS`.
+            transpositions (bool): Whether positions reached by different action orders share their node. Defaults to True.
+
+        Raises:
+            ValueError: If no budget is given, or if a budget or the number of workers is not positive.
+        """
+        if iterations is None and time_limit is None:
+            raise ValueError("The search needs an iteration or a time budget.")
+        if (iterations is not None and iterations < 1) or (time_limit is not None and time_limit <= 0):
+            raise ValueError(f"Invalid budget: {iterations} iterations, {time_limit} seconds. Budgets must be positive.")
+        self.rng = random.Random(seed)
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns
+        if workers < 1:
+            raise ValueError(f"Invalid number of workers: {workers}. Must be positive.")
+        self.workers = workers
+        self.table = TranspositionTable() if transpositions else None
+        self.lethal = LethalSolver()
+        self.statistics: dict[Action, tuple[int, float]] = {}
+        self._pool = None  # Started on the first parallel search
+
+        # Subtree kept from the previous decision, with the game and turn it belongs to
+        self.root: MCTSNode | None = None
+        self._root_engine: GameEngine | None = None
+        self._root_turn = 0
+
+    def choose_action(self, engine: GameEngine) -> Action:
+        """
+        Chooses the next action of the engine's current player.
+
+        Args:
+            engine (GameEngine): The game being played.
+
+        Returns:
+            Action: One of the engine's legal actions.
+        """
+        actions = engine.legal_actions()
+        if len(actions) == 1:
+            self.root = None
+            return actions[0]
+
+        # A winning sequence is played as is, the search could only lose time on it
+        plan = self.lethal.find_lethal(engine)
+        if plan is not None:
+            self.root = None
+            return plan[0]
+
+        deadline = time.time() + self.time_limit if self.time_limit is not None else None
+        if self.workers > 1:
+            return self.choose_action_in_parallel(engine, actions, deadline)
+
+        # The previous subtree still describes the game while the bot's turn goes on
+        if self.root is None or self._root_engine is not engine or self._root_turn != engine.turn:
+            self.root = MCTSNode()
+        root = self.root
+        if self.table is not None:
+            self.table.new_search()  # Nodes of previous decisions are replaced first
+        self.grow(engine, root, deadline)
+        self.statistics = {action: (child.visits, child.value) for action, child in root.children.items()}
+
+        # Play the most visited action and keep its subtree
+        action = self.most_visited(actions)
+        self.root = root.children.get(action)
+        self._root_engine = engine
+        self._root_turn = engine.turn
+        return action
+
+    def choose_action_in_parallel(self, engine: GameEngine, actions: list[Action], deadline: float | None) -> Action:
+        """
+        Searches the same game in every worker process and merges the statistics of the roots.
+
+        Args:
+            engine (GameEngine): The game being played.
+            actions (list[Action]): The legal actions of the game.
+            deadline (float | None): The `time.time()` at which the workers stop (None for no limit).
+
+        Returns:
+            Action: The action with the most visits over all workers.
+        """
+        if self._pool is None:
+            self._pool = Pool(self.workers)
+        tasks = [(engine, self.rng.getrandbits(64), self.iterations, self.time_limit, deadline, self.exploration, self.rollout_turns, self.table is not None) for _ in range(self.workers)]
+
+        self.statistics = {}
+        for statistics in self._pool.starmap(search_root, tasks):
+            for action, (visits, value) in statistics.items():
+                total_visits, total_value = self.statistics.get(action, (0, 0.0))
+                self.statistics[action] = (total_visits + visits, total_value + value)
+        self.root = None
+        return self.most_visited(actions)
+
+    def most_visited(self, actions: list[Action]) -> Action:
+        """
+        Returns the legal action with the most visits in the statistics of the last decision.
+
+        Args:
+            actions (list[Action]): The legal actions.
+
+        Returns:
+            Action: The most visited action, the first legal action if none was visited.
+        """
+        return max(actions, key=lambda action: self.statistics.get(action, (-1, 0.0))[0])
+
+    def grow(self, engine: GameEngine, root: MCTSNode, deadline: float | None) -> None:
+        """
+        Runs search iterations from a game until the iteration budget or the deadline is exhausted.
+
+        Args:
+            engine (GameEngine): The game being played, which is not modified.
+            root (MCTSNode): The node of the game's current state.
+            deadline (float | None): The `time.time()` at which the search stops (None for no limit).
+        """
+        iteration = 0
+        while (self.iterations is None or iteration < self.iterations) and (deadline is None or time.time() < deadline):
+            self.search(engine, root)
+            iteration += 1
+
+    def close(self) -> None:
+        """
+        Stops the worker processes of the parallel search, if they were started.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def search(self, engine: GameEngine, root: MCTSNode) -> None:
+        """
+        Runs one iteration of the search: selection, expansion, rollout and backpropagation.
+
+        Args:
+            engine (GameEngine): The game being played, which is not modified.
+            root (MCTSNode): The node of the game's current state.
+        """
+        state = engine.clone()
+        for player in (state.logic.player_1, state.logic.player_2):
+            player.deck.shuffle(self.rng)  # The order of the decks is unknown
+
+        # Selection, among the actions that are legal in this determinization
+        node = root
+        path = [root]
+        while not state.is_terminal():
+            actions = state.legal_actions()
+            untried = [action for action in actions if action not in node.children]
+            if untried:
+                # Expansion, reusing the node of the position if it was reached by another path
+                action = self.rng.choice(untried)
+                mover = player_number(state, state.current_player)
+                state.apply(action)
+                node.children[action] = node = self.node_of(state, mover, len(path))
+                path.append(node)
+                break
+            action = self.select(node, actions)
+            state.apply(action)
+            node = node.children[action]
+            path.append(node)
+
+        reward = self.rollout(state)
+
+        # Backpropagation, each node being scored for the player who moved into it
+        for node in path:
+            node.visits += 1
+            node.value += reward if node.player == 1 else 1.0 - reward
+
+    def node_of(self, state: GameEngine, mover: int, ply: int) -> MCTSNode:
+        """
+        Returns the node of a position, from the transposition table if it was already expanded.
+
+        Args:
+            state (GameEngine): The position, just after `mover` played.
+            mover (int): The number of the player who played the last action.
+            ply (int): The number of actions between the root and the position.
+
+        Returns:
+            MCTSNode: The shared or new node.
+        """
+        if self.table is None:
+            return MCTSNode(mover)
+        key = state.zobrist_hash() ^ zobrist_key("mover", mover)
+        node = self.table.lookup(key)
+        if node is None:
+            node = MCTSNode(mover)
+            self.table.store(key, node, -ply)  # Nodes close to the root are kept on collisions
+        return node
+
+    def select(self, node: MCTSNode, actions: list[Action]) -> Action:
+        """
+        Picks the action with the best UCB1 score among explored legal actions.
+
+        Args:
+            node (MCTSNode): The current node, whose children include every action of `actions`.
+            actions (list[Action]): The legal actions.
+
+        Returns:
+            Action: The selected action.
+        """
+        log_visits = math.log(node.visits or 1)
+        best_action, best_score = actions[0], -math.inf
+        for action in actions:
+            child = node.children[action]
+            score = child.value / child.visits + self.exploration * math.sqrt(log_visits / child.visits)
+            if score > best_score:
+                best_action, best_score = action, score
+        return best_action
+
+    def rollout(self, state: GameEngine) -> float:
+        """
+        Plays random actions on a game for a few turns and evaluates the result.
+
+        Args:
+            state (GameEngine): A clone of the game, modified by the rollout.
+
+        Returns:
+            float: The estimated chances of the first player to win.
+        """
+        last_turn = state.turn + self.rollout_turns
+        choice = self.rng.choice
+        while not state.is_terminal() and state.turn < last_turn:
+            state.apply(choice(state.legal_actions()))
+        return evaluate(state)
@@ -0,0 +1,37 @@
+#!/usr/bin/python3
+
+# Imports
+import random
+
+# Core Imports
+from core.game_engine import GameEngine, Action
+
+# Class
+class RandomAI:
+    """
+    Bot choosing uniformly among the legal actions of the engine.
+
+    Attributes:
+        rng (random.Random): The random generator used to pick actions.
+    """
+
+    def __init__(self, seed: int | str = None) -> None:
+        """
+        Initializes the bot.
+
+        Args:
+            seed (int | str, optional): Seed of the bot's random generator. Defaults to None.
+        """
+        self.rng = random.Random(seed)
+
+    def choose_action(self, engine: GameEngine) -> Action:
+        """
+        Chooses the next action of the engine's current player.
+
+        Args:
+            engine (GameEngine): The game being played.
+
+        Returns:
+            Action: One of the engine's legal actions.
+        """
+        return self.rng.choice(engine.legal_actions())
@@ -0,0 +1,216 @@
+#!/usr/bin/python3
+
+# Imports
+from typing import Callable
+
+# Core Imports
+from core.game_engine import GameEngine, Action, HERO_TARGET, ATTACK_ACTIONS
+
+# Utils Imports
+from utils.constants import TRADE_FACE_WEIGHT
+
+# Enum Imports
+from enums.turn_phase_enum import TurnPhase
+
+# Constants
+KEEP = -2  # Target of a unit that does not attack
+LETHAL_VALUE = float("inf")  # Value of the trades killing the opponent
+
+# Functions
+def unit_value(attack: int, health: int) -> float:
+    """
+    Returns the value of a unit on the board, as counted by the MCTS bot's evaluation.
+
+    Args:
+        attack (int): The attack of the unit.
+        health (int): The health of the unit (a dead unit is worth nothing).
+
+    Returns:
+        float: The value of the unit.
+    """
+    return attack + health if health > 0 else 0.0
+
+# Class
+class TradeOptimizer:
+    """
+    Chooses the attacks of the current player's units during the attack phase.
+
+    Each unit that can attack is assigned a target: the opponent's hero, one of their units, or
+    none. An attacker always ends in the graveyard, so a trade is worth the value it removes from
+    the opponent's board and hero minus the value of the attackers spent. Several attackers can
+    share a target, their damage adding up as in `take_damage`.
+
+    Rather than trying every order of the attackers, the optimizer solves the assignment exactly
+    over sets of attackers: enemy units are taken one by one, each receiving a subset of the
+    attackers not used yet, and the best value is kept for every set of used attackers. Enemy units
+    that no subset can profitably attack are skipped, and the attackers left over go face only
+    when that is worth more than keeping them.
+
+    Attributes:
+        value (Callable[[int, int], float]): The value of a unit from its attack and health.
+        face_weight (float): The value of one point of damage dealt to the opponent's hero.
+        transitions (int): The number of subsets tried by the last call to `best_trades`.
+    """
+    __slots__ = ("value", "face_weight", "transitions")
+
+    def __init__(self, value: Callable[[int, int], float] = unit_value, face_weight: float = TRADE_FACE_WEIGHT) -> None:
+        """
+        Initializes the optimizer.
+
+        Args:
+            value (Callable[[int, int], float]): The value of a unit from its attack and health. Defaults to `unit_value`.
+            face_weight (float): The value of one point of damage to the opponent's hero. Defaults to `TRADE_FACE_WEIGHT`.
+        """
+        self.value = value
+        self.face_weight = face_weight
+        self.transitions = 0
+
+    def best_trades(self, engine: GameEngine) -> tuple[float, list[Action]]:
+        """
+        Computes the best attacks of the current player.
+
+        Args:
+            engine (GameEngine): The game, during the current player's attack phase.
+
+        Returns:
+            tuple[float, list[Action]]: The value of the trades and the attacks to apply in order
+                (no attacks outside of the attack phase, or if attacking would lose value).
+        """
+        self.transitions = 0
+        if engine.is_terminal() or engine.phase != TurnPhase.ATTACK:
+            return 0.0, []
+
+        board = engine.current_player.deck.board
+        attackers = engine.attackers
+        attacks = [board[index].attack for index in attackers]
+        enemies = [(card.attack, card.health, card.armor) for card in engine.opponent.deck.board]
+
+        # The opponent dies if every unit goes face: the strongest units attack until they do
+        hero_left = engine.opponent.health + engine.opponent.armor
+        if sum(attacks) >= hero_left:
+            targets = [KEEP] * len(attackers)
+            for position in sorted(range(len(attackers)), key=lambda position: -attacks[position]):
+                targets[position] = HERO_TARGET
+                hero_left -= attacks[position]
+                if hero_left <= 0:
+                    break
+            return LETHAL_VALUE, self.actions_of(attackers, attacks, targets, enemies)
+
+        # Attack and value of every set of attackers, by bit mask
+        count = len(attackers)
+        full = (1 << count) - 1
+        costs = [self.value(board[index].attack, board[index].health) for index in attackers]
+        attack_sum = [0] * (full + 1)
+        cost_sum = [0.0] * (full + 1)
+        for mask in range(1, full + 1):
+            low = (mask & -mask).bit_length() - 1
+            attack_sum[mask] = attack_sum[mask & (mask - 1)] + attacks[low]
+            cost_sum[mask] = cost_sum[mask & (mask - 1)] + costs[low]
+
+        best = [float("-inf")] * (full + 1)  # Best value for each set of used attackers
+        best[0] = 0.0
+        choices = []  # For each enemy unit, the subset of attackers it received for each set of used attackers
+        for enemy_attack, health, armor in enemies:
+            # The value removed from the enemy unit by each subset of attackers
+            before = self.value(enemy_attack, health)
+            gains = [0.0] * (full + 1)
+            for subset in range(1, full + 1):
+                damage = attack_sum[subset]
+                gains[subset] = before - self.value(enemy_attack, health - max(damage - armor, 0)) - cost_sum[subset]
+            if max(gains) <= 0.0:
+                choices.append(None)  # Attacking this unit never pays off
+                continue
+
+            updated = best.copy()
+            choice = [0] * (full + 1)
+            for used in range(full + 1):
+                value = best[used]
+                if value == float("-inf"):
+                    continue
+                free = full ^ used
+                subset = free
+                while subset:
+                    self.transitions += 1
+                    candidate = value + gains[subset]
+                    if candidate > updated[used | subset]:
+                        updated[used | subset] = candidate
+                        choice[used | subset] = subset
+                    subset = (subset - 1) & free
+            best = updated
+            choices.append(choice)
+
+        # The attackers left go face when the damage is worth more than the unit
+        face_gains = [self.face_weight * attack - cost for attack, cost in zip(attacks, costs)]
+        best_value, best_used, best_face = 0.0, 0, 0
+        for used in range(full + 1):
+            if best[used] == float("-inf"):
+                continue
+            face = 0
+            value = best[used]
+            for position in range(count):
+                if not used >> position & 1 and face_gains[position] > 0.0:
+                    face |= 1 << position
+                    value += face_gains[position]
+            if value > best_value:
+                best_value, best_used, best_face = value, used, face
+
+        # Walk the choices back to the target of each attacker
+        targets = [HERO_TARGET if best_face >> position & 1 else KEEP for position in range(count)]
+        used = best_used
+        for target in range(len(enemies) - 1, -1, -1):
+            if choices[target] is None:
+                continue
+            subset = choices[target][used]
+            for position in range(count):
+                if subset >> position & 1:
+                    targets[position] = target
+            used ^= subset
+        return best_value, self.actions_of(attackers, attacks, targets, enemies)
+
+    def suggest(self, engine: GameEngine) -> list[Action]:
+        """
+        Returns the attacks the current player should make.
+
+        Args:
+            engine (GameEngine): The game, during the current player's attack phase.
+
+        Returns:
+            list[Action]: The attacks to apply in order.
+        """
+        return self.best_trades(engine)[1]
+
+    def actions_of(self, attackers: list[int], attacks: list[int], targets: list[int], enemies: list[tuple[int, int, int]]) -> list[Action]:
+        """
+        Turns the targets of the attackers into engine actions, fixing the indices of the units that leave the board.
+        Attacks on units come first, so that a lethal attack on the hero is the last action.
+
+        Args:
+            attackers (list[int]): The board index of each attacker.
+            attacks (list[int]): The attack of each attacker.
+            targets (list[int]): The target of each attacker, KEEP for none.
+            enemies (list[tuple[int, int, int]]): The attack, health and armor of each enemy unit.
+
+        Returns:
+            list[Action]: The attacks to apply in order.
+        """
+        order = [position for position, target in enumerate(targets) if target != KEEP]
+        order.sort(key=lambda position: targets[position] == HERO_TARGET)
+
+        enemy_health = [[health, armor] for _, health, armor in enemies]
+        gone_attackers: list[int] = []
+        dead_enemies: list[int] = []
+        actions = []
+        for position in order:
+            board_index, target, attack = attackers[position], targets[position], attacks[position]
+            source = board_index - sum(gone < board_index for gone in gone_attackers)
+            if target == HERO_TARGET:
+                actions.append(ATTACK_ACTIONS[source][0])
+            else:
+                actions.append(ATTACK_ACTIONS[source][target - sum(dead < target for dead in dead_enemies) + 1])
+                health, armor = enemy_health[target]
+                absorbed = min(armor, attack)
+                enemy_health[target] = [health - (attack - absorbed), armor - absorbed]
+                if enemy_health[target][0] <= 0:
+                    dead_enemies.append(target)
+            gone_attackers.append(board_index)
+        return actions
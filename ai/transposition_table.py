@@ -0,0 +1,123 @@
+#!/usr/bin/python3
+
+# Utils Imports
+from utils.constants import TRANSPOSITION_TABLE_SIZE
+
+# Enum Imports
+from enums.replacement_policy_enum import ReplacementPolicy
+
+# Class
+class TranspositionTable:
+    """
+    Fixed-size table mapping the Zobrist hashes of game states to search data, so that
+    a position reached by different action orders is only searched once.
+
+    Each hash has a single slot, chosen by its low bits. When two hashes share a slot, the
+    replacement policy decides which entry is kept. Entries stored before the last call to
+    `new_search()` are always replaced first, so the table does not fill with stale positions.
+
+    Attributes:
+        capacity (int): The number of slots.
+        policy (ReplacementPolicy): How a collision is resolved.
+        generation (int): The number of the current search.
+        hits (int): The number of successful lookups.
+        misses (int): The number of failed lookups.
+    """
+    __slots__ = ("capacity", "policy", "generation", "hits", "misses", "_slots", "_size")
+
+    def __init__(self, capacity: int = TRANSPOSITION_TABLE_SIZE, policy: ReplacementPolicy = ReplacementPolicy.DEPTH_PREFERRED) -> None:
+        """
+        Initializes an empty table.
+
+        Args:
+            capacity (int): The number of slots. Defaults to `TRANSPOSITION_TABLE_SIZE`.
+            policy (ReplacementPolicy): How a collision is resolved. Defaults to DEPTH_PREFERRED.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError(f"Invalid capacity: {capacity}. Must be positive.")
+        self.capacity = capacity
+        self.policy = policy
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._slots: list[tuple | None] = [None] * capacity  # (hash, depth, generation, value) entries
+        self._size = 0
+
+    def lookup(self, key: int) -> object | None:
+        """
+        Returns the value stored for a hash.
+
+        Args:
+            key (int): The Zobrist hash of the state.
+
+        Returns:
+            object | None: The stored value, or None if the state is not in the table.
+        """
+        entry = self._slots[key % self.capacity]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[3]
+        self.misses += 1
+        return None
+
+    def store(self, key: int, value: object, depth: int = 0) -> bool:
+        """
+        Stores a value for a hash, unless the replacement policy keeps the entry already in its slot.
+
+        Args:
+            key (int): The Zobrist hash of the state.
+            value (object): The data to store, e.g. a search node.
+            depth (int): The importance of the entry, such as the depth searched behind it.
+
+        Returns:
+            bool: True if the value was stored.
+        """
+        index = key % self.capacity
+        entry = self._slots[index]
+        if entry is None:
+            self._size += 1
+        elif (self.policy == ReplacementPolicy.DEPTH_PREFERRED and entry[0] != key
+              and entry[2] == self.generation and entry[1] > depth):
+            return False  # A deeper entry of the current search is kept
+        self._slots[index] = (key, depth, self.generation, value)
+        return True
+
+    def new_search(self) -> None:
+        """
+        Starts a new search: the entries stored so far can still be found, but are replaced first.
+        """
+        self.generation += 1
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets the statistics.
+        """
+        self._slots = [None] * self.capacity
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of occupied slots.
+
+        Returns:
+            int: The number of entries.
+        """
+        return self._size
+
+    def __contains__(self, key: int) -> bool:
+        """
+        Checks if a hash is in the table, without counting a hit or a miss.
+
+        Args:
+            key (int): The Zobrist hash of the state.
+
+        Returns:
+            bool: True if the table holds a value for the hash.
+        """
+        entry = self._slots[key % self.capacity]
+        return entry is not None and entry[0] == key
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+
+# Imports
+import copy
+import random
+import time
+
+# Core Imports
+from core.card_catalog import CardCatalog
+from core.game_engine import GameEngine
+
+# Modules Imports
+from modules.deck_mod import Deck
+from modules.player_mod import Player
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+
+# Constants
+RANDOM_ACTIONS = 40  # Random actions played before measuring, to reach a mid-game state
+DURATION = 1.0  # Seconds spent measuring each copy method
+
+# Functions
+def clones_per_second(copy_state: callable) -> float:
+    """
+    Measures how many times a copy function runs per second.
+
+    Args:
+        copy_state (callable): Function copying the game state.
+
+    Returns:
+        float: The number of copies per second.
+    """
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        copy_state()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+def main() -> None:
+    """
+    Prints the number of mid-game states copied per second with `GameEngine.clone` and with `copy.deepcopy`.
+    """
+    catalog = CardCatalog.from_files()
+    player_1 = Player("Player 1", catalog.create_hero(catalog.heroes_by_class(CardClass.MAGE)[0]), Deck(catalog.create_class_cards(CardClass.MAGE)))
+    player_2 = Player("Player 2", catalog.create_hero(catalog.heroes_by_class(CardClass.WARRIOR)[0]), Deck(catalog.create_class_cards(CardClass.WARRIOR)))
+    engine = GameEngine(player_1, player_2, first_player=player_1)
+
+    rng = random.Random(0)
+    for _ in range(RANDOM_ACTIONS):
+        if engine.is_terminal():
+            break
+        engine.apply(rng.choice(engine.legal_actions()))
+
+    cloned = clones_per_second(engine.clone)
+    deep_copied = clones_per_second(lambda: copy.deepcopy(engine))
+    print(f"clone():    {cloned:10.0f} clones per second")
+    print(f"deepcopy(): {deep_copied:10.0f} clones per second ({cloned / deep_copied:.1f}x slower)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+
+# Imports
+import gc
+import tracemalloc
+
+# Core Imports
+from core.card_catalog import CardCatalog
+from core.game_engine import GameEngine
+
+# Modules Imports
+from modules.deck_mod import Deck
+from modules.player_mod import Player
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+
+# Constants
+CARD_COUNT = 30000  # Number of cards allocated to measure the size of one card
+GAME_COUNT = 1000  # Number of games allocated to measure the size of one game
+
+# Functions
+def measure(build: callable, count: int) -> float:
+    """
+    Measures the memory allocated per object by a builder.
+
+    Args:
+        build (callable): Function building one object.
+        count (int): Number of objects to build and keep alive.
+
+    Returns:
+        float: The average number of bytes allocated per object.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+def main() -> None:
+    """
+    Prints the number of bytes used by one card and by one game between two full decks.
+    """
+    catalog = CardCatalog.from_files()
+    mage_cards = catalog.cards_by_class(CardClass.MAGE)
+    unit_record = next(record for record in mage_cards if record["race"] is not None)
+    spell_record = next(record for record in mage_cards if record["race"] is None)
+    mage_hero = catalog.heroes_by_class(CardClass.MAGE)[0]
+    warrior_hero = catalog.heroes_by_class(CardClass.WARRIOR)[0]
+
+    def build_game() -> GameEngine:
+        player_1 = Player("Player 1", catalog.create_hero(mage_hero), Deck(catalog.create_class_cards(CardClass.MAGE)))
+        player_2 = Player("Player 2", catalog.create_hero(warrior_hero), Deck(catalog.create_class_cards(CardClass.WARRIOR)))
+        return GameEngine(player_1, player_2)
+
+    print(f"Unit:  {measure(lambda: catalog.create_card(unit_record, 1), CARD_COUNT):8.1f} bytes per card")
+    print(f"Spell: {measure(lambda: catalog.create_card(spell_record, 1), CARD_COUNT):8.1f} bytes per card")
+    print(f"Game:  {measure(build_game, GAME_COUNT):8.1f} bytes per game (two players, 60 cards)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+
+# Imports
+import time
+
+# Core Imports
+from core.card_catalog import CardCatalog
+from core.simulation_mod import play_game
+
+# Modules Imports
+from modules.deck_mod import Deck
+from modules.player_mod import Player
+
+# AI Imports
+from ai.random_ai import RandomAI
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+
+# Constants
+DURATION = 3.0  # Seconds spent playing games
+
+# Functions
+def games_per_second(player_1: Player, player_2: Player) -> tuple[float, float]:
+    """
+    Measures how many games between random bots one process plays per second.
+
+    Args:
+        player_1 (Player): The template of the first player.
+        player_2 (Player): The template of the second player.
+
+    Returns:
+        tuple[float, float]: The number of games and of turns played per second.
+    """
+    games = turns = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        _, played = play_game(player_1, player_2, RandomAI, RandomAI, seed=f"benchmark-{games}")
+        games += 1
+        turns += played
+    elapsed = time.perf_counter() - start
+    return games / elapsed, turns / elapsed
+
+def main() -> None:
+    """
+    Prints the number of games between random bots played per second by one process, without replays or history.
+    """
+    catalog = CardCatalog.from_files()
+    player_1 = Player("Player 1", catalog.create_hero(catalog.heroes_by_class(CardClass.MAGE)[0]), Deck(catalog.create_class_cards(CardClass.MAGE)[:30]))
+    player_2 = Player("Player 2", catalog.create_hero(catalog.heroes_by_class(CardClass.WARRIOR)[0]), Deck(catalog.create_class_cards(CardClass.WARRIOR)[:30]))
+
+    games, turns = games_per_second(player_1, player_2)
+    print(f"play_game(): {games:8.0f} games per second ({turns:.0f} turns per second, one process)")
+
+if __name__ == "__main__":
+    main()
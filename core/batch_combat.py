@@ -0,0 +1,277 @@
+#!/usr/bin/python3
+
+# Imports
+import numpy as np
+
+# Core Imports
+from core.game_engine import GameEngine, HERO_TARGET
+
+# Utils Imports
+from utils.constants import BOARD_LIMIT, CARD_MAXIMUM_ATTACK, CARD_MAXIMUM_HEALTH, CARD_MAXIMUM_ARMOR
+
+# Constants
+STAT_TYPE = np.int32  # Stats can go below zero, as they do on the cards
+SLOTS = np.arange(BOARD_LIMIT)
+
+# Functions
+def buff(values: np.ndarray, amount: np.ndarray, maximum: int | None) -> np.ndarray:
+    """
+    Adds the positive amounts of a spell to stats, capped like `Card.apply_effects` does.
+
+    Args:
+        values (np.ndarray): The current stats.
+        amount (np.ndarray): The spell's amounts; amounts of zero or less leave the stat unchanged.
+        maximum (int | None): The cap of the stat (None for no cap).
+
+    Returns:
+        np.ndarray: The new stats.
+    """
+    buffed = values + amount
+    if maximum is not None:
+        buffed = np.minimum(buffed, maximum)
+    return np.where(amount > 0, buffed, values)
+
+# Class
+class BatchCombat:
+    """
+    The boards of many games stored as struct-of-arrays, so that one call resolves an attack in every game.
+
+    Each stat is an array indexed by game, side (0 for the first player, 1 for the second) and slot.
+    A unit keeps its slot until it goes to the graveyard, which only clears its `alive` flag, so removing
+    a unit costs the same whatever its board: the board is the living units in slot order, and the position
+    of a unit on the board (the index used by the engine) is the number of living units before its slot.
+    `slots_of` and `positions_of` convert between both.
+
+    Every method takes the games it acts on as an array of game indices, each game appearing at most once,
+    and the other arguments as arrays with one value per game (or scalars). Damage goes through armor first
+    and spells are capped by `CARD_MAXIMUM_*`, exactly as on `Card` and `Player`.
+
+    Attributes:
+        attack (np.ndarray): The attack of each unit, of shape (games, 2, BOARD_LIMIT).
+        health (np.ndarray): The health of each unit.
+        armor (np.ndarray): The armor of each unit.
+        alive (np.ndarray): Whether each slot holds a unit on the board.
+        size (np.ndarray): The number of units on each board, of shape (games, 2).
+        graveyard (np.ndarray): The number of units each side sent to the graveyard.
+        hero_health (np.ndarray): The health of each hero, of shape (games, 2).
+        hero_armor (np.ndarray): The armor of each hero.
+        current (np.ndarray): The side whose turn it is in each game, of shape (games,).
+    """
+
+    def __init__(self, games: int) -> None:
+        """
+        Initializes the empty boards of a batch of games, the first player being the current player.
+
+        Args:
+            games (int): The number of games.
+        """
+        shape = (games, 2, BOARD_LIMIT)
+        self.attack = np.zeros(shape, STAT_TYPE)
+        self.health = np.zeros(shape, STAT_TYPE)
+        self.armor = np.zeros(shape, STAT_TYPE)
+        self.alive = np.zeros(shape, bool)
+        self.size = np.zeros((games, 2), STAT_TYPE)
+        self.graveyard = np.zeros((games, 2), STAT_TYPE)
+        self.hero_health = np.zeros((games, 2), STAT_TYPE)
+        self.hero_armor = np.zeros((games, 2), STAT_TYPE)
+        self.current = np.zeros(games, STAT_TYPE)
+
+    @classmethod
+    def from_engines(cls, engines: list[GameEngine]) -> "BatchCombat":
+        """
+        Copies the boards and heroes of several games into a batch, each board filling the first slots of its side.
+
+        Args:
+            engines (list[GameEngine]): The games, in the order of the batch.
+
+        Returns:
+            BatchCombat: The batch.
+        """
+        batch = cls(len(engines))
+        for game, engine in enumerate(engines):
+            for side, player in enumerate((engine.logic.player_1, engine.logic.player_2)):
+                board = player.deck.board
+                batch.size[game, side] = len(board)
+                batch.graveyard[game, side] = len(player.deck.graveyard)
+                batch.attack[game, side, :len(board)] = [card.attack for card in board]
+                batch.health[game, side, :len(board)] = [card.health for card in board]
+                batch.armor[game, side, :len(board)] = [card.armor for card in board]
+                batch.alive[game, side, :len(board)] = True
+                batch.hero_health[game, side] = player.health
+                batch.hero_armor[game, side] = player.armor
+            batch.current[game] = 0 if engine.current_player is engine.logic.player_1 else 1
+        return batch
+
+    def board(self, game: int, side: int) -> list[tuple[int, int, int]]:
+        """
+        Returns one board of the batch.
+
+        Args:
+            game (int): The index of the game.
+            side (int): The side of the board.
+
+        Returns:
+            list[tuple[int, int, int]]: The attack, health and armor of each unit, in board order.
+        """
+        alive = self.alive[game, side]
+        return list(zip(self.attack[game, side, alive].tolist(), self.health[game, side, alive].tolist(), self.armor[game, side, alive].tolist()))
+
+    def slots_of(self, games: np.ndarray, side: np.ndarray, position: np.ndarray) -> np.ndarray:
+        """
+        Converts board positions, as used by the engine's actions, into slots. HERO_TARGET is kept as is.
+
+        Args:
+            games (np.ndarray): The games.
+            side (np.ndarray): The side of each board.
+            position (np.ndarray): The position of a unit on each board, or HERO_TARGET.
+
+        Returns:
+            np.ndarray: The slot of each unit, or HERO_TARGET.
+        """
+        games, side, position = np.broadcast_arrays(np.asarray(games), np.asarray(side), np.asarray(position))
+        alive = self.alive[games, side]
+        living = np.cumsum(alive, axis=-1)  # Units up to each slot
+        slot = np.argmax(alive & (living == position[..., None] + 1), axis=-1)
+        return np.where(position == HERO_TARGET, HERO_TARGET, slot)
+
+    def positions_of(self, games: np.ndarray, side: np.ndarray, slot: np.ndarray) -> np.ndarray:
+        """
+        Converts slots into board positions, as used by the engine's actions. HERO_TARGET is kept as is.
+
+        Args:
+            games (np.ndarray): The games.
+            side (np.ndarray): The side of each board.
+            slot (np.ndarray): The slot of a unit on each board, or HERO_TARGET.
+
+        Returns:
+            np.ndarray: The position of each unit, or HERO_TARGET.
+        """
+        games, side, slot = np.broadcast_arrays(np.asarray(games), np.asarray(side), np.asarray(slot))
+        before = (self.alive[games, side] & (SLOTS < slot[..., None])).sum(axis=-1)  # Units in the slots before
+        return np.where(slot == HERO_TARGET, HERO_TARGET, before)
+
+    def take_damage(self, games: np.ndarray, side: np.ndarray, slot: np.ndarray, amount: np.ndarray) -> None:
+        """
+        Damages one unit in each game, reducing its armor first and then its health, as `Card.take_damage` does.
+
+        Args:
+            games (np.ndarray): The games.
+            side (np.ndarray): The side of the damaged unit.
+            slot (np.ndarray): The slot of the damaged unit.
+            amount (np.ndarray): The damage.
+        """
+        armor = self.armor[games, side, slot] - amount
+        self.health[games, side, slot] += np.minimum(armor, 0)  # Damage left once the armor is depleted
+        self.armor[games, side, slot] = np.maximum(armor, 0)
+
+    def hero_take_damage(self, games: np.ndarray, side: np.ndarray, amount: np.ndarray) -> None:
+        """
+        Damages one hero in each game, reducing their armor first and then their health, as `Player.take_damage` does.
+
+        Args:
+            games (np.ndarray): The games.
+            side (np.ndarray): The side of the damaged hero.
+            amount (np.ndarray): The damage.
+        """
+        armor = self.hero_armor[games, side] - amount
+        self.hero_health[games, side] += np.minimum(armor, 0)
+        self.hero_armor[games, side] = np.maximum(armor, 0)
+
+    def apply_effects(self, games: np.ndarray, side: np.ndarray, slot: np.ndarray, attack: np.ndarray, health: np.ndarray, armor: np.ndarray) -> None:
+        """
+        Applies a spell to one unit in each game, as `Card.apply_effects` does.
+
+        Args:
+            games (np.ndarray): The games.
+            side (np.ndarray): The side of the targeted unit.
+            slot (np.ndarray): The slot of the targeted unit.
+            attack (np.ndarray): The attack of the spell.
+            health (np.ndarray): The health of the spell.
+            armor (np.ndarray): The armor of the spell.
+        """
+        self.health[games, side, slot] = buff(self.health[games, side, slot], health, CARD_MAXIMUM_HEALTH)
+        self.armor[games, side, slot] = buff(self.armor[games, side, slot], armor, CARD_MAXIMUM_ARMOR)
+        self.attack[games, side, slot] = buff(self.attack[games, side, slot], attack, CARD_MAXIMUM_ATTACK)
+
+    def remove(self, games: np.ndarray, side: np.ndarray, slot: np.ndarray) -> None:
+        """
+        Moves one unit to the graveyard in each game. The units after it move down one board position but keep their slots.
+
+        Args:
+            games (np.ndarray): The games.
+            side (np.ndarray): The side of the removed unit.
+            slot (np.ndarray): The slot of the removed unit.
+        """
+        self.alive[games, side, slot] = False
+        self.size[games, side] -= 1
+        self.graveyard[games, side] += 1
+
+    def attack_targets(self, games: np.ndarray, slot: np.ndarray, target: np.ndarray) -> None:
+        """
+        Attacks with one unit of the current side in each game, as `GameEngine.attack` does: the target takes
+        the unit's attack as damage, the unit goes to the graveyard, and so does the target if it is a unit that died.
+
+        Args:
+            games (np.ndarray): The games.
+            slot (np.ndarray): The slot of the attacking unit.
+            target (np.ndarray): The slot of the targeted unit of the other side, or HERO_TARGET for their hero.
+
+        Raises:
+            ValueError: If an attacker or a target is not on the board, or an attacker has no attack.
+        """
+        games, slot, target = np.broadcast_arrays(np.asarray(games), np.asarray(slot), np.asarray(target))
+        side = self.current[games]
+        other = 1 - side
+        hero = target == HERO_TARGET
+        unit = ~hero
+        units = games[unit], other[unit], target[unit]  # The targeted units
+        if np.any((slot < 0) | (slot >= BOARD_LIMIT) | (target < HERO_TARGET) | (target >= BOARD_LIMIT)):
+            raise ValueError("Invalid attack: the attacker or the target is not on the board.")
+        if not (self.alive[games, side, slot].all() and self.alive[units].all()):
+            raise ValueError("Invalid attack: the attacker or the target is not on the board.")
+        power = self.attack[games, side, slot]
+        if np.any(power <= 0):
+            raise ValueError("Invalid attack: a unit cannot attack because its attack value is zero or less.")
+
+        self.hero_take_damage(games[hero], other[hero], power[hero])
+        self.take_damage(*units, power[unit])
+        self.remove(games, side, slot)
+        dead = self.health[units] <= 0
+        self.remove(units[0][dead], units[1][dead], units[2][dead])
+
+    def random_attacks(self, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Picks a random attack in every game where the current side has a unit able to attack:
+        a uniform attacker among them and a uniform target among the other side's units and hero.
+
+        Args:
+            rng (np.random.Generator): The generator of the choices.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The games, attacker slots and target slots, ready for `attack_targets`.
+        """
+        games = np.arange(len(self.current))
+        side = self.current
+        ready = self.alive[games, side] & (self.attack[games, side] > 0)
+        games = games[ready.any(axis=1)]
+        side = side[games]
+        slot = np.where(ready[games], rng.random((len(games), BOARD_LIMIT)), -1.0).argmax(axis=1)  # The highest key picks a uniform attacker
+
+        targets = np.ones((len(games), BOARD_LIMIT + 1), bool)  # The last column is the hero, always a target
+        targets[:, :BOARD_LIMIT] = self.alive[games, 1 - side]
+        target = np.where(targets, rng.random(targets.shape), -1.0).argmax(axis=1)
+        return games, slot, np.where(target == BOARD_LIMIT, HERO_TARGET, target)
+
+    def combat_round(self, rng: np.random.Generator) -> int:
+        """
+        Resolves one random attack in every game where the current side can still attack.
+
+        Args:
+            rng (np.random.Generator): The generator of the choices.
+
+        Returns:
+            int: The number of games where an attack was made.
+        """
+        games, slot, target = self.random_attacks(rng)
+        self.attack_targets(games, slot, target)
+        return len(games)
@@ -0,0 +1,207 @@
+#!/usr/bin/python3
+
+# Imports
+import os
+import struct
+import sys
+
+# Core Imports
+from core.card_catalog import CardCatalog
+
+# Utils Imports
+from utils.constants import CATALOG_PATH, HEROES_DB_PATH, SPELLS_DB_PATH, UNITS_DB_PATH
+from utils.database_utils import Database
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+from enums.card_type_enum import CardType
+from enums.hero_power_enum import HeroPower
+from enums.race_enum import Race
+from enums.rarity_enum import Rarity
+
+# Constants
+MAGIC = b"HSCC"  # Identifies a compiled card catalog
+VERSION = 1  # Incremented whenever the layout or an enum changes
+NO_RACE = 0xFF  # Race code of spells
+
+# File layout: header, hero records, card records, string offsets, UTF-8 string blob
+HEADER = struct.Struct("<4sHHIII")  # magic, version, reserved, hero count, card count, string count
+HERO_RECORD = struct.Struct("<IIIBBhhhh")  # id, name, description, class, power, attack, health, mana, armor
+CARD_RECORD = struct.Struct("<IIBBBBhhhh")  # name, description, type, class, rarity, race, cost, attack, health, armor
+
+# Enum members are stored by their position in these tuples
+CARD_CLASSES = tuple(CardClass)
+CARD_TYPES = tuple(CardType)
+HERO_POWERS = tuple(HeroPower)
+RACES = tuple(Race)
+RARITIES = tuple(Rarity)
+
+# Class
+class BinaryCatalog:
+    """
+    Compiles a card catalog into a compact binary file and loads it back with a single read.
+
+    Heroes and cards are stored as fixed-size records whose texts are indexes into a shared string table,
+    so loading does no JSON parsing and no TinyDB table construction.
+    """
+
+    @staticmethod
+    def compile(catalog: CardCatalog, file_path: str = CATALOG_PATH) -> None:
+        """
+        Writes a catalog to a binary file. The file is replaced atomically.
+
+        Args:
+            catalog (CardCatalog): The catalog to compile.
+            file_path (str): Path to the binary file. Defaults to `CATALOG_PATH`.
+        """
+        strings: dict[str, int] = {}  # Each distinct text is stored once
+
+        def string_index(text: str) -> int:
+            return strings.setdefault(text, len(strings))
+
+        heroes = b"".join(HERO_RECORD.pack(
+            hero["id"],
+            string_index(hero["name"]),
+            string_index(hero["description"]),
+            CARD_CLASSES.index(hero["hero_class"]),
+            HERO_POWERS.index(hero["hero_power"]),
+            hero["attack"],
+            hero["health"],
+            hero["mana"],
+            hero["armor"]
+        ) for hero in catalog.heroes)
+
+        cards = b"".join(CARD_RECORD.pack(
+            string_index(card["name"]),
+            string_index(card["description"]),
+            CARD_TYPES.index(card["card_type"]),
+            CARD_CLASSES.index(card["card_class"]),
+            RARITIES.index(card["card_rarity"]),
+            NO_RACE if card["race"] is None else RACES.index(card["race"]),
+            card["cost"],
+            card["attack"],
+            card["health"],
+            card["armor"]
+        ) for card in catalog.cards)
+
+        encoded = [text.encode("utf-8") for text in strings]
+        offsets = [0]
+        for text in encoded:
+            offsets.append(offsets[-1] + len(text))
+
+        Database.ensure_directory_exists(file_path)
+        temporary_path = f"{file_path}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, 0, len(catalog.heroes), len(catalog.cards), len(encoded)))
+            file.write(heroes)
+            file.write(cards)
+            file.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            file.write(b"".join(encoded))
+        os.replace(temporary_path, file_path)
+
+    @staticmethod
+    def load(file_path: str = CATALOG_PATH) -> CardCatalog:
+        """
+        Loads a catalog from a binary file.
+
+        Args:
+            file_path (str): Path to the binary file. Defaults to `CATALOG_PATH`.
+
+        Returns:
+            CardCatalog: The loaded catalog.
+
+        Raises:
+            ValueError: If the file is not a compiled catalog of the current version.
+        """
+        with open(file_path, "rb") as file:
+            data = file.read()  # The whole catalog is read at once
+
+        if len(data) < HEADER.size:
+            raise ValueError(f"Invalid catalog file: {file_path}. The file is truncated.")
+        magic, version, _, hero_count, card_count, string_count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Invalid catalog file: {file_path}. Not a compiled catalog.")
+        if version != VERSION:
+            raise ValueError(f"Invalid catalog file: {file_path}. Version {version} is not supported, expected {VERSION}.")
+
+        # Locate each section
+        view = memoryview(data)
+        heroes_start = HEADER.size
+        cards_start = heroes_start + hero_count * HERO_RECORD.size
+        offsets_start = cards_start + card_count * CARD_RECORD.size
+        blob_start = offsets_start + (string_count + 1) * 4
+        offsets = struct.unpack_from(f"<{string_count + 1}I", data, offsets_start)
+        if blob_start + offsets[-1] != len(data):
+            raise ValueError(f"Invalid catalog file: {file_path}. The file is truncated.")
+        strings = [str(view[blob_start + offsets[index]:blob_start + offsets[index + 1]], "utf-8") for index in range(string_count)]
+
+        catalog = CardCatalog()
+        for hero_id, name, description, hero_class, hero_power, attack, health, mana, armor in HERO_RECORD.iter_unpack(view[heroes_start:cards_start]):
+            catalog.index_hero({
+                "id": hero_id,
+                "name": strings[name],
+                "description": strings[description],
+                "hero_class": CARD_CLASSES[hero_class],
+                "hero_power": HERO_POWERS[hero_power],
+                "attack": attack,
+                "health": health,
+                "mana": mana,
+                "armor": armor
+            })
+        for name, description, card_type, card_class, rarity, race, cost, attack, health, armor in CARD_RECORD.iter_unpack(view[cards_start:offsets_start]):
+            catalog.index_card({
+                "name": strings[name],
+                "cost": cost,
+                "description": strings[description],
+                "card_type": CARD_TYPES[card_type],
+                "card_class": CARD_CLASSES[card_class],
+                "card_rarity": RARITIES[rarity],
+                "race": None if race == NO_RACE else RACES[race],
+                "attack": attack,
+                "health": health,
+                "armor": armor
+            })
+        return catalog
+
+    @staticmethod
+    def build(file_path: str = CATALOG_PATH, heroes_path: str = HEROES_DB_PATH, units_path: str = UNITS_DB_PATH, spells_path: str = SPELLS_DB_PATH) -> CardCatalog:
+        """
+        Compiles the JSON data files into a binary catalog.
+
+        Args:
+            file_path (str): Path to the binary file. Defaults to `CATALOG_PATH`.
+            heroes_path (str): Path to the heroes file.
+            units_path (str): Path to the units file.
+            spells_path (str): Path to the spells file.
+
+        Returns:
+            CardCatalog: The compiled catalog.
+        """
+        catalog = CardCatalog.from_files(heroes_path, units_path, spells_path)
+        BinaryCatalog.compile(catalog, file_path)
+        return catalog
+
+    @staticmethod
+    def load_or_build(file_path: str = CATALOG_PATH, heroes_path: str = HEROES_DB_PATH, units_path: str = UNITS_DB_PATH, spells_path: str = SPELLS_DB_PATH) -> CardCatalog:
+        """
+        Loads the binary catalog, compiling it first if it is missing or older than one of the data files.
+
+        Args:
+            file_path (str): Path to the binary file. Defaults to `CATALOG_PATH`.
+            heroes_path (str): Path to the heroes file.
+            units_path (str): Path to the units file.
+            spells_path (str): Path to the spells file.
+
+        Returns:
+            CardCatalog: The loaded catalog.
+        """
+        sources = (heroes_path, units_path, spells_path)
+        if not os.path.exists(file_path) or any(os.path.getmtime(source) > os.path.getmtime(file_path) for source in sources):
+            return BinaryCatalog.build(file_path, heroes_path, units_path, spells_path)
+        return BinaryCatalog.load(file_path)
+
+# Build step: python -m core.binary_catalog [output path]
+if __name__ == "__main__":
+    output_path = sys.argv[1] if len(sys.argv) > 1 else CATALOG_PATH
+    compiled = BinaryCatalog.build(output_path)
+    print(f"Compiled {len(compiled.heroes)} heroes and {len(compiled.cards)} cards into {output_path} ({os.path.getsize(output_path)} bytes).")
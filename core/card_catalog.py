@@ -0,0 +1,475 @@
+#!/usr/bin/python3
+
+# Imports
+import hashlib
+from typing import Iterable
+from tinydb import TinyDB
+
+# Modules Imports
+from modules.card_mod import Card
+from modules.hero_mod import Hero
+from modules.unit_mod import Unit
+from modules.spell_mod import Spell
+from modules.card_definition_mod import CardDefinition
+
+# Utils Imports
+from utils.constants import (
+    HEROES_DB_PATH,
+    HERO_MAXIMUM_MANA,
+    CARD_MAXIMUM_HEALTH,
+    SPELLS_DB_PATH,
+    UNITS_DB_PATH,
+    HEROES_TABLE_NAME,
+    SPELLS_TABLE_NAME,
+    UNITS_TABLE_NAME
+)
+from utils.database_utils import Database
+from utils.json_stream_utils import ClassDocumentReader
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+from enums.card_type_enum import CardType
+from enums.hero_power_enum import HeroPower
+from enums.race_enum import Race
+from enums.rarity_enum import Rarity
+
+# Class
+class CardCatalog:
+    """
+    In-memory catalog of all heroes, units and spells, loaded once and indexed for constant-time lookups.
+
+    Raw table rows are normalized into records whose enum fields are already parsed. Cards get a catalog id,
+    their position in `cards`, and are indexed by class, mana cost, race, rarity and name.
+    The cards of each class are also kept in a precomputed list, units first, in file order.
+    Each card record holds the shared `CardDefinition` that all the cards built from it point to.
+    Since catalog ids are positions, `fingerprint()` identifies the ids of a catalog, e.g. to reject deck codes made for another one.
+
+    Attributes:
+        heroes (list[dict]): All hero records.
+        cards (list[dict]): All unit and spell records, indexed by catalog id.
+    """
+
+    def __init__(self, heroes_table: Iterable[dict] = None, units_table: Iterable[dict] = None, spells_table: Iterable[dict] = None) -> None:
+        """
+        Initializes the catalog from the rows of the heroes, units and spells tables.
+        The rows are indexed one at a time, so they can be read lazily (e.g. by a `ClassDocumentReader`).
+
+        Args:
+            heroes_table (Iterable[dict], optional): Rows mapping a class name to its heroes.
+            units_table (Iterable[dict], optional): Rows mapping a class name to its units.
+            spells_table (Iterable[dict], optional): Rows mapping a class name to its spells.
+
+        Raises:
+            KeyError: If a class, race, rarity or hero power name is unknown.
+        """
+        self.heroes: list[dict] = []
+        self.cards: list[dict] = []
+
+        # Hash indexes
+        self._heroes_by_id: dict[int, dict] = {}
+        self._heroes_by_class: dict[CardClass, list[dict]] = {}
+        self._heroes_by_name: dict[tuple[CardClass, str], dict] = {}
+        self._cards_by_class_and_type: dict[tuple[CardClass, CardType], list[dict]] = {}
+        self._cards_by_class: dict[CardClass, list[dict]] = {}  # Precomputed on first lookup
+        self._cards_by_cost: dict[int, list[dict]] = {}
+        self._cards_by_race: dict[Race, list[dict]] = {}
+        self._cards_by_rarity: dict[Rarity, list[dict]] = {}
+        self._cards_by_name: dict[str, list[dict]] = {}
+        self._fingerprint: int | None = None  # Computed on first use
+
+        for row in heroes_table or []:
+            for heroes in row.values():
+                for hero in heroes:
+                    self.add_hero(hero)
+        for row in units_table or []:
+            for class_name, units in row.items():
+                for unit in units:
+                    self.add_card(class_name, unit, CardType.UNIT)
+        for row in spells_table or []:
+            for class_name, spells in row.items():
+                for spell in spells:
+                    self.add_card(class_name, spell, CardType.SPELL)
+
+    @classmethod
+    def from_database(cls, hearthstone_db: TinyDB) -> "CardCatalog":
+        """
+        Loads the catalog from the heroes, units and spells tables of the database.
+
+        Args:
+            hearthstone_db (TinyDB): The database containing the game data.
+
+        Returns:
+            CardCatalog: The loaded catalog.
+        """
+        return cls(
+            Database.fetch_all_from_table(hearthstone_db, HEROES_TABLE_NAME),
+            Database.fetch_all_from_table(hearthstone_db, UNITS_TABLE_NAME),
+            Database.fetch_all_from_table(hearthstone_db, SPELLS_TABLE_NAME)
+        )
+
+    @classmethod
+    def from_files(cls, heroes_path: str = HEROES_DB_PATH, units_path: str = UNITS_DB_PATH, spells_path: str = SPELLS_DB_PATH) -> "CardCatalog":
+        """
+        Loads the catalog directly from the JSON data files, reading them incrementally
+        so that only the catalog, and not the parsed files, is held in memory.
+
+        Args:
+            heroes_path (str): Path to the heroes file.
+            units_path (str): Path to the units file.
+            spells_path (str): Path to the spells file.
+
+        Returns:
+            CardCatalog: The loaded catalog.
+
+        Raises:
+            ValueError: If a file does not group rows by class.
+        """
+        return cls(ClassDocumentReader(heroes_path), ClassDocumentReader(units_path), ClassDocumentReader(spells_path))
+
+    def add_hero(self, hero: dict) -> dict:
+        """
+        Normalizes a hero row and adds it to the catalog.
+
+        Args:
+            hero (dict): The raw hero row.
+
+        Returns:
+            dict: The hero record.
+        """
+        record = {
+            "id": hero["id"],
+            "name": hero["name"],
+            "description": hero.get("description", ""),
+            "hero_class": CardClass[hero["hero_class"].upper()],
+            "hero_power": HeroPower[hero["hero_power"].upper()],
+            "attack": hero["attack"],
+            "health": hero["health"],
+            "mana": hero["mana"],
+            "armor": hero["armor"]
+        }
+        return self.index_hero(record)
+
+    def index_hero(self, record: dict) -> dict:
+        """
+        Adds an already normalized hero record to the catalog and its indexes.
+
+        Args:
+            record (dict): The hero record.
+
+        Returns:
+            dict: The hero record.
+        """
+        self.heroes.append(record)
+        self._fingerprint = None
+        self._heroes_by_id[record["id"]] = record
+        self._heroes_by_class.setdefault(record["hero_class"], []).append(record)
+        self._heroes_by_name[(record["hero_class"], record["name"])] = record
+        return record
+
+    def add_card(self, class_name: str, card: dict, card_type: CardType) -> dict:
+        """
+        Normalizes a unit or spell row, gives it the next catalog id and indexes it.
+
+        Args:
+            class_name (str): The name of the class the card belongs to (e.g., "MAGE").
+            card (dict): The raw card row.
+            card_type (CardType): The type of the card.
+
+        Returns:
+            dict: The card record.
+        """
+        record = {
+            "name": card.get("name", ""),
+            "cost": card.get("cost", 0),
+            "description": card.get("description", ""),
+            "card_type": card_type,
+            "card_class": CardClass[class_name.upper()],
+            "card_rarity": Rarity[card.get("rarity", "COMMON").upper()],
+            "race": Race[card.get("race", "ALL").upper()] if card_type == CardType.UNIT else None,
+            "attack": card.get("attack", 0),
+            "health": card.get("health", 0),
+            "armor": card.get("armor", 0)
+        }
+        return self.index_card(record)
+
+    def index_card(self, record: dict) -> dict:
+        """
+        Gives an already normalized card record the next catalog id and its shared definition, and adds it to the catalog and its indexes.
+
+        Args:
+            record (dict): The card record, without id.
+
+        Returns:
+            dict: The card record.
+        """
+        record["id"] = len(self.cards)
+        record["definition"] = CardDefinition.intern(
+            record["name"],
+            min(record["cost"], HERO_MAXIMUM_MANA) if HERO_MAXIMUM_MANA is not None else record["cost"],
+            record["description"],
+            (record["card_class"],),
+            record["card_type"],
+            record["card_rarity"],
+            record["race"],
+            record["attack"],
+            min(record["health"], CARD_MAXIMUM_HEALTH) if CARD_MAXIMUM_HEALTH is not None else record["health"],
+            record["armor"]
+        )
+        self.cards.append(record)
+        self._fingerprint = None
+
+        # The list of the class is rebuilt on its next lookup, units first
+        self._cards_by_class_and_type.setdefault((record["card_class"], record["card_type"]), []).append(record)
+        self._cards_by_class.pop(record["card_class"], None)
+
+        self._cards_by_cost.setdefault(record["definition"].cost, []).append(record)  # The cost the cards are played at
+        self._cards_by_rarity.setdefault(record["card_rarity"], []).append(record)
+        self._cards_by_name.setdefault(record["name"], []).append(record)
+        if record["race"] is not None:
+            self._cards_by_race.setdefault(record["race"], []).append(record)
+        return record
+
+    def fingerprint(self) -> int:
+        """
+        Returns a 32-bit hash of the heroes and cards of the catalog, in id order. Every field but the descriptions
+        is hashed, so adding, removing, reordering or changing a hero or card gives another fingerprint.
+
+        Returns:
+            int: The fingerprint.
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=4)
+            for record in self.heroes + self.cards:
+                digest.update(repr([(key, value) for key, value in record.items() if key not in ("description", "definition")]).encode())
+            self._fingerprint = int.from_bytes(digest.digest(), "little")
+        return self._fingerprint
+
+    def hero_classes(self) -> list[CardClass]:
+        """
+        Returns the classes having at least one hero, in loading order.
+
+        Returns:
+            list[CardClass]: The playable classes.
+        """
+        return list(self._heroes_by_class)
+
+    def heroes_by_class(self, card_class: CardClass) -> list[dict]:
+        """
+        Returns the heroes of a class.
+
+        Args:
+            card_class (CardClass): The class of the heroes.
+
+        Returns:
+            list[dict]: The hero records.
+        """
+        return self._heroes_by_class.get(card_class, [])
+
+    def get_hero_by_id(self, hero_id: int) -> dict:
+        """
+        Returns a hero by id.
+
+        Args:
+            hero_id (int): The id of the hero.
+
+        Returns:
+            dict: The hero record.
+
+        Raises:
+            KeyError: If no hero has this id.
+        """
+        if hero_id not in self._heroes_by_id:
+            raise KeyError(f"Unknown hero id: {hero_id}.")
+        return self._heroes_by_id[hero_id]
+
+    def get_hero(self, card_class: CardClass, name: str) -> dict | None:
+        """
+        Finds a hero by class and name.
+
+        Args:
+            card_class (CardClass): The class of the hero.
+            name (str): The name of the hero.
+
+        Returns:
+            dict | None: The hero record, or None if no such hero exists.
+        """
+        return self._heroes_by_name.get((card_class, name))
+
+    def get_card(self, card_id: int) -> dict:
+        """
+        Returns a card by catalog id.
+
+        Args:
+            card_id (int): The catalog id of the card.
+
+        Returns:
+            dict: The card record.
+
+        Raises:
+            KeyError: If no card has this id.
+        """
+        if not 0 <= card_id < len(self.cards):
+            raise KeyError(f"Unknown card id: {card_id}.")
+        return self.cards[card_id]
+
+    def cards_by_class(self, card_class: CardClass) -> list[dict]:
+        """
+        Returns the cards of a class, units first.
+
+        Args:
+            card_class (CardClass): The class of the cards.
+
+        Returns:
+            list[dict]: The card records.
+        """
+        class_cards = self._cards_by_class.get(card_class)
+        if class_cards is None:
+            class_cards = (self._cards_by_class_and_type.get((card_class, CardType.UNIT), [])
+                           + self._cards_by_class_and_type.get((card_class, CardType.SPELL), []))
+            self._cards_by_class[card_class] = class_cards
+        return class_cards
+
+    def cards_by_cost(self, cost: int) -> list[dict]:
+        """
+        Returns the cards with a given mana cost, as capped in their definition (the cost of the cards built from them).
+
+        Args:
+            cost (int): The mana cost.
+
+        Returns:
+            list[dict]: The card records.
+        """
+        return self._cards_by_cost.get(cost, [])
+
+    def cards_by_race(self, race: Race) -> list[dict]:
+        """
+        Returns the units of a race.
+
+        Args:
+            race (Race): The race of the units.
+
+        Returns:
+            list[dict]: The card records.
+        """
+        return self._cards_by_race.get(race, [])
+
+    def cards_by_rarity(self, rarity: Rarity) -> list[dict]:
+        """
+        Returns the cards of a rarity.
+
+        Args:
+            rarity (Rarity): The rarity of the cards.
+
+        Returns:
+            list[dict]: The card records.
+        """
+        return self._cards_by_rarity.get(rarity, [])
+
+    def cards_by_name(self, name: str) -> list[dict]:
+        """
+        Returns the cards with a given name (several cards may share a name with different stats).
+
+        Args:
+            name (str): The name of the cards.
+
+        Returns:
+            list[dict]: The card records.
+        """
+        return self._cards_by_name.get(name, [])
+
+    def find(self, card_class: CardClass = None, cost: int = None, race: Race = None, rarity: Rarity = None, card_type: CardType = None) -> list[dict]:
+        """
+        Returns the cards matching all the given criteria. The smallest index is scanned and filtered by the others.
+
+        Args:
+            card_class (CardClass, optional): The class of the cards.
+            cost (int, optional): The mana cost of the cards, as capped in their definition.
+            race (Race, optional): The race of the cards.
+            rarity (Rarity, optional): The rarity of the cards.
+            card_type (CardType, optional): The type of the cards.
+
+        Returns:
+            list[dict]: The matching card records, in catalog id order.
+        """
+        criteria = [
+            (lambda record: record["card_class"], card_class, self.cards_by_class),
+            (lambda record: record["definition"].cost, cost, self.cards_by_cost),
+            (lambda record: record["race"], race, self.cards_by_race),
+            (lambda record: record["card_rarity"], rarity, self.cards_by_rarity)
+        ]
+        candidates = [(lookup(value), field, value) for field, value, lookup in criteria if value is not None]
+        if not candidates:
+            records = self.cards
+            filters = []
+        else:
+            candidates.sort(key=lambda candidate: len(candidate[0]))
+            records = candidates[0][0]
+            filters = [(field, value) for _, field, value in candidates[1:]]
+        if card_type is not None:
+            filters.append((lambda record: record["card_type"], card_type))
+
+        matches = [record for record in records if all(field(record) == value for field, value in filters)]
+        return sorted(matches, key=lambda record: record["id"])
+
+    def create_hero(self, record: dict) -> Hero:
+        """
+        Builds a Hero from a hero record.
+
+        Args:
+            record (dict): The hero record.
+
+        Returns:
+            Hero: The new hero.
+        """
+        return Hero(
+            id=record["id"],
+            name=record["name"],
+            description=record["description"],
+            hero_class=record["hero_class"],
+            hero_power=record["hero_power"],
+            attack=record["attack"],
+            health=record["health"],
+            mana=record["mana"],
+            armor=record["armor"]
+        )
+
+    def create_card(self, record: dict, card_id: int) -> Card:
+        """
+        Builds a Unit or a Spell from a card record. The card shares the record's definition.
+
+        Args:
+            record (dict): The card record.
+            card_id (int): The id of the card in its deck.
+
+        Returns:
+            Card: The new unit or spell, in the deck.
+        """
+        card_class = Unit if record["card_type"] == CardType.UNIT else Spell
+        return card_class.from_definition(record["definition"], card_id)
+
+    def create_class_cards(self, card_class: CardClass) -> list[Card]:
+        """
+        Builds all the cards of a class, numbered from 1.
+
+        Args:
+            card_class (CardClass): The class of the cards.
+
+        Returns:
+            list[Card]: The new units and spells.
+        """
+        return [self.create_card(record, index + 1) for index, record in enumerate(self.cards_by_class(card_class))]
+
+    def create_deck_cards(self, card_ids: list[int]) -> list[Card]:
+        """
+        Builds the cards of a deck from their catalog ids, e.g. decoded from a deck code, numbered from 1.
+
+        Args:
+            card_ids (list[int]): The catalog ids of the cards.
+
+        Returns:
+            list[Card]: The new units and spells, in the order of the ids.
+
+        Raises:
+            KeyError: If no card has one of the ids.
+        """
+        return [self.create_card(self.get_card(card_id), index + 1) for index, card_id in enumerate(card_ids)]
@@ -0,0 +1,257 @@
+#!/usr/bin/python3
+
+# Imports
+import base64
+import binascii
+import hashlib
+from tinydb import TinyDB, Query
+
+# Utils Imports
+from utils.constants import DECKS_TABLE_NAME
+from utils.sqlite_utils import SQLiteDatabase
+
+# Constants
+DECK_CODE_VERSION = 1  # Incremented whenever the layout of the codes changes
+
+# Functions
+def write_varint(buffer: bytearray, value: int) -> None:
+    """
+    Appends an unsigned integer as a varint: 7 bits per byte, low bits first, the high bit set on every byte but the last.
+
+    Args:
+        buffer (bytearray): The buffer to append to.
+        value (int): The integer.
+
+    Raises:
+        ValueError: If the integer is negative.
+    """
+    if value < 0:
+        raise ValueError(f"Invalid varint: {value}. It must not be negative.")
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+def encode_deck(hero_id: int, card_ids: list[int], fingerprint: int) -> str:
+    """
+    Encodes a deck as a deck code: the version, the catalog fingerprint, the hero id, the number of cards and the catalog id
+    of each card, as varints encoded in URL-safe base64. Cards are sorted, each id being stored as its difference with the previous one,
+    so that a deck has a single code whatever the order of its cards, and most ids take one byte.
+
+    Catalog ids are positions in the catalog, so the fingerprint lets `decode_deck` reject a code made for another catalog
+    instead of giving it other cards.
+
+    Args:
+        hero_id (int): The id of the hero.
+        card_ids (list[int]): The catalog ids of the cards.
+        fingerprint (int): The fingerprint of the catalog, from `CardCatalog.fingerprint()`.
+
+    Returns:
+        str: The deck code.
+
+    Raises:
+        ValueError: If an id is negative.
+    """
+    buffer = bytearray()
+    for value in (DECK_CODE_VERSION, fingerprint, hero_id, len(card_ids)):
+        write_varint(buffer, value)
+    previous = 0
+    for card_id in sorted(card_ids):
+        write_varint(buffer, card_id - previous)
+        previous = card_id
+    return base64.urlsafe_b64encode(bytes(buffer)).rstrip(b"=").decode("ascii")
+
+def decode_deck(code: str, fingerprint: int) -> tuple[int, list[int]]:
+    """
+    Decodes a deck code in a single pass over its bytes.
+
+    Args:
+        code (str): The deck code.
+        fingerprint (int): The fingerprint of the catalog the ids are looked up in, from `CardCatalog.fingerprint()`.
+
+    Returns:
+        tuple[int, list[int]]: The id of the hero and the sorted catalog ids of the cards.
+
+    Raises:
+        ValueError: If the code is not a deck code of the current version, or was made for another catalog.
+    """
+    try:
+        data = base64.urlsafe_b64decode(code + "=" * (-len(code) % 4))
+    except (binascii.Error, ValueError):
+        raise ValueError(f"Invalid deck code: {code}. Not base64.") from None
+
+    values = []  # Version, fingerprint, hero id, card count, then the differences between card ids
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    if shift or len(values) < 4:
+        raise ValueError(f"Invalid deck code: {code}. The code is truncated.")
+    if values[0] != DECK_CODE_VERSION:
+        raise ValueError(f"Invalid deck code: {code}. Version {values[0]} is not supported, expected {DECK_CODE_VERSION}.")
+    if values[1] != fingerprint:
+        raise ValueError(f"Invalid deck code: {code}. It was made for another version of the catalog.")
+    if values[3] != len(values) - 4:
+        raise ValueError(f"Invalid deck code: {code}. Expected {values[3]} cards, found {len(values) - 4}.")
+
+    card_ids, card_id = [], 0
+    for delta in values[4:]:
+        card_id += delta
+        card_ids.append(card_id)
+    return values[2], card_ids
+
+def deck_hash(code: str) -> str:
+    """
+    Returns the hash identifying a deck. Equal decks have equal codes, hence equal hashes.
+
+    Args:
+        code (str): The deck code.
+
+    Returns:
+        str: The hexadecimal BLAKE2 digest of the code.
+    """
+    return hashlib.blake2b(code.encode("ascii"), digest_size=16).hexdigest()
+
+# Class
+class DeckLibrary:
+    """
+    Named decks saved as deck codes in the decks table, with duplicate decks detected by hash.
+
+    Each document stores the name, code and hash of a deck, so loading a deck decodes its code
+    instead of rebuilding cards from table rows. Decks saved with another catalog are listed but cannot be loaded.
+
+    Attributes:
+        db (TinyDB | SQLiteDatabase): The database holding the decks table.
+        fingerprint (int): The fingerprint of the catalog the card ids belong to.
+        table_name (str): The name of the decks table.
+    """
+
+    def __init__(self, db: TinyDB | SQLiteDatabase, fingerprint: int, table_name: str = DECKS_TABLE_NAME) -> None:
+        """
+        Initializes the library, reading the saved decks once.
+
+        Args:
+            db (TinyDB | SQLiteDatabase): The database holding the decks table.
+            fingerprint (int): The fingerprint of the catalog the card ids belong to, from `CardCatalog.fingerprint()`.
+            table_name (str): The name of the decks table. Defaults to `DECKS_TABLE_NAME`.
+        """
+        self.db = db
+        self.fingerprint = fingerprint
+        self.table_name = table_name
+        self.by_hash: dict[str, dict] = {}
+        self.by_name: dict[str, dict] = {}
+        for document in db.table(table_name).all():
+            self.by_hash.setdefault(document["hash"], document)
+            self.by_name[document["name"]] = document
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of saved decks.
+        """
+        return len(self.by_hash)
+
+    def save(self, name: str, hero_id: int, card_ids: list[int]) -> str:
+        """
+        Saves a deck under a name, replacing the deck saved under this name.
+        A deck already saved, whatever its name, is found by its hash and not saved again.
+
+        Args:
+            name (str): The name of the deck.
+            hero_id (int): The id of the hero.
+            card_ids (list[int]): The catalog ids of the cards.
+
+        Returns:
+            str: The code of the deck.
+
+        Raises:
+            ValueError: If an id is negative.
+        """
+        code = encode_deck(hero_id, card_ids, self.fingerprint)
+        key = deck_hash(code)
+        saved = self.by_hash.get(key)
+        if saved is not None:
+            return saved["code"]
+
+        document = {"name": name, "code": code, "hash": key}
+        replaced = self.by_name.get(name)
+        if replaced is not None:
+            self._unindex(replaced)
+        self.db.table(self.table_name).upsert(document, Query().name == name)
+        self.by_hash[key] = self.by_name[name] = document
+        return code
+
+    def find(self, code: str) -> str | None:
+        """
+        Returns the name under which a deck is saved.
+
+        Args:
+            code (str): The code of the deck.
+
+        Returns:
+            str | None: The name of the deck, or None if it is not saved.
+        """
+        saved = self.by_hash.get(deck_hash(code))
+        return None if saved is None else saved["name"]
+
+    def load(self, name: str) -> tuple[int, list[int]]:
+        """
+        Loads a saved deck.
+
+        Args:
+            name (str): The name of the deck.
+
+        Returns:
+            tuple[int, list[int]]: The id of the hero and the catalog ids of the cards.
+
+        Raises:
+            KeyError: If no deck has this name.
+            ValueError: If the deck was saved with another catalog.
+        """
+        if name not in self.by_name:
+            raise KeyError(f"Unknown deck: {name}.")
+        return decode_deck(self.by_name[name]["code"], self.fingerprint)
+
+    def names(self) -> list[str]:
+        """
+        Returns the names of the saved decks, in saving order.
+
+        Returns:
+            list[str]: The names.
+        """
+        return list(self.by_name)
+
+    def delete(self, name: str) -> None:
+        """
+        Deletes a saved deck.
+
+        Args:
+            name (str): The name of the deck.
+
+        Raises:
+            KeyError: If no deck has this name.
+        """
+        if name not in self.by_name:
+            raise KeyError(f"Unknown deck: {name}.")
+        self._unindex(self.by_name.pop(name))
+        self.db.table(self.table_name).remove(Query().name == name)
+
+    def _unindex(self, document: dict) -> None:
+        """
+        Removes a replaced or deleted deck from the hash index. The hash is kept if it belongs to another saved name
+        holding the same deck, such as decks saved by another process.
+
+        Args:
+            document (dict): The document of the deck, already replaced or removed from `by_name`.
+        """
+        if self.by_hash.get(document["hash"]) is not document:
+            return  # The hash belongs to another name
+        del self.by_hash[document["hash"]]
+        for other in self.by_name.values():
+            if other is not document and other["hash"] == document["hash"]:
+                self.by_hash[document["hash"]] = other
+                break
@@ -0,0 +1,660 @@
+#!/usr/bin/python3
+
+# Imports
+from typing import Iterator, NamedTuple
+
+# Core Imports
+from core.game_logic import GameLogic
+
+# Modules Imports
+from modules.player_mod import Player
+from modules.spell_mod import Spell
+
+# Utils Imports
+from utils.zobrist_utils import zobrist_key, rotate
+from utils.rng_utils import GameRandom, copy_stream
+from utils.journal_utils import Journal
+from utils.constants import (
+    HERO_MAXIMUM_MANA,
+    HAND_LIMIT,
+    BOARD_LIMIT,
+    HERO_POWER_COST,
+    HERO_POWER_ATTACK
+)
+
+# Enum Imports
+from enums.action_type_enum import ActionType
+from enums.turn_phase_enum import TurnPhase
+
+# Constants
+HERO_TARGET = -1  # Target index designating a hero instead of a unit on the board
+PHASE_ORDER = (TurnPhase.PLAY_CARD, TurnPhase.HERO_POWER, TurnPhase.ATTACK, TurnPhase.HERO_ATTACK)
+
+# Class
+class Action(NamedTuple):
+    """
+    Represents a single decision taken by the current player.
+
+    Attributes:
+        action_type (ActionType): The kind of action.
+        source (int): Index of the card in the hand (PLAY_CARD) or on the board (ATTACK), -1 otherwise.
+        target (int): Index of the targeted unit on the board, or HERO_TARGET to target a hero.
+            Spells target the current player's side, attacks target the opponent's side.
+    """
+    action_type: ActionType
+    source: int = -1
+    target: int = HERO_TARGET
+
+PASS_ACTION = Action(ActionType.PASS)
+USE_HERO_POWER_ACTION = Action(ActionType.USE_HERO_POWER)
+
+# Every possible action, built once so that generating moves never creates one; targets are indexed from HERO_TARGET
+PLAY_CARD_ACTIONS = tuple(tuple(Action(ActionType.PLAY_CARD, source, target) for target in range(HERO_TARGET, BOARD_LIMIT)) for source in range(HAND_LIMIT))
+ATTACK_ACTIONS = tuple(tuple(Action(ActionType.ATTACK, source, target) for target in range(HERO_TARGET, BOARD_LIMIT)) for source in range(BOARD_LIMIT))
+HERO_ATTACK_ACTIONS = tuple(Action(ActionType.HERO_ATTACK, -1, target) for target in range(HERO_TARGET, BOARD_LIMIT))
+
+class GameEngine:
+    """
+    Headless game engine applying the rules of a game between two players.
+
+    The engine never performs any input or output: callers query `legal_actions()`,
+    pick one of them and feed it back with `apply(action)` until `is_terminal()` is True.
+    Phases where the current player has nothing to do are skipped automatically.
+
+    The cards that can be played or attack are computed once when a phase is entered and then
+    updated by each attack, so listing the legal actions only walks these small sets.
+    Call `refresh_moves()` after modifying the players directly during a phase.
+
+    Once `start_journal()` was called, every change made by an action is recorded as a small delta:
+    `make`/`unmake` let a search play and take back actions in place instead of cloning the game,
+    and `undo`/`redo` let a player take back their moves.
+
+    Attributes:
+        logic (GameLogic): The game logic holding both players.
+        current_player (Player): The player whose turn it is.
+        opponent (Player): The other player.
+        turn (int): The number of turns started so far (each player's turn counts as one).
+        turn_limit (int | None): Number of turns after which the game ends in a draw (None for no limit).
+        phase (TurnPhase): The current phase of the turn.
+        played_card (bool): Whether the current player has played a card this turn.
+        played_hero_power (bool): Whether the current player has used their hero power this turn.
+        rng (GameRandom): The random streams of the game, whose seed replays it.
+        playable (list[int]): Hand indices of the cards the current player can play (PLAY_CARD phase).
+        attackers (list[int]): Board indices of the units that can still attack (ATTACK phase).
+        targets (int): The number of targets on the opponent's side, their hero included.
+        journal (Journal | None): The journal of the changes, None until `start_journal()` is called.
+        history (list[tuple[Action, int]]): Each action made since the journal started, with the journal's length before it.
+        undone (list[Action]): The actions taken back by `undo`, most recent last, that `redo` plays again.
+    """
+
+    def __init__(self, player_1: Player, player_2: Player, first_player: Player = None, turn_limit: int = None, rng: GameRandom = None) -> None:
+        """
+        Initializes the engine and starts the first turn.
+
+        Args:
+            player_1 (Player): The first player.
+            player_2 (Player): The second player.
+            first_player (Player, optional): The player who starts. Chosen randomly if None.
+            turn_limit (int, optional): Number of turns after which the game is a draw. Defaults to None.
+            rng (GameRandom, optional): The random streams of the game. Defaults to None, for streams with a random seed.
+
+        Raises:
+            TypeError: If a player is not a Player.
+            ValueError: If `first_player` is neither `player_1` nor `player_2`.
+        """
+        if not isinstance(player_2, Player):
+            raise TypeError(f"Expected 'player_2' to be a Player, got {type(player_2).__name__}")
+        self.rng = rng if rng is not None else GameRandom()
+        self.logic = GameLogic(player_1, player_2, self.rng.stream("start"))  # Validates the first player
+
+        # Determine the turn order
+        if first_player is None:
+            self.current_player, self.opponent = self.logic.choose_who_starts()
+        elif first_player is player_1:
+            self.current_player, self.opponent = player_1, player_2
+        elif first_player is player_2:
+            self.current_player, self.opponent = player_2, player_1
+        else:
+            raise ValueError("The first player must be one of the two players of the game.")
+
+        self.turn = 0
+        self.turn_limit = turn_limit
+        self.phase = TurnPhase.PLAY_CARD
+        self.played_card = False
+        self.played_hero_power = False
+        self.playable: list[int] = []
+        self.attackers: list[int] = []
+        self.targets = 1
+        self.journal: Journal | None = None
+        self.history: list[tuple[Action, int]] = []
+        self.undone: list[Action] = []
+
+        self.start_turn()  # Start the first player's turn
+
+    def clone(self) -> "GameEngine":
+        """
+        Returns an independent copy of the game, identical to `copy.deepcopy` but much faster.
+        Cards are copied with their shared definitions, and heroes, which a game never modifies, are shared.
+        The random streams are copied in their current states. The copy does not journal its changes.
+
+        Returns:
+            GameEngine: The new engine, in the same turn and phase.
+        """
+        engine = GameEngine.__new__(GameEngine)  # Skips __init__, which would start a turn
+        player_1, player_2 = self.logic.player_1.clone(), self.logic.player_2.clone()
+        engine.rng = self.rng.clone()  # Draws of the copy must not shift those of the original
+        start = self.logic.rng
+        engine.logic = GameLogic(player_1, player_2, engine.rng.stream("start") if start is self.rng.stream("start") else copy_stream(start))
+        if self.current_player is self.logic.player_1:
+            engine.current_player, engine.opponent = player_1, player_2
+        else:
+            engine.current_player, engine.opponent = player_2, player_1
+        engine.turn = self.turn
+        engine.turn_limit = self.turn_limit
+        engine.phase = self.phase
+        engine.played_card = self.played_card
+        engine.played_hero_power = self.played_hero_power
+        engine.playable = self.playable.copy()
+        engine.attackers = self.attackers.copy()
+        engine.targets = self.targets
+        engine.journal = None
+        engine.history = []
+        engine.undone = []
+        return engine
+
+    @classmethod
+    def resume(cls, player_1: Player, player_2: Player, player_1_to_play: bool, turn: int, phase: TurnPhase, played_card: bool = False, played_hero_power: bool = False, turn_limit: int = None, rng: GameRandom = None) -> "GameEngine":
+        """
+        Creates an engine for a game already under way, such as a saved state, without starting a turn.
+
+        Args:
+            player_1 (Player): The first player, in their saved state.
+            player_2 (Player): The second player, in their saved state.
+            player_1_to_play (bool): Whether it is the first player's turn.
+            turn (int): The number of the turn being played.
+            phase (TurnPhase): The current phase of the turn.
+            played_card (bool): Whether the current player has played a card this turn. Defaults to False.
+            played_hero_power (bool): Whether the current player has used their hero power this turn. Defaults to False.
+            turn_limit (int, optional): Number of turns after which the game is a draw. Defaults to None.
+            rng (GameRandom, optional): The random streams of the game. Defaults to None, for streams with a random seed.
+
+        Returns:
+            GameEngine: The engine, with the moves of the current phase computed.
+        """
+        engine = cls.__new__(cls)  # Skips __init__, which would start a turn
+        engine.rng = rng if rng is not None else GameRandom()
+        engine.logic = GameLogic(player_1, player_2, engine.rng.stream("start"))
+        engine.current_player, engine.opponent = (player_1, player_2) if player_1_to_play else (player_2, player_1)
+        engine.turn = turn
+        engine.turn_limit = turn_limit
+        engine.phase = phase
+        engine.played_card = played_card
+        engine.played_hero_power = played_hero_power
+        engine.playable = []
+        engine.attackers = []
+        engine.targets = 1
+        engine.journal = None
+        engine.history = []
+        engine.undone = []
+        engine.refresh_moves()
+        return engine
+
+    def snapshot(self) -> "GameEngine":
+        """
+        Saves the current state of the game, to be restored later with `restore`.
+
+        Returns:
+            GameEngine: A clone of the engine.
+        """
+        return self.clone()
+
+    def restore(self, snapshot: "GameEngine") -> None:
+        """
+        Sets the game back to a snapshot. Both players keep their identity, so references
+        held by callers stay valid, and the snapshot can be restored again.
+        A journal in use is started again, as the actions made before cannot be taken back anymore.
+
+        Args:
+            snapshot (GameEngine): A snapshot taken from this engine.
+        """
+        player_1, player_2 = self.logic.player_1, self.logic.player_2
+        player_1.restore(snapshot.logic.player_1)
+        player_2.restore(snapshot.logic.player_2)
+        if snapshot.current_player is snapshot.logic.player_1:
+            self.current_player, self.opponent = player_1, player_2
+        else:
+            self.current_player, self.opponent = player_2, player_1
+        self.turn = snapshot.turn
+        self.turn_limit = snapshot.turn_limit
+        self.phase = snapshot.phase
+        self.played_card = snapshot.played_card
+        self.played_hero_power = snapshot.played_hero_power
+        self.playable = snapshot.playable.copy()
+        self.attackers = snapshot.attackers.copy()
+        self.targets = snapshot.targets
+        if self.journal is not None:
+            self.start_journal()
+
+    def start_journal(self) -> Journal:
+        """
+        Starts recording the changes of the game, forgetting the actions recorded before if any.
+
+        Returns:
+            Journal: The new journal, shared by the players, their decks and their cards.
+        """
+        self.journal = Journal()
+        self.attach_journal(self.journal)
+        self.history = []
+        self.undone = []
+        return self.journal
+
+    def stop_journal(self) -> None:
+        """
+        Stops recording the changes of the game. The actions made so far cannot be taken back anymore.
+        """
+        self.attach_journal(None)
+        self.journal = None
+        self.history = []
+        self.undone = []
+
+    def attach_journal(self, journal: Journal | None) -> None:
+        """
+        Sets the journal of both players, their decks and all their cards.
+
+        Args:
+            journal (Journal | None): The journal, or None to stop recording.
+        """
+        for player in (self.logic.player_1, self.logic.player_2):
+            player.journal = journal
+            deck = player.deck
+            deck.journal = journal
+            for zone in (deck.cards, deck.hand, deck.board, deck.graveyard):
+                for card in zone:
+                    card.journal = journal
+
+    def make(self, action: Action) -> None:
+        """
+        Applies an action and records its changes, so that `unmake` can take it back.
+
+        Args:
+            action (Action): One of the actions returned by `legal_actions()`.
+
+        Raises:
+            ValueError: If the journal is not started, the game is over or the action does not belong to the current phase.
+        """
+        journal = self.journal
+        if journal is None:
+            raise ValueError("Cannot make an action, the journal is not started.")
+        mark = len(journal)
+        journal.record(self.rewind, self.current_player, self.opponent, self.turn, self.phase, self.played_card,
+                       self.played_hero_power, self.playable, self.attackers, self.targets)  # Lists are replaced, never modified
+        try:
+            self.play(action)
+        except Exception:
+            journal.undo(mark)  # Nothing of a refused action is kept
+            raise
+        self.history.append((action, mark))
+
+    def unmake(self) -> Action:
+        """
+        Takes back the last action made, restoring the game exactly as it was before it.
+
+        Returns:
+            Action: The action taken back.
+
+        Raises:
+            ValueError: If no action was made since the journal started.
+        """
+        if not self.history:
+            raise ValueError("Cannot take back an action, none was made since the journal started.")
+        action, mark = self.history.pop()
+        self.journal.undo(mark)
+        return action
+
+    def undo(self) -> Action:
+        """
+        Takes back the last action, which `redo` can play again.
+
+        Returns:
+            Action: The action taken back.
+
+        Raises:
+            ValueError: If no action was made since the journal started.
+        """
+        action = self.unmake()
+        self.undone.append(action)
+        return action
+
+    def redo(self) -> Action:
+        """
+        Plays again the last action taken back by `undo`.
+
+        Returns:
+            Action: The action played again.
+
+        Raises:
+            ValueError: If no action was taken back since the last new action.
+        """
+        if not self.undone:
+            raise ValueError("Cannot redo an action, none was taken back.")
+        action = self.undone.pop()
+        self.make(action)
+        return action
+
+    def rewind(self, current_player: Player, opponent: Player, turn: int, phase: TurnPhase, played_card: bool,
+               played_hero_power: bool, playable: list[int], attackers: list[int], targets: int) -> None:
+        """
+        Sets the turn state back to values recorded by the journal before an action.
+
+        Args:
+            current_player (Player): The player whose turn it was.
+            opponent (Player): The other player.
+            turn (int): The number of the turn.
+            phase (TurnPhase): The phase of the turn.
+            played_card (bool): Whether the current player had played a card this turn.
+            played_hero_power (bool): Whether the current player had used their hero power this turn.
+            playable (list[int]): The cards that could be played.
+            attackers (list[int]): The units that could attack.
+            targets (int): The number of targets on the opponent's side.
+        """
+        self.current_player, self.opponent = current_player, opponent
+        self.turn, self.phase = turn, phase
+        self.played_card, self.played_hero_power = played_card, played_hero_power
+        self.playable, self.attackers, self.targets = playable, attackers, targets
+
+    def zobrist_hash(self) -> int:
+        """
+        Returns the Zobrist hash of the game's state, equal for states reached by different action orders.
+        The zones of each deck are hashed incrementally by the deck, while the stats of the players and
+        of the units on the board, which change on every attack, are hashed here.
+
+        Returns:
+            int: The 64-bit hash of the state.
+        """
+        player_1, player_2 = self.logic.player_1, self.logic.player_2
+        value = player_1.deck.zone_hash ^ rotate(player_2.deck.zone_hash, 32)  # Rotated so that both decks can hold the same ids
+        for side, player in ((1, player_1), (2, player_2)):
+            value ^= (zobrist_key(side, "attack", player.attack) ^ zobrist_key(side, "health", player.health)
+                      ^ zobrist_key(side, "mana", player.mana) ^ zobrist_key(side, "armor", player.armor))
+            for card in player.deck.board:
+                value ^= zobrist_key(side, card.id, card.attack, card.health, card.armor)
+        value ^= zobrist_key("turn", self.turn, self.phase, self.current_player is player_1, self.played_card, self.played_hero_power)
+        return value
+
+    def is_terminal(self) -> bool:
+        """
+        Checks if the game is over, either because a player died or because the turn limit was reached.
+
+        Returns:
+            bool: True if no more actions can be applied.
+        """
+        if self.logic.check_game_over():
+            return True
+        return self.turn_limit is not None and self.turn > self.turn_limit
+
+    def winner(self) -> Player | None:
+        """
+        Returns the winner of the game.
+
+        Returns:
+            Player | None: The winning player, or None if the game is not over or ended in a draw.
+        """
+        if not self.logic.check_game_over():
+            return None
+        return self.logic.get_winner()
+
+    def start_turn(self) -> None:
+        """
+        Starts the turn of the current player: adds mana, draws a card and enters the first phase where they can act.
+        """
+        self.turn += 1
+        if self.is_terminal():  # The turn limit has been reached
+            return
+
+        self.played_card = False
+        self.played_hero_power = False
+        self.add_mana(self.current_player)
+        self.draw_card(self.current_player)
+        self.enter_phase(0)
+
+    def end_turn(self) -> None:
+        """
+        Ends the turn of the current player and starts the opponent's turn.
+        """
+        self.current_player, self.opponent = self.opponent, self.current_player
+        self.start_turn()
+
+    def enter_phase(self, phase_index: int) -> None:
+        """
+        Enters the first phase, starting at `phase_index` in PHASE_ORDER, where the current player can act.
+        Ends the turn if no such phase remains.
+
+        Args:
+            phase_index (int): Index in PHASE_ORDER of the first phase to consider.
+        """
+        while phase_index < len(PHASE_ORDER):
+            self.phase = PHASE_ORDER[phase_index]
+            if self.can_act():
+                return
+            phase_index += 1
+        self.end_turn()
+
+    def can_act(self) -> bool:
+        """
+        Updates the moves of the current phase and checks if the current player has at least one action other than passing.
+
+        Returns:
+            bool: True if the current phase offers a choice to the current player.
+        """
+        player = self.current_player
+        if self.phase == TurnPhase.PLAY_CARD:
+            if len(player.deck.board) >= BOARD_LIMIT:
+                self.playable = []
+            else:
+                mana = player.mana
+                self.playable = [index for index, card in enumerate(player.deck.hand) if card.cost <= mana]
+            return bool(self.playable)
+        if self.phase == TurnPhase.HERO_POWER:
+            return player.mana >= HERO_POWER_COST
+        self.targets = len(self.opponent.deck.board) + 1
+        if self.phase == TurnPhase.ATTACK:
+            self.attackers = [] if self.played_card else [index for index, card in enumerate(player.deck.board) if card.attack > 0]
+            return bool(self.attackers)
+        return not self.played_hero_power and player.attack > 0
+
+    def refresh_moves(self) -> None:
+        """
+        Recomputes the moves of the current phase, after the players were modified outside of the engine.
+        """
+        if not self.is_terminal():
+            self.can_act()
+
+    def iter_legal_actions(self) -> Iterator[Action]:
+        """
+        Iterates over the actions the current player can take in the current phase, without building any list or action.
+
+        Yields:
+            Action: The legal actions, always ending with the PASS action (none if the game is over).
+        """
+        if self.is_terminal():
+            return
+
+        if self.phase == TurnPhase.PLAY_CARD:
+            hand = self.current_player.deck.hand
+            spell_targets = len(self.current_player.deck.board) + 1  # Own hero and units already on the board
+            for index in self.playable:
+                actions = PLAY_CARD_ACTIONS[index]
+                if isinstance(hand[index], Spell):
+                    for target in range(spell_targets):
+                        yield actions[target]
+                else:
+                    yield actions[0]
+        elif self.phase == TurnPhase.HERO_POWER:
+            yield USE_HERO_POWER_ACTION
+        elif self.phase == TurnPhase.ATTACK:
+            targets = self.targets
+            for index in self.attackers:
+                actions = ATTACK_ACTIONS[index]
+                for target in range(targets):
+                    yield actions[target]
+        else:
+            for target in range(self.targets):
+                yield HERO_ATTACK_ACTIONS[target]
+        yield PASS_ACTION
+
+    def legal_actions(self) -> list[Action]:
+        """
+        Lists the actions the current player can take in the current phase.
+
+        Returns:
+            list[Action]: The legal actions, always ending with the PASS action (empty if the game is over).
+        """
+        return list(self.iter_legal_actions())
+
+    def apply(self, action: Action) -> None:
+        """
+        Applies an action of the current player and moves the game forward.
+        When the journal is started, the action can be taken back with `undo`, and the actions undone before are forgotten.
+
+        Args:
+            action (Action): One of the actions returned by `legal_actions()`.
+
+        Raises:
+            ValueError: If the game is over or the action does not belong to the current phase.
+        """
+        if self.journal is None:
+            self.play(action)
+            return
+        self.make(action)
+        self.undone.clear()  # A new action replaces the ones taken back
+
+    def play(self, action: Action) -> None:
+        """
+        Applies an action of the current player and moves the game forward, without any bookkeeping of the journal's history.
+
+        Args:
+            action (Action): One of the actions returned by `legal_actions()`.
+
+        Raises:
+            ValueError: If the game is over or the action does not belong to the current phase.
+        """
+        if self.is_terminal():
+            raise ValueError("Cannot apply an action, the game is over.")
+
+        action_type = action.action_type
+        phase_index = PHASE_ORDER.index(self.phase)
+        if action_type == ActionType.PASS:
+            self.enter_phase(phase_index + 1)
+            return
+
+        if self.phase == TurnPhase.PLAY_CARD and action_type == ActionType.PLAY_CARD:
+            self.play_card(action.source, action.target)
+            next_phase_index = phase_index + 1  # A single card can be played per turn
+        elif self.phase == TurnPhase.HERO_POWER and action_type == ActionType.USE_HERO_POWER:
+            self.use_hero_power()
+            next_phase_index = phase_index + 1
+        elif self.phase == TurnPhase.ATTACK and action_type == ActionType.ATTACK:
+            self.attack(action.source, action.target)
+            if self.attackers and not self.logic.check_game_over():
+                return  # Other units can still attack, their moves were updated by the attack
+            next_phase_index = phase_index + 1
+        elif self.phase == TurnPhase.HERO_ATTACK and action_type == ActionType.HERO_ATTACK:
+            self.hero_attack(action.target)
+            next_phase_index = phase_index + 1
+        else:
+            raise ValueError(f"Invalid action {action_type} during the {self.phase} phase.")
+
+        if not self.logic.check_game_over():
+            self.enter_phase(next_phase_index)
+
+    def add_mana(self, player: Player) -> None:
+        """
+        Increase the player's mana by 1 if it is below the maximum limit.
+
+        Args:
+            player (Player): The player whose mana will be increased.
+        """
+        if player.mana < HERO_MAXIMUM_MANA:
+            player.mana += 1
+
+    def draw_card(self, player: Player) -> None:
+        """
+        Draw a card from the player's deck if they have space in their hand.
+
+        Args:
+            player (Player): The player drawing a card.
+        """
+        if len(player.deck.hand) < HAND_LIMIT and player.deck.remaining >= 1:
+            player.deck.draw()
+
+    def play_card(self, hand_index: int, target_index: int = HERO_TARGET) -> None:
+        """
+        Plays a card from the current player's hand. A spell is applied to its target and then moved to the graveyard.
+
+        Args:
+            hand_index (int): Index of the card in the hand.
+            target_index (int): Index of the targeted unit on the player's board, or HERO_TARGET for the player.
+
+        Raises:
+            ValueError: If the player does not have enough mana or the board is full.
+        """
+        player = self.current_player
+        card = player.deck.hand[hand_index]
+        if card.cost > player.mana:
+            raise ValueError(f"Not enough mana to play {card.name}. Requires {card.cost} mana, but you have {player.mana}.")
+
+        target = player if target_index == HERO_TARGET else player.deck.board[target_index]  # Resolve before the spell joins the board
+        player.mana -= card.cost
+        player.deck.play_card(card)
+        if isinstance(card, Spell):
+            target.apply_effects(card)
+            player.deck.move_to_graveyard(card)
+        self.played_card = True
+
+    def use_hero_power(self) -> None:
+        """
+        Uses the current player's hero power, increasing their attack in exchange for mana.
+
+        Raises:
+            ValueError: If the player does not have enough mana.
+        """
+        player = self.current_player
+        if player.mana < HERO_POWER_COST:
+            raise ValueError(f"Not enough mana to use the hero power. Requires {HERO_POWER_COST} mana, but you have {player.mana}.")
+        player.attack += HERO_POWER_ATTACK
+        player.mana -= HERO_POWER_COST
+        self.played_hero_power = True
+
+    def attack(self, board_index: int, target_index: int = HERO_TARGET) -> None:
+        """
+        Attacks the opponent or one of their units with a unit of the current player's board.
+        The attacking unit is moved to the graveyard, and so is the target if it dies.
+
+        Args:
+            board_index (int): Index of the attacking unit on the player's board.
+            target_index (int): Index of the targeted unit on the opponent's board, or HERO_TARGET for the opponent.
+        """
+        attacker = self.current_player.deck.board[board_index]
+        target = self.opponent if target_index == HERO_TARGET else self.opponent.deck.board[target_index]
+        attacker.attack_player_or_unit(target)
+        self.current_player.deck.move_to_graveyard(attacker)
+        if target is not self.opponent and target.health <= 0:
+            self.opponent.deck.move_to_graveyard(target)
+            self.targets -= 1
+
+        # The attacker left the board: the units after it move down by one
+        self.attackers = [index - (index > board_index) for index in self.attackers if index != board_index]
+
+    def hero_attack(self, target_index: int = HERO_TARGET) -> None:
+        """
+        Attacks the opponent or one of their units with the current player's hero, then resets the hero's attack.
+
+        Args:
+            target_index (int): Index of the targeted unit on the opponent's board, or HERO_TARGET for the opponent.
+        """
+        player = self.current_player
+        target = self.opponent if target_index == HERO_TARGET else self.opponent.deck.board[target_index]
+        player.attack_player_or_unit(target)
+        if target is not self.opponent and target.health <= 0:
+            self.opponent.deck.move_to_graveyard(target)
+        player.attack = 0
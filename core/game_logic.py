@@ -18,13 +18,14 @@ class GameLogic:
     player and board state management, and printing of the game's visual elements.
     """
 
-    def __init__(self, player_1: Player, player_2: Player = None):
+    def __init__(self, player_1: Player, player_2: Player = None, rng: random.Random = None):
         """
         Initializes the game logic with two players.
 
         Args:
             player_1 (Player): The first player.
             player_2 (Player, optional): The second player. Defaults to None.
+            rng (random.Random, optional): The generator choosing who starts. Defaults to None, for a new unseeded generator.
         """
         if not isinstance(player_1, Player):
             raise TypeError(f"Expected 'player_1' to be a Player, got {type(player_1).__name__}")
@@ -33,6 +34,7 @@ class GameLogic:
         if player_2 is not None and not isinstance(player_2, Player):
             raise TypeError(f"Expected 'player_2' to be a Player or None, got {type(player_2).__name__}")
         self.player_2: Player | None = player_2
+        self.rng = rng if rng is not None else random.Random()
 
     def choose_who_starts(self) -> tuple[Player, Player]:
         """
@@ -45,7 +47,7 @@ class GameLogic:
         if self.player_2 is None:
             return self.player_1, None
         # Randomly selects which player will go first
-        return (self.player_1, self.player_2) if random.choice([True, False]) else (self.player_2, self.player_1)
+        return (self.player_1, self.player_2) if self.rng.choice([True, False]) else (self.player_2, self.player_1)
     
     def check_game_over(self) -> bool:
         """
@@ -130,7 +132,7 @@ class GameLogic:
         )
 
         deck_panel = Panel(
-            Text(f"{len(player.deck.cards)} cards", style="bold magenta"),
+            Text(f"{player.deck.remaining} cards", style="bold magenta"),
             title="Deck",
             border_style="magenta",
             expand=False
@@ -1,37 +1,57 @@
 #!/usr/bin/python3
 
 # Imports
+from typing import Sequence
 from tinydb import TinyDB
-import json
 import os
+import time
 from rich.panel import Panel
-from tinydb import TinyDB
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table
 
 # Core Imports
 from core.game_logic import GameLogic
+from core.game_engine import (
+     GameEngine,
+     Action,
+     PASS_ACTION,
+     USE_HERO_POWER_ACTION,
+     PLAY_CARD_ACTIONS,
+     ATTACK_ACTIONS,
+     HERO_ATTACK_ACTIONS
+)
+from core.binary_catalog import BinaryCatalog
+from core.match_history import MatchHistory, MatchRecord
+from core.replay_log import GameRecorder, ReplayWriter
 
 # Modules Imports
 from modules.player_mod import Player
-from modules.unit_mod import Unit
 from modules.spell_mod import Spell
 
 # Utils Imports
 from utils.constants import (
-     DATABASE_PATH,
+     CATALOG_PATH,
+     MCTS_WORKERS,
      HEROES_DB_PATH,
      HEROES_TABLE_NAME,
      SPELLS_TABLE_NAME,
      SPELLS_DB_PATH,
      UNITS_DB_PATH,
-     UNITS_TABLE_NAME,
-     HERO_MAXIMUM_MANA,
-     HAND_LIMIT,
-     BOARD_LIMIT
+     UNITS_TABLE_NAME
 )
 from utils.database_utils import Database
+from utils.manifest_utils import DatabaseManifest
+from utils.sqlite_utils import SQLiteDatabase
+from utils.rng_utils import GameRandom, derive_seed
+
+# Enum Imports
+from enums.action_type_enum import ActionType
+from enums.turn_phase_enum import TurnPhase
+
+# AI Imports
+from ai.mcts_ai import MCTSAI
+from ai.trade_optimizer import TradeOptimizer
 
 # Interfaces Imports
 from interfaces.player_choice_interface import PlayerChoiceInterface
@@ -51,33 +71,51 @@ class Game:
         self.console = Console()  # Create an instance of Console to display messages in the terminal.
 
         # Initialize the database with the provided path and setup the tables for heroes, spells, and units.
-        self.hearthstone_db = Database.initialize_database(DATABASE_PATH)
-        self.init_database(self.hearthstone_db, HEROES_TABLE_NAME, HEROES_DB_PATH)
-        self.init_database(self.hearthstone_db, SPELLS_TABLE_NAME, SPELLS_DB_PATH)
-        self.init_database(self.hearthstone_db, UNITS_TABLE_NAME, UNITS_DB_PATH)
-    
-        # Set up the interface for player choices and initialize both players.
-        interface = PlayerChoiceInterface(self.hearthstone_db)
-        player_1, player_2 = interface.setup_players()
-        self.logic = GameLogic(player_1, player_2)  # Initialize game logic with two players.
-        self.start()  # Start the game loop.
-
-    def init_database(self, hearthstone_db: TinyDB, table_name: str, table_path: str) -> None:
+        # The database uses the configured backend, a TinyDB file read once and written in batches by default.
+        self.hearthstone_db = Database.open_database()
+        try:
+            self.init_database(self.hearthstone_db, HEROES_TABLE_NAME, HEROES_DB_PATH)
+            self.init_database(self.hearthstone_db, SPELLS_TABLE_NAME, SPELLS_DB_PATH)
+            self.init_database(self.hearthstone_db, UNITS_TABLE_NAME, UNITS_DB_PATH)
+            Database.flush(self.hearthstone_db)
+
+            # Load the card catalog from its compiled binary file, rebuilt if the data files changed.
+            self.catalog = BinaryCatalog.load_or_build(CATALOG_PATH)
+
+            # Draw every random choice of the game, from the setup on, from streams whose seed replays it.
+            self.rng = GameRandom()
+
+            # Set up the interface for player choices and initialize both players.
+            interface = PlayerChoiceInterface(self.hearthstone_db, self.catalog, self.rng)
+            player_1, player_2 = interface.setup_players()
+            Database.flush(self.hearthstone_db)  # Write the decks saved during the setup.
+            self.logic = GameLogic(player_1, player_2)  # Initialize game logic with two players.
+
+            # In the PVAI mode, the second player is controlled by the MCTS bot.
+            self.ai_player = player_2 if interface.game_mode == "PVAI" else None
+            self.bot = MCTSAI(seed=derive_seed(self.rng.seed, "bot", 2), workers=MCTS_WORKERS) if self.ai_player is not None else None
+            self.trades = TradeOptimizer()  # Suggests the attacks of the human players.
+            self.start()  # Start the game loop.
+        finally:
+            self.hearthstone_db.close()  # Write the pending changes, however the game ends.
+
+    def init_database(self, hearthstone_db: TinyDB | SQLiteDatabase, table_name: str, table_path: str) -> None:
         """
-        Initializes a database table by loading data from a JSON file.
+        Initializes a database table by loading data from a JSON file, read incrementally.
+        The table is left untouched if the file did not change since the table was last seeded.
         
         Args:
-            hearthstone_db (TinyDB): The TinyDB instance where the table resides.
+            hearthstone_db (TinyDB | SQLiteDatabase): The database instance where the table resides.
             table_name (str): The name of the table to initialize.
             table_path (str): The path to the JSON file containing the data.
         
         Raises:
             TypeError: If the database or table name is not the expected type.
-            ValueError: If the table path does not exist.
+            ValueError: If the table path does not exist or the file does not group rows by class.
         """
         # Check for the correct types of inputs.
-        if not isinstance(hearthstone_db, TinyDB):
-            raise TypeError(f"Expected 'hearthstone_db' to be a TinyDB, got {type(hearthstone_db).__name__}")
+        if not isinstance(hearthstone_db, (TinyDB, SQLiteDatabase)):
+            raise TypeError(f"Expected 'hearthstone_db' to be a TinyDB or a SQLiteDatabase, got {type(hearthstone_db).__name__}")
         if not isinstance(table_name, str):
             raise TypeError(f"Expected 'table_name' to be a string, got {type(table_name).__name__}")
         if isinstance(table_path, str):
@@ -86,49 +124,64 @@ class Game:
         else:
             raise TypeError(f"Expected 'table_path' to be a string, got {type(table_path).__name__}")
         
-        # Load the data from the JSON file.
-        with open(table_path, "r") as file:
-            table_data = json.load(file)
+        # Skip the table if it was already seeded from the current content of the file.
+        manifest = DatabaseManifest(hearthstone_db)
+        if manifest.is_up_to_date(table_name, table_path) and len(Database.initialize_table(hearthstone_db, table_name)):
+            return
 
-        # If the table exists, clear it and insert the new data; otherwise, just insert the data.
-        if Database.fetch_all_from_table(hearthstone_db, table_name):
+        # If the table exists, clear it, then stream the data of the JSON file into it by batches.
+        if len(Database.initialize_table(hearthstone_db, table_name)):
             Database.clear_table(hearthstone_db, table_name)
-            Database.insert_data_to_table(hearthstone_db, table_name, table_data)
-        else:
-            Database.insert_data_to_table(hearthstone_db, table_name, table_data)
+        Database.insert_file_to_table(hearthstone_db, table_name, table_path)
+        manifest.record(table_name, table_path)  # Remember which file version the table holds.
 
     def start(self) -> Player:
         """
         Starts the game loop where players alternate turns until the game ends.
-        The game alternates between players, checking for game over conditions after each turn.
+        The rules are applied by the headless engine, this loop only asks the players for their decisions.
         Once the game ends, the winner is displayed.
         """
-        turn_order = self.logic.choose_who_starts()  # Choose who starts the game.
-        
-        # Continue the game until there is a winner.
-        while not self.logic.check_game_over():
-            self.play_turn(turn_order[0], turn_order[1])  # Player 1's turn.
-
-            if self.logic.check_game_over():
-                break
+        self.engine = GameEngine(self.logic.player_1, self.logic.player_2, rng=self.rng)  # Choose who starts the game.
+        self.recorder = GameRecorder(self.engine)  # Records every action for the replay log.
+        self.started = time.time()  # Saved with the result of the game.
 
-            self.play_turn(turn_order[1], turn_order[0])  # Player 2's turn.
+        # Continue the game until there is a winner.
+        while not self.engine.is_terminal():
+            self.play_turn(self.engine.current_player, self.engine.opponent)
 
-            if self.logic.check_game_over():
-                break
+        # Stop the bot's worker processes, if any.
+        if self.bot is not None:
+            self.bot.close()
 
         # Once the game is over, display the winner.
         self.console.clear()
-        winner = self.logic.get_winner()
+        winner = self.engine.winner()
         self.stop(winner)
+        return winner
 
     def stop(self, winner: Player) -> None:
         """
-        Ends the game and displays the winner.
+        Ends the game, saves its result in the match history, appends its replay to the replay log and displays the winner.
         """
+        with MatchHistory() as history:
+            history.append(MatchRecord.from_engine(self.engine, time.time() - self.started))
+        with ReplayWriter() as writer:
+            writer.write(self.recorder)
         self.console.clear()
         self.console.print(self.logic.print_winner(winner))  # Print the winner's message.
 
+    def apply(self, action: Action) -> None:
+        """
+        Applies an action to the game and records it in the game's replay.
+
+        Args:
+            action (Action): One of the engine's legal actions.
+
+        Raises:
+            ValueError: If the engine refuses the action.
+        """
+        self.recorder.apply(action)
+
     def print_game(self, player: Player) -> None:
         """
         Prints the current game state including player stats, hand, board, and the active player's turn.
@@ -154,9 +207,11 @@ class Game:
         self.console.print()  # Add a blank line.
         self.console.print(Panel(f"[bold cyan]{player.name}'s turn[/bold cyan]", border_style="yellow", expand=False))
 
+
     def play_turn(self, player: Player, opponent: Player) -> None:
         """
-        Executes the actions for one player's turn, including drawing cards, playing units/spells, using hero power, and attacking.
+        Executes the actions for one player's turn, including playing units/spells, using hero power, and attacking.
+        Mana and card draw are handled by the engine when the turn starts.
         
         Args:
             player (Player): The player whose turn it is.
@@ -164,42 +219,60 @@ class Game:
         """
         self.console.clear()  # Clear the console for the new turn.
 
-        self.add_mana(player)  # Add mana for the player.
-        self.draw_card(player)  # Draw a card for the player.
-        played_card: bool = self.play_cards(player)  # Prompt player to play a card if possible.
-        played_hero_power: bool = self.ask_hero_power(player)  # Ask if the player wants to use hero power.
-
-        if not played_card:
-            self.use_cards(player, opponent)  # Use the cards on the board if no card was played.
-
-        if not played_hero_power:
-            self.use_hero_power(player, opponent)  # Use hero power if it hasn't been used yet.
+        # Let the bot play the turn of the AI player.
+        if player is self.ai_player:
+            self.play_ai_turn(player)
+            return
+
+        # Ask the player for a decision until the engine moves on to the opponent's turn.
+        while not self.engine.is_terminal() and self.engine.current_player is player:
+            if self.engine.phase == TurnPhase.PLAY_CARD:
+                self.play_cards(player)  # Prompt player to play a card if possible.
+            elif self.engine.phase == TurnPhase.HERO_POWER:
+                self.ask_hero_power(player)  # Ask if the player wants to use hero power.
+            elif self.engine.phase == TurnPhase.ATTACK:
+                self.use_cards(player, opponent)  # Use the cards on the board if no card was played.
+            else:
+                self.use_hero_power(player, opponent)  # Use hero power if it hasn't been used yet.
 
-    def add_mana(self, player: Player) -> None:
+    def play_ai_turn(self, player: Player) -> None:
         """
-        Increase the player's mana by 1 if it is below the maximum limit.
-        
+        Plays the turn of the AI player, showing each action chosen by the bot.
+
         Args:
-            player (Player): The player whose mana will be increased.
+            player (Player): The player controlled by the bot.
         """
-        try:
-            if player.mana < HERO_MAXIMUM_MANA:  # Check if mana is less than the maximum allowed.
-                player.mana += 1  # Increase the player's mana by 1.
-        except ValueError:
-            raise
+        while not self.engine.is_terminal() and self.engine.current_player is player:
+            self.print_game(player)  # Display the game state.
+            action = self.bot.choose_action(self.engine)
+            if action.action_type != ActionType.PASS:
+                self.console.print(f"[yellow]{player.name} chooses: {self.describe_action(action)}[/yellow]")
+                time.sleep(1)  # Pause so that the action can be read.
+            self.apply(action)
 
-    def draw_card(self, player: Player) -> None:
+    def describe_action(self, action: Action) -> str:
         """
-        Draw a card from the player's deck if they have space in their hand.
-        
+        Describes an action of the current player in words.
+
         Args:
-            player (Player): The player drawing a card.
+            action (Action): One of the engine's legal actions.
+
+        Returns:
+            str: The description of the action.
         """
-        try:
-            if len(player.deck.hand) < HAND_LIMIT and len(player.deck.cards) >= 1:  # Check hand space.
-                player.deck.draw()  # Draw a card from the deck.
-        except ValueError:
-            raise
+        player, opponent = self.engine.current_player, self.engine.opponent
+        if action.action_type == ActionType.PLAY_CARD:
+            card = player.deck.hand[action.source]
+            if not isinstance(card, Spell):
+                return f"play {card.name}"
+            target = player.name if action.target < 0 else player.deck.board[action.target].name
+            return f"cast {card.name} on {target}"
+        if action.action_type == ActionType.USE_HERO_POWER:
+            return "use the hero power"
+        target = opponent.name if action.target < 0 else opponent.deck.board[action.target].name
+        if action.action_type == ActionType.ATTACK:
+            return f"attack {target} with {player.deck.board[action.source].name}"
+        return f"attack {target} with {player.hero.name}"
 
     def play_cards(self, player: Player) -> bool:
         """
@@ -212,71 +285,50 @@ class Game:
         Returns:
             bool: True if a card was successfully played, False otherwise.
         """
-        try:
-            self.print_game(player)  # Display the game state.
-            
-            playable_cards = [card for card in player.deck.hand if card.cost <= player.mana]  # Filter playable cards.
-            if not playable_cards or len(player.deck.board) == BOARD_LIMIT:  # No playable cards or board limit reached.
-                return False
-
-            # Display the playable cards in a table format.
-            playable_card_table = Table(title="\n[bold cyan]Playable cards[/bold cyan]")
-            playable_card_table.add_column("Index", justify="center", style="magenta", no_wrap=True)
-            playable_card_table.add_column("Name", justify="left", style="yellow")
-
-            for i, card in enumerate(playable_cards):
-                playable_card_table.add_row(str(i + 1), card.name)
-            self.console.print(playable_card_table)
-
-            card_choices = ["0"] + [str(i + 1) for i in range(len(playable_cards))]  # Choices for card selection.
-            card_choice = Prompt.ask("[yellow]Enter the number of the playing card (or '0' to skip): [/yellow]", choices=card_choices, default="0")
-
-            if card_choice == '0':  # If the player skips.
-                return False
-
-            try:
-                index = int(card_choice) - 1
-                card_to_play = playable_cards[index]
-
-                if isinstance(card_to_play, Unit):  # If the card is a unit, reduce mana and play the card.
-                    player.mana -= card_to_play.cost
-                    player.deck.play_card(card_to_play)
-                    return True
-                elif isinstance(card_to_play, Spell):  # If the card is a spell, reduce mana and play the card.
-                    player.mana -= card_to_play.cost
-                    player.deck.play_card(card_to_play)
-                    
-                    # Display choosable cards (those to apply the spell effect to).
-                    choosable_card_table = Table(title="\n[bold cyan]Choosable cards[/bold cyan]")
-                    choosable_card_table.add_column("Index", justify="center", style="magenta", no_wrap=True)
-                    choosable_card_table.add_column("Name", justify="left", style="yellow")
-                    choosable_card_table.add_column("Attack", justify="left", style="red")
-                    choosable_card_table.add_column("Health", justify="left", style="green")
-                    choosable_card_table.add_column("Armor", justify="left", style="white")
-
-                    choosable_card_table.add_row(str(0), player.name, str(player.attack), str(player.health), str(player.armor))
-                    for i, card in enumerate(list(filter(lambda card: card != card_to_play, player.deck.board))):
-                        choosable_card_table.add_row(str(i + 1), card.name, str(card.attack), str(card.health), str(card.armor))
-                    self.console.print(choosable_card_table)
-
-                    card_choices = ["0"] + [str(i + 1) for i in range(len(list(filter(lambda card: card != card_to_play, player.deck.board))))]  # Choices for choosing a card.
-                    card_choice = Prompt.ask("[yellow]Enter the number of the playing card: [/yellow]", choices=card_choices, default="0")
-
-                    if card_choice == '0':
-                        selected_card = player
-                    else:
-                        index = int(card_choice) - 1
-                        selected_card = player.deck.board[index]
-                    try:
-                        selected_card.apply_effects(card_to_play)  # Apply the spell effects.
-                        player.deck.move_to_graveyard(card_to_play)  # Move the played card to the graveyard.
-                        return True
-                    except Exception as e:
-                        raise
-            except ValueError:
-                raise
-        except ValueError:
-            raise
+        self.print_game(player)  # Display the game state.
+
+        # The engine keeps the hand indices of the cards the player can afford.
+        playable_cards = [player.deck.hand[hand_index] for hand_index in self.engine.playable]
+
+        # Display the playable cards in a table format.
+        playable_card_table = Table(title="\n[bold cyan]Playable cards[/bold cyan]")
+        playable_card_table.add_column("Index", justify="center", style="magenta", no_wrap=True)
+        playable_card_table.add_column("Name", justify="left", style="yellow")
+
+        for i, card in enumerate(playable_cards):
+            playable_card_table.add_row(str(i + 1), card.name)
+        self.console.print(playable_card_table)
+
+        card_choices = ["0"] + [str(i + 1) for i in range(len(playable_cards))]  # Choices for card selection.
+        card_choice = Prompt.ask("[yellow]Enter the number of the playing card (or '0' to skip): [/yellow]", choices=card_choices, default="0")
+
+        if card_choice == '0':  # If the player skips.
+            self.apply(PASS_ACTION)
+            return False
+
+        actions = PLAY_CARD_ACTIONS[self.engine.playable[int(card_choice) - 1]]
+        card_to_play = playable_cards[int(card_choice) - 1]
+
+        if isinstance(card_to_play, Spell):
+            # Display choosable cards (those to apply the spell effect to).
+            choosable_card_table = Table(title="\n[bold cyan]Choosable cards[/bold cyan]")
+            choosable_card_table.add_column("Index", justify="center", style="magenta", no_wrap=True)
+            choosable_card_table.add_column("Name", justify="left", style="yellow")
+            choosable_card_table.add_column("Attack", justify="left", style="red")
+            choosable_card_table.add_column("Health", justify="left", style="green")
+            choosable_card_table.add_column("Armor", justify="left", style="white")
+
+            choosable_card_table.add_row(str(0), player.name, str(player.attack), str(player.health), str(player.armor))
+            for i, card in enumerate(player.deck.board):
+                choosable_card_table.add_row(str(i + 1), card.name, str(card.attack), str(card.health), str(card.armor))
+            self.console.print(choosable_card_table)
+
+            card_choices = [str(i) for i in range(len(player.deck.board) + 1)]  # Choices for choosing a card.
+            card_choice = Prompt.ask("[yellow]Enter the number of the playing card: [/yellow]", choices=card_choices, default="0")
+            self.apply(actions[int(card_choice)])  # Apply the spell effects.
+        else:
+            self.apply(actions[0])  # Reduce mana and play the unit.
+        return True
 
     def ask_hero_power(self, player: Player) -> bool:
         """
@@ -286,221 +338,122 @@ class Game:
             player (Player): The player considering using their hero power.
 
         Returns:
-            None
+            bool: True if the hero power was used, False otherwise.
         """
-        try:
-            # Check if the player has enough mana (4 or more)
-            if player.mana >= 4:
-                # Display the current game state
-                self.print_game(player)
-
-                # Define the possible choices (yes/no)
-                answer_choices = ["o", "n"]
-                
-                # Ask the player if they want to use their hero power
-                answer_choice = Prompt.ask(f"[yellow]Do you want to use {player.hero.name}'s hero power? [/yellow]", choices=answer_choices, default="n")
-
-                # If the player answers 'yes'
-                if answer_choice == "o":
-                    try:
-                        # Increase the player's attack by 2 and decrease their mana by 4
-                        player.attack += 2
-                        player.mana -= 4
-                        
-                        # Print the updated game state
-                        self.print_game(player)
-                        
-                        # Return True indicating the hero power was used
-                        return True
-                    except Exception as e:
-                        # Raise any exception that occurs (should handle specific exceptions in production)
-                        raise
-                else:
-                    # If the player answers 'no', return False
-                    return False
-            else:
-                # If the player doesn't have enough mana, return False
-                return False
-        except ValueError:
-            # Catch any value errors that occur and raise them
-            raise
+        # Display the current game state
+        self.print_game(player)
+
+        # Ask the player if they want to use their hero power
+        answer_choice = Prompt.ask(f"[yellow]Do you want to use {player.hero.name}'s hero power? [/yellow]", choices=["o", "n"], default="n")
+
+        # If the player answers 'no', skip the hero power
+        if answer_choice != "o":
+            self.apply(PASS_ACTION)
+            return False
+
+        # Increase the player's attack and decrease their mana
+        self.apply(USE_HERO_POWER_ACTION)
+        self.print_game(player)
+        return True
 
     def use_cards(self, player: Player, opponent: Player) -> None:
         """
-        Prompts the player to use their hero power if they have enough mana.
+        Prompts the player to attack with the units on their board until they decide to stop.
 
         Args:
-            player (Player): The player considering using their hero power.
-
-        Returns:
-            bool: True if the hero power was used, False otherwise.
+            player (Player): The player whose units attack.
+            opponent (Player): The opponent who may be attacked.
         """
-        try:
-            # Continuously prompt the player until they decide to stop
-            while True:
-                # Print the current game state
-                self.print_game(player)
-                
-                # If the player has no cards on their board, break the loop
-                if not player.deck.board:
-                    break
-
-                # Prepare a table displaying the player's cards
-                choosable_card_table = Table(title="\n[bold cyan]Choosable cards[/bold cyan]")
-                choosable_card_table.add_column("Index", justify="center", style="magenta", no_wrap=True)
-                choosable_card_table.add_column("Name", justify="left", style="yellow")
-                choosable_card_table.add_column("Attack", justify="left", style="red")
-                choosable_card_table.add_column("Health", justify="left", style="green")
-
-                # Add each card from the player's board to the table
-                for i, card in enumerate(player.deck.board):
-                    choosable_card_table.add_row(str(i + 1), card.name, str(card.attack), str(card.health))
-                
-                # Display the table
-                self.console.print(choosable_card_table)
-
-                # Define possible choices for the player (select card or skip)
-                card_choices = ["0"] + [str(i + 1) for i in range(len(player.deck.board))]
-                
-                # Ask the player which card they want to play
-                card_choice = Prompt.ask("[yellow]Enter the number of the playing card (or '0' to skip): [/yellow]", choices=card_choices, default="0")
-
-                # If the player chooses to skip, break the loop
-                if card_choice == '0':
-                    break
-
-                try:
-                    # Convert the player's choice into an integer index
-                    index = int(card_choice) - 1
-                    attacker = player.deck.board[index]
-
-                    # Prepare a table displaying the opponent's targetable cards
-                    targetable_card_table = Table(title="\n[bold cyan]Targetable cards[/bold cyan]")
-                    targetable_card_table.add_column("Index", justify="center", style="magenta", no_wrap=True)
-                    targetable_card_table.add_column("Name", justify="left", style="yellow")
-                    targetable_card_table.add_column("Health", justify="left", style="green")
-
-                    # Add the opponent's name and health to the table
-                    targetable_card_table.add_row(str(0), opponent.name, str(opponent.health))
-                    
-                    # Add the opponent's cards to the table
-                    for i, card in enumerate(opponent.deck.board):
-                        targetable_card_table.add_row(str(i + 1), card.name, str(card.health))
-                    
-                    # Display the table
-                    self.console.print(targetable_card_table)
-
-                    # Define possible choices for the target (select target or skip)
-                    card_choices = ["0"] + [str(i + 1) for i in range(len(opponent.deck.board))]
-                    
-                    # Ask the player which target they want to attack
-                    card_choice = Prompt.ask("[yellow]Enter the target card number: [/yellow]", choices=card_choices, default="0")
-
-                    try:
-                        # Convert the player's choice into an integer index for the target
-                        target_index = int(card_choice) - 1
-                        
-                        # If the player chooses to attack the opponent directly
-                        if target_index == -1:
-                            target = opponent
-                            attacker.attack_player_or_unit(target)
-                            player.deck.move_to_graveyard(attacker)
-                        
-                        # If the player chooses to attack a specific card of the opponent
-                        elif 0 <= target_index < len(opponent.deck.board):
-                            target = opponent.deck.board[target_index]
-                            attacker.attack_player_or_unit(target)
-                            player.deck.move_to_graveyard(attacker)
-                            
-                            # If the target card is dead, move it to the graveyard
-                            if target.health <= 0:
-                                opponent.deck.move_to_graveyard(target)
-                        
-                        # Print the updated game state
-                        self.print_game(player)
-                    except ValueError:
-                        # If there's an error with the player's input, raise the error
-                        raise
-                except ValueError:
-                    # If there's an error with the player's card selection, raise the error
-                    raise
-        except ValueError:
-            # Catch any value errors that occur and raise them
-            raise
+        # Continuously prompt the player until they decide to stop or no unit can attack anymore
+        while not self.engine.is_terminal() and self.engine.current_player is player and self.engine.phase == TurnPhase.ATTACK:
+            # Print the current game state
+            self.print_game(player)
+
+            # The engine keeps the board indices of the units that can still attack
+            attackers = [player.deck.board[board_index] for board_index in self.engine.attackers]
+
+            # Prepare a table displaying the player's cards
+            choosable_card_table = Table(title="\n[bold cyan]Choosable cards[/bold cyan]")
+            choosable_card_table.add_column("Index", justify="center", style="magenta", no_wrap=True)
+            choosable_card_table.add_column("Name", justify="left", style="yellow")
+            choosable_card_table.add_column("Attack", justify="left", style="red")
+            choosable_card_table.add_column("Health", justify="left", style="green")
+
+            # Add each card able to attack to the table
+            for i, card in enumerate(attackers):
+                choosable_card_table.add_row(str(i + 1), card.name, str(card.attack), str(card.health))
+            self.console.print(choosable_card_table)
+
+            # Suggest the next attack of the best trades (they are computed again after each attack)
+            suggestion = self.trades.suggest(self.engine)
+            advice = self.describe_action(suggestion[0]) if suggestion else "keep your units on the board"
+            self.console.print(f"[green]Suggestion: {advice}.[/green]")
+
+            # Ask the player which card they want to play (or '0' to skip)
+            card_choices = ["0"] + [str(i + 1) for i in range(len(attackers))]
+            card_choice = Prompt.ask("[yellow]Enter the number of the playing card (or '0' to skip): [/yellow]", choices=card_choices, default="0")
+
+            # If the player chooses to skip, stop attacking
+            if card_choice == '0':
+                self.apply(PASS_ACTION)
+                break
+
+            # Ask the player which target they want to attack and resolve the attack
+            actions = ATTACK_ACTIONS[self.engine.attackers[int(card_choice) - 1]]
+            self.apply(self.choose_target(opponent, actions))
+
+            # Print the updated game state
+            self.print_game(player)
 
     def use_hero_power(self, player: Player, opponent: Player) -> None:
         """
-        Allows the player to use their hero power to attack an opponent or their units, if they have attack points.
+        Allows the player to attack an opponent or their units with their hero, if they have attack points.
 
         Args:
             player (Player): The player using their hero power.
             opponent (Player): The opponent who may be attacked.
+        """
+        # Print the current game state
+        self.print_game(player)
+
+        # Ask the player if they want to attack with their hero power
+        answer_choice = Prompt.ask(f"[yellow]Do you want to attack with {player.hero.name}? [/yellow]", choices=["o", "n"], default="n")
+
+        # If the player answers 'no', skip the hero attack
+        if answer_choice != "o":
+            self.apply(PASS_ACTION)
+            return
+
+        # Ask the player which target they want to attack and resolve the attack
+        self.apply(self.choose_target(opponent, HERO_ATTACK_ACTIONS))
+
+        # Print the updated game state
+        self.print_game(player)
+
+    def choose_target(self, opponent: Player, actions: Sequence[Action]) -> Action:
+        """
+        Displays the opponent's targetable cards and prompts the player to pick one.
+
+        Args:
+            opponent (Player): The opponent who may be attacked.
+            actions (Sequence[Action]): The attacks of one attacker, indexed by target from the opponent's hero.
 
         Returns:
-            None
+            Action: The attack on the chosen target.
         """
-        try:
-            # Check if the player has attack points
-            if player.attack > 0:
-                # Print the current game state
-                self.print_game(player)
-
-                # Define possible choices for the player (yes/no)
-                answer_choices = ["o", "n"]
-                
-                # Ask the player if they want to attack with their hero power
-                answer_choice = Prompt.ask(f"[yellow]Do you want to attack with {player.hero.name}? [/yellow]", choices=answer_choices, default="n")
-
-                # If the player answers 'yes'
-                if answer_choice == "o":
-                    # Prepare a table displaying the opponent's targetable cards
-                    target_card_table = Table(title="\n[bold cyan]Targetable cards[/bold cyan]")
-                    target_card_table.add_column("Index", justify="center", style="magenta", no_wrap=True)
-                    target_card_table.add_column("Name", justify="left", style="yellow")
-                    target_card_table.add_column("Health", justify="left", style="green")
-
-                    # Add the opponent's name and health to the table
-                    target_card_table.add_row(str(0), opponent.name, str(opponent.health))
-                    
-                    # Add the opponent's cards to the table
-                    for i, card in enumerate(opponent.deck.board):
-                        target_card_table.add_row(str(i + 1), card.name, str(card.health))
-                    
-                    # Display the table
-                    self.console.print(target_card_table)
-
-                    # Define possible choices for the target (select target or skip)
-                    card_choices = ["0"] + [str(i + 1) for i in range(len(opponent.deck.board))]
-                    
-                    # Ask the player which target they want to attack
-                    card_choice = Prompt.ask("[yellow]Enter the target card number: [/yellow]", choices=card_choices, default="0")
-
-                    try:
-                        # Convert the player's choice into an integer index for the target
-                        target_index = int(card_choice) - 1
-                        
-                        # If the player chooses to attack the opponent directly
-                        if target_index == -1:
-                            target = opponent
-                            player.attack_player_or_unit(target)
-                        
-                        # If the player chooses to attack a specific card of the opponent
-                        elif 0 <= target_index < len(opponent.deck.board):
-                            target = opponent.deck.board[target_index]
-                            player.attack_player_or_unit(target)
-                            
-                            # If the target card is dead, move it to the graveyard
-                            if target.health <= 0:
-                                opponent.deck.move_to_graveyard(target)
-
-                        # Reset the player's attack points after using hero power
-                        player.attack = 0
-
-                        # Print the updated game state
-                        self.print_game(player)
-                    except ValueError:
-                        # If there's an error with the player's input, raise the error
-                        raise
-        except ValueError:
-            # Catch any value errors that occur and raise them
-            raise
+        # Prepare a table displaying the opponent's targetable cards
+        target_card_table = Table(title="\n[bold cyan]Targetable cards[/bold cyan]")
+        target_card_table.add_column("Index", justify="center", style="magenta", no_wrap=True)
+        target_card_table.add_column("Name", justify="left", style="yellow")
+        target_card_table.add_column("Health", justify="left", style="green")
+
+        # Add the opponent's name and health, then their cards, to the table
+        target_card_table.add_row(str(0), opponent.name, str(opponent.health))
+        for i, card in enumerate(opponent.deck.board):
+            target_card_table.add_row(str(i + 1), card.name, str(card.health))
+        self.console.print(target_card_table)
+
+        # Ask the player which target they want to attack
+        card_choices = [str(i) for i in range(self.engine.targets)]
+        card_choice = Prompt.ask("[yellow]Enter the target card number: [/yellow]", choices=card_choices, default="0")
+        return actions[int(card_choice)]
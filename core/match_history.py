@@ -0,0 +1,747 @@
+#!/usr/bin/python3
+
+# Imports
+import bisect
+import heapq
+import os
+import re
+import struct
+import tempfile
+import time
+from typing import Iterator, NamedTuple
+
+# Core Imports
+from core.game_engine import GameEngine
+from core.binary_catalog import CARD_CLASSES
+
+# Modules Imports
+from modules.player_mod import Player
+
+# Utils Imports
+from utils.constants import MATCH_HISTORY_PATH, MATCH_HISTORY_COMPACT_MATCHES, MATCH_HISTORY_SEGMENT_LIMIT
+from utils.database_utils import Database
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+
+# Constants
+LOG_MAGIC = b"HSML"  # Identifies the active log of a match history
+SEGMENT_MAGIC = b"HSMS"  # Identifies a compacted segment of a match history
+VERSION = 1  # Incremented whenever the layout or an enum changes
+LOG_NAME = "active.log"
+SEGMENT_NAME = re.compile(r"segment-(\d{6})-(\d{6})\.seg")
+
+# File layout: header, then records appended one after the other, each one a record header followed by its body.
+# Texts and decks are written once per file, before the first match using them, and referenced by index.
+HEADER = struct.Struct("<4sHHI")  # magic, version, reserved, generation (of the log; 0 for a segment)
+RECORD_HEADER = struct.Struct("<BI")  # tag, body size
+STRING_TAG, DECK_TAG, MATCH_TAG, SEGMENT_TAG, PLAYER_INDEX_TAG, CLASS_INDEX_TAG = 1, 2, 3, 4, 5, 6
+
+MATCH_RECORD = struct.Struct("<dfHBBBIIIIII")  # timestamp, duration, turns, winner (0 for a draw), class 1, class 2, name 1, name 2, hero 1, hero 2, deck 1, deck 2
+SEGMENT_RECORD = struct.Struct("<IIIdd")  # first generation, last generation, match count, first timestamp, last timestamp
+INDEX_ENTRY = struct.Struct("<I")  # Texts, deck cards and posting lists are arrays of indexes
+CLASS_ENTRY = struct.Struct("<B")
+
+# Functions
+def pack_record(tag: int, body: bytes) -> bytes:
+    """
+    Prefixes the body of a record with its header.
+
+    Args:
+        tag (int): The kind of record.
+        body (bytes): The body of the record.
+
+    Returns:
+        bytes: The record, ready to be appended.
+    """
+    return RECORD_HEADER.pack(tag, len(body)) + body
+
+def pack_indexes(indexes: list[int]) -> bytes:
+    """
+    Encodes an array of indexes.
+
+    Args:
+        indexes (list[int]): The indexes.
+
+    Returns:
+        bytes: The indexes as little-endian 32-bit integers.
+    """
+    return struct.pack(f"<{len(indexes)}I", *indexes)
+
+def unpack_indexes(data: bytes, offset: int, size: int) -> tuple[int, ...]:
+    """
+    Decodes an array of indexes.
+
+    Args:
+        data (bytes): The content of the file.
+        offset (int): The start of the array.
+        size (int): The size of the array in bytes.
+
+    Returns:
+        tuple[int, ...]: The indexes.
+    """
+    return struct.unpack_from(f"<{size // INDEX_ENTRY.size}I", data, offset)
+
+def read_file(file_path: str, magic: bytes, kind: str) -> tuple[bytes, int]:
+    """
+    Reads a file of the match history with a single read and checks its header.
+
+    Args:
+        file_path (str): Path to the file.
+        magic (bytes): The magic number of its kind of file.
+        kind (str): The kind of file, for error messages.
+
+    Returns:
+        tuple[bytes, int]: The content of the file and the generation of its header.
+
+    Raises:
+        ValueError: If the file is not of the expected kind and version.
+    """
+    with open(file_path, "rb") as file:
+        data = file.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"Invalid match history file: {file_path}. The file is truncated.")
+    found, version, _, generation = HEADER.unpack_from(data, 0)
+    if found != magic:
+        raise ValueError(f"Invalid match history file: {file_path}. Not a {kind}.")
+    if version != VERSION:
+        raise ValueError(f"Invalid match history file: {file_path}. Version {version} is not supported, expected {VERSION}.")
+    return data, generation
+
+def iter_records(data: bytes) -> Iterator[tuple[int, int, int]]:
+    """
+    Iterates over the complete records of a file, stopping at a record cut short by a crash.
+
+    Args:
+        data (bytes): The content of the file.
+
+    Yields:
+        tuple[int, int, int]: The tag, the start of the body and the end of each record.
+    """
+    offset = HEADER.size
+    while offset + RECORD_HEADER.size <= len(data):
+        tag, size = RECORD_HEADER.unpack_from(data, offset)
+        start = offset + RECORD_HEADER.size
+        if start + size > len(data):
+            return  # The last append was interrupted
+        yield tag, start, start + size
+        offset = start + size
+
+def write_atomically(file_path: str, content: bytes) -> None:
+    """
+    Writes a file through a temporary file replacing it at once, so that a crash never leaves it half written.
+
+    Args:
+        file_path (str): Path to the file.
+        content (bytes): The content of the file.
+    """
+    descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)), suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, file_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+def deck_names(player: Player) -> tuple[str, ...]:
+    """
+    Returns the names of all cards of a player, whatever their zone, in a stable order.
+
+    Args:
+        player (Player): The player.
+
+    Returns:
+        tuple[str, ...]: The sorted names of the cards.
+    """
+    deck = player.deck
+    return tuple(sorted(card.name for zone in (deck.cards, deck.hand, deck.board, deck.graveyard) for card in zone))
+
+# Class
+class MatchRecord(NamedTuple):
+    """
+    The outcome of one finished game.
+
+    Attributes:
+        timestamp (float): When the game ended, in seconds since the epoch.
+        duration (float): The length of the game in seconds.
+        turns (int): The number of turns played.
+        winner (int): The number of the winning player (0 for a draw).
+        players (tuple[str, str]): The names of both players.
+        heroes (tuple[str, str]): The names of their heroes.
+        hero_classes (tuple[CardClass, CardClass]): The classes of their heroes.
+        decks (tuple[tuple[str, ...], tuple[str, ...]]): The sorted card names of their decks.
+    """
+    timestamp: float
+    duration: float
+    turns: int
+    winner: int
+    players: tuple[str, str]
+    heroes: tuple[str, str]
+    hero_classes: tuple[CardClass, CardClass]
+    decks: tuple[tuple[str, ...], tuple[str, ...]]
+
+    @classmethod
+    def from_engine(cls, engine: GameEngine, duration: float, timestamp: float = None) -> "MatchRecord":
+        """
+        Builds the record of a finished game.
+
+        Args:
+            engine (GameEngine): The game, once it is over.
+            duration (float): The length of the game in seconds.
+            timestamp (float, optional): When the game ended. Defaults to now.
+
+        Returns:
+            MatchRecord: The record.
+        """
+        player_1, player_2 = engine.logic.player_1, engine.logic.player_2
+        winner = engine.winner()
+        return cls(
+            time.time() if timestamp is None else timestamp,
+            duration,
+            engine.turn,
+            0 if winner is None else (1 if winner is player_1 else 2),
+            (player_1.name, player_2.name),
+            (player_1.hero.name, player_2.hero.name),
+            (player_1.hero.hero_class, player_2.hero.hero_class),
+            (deck_names(player_1), deck_names(player_2))
+        )
+
+class RecordTables:
+    """
+    The texts and decks of one file of the match history, each stored once and referenced by index by the matches.
+
+    Attributes:
+        strings (list[str]): The texts, by index.
+        decks (list[tuple[int, ...]]): The text indexes of the cards of each deck, by index.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes empty tables.
+        """
+        self.strings: list[str] = []
+        self.decks: list[tuple[int, ...]] = []
+        self.string_indexes: dict[str, int] = {}
+        self.deck_indexes: dict[tuple[int, ...], int] = {}
+
+    def read(self, data: bytes, tag: int, start: int, end: int) -> bool:
+        """
+        Adds the text or deck of a record to the tables.
+
+        Args:
+            data (bytes): The content of the file.
+            tag (int): The kind of record.
+            start (int): The start of the record's body.
+            end (int): The end of the record.
+
+        Returns:
+            bool: True if the record was a text or a deck.
+        """
+        if tag == STRING_TAG:
+            text = data[start:end].decode("utf-8")
+            self.string_indexes[text] = len(self.strings)
+            self.strings.append(text)
+        elif tag == DECK_TAG:
+            deck = unpack_indexes(data, start, end - start)
+            self.deck_indexes[deck] = len(self.decks)
+            self.decks.append(deck)
+        else:
+            return False
+        return True
+
+    def string_index(self, text: str, records: list[bytes]) -> int:
+        """
+        Returns the index of a text, adding it to the tables the first time.
+
+        Args:
+            text (str): The text.
+            records (list[bytes]): The records to write, to which a new text is added.
+
+        Returns:
+            int: The index of the text.
+        """
+        index = self.string_indexes.get(text)
+        if index is None:
+            index = self.string_indexes[text] = len(self.strings)
+            self.strings.append(text)
+            records.append(pack_record(STRING_TAG, text.encode("utf-8")))
+        return index
+
+    def deck_index(self, deck: tuple[int, ...], records: list[bytes]) -> int:
+        """
+        Returns the index of a deck, adding it to the tables the first time.
+
+        Args:
+            deck (tuple[int, ...]): The text indexes of the cards of the deck.
+            records (list[bytes]): The records to write, to which a new deck is added.
+
+        Returns:
+            int: The index of the deck.
+        """
+        index = self.deck_indexes.get(deck)
+        if index is None:
+            index = self.deck_indexes[deck] = len(self.decks)
+            self.decks.append(deck)
+            records.append(pack_record(DECK_TAG, pack_indexes(deck)))
+        return index
+
+    def fields(self, match: MatchRecord, records: list[bytes]) -> tuple:
+        """
+        Returns the fields of the record of a match, adding the records of the texts and decks it uses for the first time.
+
+        Args:
+            match (MatchRecord): The match.
+            records (list[bytes]): The records to write, to which new texts and decks are added.
+
+        Returns:
+            tuple: The fields of `MATCH_RECORD`.
+        """
+        def deck_index(names: tuple[str, ...]) -> int:
+            return self.deck_index(tuple(self.string_index(name, records) for name in names), records)
+
+        return (
+            match.timestamp,
+            match.duration,
+            match.turns,
+            match.winner,
+            CARD_CLASSES.index(match.hero_classes[0]),
+            CARD_CLASSES.index(match.hero_classes[1]),
+            self.string_index(match.players[0], records),
+            self.string_index(match.players[1], records),
+            self.string_index(match.heroes[0], records),
+            self.string_index(match.heroes[1], records),
+            deck_index(match.decks[0]),
+            deck_index(match.decks[1])
+        )
+
+    def encode(self, match: MatchRecord, records: list[bytes]) -> bytes:
+        """
+        Encodes a match, adding the records of the texts and decks it uses for the first time.
+
+        Args:
+            match (MatchRecord): The match.
+            records (list[bytes]): The records to write, to which new texts and decks are added.
+
+        Returns:
+            bytes: The match record.
+        """
+        return pack_record(MATCH_TAG, MATCH_RECORD.pack(*self.fields(match, records)))
+
+    def decode(self, data: bytes, offset: int) -> MatchRecord:
+        """
+        Decodes the body of a match record.
+
+        Args:
+            data (bytes): The content of the file.
+            offset (int): The start of the record's body.
+
+        Returns:
+            MatchRecord: The match.
+        """
+        timestamp, duration, turns, winner, class_1, class_2, name_1, name_2, hero_1, hero_2, deck_1, deck_2 = MATCH_RECORD.unpack_from(data, offset)
+        strings = self.strings
+        return MatchRecord(
+            timestamp,
+            duration,
+            turns,
+            winner,
+            (strings[name_1], strings[name_2]),
+            (strings[hero_1], strings[hero_2]),
+            (CARD_CLASSES[class_1], CARD_CLASSES[class_2]),
+            tuple(tuple(strings[index] for index in self.decks[deck]) for deck in (deck_1, deck_2))
+        )
+
+class MatchSegment:
+    """
+    A compacted, read-only file of the match history: its matches are sorted by time and indexed by player and hero class.
+
+    Attributes:
+        file_path (str): Path to the segment.
+        first_generation (int): The generation of the first active log compacted into the segment.
+        last_generation (int): The generation of the last active log compacted into the segment.
+        first_timestamp (float): The time of the segment's first match.
+        last_timestamp (float): The time of the segment's last match.
+        timestamps (list[float]): The time of each match, in order.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Reads a segment with a single read.
+
+        Args:
+            file_path (str): Path to the segment.
+
+        Raises:
+            ValueError: If the file is not a complete segment of the current version.
+        """
+        data, _ = read_file(file_path, SEGMENT_MAGIC, "match history segment")
+        self.file_path = file_path
+        self.data = data
+        self.tables = RecordTables()
+        self.offsets: list[int] = []  # Start of the body of each match record
+        self.players: dict[str, tuple[int, ...]] = {}  # Matches of each player
+        self.classes: dict[CardClass, tuple[int, ...]] = {}  # Matches of each hero class
+        header = None
+        end = HEADER.size
+
+        for tag, start, end in iter_records(data):
+            if self.tables.read(data, tag, start, end):
+                continue
+            if tag == MATCH_TAG:
+                self.offsets.append(start)
+            elif tag == SEGMENT_TAG:
+                header = SEGMENT_RECORD.unpack_from(data, start)
+            elif tag == PLAYER_INDEX_TAG:
+                name, = INDEX_ENTRY.unpack_from(data, start)
+                self.players[self.tables.strings[name]] = unpack_indexes(data, start + INDEX_ENTRY.size, end - start - INDEX_ENTRY.size)
+            elif tag == CLASS_INDEX_TAG:
+                card_class, = CLASS_ENTRY.unpack_from(data, start)
+                self.classes[CARD_CLASSES[card_class]] = unpack_indexes(data, start + CLASS_ENTRY.size, end - start - CLASS_ENTRY.size)
+            else:
+                raise ValueError(f"Invalid match history file: {file_path}. Unknown record {tag} at offset {start - RECORD_HEADER.size}.")
+        if header is None or end != len(data) or header[2] != len(self.offsets):
+            raise ValueError(f"Invalid match history file: {file_path}. The segment is incomplete.")
+
+        self.first_generation, self.last_generation, _, self.first_timestamp, self.last_timestamp = header
+        self.timestamps = [struct.unpack_from("<d", data, offset)[0] for offset in self.offsets]
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of matches in the segment.
+        """
+        return len(self.offsets)
+
+    def match(self, index: int) -> MatchRecord:
+        """
+        Decodes one match of the segment.
+
+        Args:
+            index (int): The position of the match in the segment.
+
+        Returns:
+            MatchRecord: The match.
+        """
+        return self.tables.decode(self.data, self.offsets[index])
+
+    def query(self, player: str = None, hero_class: CardClass = None, start: float = None, end: float = None) -> list[MatchRecord]:
+        """
+        Finds the matches of the segment played by a player, with a hero class, or in a time range.
+        The indexes give the candidates and the time range is found by bisection, so no other match is decoded.
+
+        Args:
+            player (str, optional): The name of one of the players.
+            hero_class (CardClass, optional): The class of one of the heroes.
+            start (float, optional): The earliest end time, included.
+            end (float, optional): The latest end time, excluded.
+
+        Returns:
+            list[MatchRecord]: The matching matches, in time order.
+        """
+        if (start is not None and start > self.last_timestamp) or (end is not None and end <= self.first_timestamp):
+            return []
+        low = 0 if start is None else bisect.bisect_left(self.timestamps, start)
+        high = len(self) if end is None else bisect.bisect_left(self.timestamps, end)
+
+        candidates = None
+        for postings in (None if player is None else self.players.get(player, ()), None if hero_class is None else self.classes.get(hero_class, ())):
+            if postings is not None:
+                postings = postings[bisect.bisect_left(postings, low):bisect.bisect_left(postings, high)]
+                candidates = postings if candidates is None else sorted(set(candidates).intersection(postings))
+        if candidates is None:
+            candidates = range(low, high)
+        return [self.match(index) for index in candidates]
+
+    @staticmethod
+    def encode(matches: list[MatchRecord], first_generation: int, last_generation: int) -> bytes:
+        """
+        Encodes matches as a segment, sorted by time, with the posting lists of each player and hero class.
+
+        Args:
+            matches (list[MatchRecord]): The matches.
+            first_generation (int): The generation of the first active log compacted into the segment.
+            last_generation (int): The generation of the last active log compacted into the segment.
+
+        Returns:
+            bytes: The content of the segment.
+        """
+        tables, records = RecordTables(), []
+        fields = [tables.fields(match, records) for match in sorted(matches, key=lambda match: match.timestamp)]
+        return MatchSegment.assemble(tables, records, fields, first_generation, last_generation)
+
+    @staticmethod
+    def merge(segments: list["MatchSegment"]) -> bytes:
+        """
+        Merges consecutive segments into one. Their matches, already sorted by time, are merged in order,
+        and their records are copied with the indexes of their texts and decks renumbered, without being decoded.
+
+        Args:
+            segments (list[MatchSegment]): The segments, oldest first.
+
+        Returns:
+            bytes: The content of the merged segment.
+        """
+        tables, records = RecordTables(), []
+        mappings = []  # New index of each text and deck of each segment
+        for segment in segments:
+            strings = [tables.string_index(text, records) for text in segment.tables.strings]
+            decks = [tables.deck_index(tuple(strings[index] for index in deck), records) for deck in segment.tables.decks]
+            mappings.append((strings, decks))
+
+        fields = []
+        ordered = heapq.merge(*[zip(segment.timestamps, [number] * len(segment), segment.offsets) for number, segment in enumerate(segments)])
+        for _, number, offset in ordered:
+            strings, decks = mappings[number]
+            *head, name_1, name_2, hero_1, hero_2, deck_1, deck_2 = MATCH_RECORD.unpack_from(segments[number].data, offset)
+            fields.append((*head, strings[name_1], strings[name_2], strings[hero_1], strings[hero_2], decks[deck_1], decks[deck_2]))
+        return MatchSegment.assemble(tables, records, fields, segments[0].first_generation, segments[-1].last_generation)
+
+    @staticmethod
+    def assemble(tables: RecordTables, records: list[bytes], fields: list[tuple], first_generation: int, last_generation: int) -> bytes:
+        """
+        Writes the content of a segment from the fields of its matches, sorted by time.
+
+        Args:
+            tables (RecordTables): The texts and decks the matches refer to.
+            records (list[bytes]): The records of the texts and decks.
+            fields (list[tuple]): The fields of `MATCH_RECORD` of each match, sorted by time.
+            first_generation (int): The generation of the first active log compacted into the segment.
+            last_generation (int): The generation of the last active log compacted into the segment.
+
+        Returns:
+            bytes: The content of the segment.
+        """
+        header = pack_record(SEGMENT_TAG, SEGMENT_RECORD.pack(
+            first_generation, last_generation, len(fields),
+            fields[0][0] if fields else 0.0, fields[-1][0] if fields else 0.0
+        ))
+
+        players: dict[int, list[int]] = {}
+        classes: dict[int, list[int]] = {}
+        for index, (_, _, _, _, class_1, class_2, name_1, name_2, *_) in enumerate(fields):
+            for name in dict.fromkeys((name_1, name_2)):
+                players.setdefault(name, []).append(index)
+            for hero_class in dict.fromkeys((class_1, class_2)):
+                classes.setdefault(hero_class, []).append(index)
+        encoded = [pack_record(MATCH_TAG, MATCH_RECORD.pack(*match)) for match in fields]
+        indexes = [pack_record(PLAYER_INDEX_TAG, INDEX_ENTRY.pack(name) + pack_indexes(postings)) for name, postings in players.items()]
+        indexes += [pack_record(CLASS_INDEX_TAG, CLASS_ENTRY.pack(hero_class) + pack_indexes(postings)) for hero_class, postings in classes.items()]
+        return HEADER.pack(SEGMENT_MAGIC, VERSION, 0, 0) + b"".join([header] + records + encoded + indexes)
+
+class MatchHistory:
+    """
+    Persistent history of finished games: an append-only active log, compacted into indexed segments.
+
+    Each match is appended to the active log with a single write of a few dozen bytes, texts and decks being written
+    once per file. Once the log holds `compact_matches` matches, it is rewritten as a segment sorted by time
+    with posting lists by player and hero class, and a new log is started. Segments are merged by tiers of similar size:
+    as soon as the newest `segment_limit` segments are in the same tier, they are merged into one segment of the next tier,
+    so each match is rewritten once per tier and a merge never rewrites the larger, older segments.
+    Segments and logs are replaced atomically, and each log has a generation
+    that its segment remembers, so a log whose compaction was interrupted is never counted twice.
+    Segments are only read by queries, counts and compactions: opening a history to append a match reads its active log alone.
+
+    Attributes:
+        directory (str): The directory of the history.
+        compact_matches (int): The number of matches of the active log that triggers its compaction.
+        segment_limit (int): The number of segments of a tier merged together.
+        ranges (list[tuple[int, int]]): The first and last generation of each compacted segment, oldest first.
+        segments (list[MatchSegment]): The compacted segments, oldest first, read the first time they are needed.
+        generation (int): The generation of the active log.
+        matches (list[MatchRecord]): The matches of the active log, in append order.
+    """
+
+    def __init__(self, directory: str = MATCH_HISTORY_PATH, compact_matches: int = MATCH_HISTORY_COMPACT_MATCHES, segment_limit: int = MATCH_HISTORY_SEGMENT_LIMIT) -> None:
+        """
+        Opens a match history, creating its directory if needed.
+
+        Args:
+            directory (str): The directory of the history. Defaults to `MATCH_HISTORY_PATH`.
+            compact_matches (int): The number of matches that triggers a compaction. Defaults to `MATCH_HISTORY_COMPACT_MATCHES`.
+            segment_limit (int): The number of segments of a tier merged together. Defaults to `MATCH_HISTORY_SEGMENT_LIMIT`.
+
+        Raises:
+            ValueError: If a limit is too small, or a file of the directory is not part of a match history.
+        """
+        if compact_matches < 1 or segment_limit < 2:
+            raise ValueError(f"Invalid compaction limits: {compact_matches} matches, {segment_limit} segments. They must be at least 1 match and 2 segments.")
+        self.directory = directory
+        self.compact_matches = compact_matches
+        self.segment_limit = segment_limit
+        Database.ensure_directory_exists(os.path.join(directory, LOG_NAME))
+
+        # Segments merged into another one are left over by an interrupted merge
+        ranges = sorted(tuple(map(int, found.groups())) for found in map(SEGMENT_NAME.fullmatch, os.listdir(directory)) if found)
+        self.ranges = []
+        for first, last in ranges:
+            if any(other != (first, last) and other[0] <= first and last <= other[1] for other in ranges):
+                os.remove(self.segment_path(first, last))
+            else:
+                self.ranges.append((first, last))
+        self._segments: list[MatchSegment] | None = None  # Read by `segments`
+        compacted = max((last for _, last in self.ranges), default=0)  # Segment names hold their generations
+
+        self.log_path = os.path.join(directory, LOG_NAME)
+        self.tables = RecordTables()
+        self.matches: list[MatchRecord] = []
+        if os.path.exists(self.log_path) and os.path.getsize(self.log_path) > 0:
+            data, self.generation = read_file(self.log_path, LOG_MAGIC, "match history log")
+        else:
+            data, self.generation = b"", 0
+        if self.generation <= compacted:
+            self.reset_log(compacted + 1)  # The log is new, or was compacted before it could be reset
+        else:
+            size = HEADER.size
+            for tag, start, size in iter_records(data):
+                if self.tables.read(data, tag, start, size):
+                    continue
+                if tag != MATCH_TAG:
+                    raise ValueError(f"Invalid match history file: {self.log_path}. Unknown record {tag} at offset {start - RECORD_HEADER.size}.")
+                self.matches.append(self.tables.decode(data, start))
+            self.file = open(self.log_path, "r+b")
+            self.file.truncate(size)  # Drops a record cut short by a crash
+            self.file.seek(size)
+
+    def __enter__(self) -> "MatchHistory":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of matches in the history.
+        """
+        return sum(len(segment) for segment in self.segments) + len(self.matches)
+
+    def close(self) -> None:
+        """
+        Closes the active log.
+        """
+        self.file.close()
+
+    @property
+    def segments(self) -> list[MatchSegment]:
+        """
+        Reads the compacted segments the first time they are needed.
+
+        Returns:
+            list[MatchSegment]: The segments, oldest first.
+
+        Raises:
+            ValueError: If a segment is not a complete segment of the current version.
+        """
+        if self._segments is None:
+            self._segments = [MatchSegment(self.segment_path(first, last)) for first, last in self.ranges]
+        return self._segments
+
+    def segment_path(self, first: int, last: int) -> str:
+        """
+        Returns the path of a segment.
+
+        Args:
+            first (int): The generation of the first log of the segment.
+            last (int): The generation of the last log of the segment.
+
+        Returns:
+            str: The path.
+        """
+        return os.path.join(self.directory, f"segment-{first:06d}-{last:06d}.seg")
+
+    def reset_log(self, generation: int) -> None:
+        """
+        Replaces the active log by an empty one.
+
+        Args:
+            generation (int): The generation of the new log.
+        """
+        if getattr(self, "file", None) is not None:
+            self.file.close()
+        write_atomically(self.log_path, HEADER.pack(LOG_MAGIC, VERSION, 0, generation))
+        self.generation = generation
+        self.tables = RecordTables()
+        self.matches = []
+        self.file = open(self.log_path, "r+b")
+        self.file.seek(0, os.SEEK_END)
+
+    def append(self, match: MatchRecord) -> None:
+        """
+        Appends a finished game to the active log, compacting it when it is full.
+
+        Args:
+            match (MatchRecord): The game.
+        """
+        records: list[bytes] = []
+        records.append(self.tables.encode(match, records))  # Texts and decks come before the match
+        self.file.write(b"".join(records))
+        self.file.flush()
+        self.matches.append(match)
+        if len(self.matches) >= self.compact_matches:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Rewrites the active log as an indexed segment and starts a new log, then merges the newest segments while
+        `segment_limit` of them are in the same tier.
+        """
+        if self.matches:
+            path = self.segment_path(self.generation, self.generation)
+            write_atomically(path, MatchSegment.encode(self.matches, self.generation, self.generation))
+            self.segments.append(MatchSegment(path))
+            self.reset_log(self.generation + 1)
+
+        while len(self.segments) >= self.segment_limit:
+            tier = self.tier(self.segments[-1])
+            count = 0
+            while count < len(self.segments) and self.tier(self.segments[-1 - count]) == tier:
+                count += 1
+            if count < self.segment_limit:
+                break
+            merged = self.segments[-count:]
+            path = self.segment_path(merged[0].first_generation, merged[-1].last_generation)
+            write_atomically(path, MatchSegment.merge(merged))
+            for segment in merged:
+                os.remove(segment.file_path)
+            self.segments[-count:] = [MatchSegment(path)]
+        self.ranges = [(segment.first_generation, segment.last_generation) for segment in self.segments]
+
+    def tier(self, segment: MatchSegment) -> int:
+        """
+        Returns the size tier of a segment: 0 below `compact_matches * segment_limit` matches, then one more tier
+        each time the size is multiplied by `segment_limit`.
+
+        Args:
+            segment (MatchSegment): The segment.
+
+        Returns:
+            int: The tier.
+        """
+        tier, limit = 0, self.compact_matches * self.segment_limit
+        while len(segment) >= limit:
+            tier, limit = tier + 1, limit * self.segment_limit
+        return tier
+
+    def query(self, player: str = None, hero_class: CardClass = None, start: float = None, end: float = None) -> list[MatchRecord]:
+        """
+        Finds the matches played by a player, with a hero class, or in a time range. Criteria left to None match every game.
+
+        Args:
+            player (str, optional): The name of one of the players.
+            hero_class (CardClass, optional): The class of one of the heroes.
+            start (float, optional): The earliest end time, in seconds since the epoch, included.
+            end (float, optional): The latest end time, excluded.
+
+        Returns:
+            list[MatchRecord]: The matching matches, in time order.
+        """
+        found = [match for segment in self.segments for match in segment.query(player, hero_class, start, end)]
+        found += [match for match in self.matches
+                  if (player is None or player in match.players)
+                  and (hero_class is None or hero_class in match.hero_classes)
+                  and (start is None or match.timestamp >= start)
+                  and (end is None or match.timestamp < end)]
+        return sorted(found, key=lambda match: match.timestamp)
@@ -0,0 +1,735 @@
+#!/usr/bin/python3
+
+# Imports
+import bisect
+import mmap
+import os
+import struct
+
+# Core Imports
+from core.game_engine import (
+    GameEngine,
+    Action,
+    PHASE_ORDER,
+    PASS_ACTION,
+    USE_HERO_POWER_ACTION,
+    PLAY_CARD_ACTIONS,
+    ATTACK_ACTIONS,
+    HERO_ATTACK_ACTIONS
+)
+from core.binary_catalog import CARD_CLASSES, CARD_TYPES, HERO_POWERS, RACES, RARITIES, NO_RACE
+
+# Modules Imports
+from modules.card_definition_mod import CardDefinition
+from modules.deck_mod import Deck
+from modules.hero_mod import Hero
+from modules.player_mod import Player
+from modules.spell_mod import Spell
+from modules.unit_mod import Unit
+
+# Utils Imports
+from utils.constants import REPLAY_PATH, REPLAY_CHECKPOINT_TURNS
+from utils.database_utils import Database
+from utils.rng_utils import GameRandom
+
+# Enum Imports
+from enums.card_status_enum import CardStatus
+from enums.card_type_enum import CardType
+
+# Constants
+MAGIC = b"HSRL"  # Identifies a replay log
+VERSION = 1  # Incremented whenever the layout, an enum or the action codes change
+
+# File layout: header, then records appended one after the other, each one a record header followed by its body.
+# Definitions and heroes are written once per file, before the first game using them, and referenced by index.
+HEADER = struct.Struct("<4sHH")  # magic, version, reserved
+RECORD_HEADER = struct.Struct("<BI")  # tag, body size
+DEFINITION_TAG, HERO_TAG, GAME_TAG = 1, 2, 3
+
+# Index: a file next to the log, with a header (same layout, own magic), then one entry per game, appended once the game is written.
+# Games are found without reading the log, and the definitions and heroes by searching the entries for the games that introduced them.
+INDEX_MAGIC = b"HSRI"  # Identifies the index of a replay log
+INDEX_SUFFIX = ".idx"  # Added to the path of the log
+INDEX_ENTRY = struct.Struct("<QII")  # start of the game record's body, definitions and heroes in the log up to that game
+
+DEFINITION_RECORD = struct.Struct("<BBBBhhhhHH")  # type, rarity, race, class count, cost, attack, health, armor, name size, description size
+HERO_RECORD = struct.Struct("<IBBhhhhHH")  # id, class, power, attack, health, mana, armor, name size, description size
+
+# Game body: header, names, seed, checkpoint index, one byte per action, checkpoint blob
+GAME_HEADER = struct.Struct("<HHiBBIHHHH")  # hero 1, hero 2, turn limit (-1 for none), winner (0 for a draw), seed kind, action count, checkpoint count, name 1 size, name 2 size, seed size
+CHECKPOINT_ENTRY = struct.Struct("<III")  # turn, index of the next action, offset in the checkpoint blob
+
+# Checkpoint: state, then for each player their stats and their cards zone by zone
+STATE_RECORD = struct.Struct("<IBB")  # turn, phase, flags
+PLAYER_RECORD = struct.Struct("<hhhhBBBB")  # attack, health, mana, armor, deck size, hand size, board size, graveyard size
+CARD_RECORD = struct.Struct("<HH")  # definition, id (cards only change on the board, so deck and hand cards have their printed stats)
+UNIT_RECORD = struct.Struct("<HHhhh")  # definition, id, attack, health, armor
+PLAYER_1_TO_PLAY, PLAYED_CARD, PLAYED_HERO_POWER = 1, 2, 4  # State flags
+INT_SEED, STR_SEED = 0, 1  # Seed kinds, the seed itself being stored as text
+
+# Every action has a one-byte code: its position in this tuple
+ACTIONS = (
+    (PASS_ACTION, USE_HERO_POWER_ACTION)
+    + tuple(action for actions in PLAY_CARD_ACTIONS for action in actions)
+    + tuple(action for actions in ATTACK_ACTIONS for action in actions)
+    + HERO_ATTACK_ACTIONS
+)
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+# Functions
+def pack_record(tag: int, body: bytes) -> bytes:
+    """
+    Prefixes the body of a record with its header.
+
+    Args:
+        tag (int): The kind of record.
+        body (bytes): The body of the record.
+
+    Returns:
+        bytes: The record, ready to be appended.
+    """
+    return RECORD_HEADER.pack(tag, len(body)) + body
+
+def encode_definition(definition: CardDefinition) -> bytes:
+    """
+    Encodes a card definition as a definition record.
+
+    Args:
+        definition (CardDefinition): The definition to encode.
+
+    Returns:
+        bytes: The record.
+    """
+    name, description = definition.name.encode("utf-8"), definition.description.encode("utf-8")
+    body = DEFINITION_RECORD.pack(
+        CARD_TYPES.index(definition.card_type),
+        RARITIES.index(definition.card_rarity),
+        NO_RACE if definition.unit_race is None else RACES.index(definition.unit_race),
+        len(definition.card_classes),
+        definition.cost,
+        definition.attack,
+        definition.health,
+        definition.armor,
+        len(name),
+        len(description)
+    )
+    classes = bytes(CARD_CLASSES.index(card_class) for card_class in definition.card_classes)
+    return pack_record(DEFINITION_TAG, body + classes + name + description)
+
+def decode_definition(data: bytes, offset: int) -> CardDefinition:
+    """
+    Decodes the body of a definition record. The definition is interned, so it is shared with the live cards.
+
+    Args:
+        data (bytes): The content of the replay file.
+        offset (int): The start of the record's body.
+
+    Returns:
+        CardDefinition: The definition.
+    """
+    card_type, rarity, race, class_count, cost, attack, health, armor, name_size, description_size = DEFINITION_RECORD.unpack_from(data, offset)
+    offset += DEFINITION_RECORD.size
+    card_classes = tuple(CARD_CLASSES[index] for index in data[offset:offset + class_count])
+    offset += class_count
+    name = data[offset:offset + name_size].decode("utf-8")
+    offset += name_size
+    description = data[offset:offset + description_size].decode("utf-8")
+    return CardDefinition.intern(
+        name,
+        cost,
+        description,
+        card_classes,
+        CARD_TYPES[card_type],
+        RARITIES[rarity],
+        None if race == NO_RACE else RACES[race],
+        attack,
+        health,
+        armor
+    )
+
+def encode_hero(hero: Hero) -> bytes:
+    """
+    Encodes a hero as a hero record.
+
+    Args:
+        hero (Hero): The hero to encode.
+
+    Returns:
+        bytes: The record.
+    """
+    name, description = hero.name.encode("utf-8"), hero.description.encode("utf-8")
+    body = HERO_RECORD.pack(
+        hero.id,
+        CARD_CLASSES.index(hero.hero_class),
+        HERO_POWERS.index(hero.hero_power),
+        hero.attack,
+        hero.health,
+        hero.mana,
+        hero.armor,
+        len(name),
+        len(description)
+    )
+    return pack_record(HERO_TAG, body + name + description)
+
+def decode_hero(data: bytes, offset: int) -> Hero:
+    """
+    Decodes the body of a hero record.
+
+    Args:
+        data (bytes): The content of the replay file.
+        offset (int): The start of the record's body.
+
+    Returns:
+        Hero: The hero.
+    """
+    hero_id, hero_class, hero_power, attack, health, mana, armor, name_size, description_size = HERO_RECORD.unpack_from(data, offset)
+    offset += HERO_RECORD.size
+    name = data[offset:offset + name_size].decode("utf-8")
+    description = data[offset + name_size:offset + name_size + description_size].decode("utf-8")
+    return Hero(hero_id, name, description, CARD_CLASSES[hero_class], HERO_POWERS[hero_power], attack, health, mana, armor)
+
+def hero_key(hero: Hero) -> tuple:
+    """
+    Returns the values identifying a hero, so that equal heroes are stored once per file.
+
+    Args:
+        hero (Hero): The hero.
+
+    Returns:
+        tuple: The hero's fields.
+    """
+    return tuple(getattr(hero, field) for field in Hero.__slots__)
+
+def index_path(file_path: str) -> str:
+    """
+    Returns the path of the index of a replay log.
+
+    Args:
+        file_path (str): Path to the replay log.
+
+    Returns:
+        str: The path of its index (e.g. "replays.bin.idx").
+    """
+    return file_path + INDEX_SUFFIX
+
+# Class
+class GameRecorder:
+    """
+    Records the actions of a game as they are applied, with a full copy of the state every few turns.
+
+    Attributes:
+        engine (GameEngine): The game being recorded, from its first turn.
+        checkpoint_turns (int): The number of turns between two checkpoints.
+        actions (bytearray): The code of each action applied, in order.
+        checkpoints (list[tuple[int, int, GameEngine]]): The turn, the index of the next action and a copy of the game
+            for each checkpoint, the first one being the state in which the recording started.
+    """
+
+    def __init__(self, engine: GameEngine, checkpoint_turns: int = REPLAY_CHECKPOINT_TURNS) -> None:
+        """
+        Starts recording a game.
+
+        Args:
+            engine (GameEngine): The game to record, before any action was applied.
+            checkpoint_turns (int): The number of turns between two checkpoints. Defaults to `REPLAY_CHECKPOINT_TURNS`.
+
+        Raises:
+            ValueError: If `checkpoint_turns` is not positive.
+        """
+        if checkpoint_turns < 1:
+            raise ValueError(f"Invalid checkpoint spacing: {checkpoint_turns}. It must be at least 1 turn.")
+        self.engine = engine
+        self.checkpoint_turns = checkpoint_turns
+        self.actions = bytearray()
+        self.checkpoints: list[tuple[int, int, GameEngine]] = [(engine.turn, 0, engine.clone())]
+
+    def apply(self, action: Action) -> None:
+        """
+        Applies an action to the game and records it, adding a checkpoint when enough turns went by.
+
+        Args:
+            action (Action): One of the engine's legal actions.
+
+        Raises:
+            ValueError: If the engine refuses the action.
+        """
+        engine = self.engine
+        turn = engine.turn
+        engine.apply(action)  # Validates the action before it is recorded
+        self.actions.append(ACTION_CODES[action])
+        if engine.turn != turn and engine.turn >= self.checkpoints[-1][0] + self.checkpoint_turns and not engine.is_terminal():
+            self.checkpoints.append((engine.turn, len(self.actions), engine.clone()))
+
+class ReplayWriter:
+    """
+    Appends recorded games to a replay log and their entries to its index.
+
+    Each game is written with a single append, after the definitions and heroes it uses for the first time,
+    so a crash can only cut the last record short. Its index entry is written once the game is on disk.
+    Opening a log reads only its index and the records the index points to, drops a record cut short
+    and indexes the complete games the index misses.
+
+    Attributes:
+        file_path (str): Path to the replay log.
+        games (int): The number of games in the log.
+    """
+
+    def __init__(self, file_path: str = REPLAY_PATH) -> None:
+        """
+        Opens a replay log for appending, creating it and its index if needed.
+
+        Args:
+            file_path (str): Path to the replay log. Defaults to `REPLAY_PATH`.
+
+        Raises:
+            ValueError: If the file exists and is not a replay log of the current version.
+        """
+        self.file_path = file_path
+        self.definitions: dict[CardDefinition, int] = {}
+        self.heroes: dict[tuple, int] = {}
+        self.games = 0
+
+        Database.ensure_directory_exists(file_path)
+        if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+            with ReplayReader(file_path) as reader:  # Validates the log and finds the end of its last complete record
+                self.definitions = {definition: index for index, definition in enumerate(reader.definitions)}
+                self.heroes = {hero_key(hero): index for index, hero in enumerate(reader.heroes)}
+                self.games = len(reader)
+                size, indexed, tail = reader.size, reader.indexed, reader.tail
+            self.file = open(file_path, "r+b")
+            self.file.truncate(size)
+            self.file.seek(size)
+        else:
+            self.file = open(file_path, "wb")
+            self.file.write(HEADER.pack(MAGIC, VERSION, 0))
+            indexed, tail = 0, []
+
+        # Keep the entries the reader trusted, then index the games found after them
+        if indexed:
+            self.index = open(index_path(file_path), "r+b")
+            self.index.truncate(HEADER.size + indexed * INDEX_ENTRY.size)
+            self.index.seek(0, os.SEEK_END)
+        else:
+            self.index = open(index_path(file_path), "wb")
+            self.index.write(HEADER.pack(INDEX_MAGIC, VERSION, 0))
+        self.index.write(b"".join(INDEX_ENTRY.pack(*entry) for entry in tail))
+        self.file.flush()
+        self.index.flush()
+
+    def __enter__(self) -> "ReplayWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the log and its index.
+        """
+        self.file.close()
+        self.index.close()
+
+    def write(self, recorder: GameRecorder) -> int:
+        """
+        Appends a recorded game to the log.
+
+        Args:
+            recorder (GameRecorder): The recorder of the game, usually once the game is over.
+
+        Returns:
+            int: The index of the game in the log.
+        """
+        engine = recorder.engine
+        player_1, player_2 = engine.logic.player_1, engine.logic.player_2
+        definitions, heroes = dict(self.definitions), dict(self.heroes)  # Committed once the game is written
+        records: list[bytes] = []
+
+        def definition_index(definition: CardDefinition) -> int:
+            index = definitions.get(definition)
+            if index is None:
+                index = definitions[definition] = len(definitions)
+                records.append(encode_definition(definition))
+            return index
+
+        def hero_index(hero: Hero) -> int:
+            key = hero_key(hero)
+            index = heroes.get(key)
+            if index is None:
+                index = heroes[key] = len(heroes)
+                records.append(encode_hero(hero))
+            return index
+
+        entries, blob = [], bytearray()
+        for turn, action_index, state in recorder.checkpoints:
+            entries.append(CHECKPOINT_ENTRY.pack(turn, action_index, len(blob)))
+            blob += self.encode_state(state, definition_index)
+
+        seed = engine.rng.seed
+        seed_text = str(seed).encode("utf-8")
+        name_1, name_2 = player_1.name.encode("utf-8"), player_2.name.encode("utf-8")
+        winner = engine.winner()
+        header = GAME_HEADER.pack(
+            hero_index(player_1.hero),
+            hero_index(player_2.hero),
+            -1 if engine.turn_limit is None else engine.turn_limit,
+            0 if winner is None else (1 if winner is player_1 else 2),
+            STR_SEED if isinstance(seed, str) else INT_SEED,
+            len(recorder.actions),
+            len(entries),
+            len(name_1),
+            len(name_2),
+            len(seed_text)
+        )
+        records.append(pack_record(GAME_TAG, b"".join([header, name_1, name_2, seed_text, *entries, recorder.actions, blob])))
+
+        data = b"".join(records)
+        start = self.file.tell() + len(data) - len(records[-1]) + RECORD_HEADER.size  # Start of the game record's body
+        self.file.write(data)
+        self.file.flush()
+        self.index.write(INDEX_ENTRY.pack(start, len(definitions), len(heroes)))
+        self.index.flush()
+        self.definitions, self.heroes = definitions, heroes
+        self.games += 1
+        return self.games - 1
+
+    @staticmethod
+    def encode_state(engine: GameEngine, definition_index: callable) -> bytes:
+        """
+        Encodes the full state of a game as a checkpoint.
+
+        Args:
+            engine (GameEngine): The game.
+            definition_index (callable): Returns the index of a card definition in the log.
+
+        Returns:
+            bytes: The checkpoint.
+        """
+        player_1 = engine.logic.player_1
+        flags = ((PLAYER_1_TO_PLAY if engine.current_player is player_1 else 0)
+                 | (PLAYED_CARD if engine.played_card else 0)
+                 | (PLAYED_HERO_POWER if engine.played_hero_power else 0))
+        parts = [STATE_RECORD.pack(engine.turn, PHASE_ORDER.index(engine.phase), flags)]
+        for player in (player_1, engine.logic.player_2):
+            deck = player.deck
+            parts.append(PLAYER_RECORD.pack(player.attack, player.health, player.mana, player.armor,
+                                            len(deck.cards), len(deck.hand), len(deck.board), len(deck.graveyard)))
+            parts.extend(CARD_RECORD.pack(definition_index(card.definition), card.id) for card in deck.cards + deck.hand)
+            parts.extend(UNIT_RECORD.pack(definition_index(card.definition), card.id, card.attack, card.health, card.armor)
+                         for card in deck.board + deck.graveyard)
+        return b"".join(parts)
+
+class ReplayReader:
+    """
+    Maps a replay log into memory and finds its games through its index, decoding them on demand.
+
+    Opening a log decodes only its definitions and heroes. The index is searched for the games whose append
+    introduced them, so the cost of opening does not grow with the number of games. Records written after
+    the last indexed game, by an interrupted writer or to a log without index, are scanned.
+
+    Attributes:
+        file_path (str): Path to the replay log.
+        definitions (list[CardDefinition]): The card definitions of the log, by index.
+        heroes (list[Hero]): The heroes of the log, by index.
+        size (int): The end of the last complete record; a record cut short by a crash is ignored.
+        indexed (int): The number of games found through the index.
+        tail (list[tuple[int, int, int]]): The index entries of the games found after the indexed ones.
+    """
+
+    def __init__(self, file_path: str = REPLAY_PATH) -> None:
+        """
+        Opens a replay log and its index.
+
+        Args:
+            file_path (str): Path to the replay log. Defaults to `REPLAY_PATH`.
+
+        Raises:
+            ValueError: If the file is not a replay log of the current version.
+        """
+        with open(file_path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"Invalid replay file: {file_path}. The file is truncated.")
+            magic, version, _ = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"Invalid replay file: {file_path}. Not a replay log.")
+            if version != VERSION:
+                raise ValueError(f"Invalid replay file: {file_path}. Version {version} is not supported, expected {VERSION}.")
+            self.data = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+
+        self.file_path = file_path
+        self.definitions: list[CardDefinition] = []
+        self.heroes: list[Hero] = []
+        self.index, self.indexed = self.open_index()
+        self.tail: list[tuple[int, int, int]] = []
+        try:
+            self.size = self.load_indexed()
+        except (ValueError, IndexError, struct.error):
+            # The index does not match the log: scan the whole log instead
+            self.definitions, self.heroes, self.indexed = [], [], 0
+            self.size = HEADER.size
+
+        data, offset = self.data, self.size
+        while offset + RECORD_HEADER.size <= len(data):
+            tag, size = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            if start + size > len(data):
+                break  # The last append was interrupted
+            if tag == GAME_TAG:
+                self.tail.append((start, len(self.definitions), len(self.heroes)))
+            else:
+                self.decode_record(tag, start, offset)
+            offset = start + size
+        self.size = offset
+
+    def __enter__(self) -> "ReplayReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmaps the log and its index. Games already decoded stay usable.
+        """
+        self.data.close()
+        if isinstance(self.index, mmap.mmap):
+            self.index.close()
+
+    def open_index(self) -> tuple[mmap.mmap | bytes, int]:
+        """
+        Maps the index of the log, if it has a valid one.
+
+        Returns:
+            tuple[mmap.mmap | bytes, int]: The index and the number of its entries pointing to complete games of the log.
+        """
+        try:
+            with open(index_path(self.file_path), "rb") as file:
+                count = (os.fstat(file.fileno()).st_size - HEADER.size) // INDEX_ENTRY.size  # A partly written entry is ignored
+                if count <= 0 or HEADER.unpack(file.read(HEADER.size)) != (INDEX_MAGIC, VERSION, 0):
+                    return b"", 0
+                index = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return b"", 0
+
+        # Entries can outlive their games if the log was cut after them
+        while count:
+            start = INDEX_ENTRY.unpack_from(index, HEADER.size + (count - 1) * INDEX_ENTRY.size)[0]
+            if HEADER.size + RECORD_HEADER.size <= start <= len(self.data) and start + RECORD_HEADER.unpack_from(self.data, start - RECORD_HEADER.size)[1] <= len(self.data):
+                break
+            count -= 1
+        return index, count
+
+    def load_indexed(self) -> int:
+        """
+        Decodes the definitions and heroes used by the indexed games, reading only the appends that introduced them.
+
+        Returns:
+            int: The end of the last indexed game.
+
+        Raises:
+            ValueError: If the index does not match the log.
+        """
+        if not self.indexed:
+            return HEADER.size
+        _, definitions, heroes = self.entry(self.indexed - 1)
+        while len(self.definitions) < definitions or len(self.heroes) < heroes:
+            known = (len(self.definitions), len(self.heroes))
+            game = bisect.bisect_left(range(self.indexed), True, key = lambda index: self.entry(index)[1] > known[0] or self.entry(index)[2] > known[1])
+            offset = self.game_end(self.entry(game - 1)[0]) if game else HEADER.size
+            end = self.entry(game)[0] - RECORD_HEADER.size
+            while offset < end:
+                tag, size = RECORD_HEADER.unpack_from(self.data, offset)
+                self.decode_record(tag, offset + RECORD_HEADER.size, offset)
+                offset += RECORD_HEADER.size + size
+            if offset != end or (len(self.definitions), len(self.heroes)) != self.entry(game)[1:]:
+                raise ValueError(f"Invalid replay index: {index_path(self.file_path)}. Entry {game} does not match the log.")
+        return self.game_end(self.entry(self.indexed - 1)[0])
+
+    def decode_record(self, tag: int, start: int, offset: int) -> None:
+        """
+        Decodes a definition or hero record and adds it to the log's.
+
+        Args:
+            tag (int): The kind of record.
+            start (int): The start of the record's body.
+            offset (int): The start of the record, for error messages.
+
+        Raises:
+            ValueError: If the record is neither a definition nor a hero.
+        """
+        if tag == DEFINITION_TAG:
+            self.definitions.append(decode_definition(self.data, start))
+        elif tag == HERO_TAG:
+            self.heroes.append(decode_hero(self.data, start))
+        else:
+            raise ValueError(f"Invalid replay file: {self.file_path}. Unknown record {tag} at offset {offset}.")
+
+    def game_end(self, start: int) -> int:
+        """
+        Args:
+            start (int): The start of a game record's body.
+
+        Returns:
+            int: The end of the record.
+
+        Raises:
+            ValueError: If there is no complete game record there.
+        """
+        tag, size = RECORD_HEADER.unpack_from(self.data, start - RECORD_HEADER.size)
+        if tag != GAME_TAG or start + size > len(self.data):
+            raise ValueError(f"Invalid replay index: {index_path(self.file_path)}. No game at offset {start}.")
+        return start + size
+
+    def entry(self, index: int) -> tuple[int, int, int]:
+        """
+        Args:
+            index (int): The index of a game.
+
+        Returns:
+            tuple[int, int, int]: The start of the game record's body and the number of definitions and heroes written up to it.
+        """
+        if index < self.indexed:
+            return INDEX_ENTRY.unpack_from(self.index, HEADER.size + index * INDEX_ENTRY.size)
+        return self.tail[index - self.indexed]
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of games in the log.
+        """
+        return self.indexed + len(self.tail)
+
+    def game(self, index: int) -> "GameReplay":
+        """
+        Decodes one game of the log.
+
+        Args:
+            index (int): The index of the game, as returned by `ReplayWriter.write`.
+
+        Returns:
+            GameReplay: The game.
+
+        Raises:
+            IndexError: If the log has no such game.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Game {index} is not in the replay log.")
+        return GameReplay(self, self.entry(index)[0])
+
+class GameReplay:
+    """
+    One recorded game, which can be restored at any turn.
+
+    Seeking restores the nearest checkpoint at or before the turn and replays only the actions after it,
+    so at most `REPLAY_CHECKPOINT_TURNS` turns are replayed whatever the length of the game.
+
+    Attributes:
+        names (tuple[str, str]): The names of both players.
+        heroes (tuple[Hero, Hero]): The heroes of both players.
+        seed (int | str): The seed of the game.
+        turn_limit (int | None): Number of turns after which the game was a draw (None for no limit).
+        winner (int): The number of the winning player (0 for a draw or an unfinished game).
+        actions (list[Action]): The actions applied, in order.
+        checkpoints (list[tuple[int, int, int]]): The turn, the index of the next action and the offset of each checkpoint.
+    """
+
+    def __init__(self, reader: ReplayReader, offset: int) -> None:
+        """
+        Decodes the header, the actions and the checkpoint index of a game record.
+
+        Args:
+            reader (ReplayReader): The log holding the game.
+            offset (int): The start of the game record's body.
+        """
+        _, size = RECORD_HEADER.unpack_from(reader.data, offset - RECORD_HEADER.size)
+        data, offset = reader.data[offset:offset + size], 0  # A copy, so the game outlives the mapping of the log
+        hero_1, hero_2, turn_limit, winner, seed_kind, action_count, checkpoint_count, name_1_size, name_2_size, seed_size = GAME_HEADER.unpack_from(data, offset)
+        offset += GAME_HEADER.size
+        self.names = (data[offset:offset + name_1_size].decode("utf-8"), data[offset + name_1_size:offset + name_1_size + name_2_size].decode("utf-8"))
+        offset += name_1_size + name_2_size
+        seed = data[offset:offset + seed_size].decode("utf-8")
+        offset += seed_size
+
+        self.definitions = reader.definitions
+        self.heroes = (reader.heroes[hero_1], reader.heroes[hero_2])
+        self.seed = seed if seed_kind == STR_SEED else int(seed)
+        self.turn_limit = None if turn_limit < 0 else turn_limit
+        self.winner = winner
+        self.checkpoints = list(CHECKPOINT_ENTRY.iter_unpack(data[offset:offset + checkpoint_count * CHECKPOINT_ENTRY.size]))
+        offset += checkpoint_count * CHECKPOINT_ENTRY.size
+        self.actions = [ACTIONS[code] for code in data[offset:offset + action_count]]
+        self.data = data
+        self.blob_start = offset + action_count
+        self.turns = [turn for turn, _, _ in self.checkpoints]  # Searched by `seek`
+
+    def restore(self, checkpoint: int) -> GameEngine:
+        """
+        Rebuilds the game as it was at one of its checkpoints.
+
+        Args:
+            checkpoint (int): The index of the checkpoint.
+
+        Returns:
+            GameEngine: A new engine in the checkpoint's state.
+        """
+        data, definitions = self.data, self.definitions
+        offset = self.blob_start + self.checkpoints[checkpoint][2]
+        turn, phase, flags = STATE_RECORD.unpack_from(data, offset)
+        offset += STATE_RECORD.size
+
+        players = []
+        for name, hero in zip(self.names, self.heroes):
+            attack, health, mana, armor, deck_size, hand_size, board_size, graveyard_size = PLAYER_RECORD.unpack_from(data, offset)
+            offset += PLAYER_RECORD.size
+            zones = []
+            for size, status in ((deck_size, CardStatus.IN_DECK), (hand_size, CardStatus.IN_HAND)):
+                cards = []
+                for definition, card_id in CARD_RECORD.iter_unpack(data[offset:offset + size * CARD_RECORD.size]):
+                    definition = definitions[definition]
+                    cards.append((Unit if definition.card_type == CardType.UNIT else Spell).from_definition(definition, card_id, status))
+                zones.append(cards)
+                offset += size * CARD_RECORD.size
+            for size, status in ((board_size, CardStatus.ON_BOARD), (graveyard_size, CardStatus.IN_GRAVEYARD)):
+                cards = []
+                for definition, card_id, card_attack, card_health, card_armor in UNIT_RECORD.iter_unpack(data[offset:offset + size * UNIT_RECORD.size]):
+                    definition = definitions[definition]
+                    card = (Unit if definition.card_type == CardType.UNIT else Spell).from_definition(definition, card_id, status)
+                    card.attack, card.health, card.armor = card_attack, card_health, card_armor
+                    cards.append(card)
+                zones.append(cards)
+                offset += size * UNIT_RECORD.size
+            player = Player(name, hero, Deck(*zones))
+            player.set_stats(attack, health, mana, armor)
+            players.append(player)
+
+        return GameEngine.resume(
+            players[0],
+            players[1],
+            player_1_to_play=bool(flags & PLAYER_1_TO_PLAY),
+            turn=turn,
+            phase=PHASE_ORDER[phase],
+            played_card=bool(flags & PLAYED_CARD),
+            played_hero_power=bool(flags & PLAYED_HERO_POWER),
+            turn_limit=self.turn_limit,
+            rng=GameRandom(self.seed)
+        )
+
+    def seek(self, turn: int) -> GameEngine:
+        """
+        Rebuilds the game at the first decision of a turn, from the nearest checkpoint.
+
+        Args:
+            turn (int): The turn to reach. Turns past the end of the game give its final state.
+
+        Returns:
+            GameEngine: A new engine at the start of the turn, or later in it if the turn started with no choice.
+        """
+        checkpoint = max(bisect.bisect_right(self.turns, turn) - 1, 0)
+        engine = self.restore(checkpoint)
+        actions, index = self.actions, self.checkpoints[checkpoint][1]
+        while engine.turn < turn and index < len(actions):
+            engine.apply(actions[index])
+            index += 1
+        return engine
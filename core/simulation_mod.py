@@ -0,0 +1,360 @@
+#!/usr/bin/python3
+
+# Imports
+import math
+import os
+import time
+from multiprocessing import Barrier, Pool
+
+# Core Imports
+from core.game_engine import GameEngine
+from core.card_catalog import CardCatalog
+from core.binary_catalog import BinaryCatalog
+from core.replay_log import GameRecorder, ReplayWriter
+from core.match_history import MatchHistory, MatchRecord
+from core.deck_codes import decode_deck
+
+# Modules Imports
+from modules.deck_mod import Deck
+from modules.player_mod import Player
+
+# AI Imports
+from ai.random_ai import RandomAI
+
+# Utils Imports
+from utils.constants import SIMULATION_TURN_LIMIT, CATALOG_PATH
+from utils.rng_utils import GameRandom, derive_seed
+
+# Worker state, set once per process by `init_worker`
+_worker_state: dict = {}
+
+# Functions
+def resolve_player(config: Player | tuple, catalog: CardCatalog = None) -> Player:
+    """
+    Returns the player template described by a configuration.
+
+    Args:
+        config (Player | tuple): A player, a `(name, hero id, card catalog ids)` tuple or a `(name, deck code)` tuple.
+        catalog (CardCatalog, optional): The catalog the ids refer to. Required for tuples.
+
+    Returns:
+        Player: The player template.
+
+    Raises:
+        ValueError: If the deck code is invalid or was made for another catalog.
+    """
+    if isinstance(config, Player):
+        return config
+    if len(config) == 2:
+        name, code = config
+        hero_id, card_ids = decode_deck(code, catalog.fingerprint())
+    else:
+        name, hero_id, card_ids = config
+    hero = catalog.create_hero(catalog.get_hero_by_id(hero_id))
+    return Player(name=name, hero=hero, deck=Deck(cards=catalog.create_deck_cards(card_ids)))
+
+def new_player(template: Player) -> Player:
+    """
+    Creates a fresh player, ready for a new game, from a player used as a template.
+    Cards are cloned so the template is never modified and no card is rebuilt.
+
+    Args:
+        template (Player): The player to copy, as produced by `PlayerChoiceInterface.setup_player`.
+
+    Returns:
+        Player: A new player with the same name, hero and deck.
+    """
+    cards = [card.clone() for card in template.deck.cards + template.deck.hand + template.deck.board + template.deck.graveyard]
+    return Player(name=template.name, hero=template.hero, deck=Deck(cards=cards))
+
+def play_game(player_1: Player, player_2: Player, bot_1: type, bot_2: type, seed: str, turn_limit: int = SIMULATION_TURN_LIMIT, writer: ReplayWriter = None, history: MatchHistory = None) -> tuple[int, int]:
+    """
+    Plays one game between two bots.
+
+    Args:
+        player_1 (Player): The template of the first player.
+        player_2 (Player): The template of the second player.
+        bot_1 (type): The bot class playing for the first player.
+        bot_2 (type): The bot class playing for the second player.
+        seed (str): The seed of the game.
+        turn_limit (int): Number of turns after which the game is a draw.
+        writer (ReplayWriter, optional): The replay log the game is appended to. Defaults to None, for no recording.
+        history (MatchHistory, optional): The match history the result is appended to. Defaults to None.
+
+    Returns:
+        tuple[int, int]: The number of the winning player (0 for a draw) and the number of turns played.
+    """
+    started = time.perf_counter()
+    rng = GameRandom(seed)  # Every draw of the game comes from its own streams, never from the global generator
+
+    first, second = new_player(player_1), new_player(player_2)
+    first.deck.shuffle(rng.stream("shuffle", 1))
+    second.deck.shuffle(rng.stream("shuffle", 2))
+    bots = {id(first): bot_1(seed=derive_seed(seed, "bot", 1)), id(second): bot_2(seed=derive_seed(seed, "bot", 2))}
+
+    engine = GameEngine(first, second, turn_limit=turn_limit, rng=rng)
+    recorder = GameRecorder(engine) if writer is not None else None
+    apply = recorder.apply if recorder is not None else engine.apply
+    while not engine.is_terminal():
+        apply(bots[id(engine.current_player)].choose_action(engine))
+    if recorder is not None:
+        writer.write(recorder)
+    if history is not None:
+        history.append(MatchRecord.from_engine(engine, time.perf_counter() - started))
+
+    winner = engine.winner()
+    if winner is None:
+        return 0, engine.turn
+    return (1 if winner is first else 2), engine.turn
+
+def worker_path(path: str) -> str:
+    """
+    Returns the path of the current process's own copy of a replay log or match history,
+    so that worker processes never append to the same file.
+
+    Args:
+        path (str): The path of the log or history.
+
+    Returns:
+        str: The path with the process id before its extension (e.g. "replays-1234.bin").
+    """
+    root, extension = os.path.splitext(path)
+    return f"{root}-{os.getpid()}{extension}"
+
+def init_worker(player_1: Player | tuple, player_2: Player | tuple, bot_1: type, bot_2: type, turn_limit: int, catalog_path: str = None, replay_path: str = None, history_path: str = None, per_worker: bool = False, barrier: Barrier = None) -> None:
+    """
+    Stores the templates of both players in the worker process, so that they are sent and built only once per worker.
+    Players given by catalog ids are built from the worker's own copy of the binary catalog.
+    The replay log and match history the games are recorded in are opened once per worker.
+
+    Args:
+        player_1 (Player | tuple): The first player or its configuration.
+        player_2 (Player | tuple): The second player or its configuration.
+        bot_1 (type): The bot class playing for the first player.
+        bot_2 (type): The bot class playing for the second player.
+        turn_limit (int): Number of turns after which a game is a draw.
+        catalog_path (str, optional): Path to the binary catalog, loaded only if a configuration needs it.
+        replay_path (str, optional): Path to the replay log of the games. Defaults to None, for no replays.
+        history_path (str, optional): Directory of the match history of the games. Defaults to None, for no history.
+        per_worker (bool): Whether the worker records in its own log and history (see `worker_path`). Defaults to False.
+        barrier (Barrier, optional): The barrier of the pool's workers, waited on by `close_pool_worker`. Defaults to None.
+    """
+    catalog = None
+    if not (isinstance(player_1, Player) and isinstance(player_2, Player)):
+        catalog = BinaryCatalog.load(catalog_path)
+    if per_worker:
+        replay_path = worker_path(replay_path) if replay_path is not None else None
+        history_path = worker_path(history_path) if history_path is not None else None
+    _worker_state.update(
+        catalog=catalog,
+        player_1=resolve_player(player_1, catalog),
+        player_2=resolve_player(player_2, catalog),
+        bot_1=bot_1,
+        bot_2=bot_2,
+        turn_limit=turn_limit,
+        writer=ReplayWriter(replay_path) if replay_path is not None else None,
+        history=MatchHistory(history_path) if history_path is not None else None,
+        barrier=barrier
+    )
+
+def close_worker() -> None:
+    """
+    Closes the replay log and match history of the current process, if any.
+    """
+    for name in ("writer", "history"):
+        recorder = _worker_state.pop(name, None)
+        if recorder is not None:
+            recorder.close()
+
+def close_pool_worker(_: int) -> None:
+    """
+    Closes the replay log and match history of a pool's worker, then waits for the other workers.
+    A worker waiting on the barrier takes no other task, so sending one task per worker closes every worker exactly once.
+    """
+    close_worker()
+    _worker_state["barrier"].wait()
+
+def play_games(seed: int, start: int, stop: int) -> tuple[int, int, int, int]:
+    """
+    Plays the games numbered from `start` to `stop` (excluded) with the worker's templates.
+
+    Args:
+        seed (int): The seed of the simulation.
+        start (int): Number of the first game.
+        stop (int): Number after the last game.
+
+    Returns:
+        tuple[int, int, int, int]: The wins of each player, the number of draws and the total number of turns.
+    """
+    results = [0, 0, 0]
+    total_turns = 0
+    for game_number in range(start, stop):
+        winner, turns = play_game(
+            _worker_state["player_1"],
+            _worker_state["player_2"],
+            _worker_state["bot_1"],
+            _worker_state["bot_2"],
+            f"{seed}:{game_number}",
+            _worker_state["turn_limit"],
+            _worker_state.get("writer"),
+            _worker_state.get("history")
+        )
+        results[winner - 1 if winner else 2] += 1
+        total_turns += turns
+    return results[0], results[1], results[2], total_turns
+
+# Class
+class SimulationResult:
+    """
+    Aggregated outcome of a series of simulated games.
+
+    Attributes:
+        games (int): The number of games played.
+        wins (tuple[int, int]): The number of games won by each player.
+        draws (int): The number of games that reached the turn limit.
+        average_turns (float): The average number of turns per game.
+    """
+
+    def __init__(self, wins_1: int, wins_2: int, draws: int, total_turns: int) -> None:
+        """
+        Initializes the result from raw counts.
+
+        Args:
+            wins_1 (int): Games won by the first player.
+            wins_2 (int): Games won by the second player.
+            draws (int): Games ending in a draw.
+            total_turns (int): Number of turns played over all games.
+        """
+        self.games = wins_1 + wins_2 + draws
+        self.wins = (wins_1, wins_2)
+        self.draws = draws
+        self.average_turns = total_turns / self.games if self.games else 0.0
+
+    def win_rate(self, player_number: int) -> float:
+        """
+        Returns the proportion of games won by a player.
+
+        Args:
+            player_number (int): The number of the player (1 or 2).
+
+        Returns:
+            float: The win rate, between 0 and 1.
+        """
+        return self.wins[player_number - 1] / self.games if self.games else 0.0
+
+    def confidence_interval(self, player_number: int, z: float = 1.96) -> tuple[float, float]:
+        """
+        Returns the Wilson score interval of a player's win rate.
+
+        Args:
+            player_number (int): The number of the player (1 or 2).
+            z (float): The normal quantile of the confidence level (1.96 for 95%).
+
+        Returns:
+            tuple[float, float]: The lower and upper bounds of the interval.
+        """
+        if not self.games:
+            return 0.0, 1.0
+        rate = self.win_rate(player_number)
+        denominator = 1 + z * z / self.games
+        center = (rate + z * z / (2 * self.games)) / denominator
+        margin = z * math.sqrt(rate * (1 - rate) / self.games + z * z / (4 * self.games * self.games)) / denominator
+        return max(0.0, center - margin), min(1.0, center + margin)
+
+    def __str__(self) -> str:
+        """
+        String representation of the result.
+
+        Returns:
+            str: The win rates of both players with their 95% confidence intervals.
+        """
+        lines = [f"{self.games} games, {self.draws} draws, {self.average_turns:.1f} turns per game"]
+        for player_number in (1, 2):
+            low, high = self.confidence_interval(player_number)
+            lines.append(f"Player {player_number}: {self.win_rate(player_number):.1%} [{low:.1%}, {high:.1%}]")
+        return "\n".join(lines)
+
+class MatchSimulator:
+    """
+    Plays many bot-vs-bot games between two players and spreads them across a pool of processes.
+
+    Attributes:
+        player_1 (Player | tuple): The first player or its configuration.
+        player_2 (Player | tuple): The second player or its configuration.
+        bot_1 (type): The bot class playing for the first player.
+        bot_2 (type): The bot class playing for the second player.
+        processes (int): The number of worker processes (1 plays in the current process).
+        turn_limit (int): Number of turns after which a game is a draw.
+        catalog_path (str): Path to the binary catalog used to build configured players.
+        replay_path (str | None): Path to the replay log of the games, None for no replays.
+        history_path (str | None): Directory of the match history of the games, None for no history.
+    """
+
+    def __init__(self, player_1: Player | tuple, player_2: Player | tuple, bot_1: type = RandomAI, bot_2: type = RandomAI, processes: int = None, turn_limit: int = SIMULATION_TURN_LIMIT, catalog_path: str = CATALOG_PATH, replay_path: str = None, history_path: str = None) -> None:
+        """
+        Initializes the simulator.
+
+        Args:
+            player_1 (Player | tuple): The first player, as produced by `PlayerChoiceInterface.setup_player`,
+                or a `(name, hero id, card catalog ids)` or `(name, deck code)` configuration.
+            player_2 (Player | tuple): The second player or its configuration.
+            bot_1 (type): The bot class playing for the first player. Defaults to RandomAI.
+            bot_2 (type): The bot class playing for the second player. Defaults to RandomAI.
+            processes (int, optional): The number of worker processes. Defaults to the number of cores.
+            turn_limit (int): Number of turns after which a game is a draw.
+            catalog_path (str): Path to the binary catalog. Defaults to `CATALOG_PATH`.
+            replay_path (str, optional): Path to the replay log every game is recorded in. With several processes,
+                each worker writes its own log next to it (see `worker_path`). Defaults to None, for no replays.
+            history_path (str, optional): Directory of the match history every game is appended to, with one history
+                per worker as for the replays. Defaults to None, for no history.
+
+        Raises:
+            TypeError: If a player is neither a Player nor a configuration.
+            ValueError: If the number of processes is not positive.
+        """
+        for name, player in (("player_1", player_1), ("player_2", player_2)):
+            if not isinstance(player, (Player, tuple)) or (isinstance(player, tuple) and len(player) not in (2, 3)):
+                raise TypeError(f"Expected '{name}' to be a Player, a (name, hero id, card ids) or a (name, deck code) tuple, got {type(player).__name__}")
+        self.player_1 = player_1
+        self.player_2 = player_2
+        self.bot_1 = bot_1
+        self.bot_2 = bot_2
+
+        self.processes = processes or os.cpu_count() or 1
+        if self.processes < 1:
+            raise ValueError(f"Invalid number of processes: {self.processes}. Must be positive.")
+        self.turn_limit = turn_limit
+        self.catalog_path = catalog_path
+        self.replay_path = replay_path
+        self.history_path = history_path
+
+    def run(self, games: int, seed: int = 0) -> SimulationResult:
+        """
+        Plays `games` games. Each game is seeded from `seed` and its number, so the result
+        does not depend on the number of processes.
+
+        Args:
+            games (int): The number of games to play.
+            seed (int): The seed of the simulation.
+
+        Returns:
+            SimulationResult: The aggregated outcome of the games.
+        """
+        worker_args = (self.player_1, self.player_2, self.bot_1, self.bot_2, self.turn_limit, self.catalog_path, self.replay_path, self.history_path)
+        if self.processes == 1:
+            init_worker(*worker_args)
+            try:
+                return SimulationResult(*play_games(seed, 0, games))
+            finally:
+                close_worker()
+
+        # A few chunks per process balance the load while keeping inter-process traffic low
+        chunk_count = min(games, self.processes * 4) or 1
+        bounds = [games * index // chunk_count for index in range(chunk_count + 1)]
+        chunks = [(seed, bounds[index], bounds[index + 1]) for index in range(chunk_count)]
+
+        barrier = Barrier(self.processes)
+        with Pool(self.processes, initializer=init_worker, initargs=worker_args + (True, barrier)) as pool:
+            totals = [sum(counts) for counts in zip(*pool.starmap(play_games, chunks))]
+            pool.map(close_pool_worker, range(self.processes), chunksize=1)  # Close the workers' files before the pool stops them
+        return SimulationResult(*totals)
@@ -0,0 +1,21 @@
+#!/usr/bin/python3
+
+# Imports
+from enum import Enum
+
+# Class
+class ActionType(Enum):
+    """
+    Represents the different actions a player can take during their turn.
+
+    - PLAY_CARD: Play a unit or a spell from the hand.
+    - USE_HERO_POWER: Spend mana to increase the hero's attack.
+    - ATTACK: Attack with a unit on the board.
+    - HERO_ATTACK: Attack with the hero.
+    - PASS: Skip the current phase of the turn.
+    """
+    PLAY_CARD = "play_card"
+    USE_HERO_POWER = "use_hero_power"
+    ATTACK = "attack"
+    HERO_ATTACK = "hero_attack"
+    PASS = "pass"
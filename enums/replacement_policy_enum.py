@@ -0,0 +1,15 @@
+#!/usr/bin/python3
+
+# Imports
+from enum import Enum
+
+# Class
+class ReplacementPolicy(Enum):
+    """
+    Represents how a transposition table chooses between a new entry and the entry already in its slot.
+
+    - ALWAYS: The new entry always replaces the stored one.
+    - DEPTH_PREFERRED: The stored entry is kept if it is deeper than the new one, unless it comes from an older search.
+    """
+    ALWAYS = "always"
+    DEPTH_PREFERRED = "depth_preferred"
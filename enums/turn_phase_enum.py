@@ -0,0 +1,17 @@
+#!/usr/bin/python3
+
+# Imports
+from enum import Enum
+
+# Class
+class TurnPhase(Enum):
+    """
+    Represents the successive phases of a player's turn.
+
+    A turn always goes through the phases in this order: the player may play a card, 
+    then use their hero power, then attack with their units, and finally attack with their hero.
+    """
+    PLAY_CARD = "play_card"
+    HERO_POWER = "hero_power"
+    ATTACK = "attack"
+    HERO_ATTACK = "hero_attack"
@@ -10,54 +10,53 @@ from rich.prompt import Prompt, IntPrompt
 from rich.table import Table
 from rich.progress import Progress
 
+# Core Imports
+from core.card_catalog import CardCatalog
+from core.deck_codes import DeckLibrary, decode_deck
+
 # Modules Imports
-from modules.hero_mod import Hero
-from modules.unit_mod import Unit
-from modules.spell_mod import Spell
 from modules.deck_mod import Deck
+from modules.hero_mod import Hero
 from modules.player_mod import Player
 
 # Utils Imports
-from utils.constants import HEROES_TABLE_NAME, SPELLS_TABLE_NAME, UNITS_TABLE_NAME
-from utils.database_utils import Database
+from utils.constants import AI_PLAYER_NAME
+from utils.repository_utils import CardRepository
+from utils.rng_utils import GameRandom
 
 # Enum Imports
 from enums.card_class_enum import CardClass
-from enums.hero_power_enum import HeroPower
-from enums.race_enum import Race
-from enums.rarity_enum import Rarity
-from enums.card_status_enum import CardStatus
 
 # Class
 class PlayerChoiceInterface():
     """
     Handles the player's choice interface, allowing them to select a game mode, 
     choose a hero, and set up their deck.
+
+    Attributes:
+        game_mode (str | None): The selected game mode ("PVP" or "PVAI"), None until it is chosen.
+        rng (GameRandom): The random streams of the game, shuffling the decks and choosing the AI's hero.
     """
 
-    def __init__(self, hearthstone_db: TinyDB):
+    def __init__(self, hearthstone_db: TinyDB, catalog: CardCatalog = None, rng: GameRandom = None):
         """
         Initializes the PlayerChoiceInterface.
 
         Args:
             hearthstone_db (TinyDB): The database containing the game data.
+            catalog (CardCatalog, optional): The loaded card catalog. If None, it is loaded from the database.
+            rng (GameRandom, optional): The random streams of the game. Defaults to None, for streams with a random seed.
         """
         self.hearthstone_db = hearthstone_db  # Store the database reference
         self.console = Console()  # Initialize the Console object for styled output
+        self.game_mode = None  # Set once the player has chosen the game mode
+        self.rng = rng if rng is not None else GameRandom()  # Its seed replays the setup and the game
 
-        # Fetch and organize all hero data from the database
-        self.heroes_table = Database.fetch_all_from_table(self.hearthstone_db, HEROES_TABLE_NAME)
-        self.heroes = {hero_class: [hero["name"] for hero in heroes] for item in self.heroes_table for hero_class, heroes in item.items()}
+        # Load all heroes, units and spells once into an indexed catalog
+        self.catalog = catalog if catalog is not None else CardCatalog.from_database(self.hearthstone_db)
+        self.heroes = {hero_class.name: [hero["name"] for hero in self.catalog.heroes_by_class(hero_class)] for hero_class in self.catalog.hero_classes()}
         self.heroes_class = {str(idx + 1): hero_class for idx, hero_class in enumerate(self.heroes.keys())}  # Mapping class indexes to hero classes
 
-        # Fetch and organize all unit data from the database
-        self.units_table = Database.fetch_all_from_table(self.hearthstone_db, UNITS_TABLE_NAME)
-        self.units = {unit_class: [unit for unit in units] for item in self.units_table for unit_class, units in item.items()}
-
-        # Fetch and organize all spell data from the database
-        self.spells_table = Database.fetch_all_from_table(self.hearthstone_db, SPELLS_TABLE_NAME)
-        self.spells = {spell_class: [spell for spell in spells] for item in self.spells_table for spell_class, spells in item.items()}
-
     def choose_game_mode(self) -> str:
         """
         Displays an enhanced interface for selecting the game mode.
@@ -71,7 +70,7 @@ class PlayerChoiceInterface():
         # Prompt the user to select a game mode with a list of options
         game_mode = Prompt.ask(
             "[yellow]Select Game Mode[/yellow]",
-            choices=["PVP"],  # Only allowing "PVP" for now
+            choices=["PVP", "PVAI"],  # Against another player or against the AI
             default="PVP"  # Default to "PVP"
         )
         self.console.clear()  # Clear the console screen
@@ -81,10 +80,56 @@ class PlayerChoiceInterface():
 
         return game_mode  # Return the selected game mode
 
+    def choose_deck(self, player_number: int) -> tuple[Hero, Deck] | None:
+        """
+        Offers to play a saved deck or a deck code instead of creating a new deck.
+        The deck is built from its decoded code, and a deck entered as a code is saved under the name of its hero.
+
+        Args:
+            player_number (int): The number of the player (1 or 2).
+
+        Returns:
+            tuple[Hero, Deck] | None: The hero and the deck, or None to create a new deck.
+        """
+        library = DeckLibrary(self.hearthstone_db, self.catalog.fingerprint())
+        deck_names = {str(index + 1): name for index, name in enumerate(library.names())}  # Mapping deck indexes to deck names
+
+        # Display the saved decks
+        self.console.print(Panel(f"[bold cyan]Setting up player {player_number}[/bold cyan]", border_style="blue", expand=False))
+        deck_table = Table(title="\n[bold cyan]Saved decks[/bold cyan]")  # Initialize a table to display the saved decks
+        deck_table.add_column("Index", justify="center", style="magenta", no_wrap=True)  # Add columns for index and deck name
+        deck_table.add_column("Decks", justify="left", style="yellow")
+        for deck_index, deck_name in deck_names.items():
+            deck_table.add_row(deck_index, deck_name)
+        deck_table.add_row("C", "Enter a deck code")
+        deck_table.add_row("N", "Create a new deck")
+        self.console.print(deck_table)  # Display the table of decks
+
+        while True:
+            deck_choice = Prompt.ask("[yellow]Enter your deck number[/yellow]", choices=list(deck_names.keys()) + ["C", "N"], default="N")
+            if deck_choice == "N":
+                self.console.clear()  # Clear the console screen
+                return None  # Create a new deck
+            try:
+                if deck_choice == "C":
+                    deck_code = Prompt.ask("[yellow]Enter your deck code[/yellow]").strip()
+                    hero_id, card_ids = decode_deck(deck_code, library.fingerprint)
+                else:
+                    hero_id, card_ids = library.load(deck_names[deck_choice])
+                selected_hero = self.catalog.create_hero(self.catalog.get_hero_by_id(hero_id))
+                deck = Deck(cards=self.catalog.create_deck_cards(card_ids))
+            except (KeyError, ValueError) as error:  # Invalid codes, codes of another catalog, unknown ids or too many cards
+                print(f"[red]Error: {error}[/red]")
+                continue
+            if deck_choice == "C":
+                library.save(selected_hero.name, hero_id, card_ids)  # Offer the deck in the saved decks from now on
+            self.console.clear()  # Clear the console screen
+            return selected_hero, deck
+
     def setup_player(self, player_number: int) -> Player:
         """
-        Sets up a player by asking for their name, selecting a hero, 
-        and creating their deck.
+        Sets up a player by asking for their name, then loading a saved deck or a deck code,
+        or selecting a hero and creating their deck.
 
         Args:
             player_number (int): The number of the player (1 or 2).
@@ -100,6 +145,18 @@ class PlayerChoiceInterface():
         player_name = Prompt.ask("\n[yellow]What's your name?[/yellow]", default=f"Player{player_number}")
         self.console.clear()  # Clear the console screen again
 
+        # Play a saved deck or a deck code if the player chooses one
+        saved_deck = self.choose_deck(player_number)
+        if saved_deck is not None:
+            selected_hero, deck = saved_deck
+            deck.shuffle(self.rng.stream("shuffle", player_number))
+            with CardRepository(db=self.hearthstone_db) as repository:
+                repository.add(selected_hero)
+                repository.add_all(deck.cards)
+            print(f"[green]Deck loaded with {deck.remaining} cards for {player_name}.[/green]")  # Show deck loading message
+            time.sleep(2)  # Pause for a brief moment
+            return Player(name=player_name, hero=selected_hero, deck=deck)
+
         # Display available classes
         self.console.print(Panel(f"[bold cyan]Setting up player {player_number}[/bold cyan]", border_style="blue", expand=False))
         class_table = Table(title="\n[bold cyan]Available classes[/bold cyan]")  # Initialize a table to display classes
@@ -138,98 +195,95 @@ class PlayerChoiceInterface():
         self.console.print(Panel(f"[bold cyan]Setting up player {player_number}[/bold cyan]", border_style="blue", expand=False))
         with Progress() as progress:  # Use the Progress context manager to display a loading progress bar
             level_bar = progress.add_task("[green]Loading data...[/green]", total=33)  # Create a new progress bar for loading
-            # Find the hero's data from the fetched hero table
-            for item in self.heroes_table:
-                if self.heroes_class[class_choice] in item:
-                    for hero in item[self.heroes_class[class_choice]]:
-                        if hero["name"] == selected_hero_name:
-                            hero_data = hero  # Store the selected hero's data
-                            break
+            # Find the hero's data in the catalog
+            hero_class = self.heroes_class[class_choice]
+            hero_data = self.catalog.get_hero(CardClass[hero_class], selected_hero_name)
             progress.update(level_bar, advance=1)  # Update the progress bar after checking hero data
 
             if hero_data:
-                # Create a Hero object using the fetched data
-                selected_hero = Hero(
-                    id=hero_data["id"],
-                    name=hero_data["name"],
-                    description=hero_data["description"],
-                    hero_class=CardClass[hero_data["hero_class"].upper()],
-                    hero_power=HeroPower[hero_data["hero_power"].upper()],
-                    attack=hero_data["attack"],
-                    health=hero_data["health"],
-                    mana=hero_data["mana"],
-                    armor=hero_data["armor"]
-                )
+                selected_hero = self.catalog.create_hero(hero_data)  # Create a Hero object using the catalog data
             else:
                 print("[red]Error: Hero data not found![/red]")  # Print error if no hero data is found
                 return None  # Return None if no hero data was found
             progress.update(level_bar, advance=1)  # Update the progress bar
 
-            # Set up the deck for the selected hero class
-            hero_class = self.heroes_class[class_choice]
-            class_units = self.units.get(hero_class, [])  # Get units related to the selected class
-            class_spells = self.spells.get(hero_class, [])  # Get spells related to the selected class
-
-            if not class_units and not class_spells:
+            # Set up the deck with the precomputed cards of the selected hero class
+            deck_cards = self.catalog.create_class_cards(CardClass[hero_class])
+            if not deck_cards:
                 print("[red]Warning: No cards found for this hero class![/red]")  # Show warning if no units or spells found
+            progress.update(level_bar, advance=len(deck_cards))  # Update the progress bar after building the deck
 
-            deck_cards = []  # Initialize a list to store the deck cards
-
-            # Add units to the deck
-            for unit in class_units:
-                deck_cards.append(Unit(
-                    id=len(deck_cards) + 1,
-                    name=unit.get("name", ""),
-                    cost=unit.get("cost", 0),
-                    description=unit.get("description", ""),
-                    attack=unit.get("attack", 0),
-                    health=unit.get("health", 0),
-                    armor=unit.get("armor", 0),
-                    unit_race=Race[unit.get("race", "ALL").upper()],
-                    card_classes=[CardClass[hero_class.upper()]],
-                    card_rarity=Rarity.COMMON,
-                    status=CardStatus.IN_DECK
-                ))
-                progress.update(level_bar, advance=1)  # Update the progress bar after adding each unit to the deck
-
-            # Add spells to the deck
-            for spell in class_spells:
-                deck_cards.append(Spell(
-                    id=len(deck_cards) + 1,
-                    name=spell.get("name", ""),
-                    cost=spell.get("cost", 0),
-                    description=spell.get("description", ""),
-                    attack=spell.get("attack", 0),
-                    health=spell.get("health", 0),
-                    armor=spell.get("armor", 0),
-                    card_classes=[CardClass[hero_class.upper()]],
-                    card_rarity=Rarity.COMMON,
-                    status=CardStatus.IN_DECK
-                ))
-                progress.update(level_bar, advance=1)  # Update the progress bar after adding each spell to the deck
-
-            # Create and shuffle the deck
+            # Create and shuffle the deck with the player's stream
             deck = Deck(cards=deck_cards)
-            deck.shuffle()
+            deck.shuffle(self.rng.stream("shuffle", player_number))
+
+            # Save the hero and the deck's cards with a single write, through the game's database and its cache
+            with CardRepository(db=self.hearthstone_db) as repository:
+                repository.add(selected_hero)
+                repository.add_all(deck_cards)
+
+            # Save the deck as a deck code, found by its hash if it was already saved
+            card_ids = [record["id"] for record in self.catalog.cards_by_class(CardClass[hero_class])]
+            deck_code = DeckLibrary(self.hearthstone_db, self.catalog.fingerprint()).save(selected_hero_name, hero_data["id"], card_ids)
             progress.update(level_bar, advance=1)  # Final progress bar update
 
         print(f"[green]Deck created with {len(deck_cards)} cards for {player_name}.[/green]")  # Show deck creation message
+        print(f"[cyan]Deck code: {deck_code}[/cyan]")  # Show the code to replay the deck
         time.sleep(2)  # Pause for a brief moment
 
         return Player(name=player_name, hero=selected_hero, deck=deck)  # Return the initialized Player object
 
-    def setup_players(self) -> tuple[Player, Player | None]:
+    def setup_ai_player(self, player_number: int) -> Player:
+        """
+        Sets up the player controlled by the AI, with a random hero and the deck of its class.
+
+        Args:
+            player_number (int): The number of the player (1 or 2).
+
+        Returns:
+            Player: The initialized Player object.
+        """
+        self.console.clear()  # Clear the console screen
+        self.console.print(Panel(f"[bold cyan]Setting up player {player_number}[/bold cyan]", border_style="blue", expand=False))
+
+        # Pick a random hero among all classes, from the AI's stream
+        hero_rng = self.rng.stream("hero", player_number)
+        hero_class = hero_rng.choice(self.catalog.hero_classes())
+        hero_data = hero_rng.choice(self.catalog.heroes_by_class(hero_class))
+        selected_hero = self.catalog.create_hero(hero_data)
+
+        # Create and shuffle the deck of the hero's class with the player's stream
+        deck_cards = self.catalog.create_class_cards(hero_class)
+        deck = Deck(cards=deck_cards)
+        deck.shuffle(self.rng.stream("shuffle", player_number))
+
+        # Save the hero and the deck's cards with a single write, through the game's database and its cache
+        with CardRepository(db=self.hearthstone_db) as repository:
+            repository.add(selected_hero)
+            repository.add_all(deck_cards)
+
+        print(f"[green]{AI_PLAYER_NAME} plays {selected_hero.name} with {len(deck_cards)} cards.[/green]")  # Show the AI's hero
+        time.sleep(2)  # Pause for a brief moment
+
+        return Player(name=AI_PLAYER_NAME, hero=selected_hero, deck=deck)  # Return the initialized Player object
+
+    def setup_players(self) -> tuple[Player, Player]:
         """
         Initializes both players based on the selected game mode.
+        In the PVAI mode, the second player is controlled by the AI.
 
         Returns:
-            tuple[Player, Player | None]: The two players (or one if AI is chosen).
+            tuple[Player, Player]: The two players.
         """
         game_mode = self.choose_game_mode()  # Get the selected game mode
+        self.game_mode = game_mode
 
         if game_mode == "PVP":  # Check if the game mode is PVP
             player_1 = self.setup_player(player_number=1)  # Set up player 1
             player_2 = self.setup_player(player_number=2)  # Set up player 2
+        elif game_mode == "PVAI":  # Check if the game mode is PVAI
+            player_1 = self.setup_player(player_number=1)  # Set up the human player
+            player_2 = self.setup_ai_player(player_number=2)  # Set up the AI player
         else:
             raise ValueError("Invalid game mode")  # Raise an error for invalid game mode
         return player_1, player_2  # Return both players
@@ -0,0 +1,147 @@
+#!/usr/bin/python3
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+from enums.card_type_enum import CardType
+from enums.rarity_enum import Rarity
+from enums.race_enum import Race
+
+# Interned definitions, keyed by their fields
+_definitions: dict[tuple, "CardDefinition"] = {}
+
+# Class
+class CardDefinition:
+    """
+    The immutable, printed part of a card. Every card built from the same fields shares
+    a single definition, so a card in a game only stores its id, status and current stats.
+
+    Definitions are created with `CardDefinition.intern` and must never be modified.
+
+    Attributes:
+        name (str): Name of the card.
+        cost (int): Mana cost of the card.
+        description (str): Description of the card's effects or abilities.
+        card_classes (tuple[CardClass, ...]): The classes associated with the card.
+        card_type (CardType): The type of the card.
+        card_rarity (Rarity): The rarity of the card.
+        unit_race (Race): The race of the card, None for spells.
+        attack (int): The printed attack value.
+        health (int): The printed health value.
+        armor (int): The printed armor value.
+    """
+    __slots__ = ("name", "cost", "description", "card_classes", "card_type", "card_rarity", "unit_race", "attack", "health", "armor")
+
+    def __init__(self,
+                name: str,
+                cost: int,
+                description: str,
+                card_classes: tuple[CardClass, ...],
+                card_type: CardType,
+                card_rarity: Rarity,
+                unit_race: Race = None,
+                attack: int = 0,
+                health: int = 0,
+                armor: int = 0
+                ) -> None:
+        """
+        Initializes a definition. Use `CardDefinition.intern` to get the shared instance instead.
+
+        Args:
+            name (str): Name of the card.
+            cost (int): Mana cost of the card.
+            description (str): Description of the card.
+            card_classes (tuple[CardClass, ...]): The classes associated with the card.
+            card_type (CardType): The type of the card.
+            card_rarity (Rarity): The rarity of the card.
+            unit_race (Race, optional): The race of the card, None for spells.
+            attack (int): The printed attack value.
+            health (int): The printed health value.
+            armor (int): The printed armor value.
+        """
+        for field, value in zip(self.__slots__, (name, cost, description, card_classes, card_type, card_rarity, unit_race, attack, health, armor)):
+            object.__setattr__(self, field, value)  # Bypasses the read-only guard below
+
+    @staticmethod
+    def intern(name: str,
+               cost: int,
+               description: str,
+               card_classes: list[CardClass] | tuple[CardClass, ...],
+               card_type: CardType,
+               card_rarity: Rarity,
+               unit_race: Race = None,
+               attack: int = 0,
+               health: int = 0,
+               armor: int = 0
+               ) -> "CardDefinition":
+        """
+        Returns the shared definition with these fields, creating it on first use.
+        Values are stored as given, so they must already be validated.
+
+        Args:
+            name (str): Name of the card.
+            cost (int): Mana cost of the card.
+            description (str): Description of the card.
+            card_classes (list[CardClass] | tuple[CardClass, ...]): The classes associated with the card.
+            card_type (CardType): The type of the card.
+            card_rarity (Rarity): The rarity of the card.
+            unit_race (Race, optional): The race of the card, None for spells.
+            attack (int): The printed attack value.
+            health (int): The printed health value.
+            armor (int): The printed armor value.
+
+        Returns:
+            CardDefinition: The interned definition.
+        """
+        key = (name, cost, description, tuple(card_classes), card_type, card_rarity, unit_race, attack, health, armor)
+        definition = _definitions.get(key)
+        if definition is None:
+            definition = _definitions[key] = CardDefinition(*key)
+        return definition
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """
+        Prevents any modification, since a definition is shared by many cards.
+
+        Raises:
+            AttributeError: Always.
+        """
+        raise AttributeError(f"Cannot set '{name}': card definitions are immutable.")
+
+    def __copy__(self) -> "CardDefinition":
+        """
+        Copying a card keeps its shared definition.
+
+        Returns:
+            CardDefinition: This definition.
+        """
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "CardDefinition":
+        """
+        Deep-copying a card keeps its shared definition.
+
+        Args:
+            memo (dict): The deepcopy memo.
+
+        Returns:
+            CardDefinition: This definition.
+        """
+        return self
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickles a definition by its fields, so it is interned again when unpickled in another process.
+
+        Returns:
+            tuple: The interning function and its arguments.
+        """
+        return CardDefinition.intern, tuple(getattr(self, field) for field in self.__slots__)
+
+    def __repr__(self) -> str:
+        """
+        String representation of the definition.
+
+        Returns:
+            str: The type and the name of the card.
+        """
+        return f"CardDefinition({self.card_type.value}: {self.name!r})"
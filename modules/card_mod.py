@@ -8,11 +8,15 @@ from utils.constants import (
     HERO_MAXIMUM_MANA
 )
 
+# Modules Imports
+from modules.card_definition_mod import CardDefinition
+
 # Enum Imports
 from enums.card_class_enum import CardClass
 from enums.card_type_enum import CardType
 from enums.rarity_enum import Rarity
 from enums.card_status_enum import CardStatus
+from enums.race_enum import Race
 
 # Class
 class Card():
@@ -20,7 +24,11 @@ class Card():
     Represents a generic card in a card game. This class serves as the base class
     for other specific types of cards, such as Unit cards or Spell cards.
 
+    A card is the per-game instance of a shared `CardDefinition`: it only stores its id, status
+    and current stats, and reads its name, cost, description, classes, type and rarity from the definition.
+
     Attributes:
+        definition (CardDefinition): The shared, immutable definition of the card.
         id (int): Unique identifier for the card.
         name (str): Name of the card.
         cost (int): Mana or resource cost to play the card (0 to HERO_MAXIMUM_MANA if defined).
@@ -32,7 +40,10 @@ class Card():
         attack (int): The attack value of the card (0 to MAX_CARD_ATTACK if defined).
         health (int): The health value of the card (0 to MAX_CARD_HEALTH if defined).
         armor (int): The armor value of the card (0 to MAX_CARD_ARMOR if defined).
+        journal (Journal | None): The journal recording the changes of the card's stats, set by `GameEngine.start_journal`.
     """
+    # Only the mutable state is stored per card, without a per-instance __dict__
+    __slots__ = ("definition", "id", "status", "attack", "health", "armor", "journal")
 
     def __init__(self,
                 id: int, 
@@ -45,7 +56,9 @@ class Card():
                 status: CardStatus = CardStatus.IN_DECK,
                 attack: int = 0,
                 health: int = 0,
-                armor: int = 0
+                armor: int = 0,
+                *,
+                unit_race: Race = None
                 ) -> None:
         """
         Initializes a Card object with its attributes.
@@ -62,35 +75,31 @@ class Card():
             attack (int): The attack value (0 to MAX_CARD_ATTACK if defined).
             health (int): The health value (0 to MAX_CARD_HEALTH if defined).
             armor (int): The armor value (0 to MAX_CARD_ARMOR if defined).
+            unit_race (Race, optional): The race of the card, given by units only.
 
         Raises:
             ValueError: If any value is invalid (e.g., negative cost, attack, health, etc.).
         """
         self.id = id  # Set the unique identifier for the card
-        self.name = name  # Set the name of the card
+        self.journal = None  # Changes are not recorded until a game starts journaling
 
         # Validate the cost of the card, it should not be negative
         if cost < 0:
             raise ValueError(f"Invalid cost: {cost}. Cost cannot be negative.")
-        # Set the cost, limiting it to HERO_MAXIMUM_MANA if defined
-        self.cost = min(cost, HERO_MAXIMUM_MANA) if HERO_MAXIMUM_MANA is not None else cost
-
-        self.description = description  # Set the description of the card
+        # Limit the cost to HERO_MAXIMUM_MANA if defined
+        cost = min(cost, HERO_MAXIMUM_MANA) if HERO_MAXIMUM_MANA is not None else cost
 
         # Validate that all card_classes are instances of CardClass
         if not all(isinstance(cls, CardClass) for cls in card_classes):
             raise ValueError("Invalid card classes: All elements in card_classes must be instances of CardClass.")
-        self.card_classes = card_classes  # Set the list of card classes associated with the card
 
         # Validate that card_type is an instance of CardType
         if not isinstance(card_type, CardType):
             raise ValueError(f"Invalid card type: {card_type}. Must be a CardType enum.")
-        self.card_type = card_type  # Set the card type (e.g., Spell, Unit)
 
         # Validate that card_rarity is an instance of Rarity
         if not isinstance(card_rarity, Rarity):
             raise ValueError(f"Invalid rarity: {card_rarity}. Must be a Rarity enum.")
-        self.card_rarity = card_rarity  # Set the card rarity (e.g., Common, Rare)
         
         # Validate that status is an instance of CardStatus
         if not isinstance(status, CardStatus):
@@ -115,6 +124,92 @@ class Card():
         # Set the armor value, limiting it to CARD_MAXIMUM_ARMOR if defined
         self.armor = min(armor, CARD_MAXIMUM_ARMOR) if CARD_MAXIMUM_ARMOR is not None else armor
 
+        # Share the definition with every card printed with the same values
+        self.definition = CardDefinition.intern(name, cost, description, card_classes, card_type, card_rarity, unit_race, self.attack, self.health, self.armor)
+
+    @classmethod
+    def from_definition(cls, definition: CardDefinition, id: int, status: CardStatus = CardStatus.IN_DECK) -> "Card":
+        """
+        Creates a card from an existing definition, with the definition's printed stats.
+        The definition was validated when it was built, so nothing is checked again.
+
+        Args:
+            definition (CardDefinition): The shared definition of the card.
+            id (int): Unique identifier for the card.
+            status (CardStatus): The current status of the card (default is IN_DECK).
+
+        Returns:
+            Card: The new card.
+        """
+        card = cls.__new__(cls)
+        card.definition = definition
+        card.id = id
+        card.status = status
+        card.attack = definition.attack
+        card.health = definition.health
+        card.armor = definition.armor
+        card.journal = None
+        return card
+
+    def clone(self) -> "Card":
+        """
+        Returns a copy of the card sharing its definition, much faster than `copy.copy`.
+
+        Returns:
+            Card: A new card of the same class with the same id, status and current stats, whose changes are not journaled.
+        """
+        card = object.__new__(self.__class__)
+        card.definition = self.definition
+        card.id = self.id
+        card.status = self.status
+        card.attack = self.attack
+        card.health = self.health
+        card.armor = self.armor
+        card.journal = None
+        return card
+
+    @property
+    def name(self) -> str:
+        """
+        str: Name of the card, read from its definition.
+        """
+        return self.definition.name
+
+    @property
+    def cost(self) -> int:
+        """
+        int: Mana cost of the card, read from its definition.
+        """
+        return self.definition.cost
+
+    @property
+    def description(self) -> str:
+        """
+        str: Description of the card, read from its definition.
+        """
+        return self.definition.description
+
+    @property
+    def card_classes(self) -> list[CardClass]:
+        """
+        list[CardClass]: A new list of the card's classes, read from its definition.
+        """
+        return list(self.definition.card_classes)
+
+    @property
+    def card_type(self) -> CardType:
+        """
+        CardType: Type of the card, read from its definition.
+        """
+        return self.definition.card_type
+
+    @property
+    def card_rarity(self) -> Rarity:
+        """
+        Rarity: Rarity of the card, read from its definition.
+        """
+        return self.definition.card_rarity
+
     def take_damage(self, amount: int) -> None:
         """
         Applies damage to the card, reducing its armor and potentially its health.
@@ -122,6 +217,8 @@ class Card():
         Args:
             amount (int): The amount of damage to apply.
         """
+        if self.journal is not None:
+            self.journal.save(self, "armor", "health")
         self.armor -= amount  # Subtract damage from the armor
         if self.armor < 0:  # If armor is less than 0, reduce health by the remaining damage
             self.health += self.armor  # Deduct the negative armor value from health
@@ -134,6 +231,8 @@ class Card():
         Args:
             spell_card (object): The spell card whose effects will be applied to this card.
         """
+        if self.journal is not None:
+            self.journal.save(self, "attack", "health", "armor")
         # Apply health change from spell card, limiting to CARD_MAXIMUM_HEALTH if defined
         if spell_card.health > 0:
             self.health = (min(self.health + spell_card.health, CARD_MAXIMUM_HEALTH)
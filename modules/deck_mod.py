@@ -2,6 +2,8 @@
 
 # Imports
 import random
+from collections.abc import MutableSequence
+from typing import Iterable, Iterator
 
 # Modules Imports
 from modules.card_mod import Card
@@ -9,19 +11,210 @@ from modules.card_mod import Card
 # Constants Imports
 from utils.constants import HAND_LIMIT, BOARD_LIMIT
 
+# Utils Imports
+from utils.zobrist_utils import zobrist_key
+
 # Enum Imports
 from enums.card_status_enum import CardStatus
 
 # Class
+class DeckCards(MutableSequence):
+    """
+    Live view of the cards left in a deck, from the top to the bottom, over the deck's stack (top card last).
+
+    Changes made through the view, e.g. `deck.cards.append(card)` or `random.shuffle(deck.cards)`, change the deck:
+    they keep its zone hash up to date and are recorded by its journal. Card statuses are not changed.
+    Slices, copies and concatenations are plain lists, and the view compares equal to the list of its cards.
+    """
+    __slots__ = ("_deck",)
+
+    def __init__(self, deck: "Deck") -> None:
+        """
+        Initializes the view of a deck's cards.
+
+        Args:
+            deck (Deck): The deck.
+        """
+        self._deck = deck
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of cards left in the deck.
+        """
+        return len(self._deck._library)
+
+    def __iter__(self) -> Iterator[Card]:
+        """
+        Returns:
+            Iterator[Card]: The cards, from the top to the bottom.
+        """
+        return reversed(self._deck._library)
+
+    def __reversed__(self) -> Iterator[Card]:
+        """
+        Returns:
+            Iterator[Card]: The cards, from the bottom to the top.
+        """
+        return iter(self._deck._library)
+
+    def __contains__(self, card: object) -> bool:
+        """
+        Returns:
+            bool: True if the card is left in the deck.
+        """
+        return card in self._deck._library
+
+    def __getitem__(self, index: int | slice) -> Card | list[Card]:
+        """
+        Returns the card at a position from the top, or a list of the cards of a slice.
+
+        Args:
+            index (int | slice): The position or slice, counted from the top.
+
+        Returns:
+            Card | list[Card]: The card, or the list of cards.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        library = self._deck._library
+        if isinstance(index, slice):
+            return library[::-1][index]
+        return library[self._position(index)]
+
+    def __setitem__(self, index: int | slice, value: Card | Iterable[Card]) -> None:
+        """
+        Replaces the card at a position from the top, or the cards of a slice.
+
+        Args:
+            index (int | slice): The position or slice, counted from the top.
+            value (Card | Iterable[Card]): The new card, or the new cards of the slice.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        deck = self._deck
+        if isinstance(index, slice):
+            cards = deck._library[::-1]
+            cards[index] = value
+            deck.cards = cards
+            return
+        position = self._position(index)
+        old = deck._library[position]
+        deck._record()
+        deck._library[position] = value
+        deck.zone_hash ^= zobrist_key(old.id, CardStatus.IN_DECK) ^ zobrist_key(value.id, CardStatus.IN_DECK)
+
+    def __delitem__(self, index: int | slice) -> None:
+        """
+        Removes the card at a position from the top, or the cards of a slice.
+
+        Args:
+            index (int | slice): The position or slice, counted from the top.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        deck = self._deck
+        if isinstance(index, slice):
+            cards = deck._library[::-1]
+            del cards[index]
+            deck.cards = cards
+            return
+        position = self._position(index)
+        deck._record()
+        card = deck._library.pop(position)
+        deck.zone_hash ^= zobrist_key(card.id, CardStatus.IN_DECK)
+
+    def insert(self, index: int, card: Card) -> None:
+        """
+        Inserts a card before a position from the top, as `list.insert` does.
+
+        Args:
+            index (int): The position, counted from the top.
+            card (Card): The card to insert.
+        """
+        deck = self._deck
+        size = len(deck._library)
+        index = max(index + size, 0) if index < 0 else min(index, size)
+        deck._record()
+        deck._library.insert(size - index, card)
+        deck.zone_hash ^= zobrist_key(card.id, CardStatus.IN_DECK)
+
+    def copy(self) -> list[Card]:
+        """
+        Returns:
+            list[Card]: A new list of the cards, from the top to the bottom.
+        """
+        return self._deck._library[::-1]
+
+    def _position(self, index: int) -> int:
+        """
+        Converts a position from the top into a position in the deck's stack.
+
+        Args:
+            index (int): The position, counted from the top (negative from the bottom).
+
+        Returns:
+            int: The position in the stack.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        size = len(self._deck._library)
+        if not -size <= index < size:
+            raise IndexError("Deck index out of range.")
+        return size - 1 - index if index >= 0 else -1 - index
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Returns:
+            bool: True if the other object is a list or view of the same cards in the same order.
+        """
+        if isinstance(other, DeckCards):
+            return self._deck._library == other._deck._library
+        if isinstance(other, list):
+            return self.copy() == other
+        return NotImplemented
+
+    __hash__ = None  # Mutable, as a list
+
+    def __add__(self, other: list[Card]) -> list[Card]:
+        """
+        Returns:
+            list[Card]: A new list of the cards followed by the other cards.
+        """
+        return self.copy() + list(other)
+
+    def __radd__(self, other: list[Card]) -> list[Card]:
+        """
+        Returns:
+            list[Card]: A new list of the other cards followed by the cards.
+        """
+        return list(other) + self.copy()
+
+    def __repr__(self) -> str:
+        """
+        Returns:
+            str: The representation of the list of cards.
+        """
+        return repr(self.copy())
+
 class Deck:
     """
     Represents a deck of cards in a card game, managing cards in the deck, hand, board, and graveyard.
 
+    Each zone only holds cards of one status, so a card's status tells which zone it is in. The cards left
+    in the deck are kept as a stack whose top is the end of the list, so that drawing does not shift the others.
+
     Attributes:
-        cards (list[Card]): The list of cards in the deck.
+        cards (DeckCards): The cards in the deck, from the top to the bottom (a live view of the stack).
         hand (list[Card]): The cards currently in the player's hand.
         board (list[Card]): The cards currently on the board.
         graveyard (list[Card]): The cards that have been played or destroyed.
+        zone_hash (int): Zobrist hash of which card is in which zone, updated by every zone move.
+        journal (Journal | None): The journal recording the zone moves, set by `GameEngine.start_journal`.
 
     Methods:
         __init__: Initializes the deck with a given list of cards, and optional lists for hand, board, and graveyard.
@@ -33,6 +226,12 @@ class Deck:
         remove_card: Removes a card from the deck.
         get_cards_by_status: Retrieves all cards with a specific status (e.g., in hand, on board, etc.).
         reset_deck: Resets the deck by moving all cards from the graveyard and board back into the deck.
+        clone: Returns a copy of the deck and of all its cards.
+        remaining: Returns the number of cards left in the deck.
+        rehash: Recomputes the zone hash after the zone lists were modified directly.
+        undo_move: Reverts a zone move recorded by the journal.
+        undo_shuffle: Reverts a shuffle recorded by the journal.
+        undo_edit: Reverts a change of the cards made through `cards`, recorded by the journal.
     """
 
     def __init__(self, cards: list[Card], hand: list[Card] = None, board: list[Card] = None, graveyard: list[Card] = None) -> None:
@@ -50,24 +249,67 @@ class Deck:
         """
         if len(cards) > 30:  # Check if the deck has more than 30 cards
             raise ValueError("A deck cannot contain more than 30 cards.")  # Raise an error if deck exceeds 30 cards
-        self.cards = cards  # Assign the provided cards list to the deck
+        self._library = cards[::-1]  # The cards of the deck, the top card last
         self.hand = hand or []  # If no hand is provided, initialize as an empty list
         self.board = board or []  # If no board is provided, initialize as an empty list
         self.graveyard = graveyard or []  # If no graveyard is provided, initialize as an empty list
+        self.journal = None  # Moves are not recorded until a game starts journaling
+
+        # Initialize the status of the cards of each zone
+        for status, zone in ((CardStatus.IN_DECK, self._library), (CardStatus.IN_HAND, self.hand), (CardStatus.ON_BOARD, self.board), (CardStatus.IN_GRAVEYARD, self.graveyard)):
+            for card in zone:  # Iterate through the cards of the zone
+                card.status = status  # Set the status of each card to its zone
+
+        self.rehash()  # Hash the initial content of each zone
+
+    @property
+    def cards(self) -> DeckCards:
+        """
+        Getter for the cards left in the deck.
+
+        Returns:
+            DeckCards: A live view of the cards in the deck, from the top to the bottom, which can be changed in place.
+        """
+        return DeckCards(self)
+
+    @cards.setter
+    def cards(self, cards: Iterable[Card]) -> None:
+        """
+        Sets the cards left in the deck, without changing their statuses. The zone hash is recomputed and the change is journaled.
 
-        # Initialize the status of cards in the deck
-        for card in self.cards:  # Iterate through the cards in the deck
-            card.status = CardStatus.IN_DECK  # Set the status of each card to IN_DECK
+        Args:
+            cards (Iterable[Card]): The cards of the deck, from the top to the bottom.
+        """
+        cards = list(cards)[::-1]  # Read the cards before the stack changes, as they may be a view of it
+        self._record()
+        self._library[:] = cards  # The list is kept, as other objects may hold it
+        self.rehash()
 
-        # Initialize the status of cards in the graveyard
-        for card in self.graveyard:  # Iterate through the cards in the graveyard
-            card.status = CardStatus.IN_GRAVEYARD  # Set the status of each card to IN_GRAVEYARD
+    @property
+    def remaining(self) -> int:
+        """
+        Getter for the number of cards left in the deck, without copying them.
 
-    def shuffle(self) -> None:
+        Returns:
+            int: The number of cards in the deck.
+        """
+        return len(self._library)
+
+    def shuffle(self, rng: random.Random = None) -> None:
         """
         Shuffles the cards in the deck randomly.
+
+        Args:
+            rng (random.Random, optional): The generator to shuffle with, e.g. a stream of the game's `GameRandom`.
+                Defaults to None, for the global generator.
         """
-        random.shuffle(self.cards)  # Shuffle the cards in the deck using the random shuffle function
+        library = self._library
+        if self.journal is not None:
+            self.journal.record(self.undo_shuffle, library.copy())
+        # Shuffle the cards from the top, so that a generator gives the same order as on a list ordered from the top
+        library.reverse()
+        (random if rng is None else rng).shuffle(library)  # Shuffle the cards in the deck with the given generator
+        library.reverse()
 
     def draw(self) -> Card:
         """
@@ -79,12 +321,15 @@ class Deck:
         Raises:
             ValueError: If the deck is empty or if the player has reached the hand limit.
         """
-        if not self.cards:  # Check if the deck is empty
+        if not self._library:  # Check if the deck is empty
             raise ValueError("Cannot draw from an empty deck.")  # Raise an error if deck is empty
         if len(self.hand) >= HAND_LIMIT:  # Check if the player has reached the hand limit
             raise ValueError(f"Hand limit reached.")  # Raise an error if hand limit is reached
-        card = self.cards.pop(0)  # Draw the top card from the deck
+        if self.journal is not None:
+            self.journal.record(self.undo_move, self._library[-1], self._library, len(self._library) - 1, self.hand, CardStatus.IN_DECK, self.zone_hash)
+        card = self._library.pop()  # Draw the top card from the deck
         card.status = CardStatus.IN_HAND  # Change the card's status to IN_HAND
+        self.zone_hash ^= zobrist_key(card.id, CardStatus.IN_DECK) ^ zobrist_key(card.id, CardStatus.IN_HAND)  # Move the card's key to the hand
         self.hand.append(card)  # Add the card to the player's hand
         return card  # Return the drawn card
 
@@ -102,8 +347,12 @@ class Deck:
             raise ValueError(f"Cannot play {card.name}. The board is full ({BOARD_LIMIT} cards maximum).")  # Raise an error if board is full
         if card.status != CardStatus.IN_HAND:  # Check if the card is in the hand
             raise ValueError("The card must be in hand to be played.")  # Raise an error if the card is not in hand
+        index = self.hand.index(card)  # Position of the card in the hand
+        if self.journal is not None:
+            self.journal.record(self.undo_move, card, self.hand, index, self.board, CardStatus.IN_HAND, self.zone_hash)
         card.status = CardStatus.ON_BOARD  # Change the card's status to ON_BOARD
-        self.hand.remove(card)  # Remove the card from the hand
+        self.zone_hash ^= zobrist_key(card.id, CardStatus.IN_HAND) ^ zobrist_key(card.id, CardStatus.ON_BOARD)  # Move the card's key to the board
+        del self.hand[index]  # Remove the card from the hand
         self.board.append(card)  # Add the card to the board
 
     def move_to_graveyard(self, card: Card) -> None:
@@ -118,11 +367,17 @@ class Deck:
         """
         if card.status not in [CardStatus.ON_BOARD, CardStatus.IN_HAND]:  # Check if the card is on the board or in hand
             raise ValueError("The card must be on the board or in hand to move to the graveyard.")  # Raise an error if card is not in the valid states
+        zone = self.hand if card.status == CardStatus.IN_HAND else self.board  # The zone of the card's status
+        try:
+            index = zone.index(card)  # Position of the card in its zone
+        except ValueError:  # The card was given its status without being put in the zone
+            zone, index = None, -1
+        if self.journal is not None:
+            self.journal.record(self.undo_move, card, zone, index, self.graveyard, card.status, self.zone_hash)
+        self.zone_hash ^= zobrist_key(card.id, card.status) ^ zobrist_key(card.id, CardStatus.IN_GRAVEYARD)  # Move the card's key to the graveyard
         card.status = CardStatus.IN_GRAVEYARD  # Change the card's status to IN_GRAVEYARD
-        if card in self.hand:  # If the card is in the hand
-            self.hand.remove(card)  # Remove it from the hand
-        elif card in self.board:  # If the card is on the board
-            self.board.remove(card)  # Remove it from the board
+        if zone is not None:  # If the card is in the hand or on the board
+            del zone[index]  # Remove it from its zone
         self.graveyard.append(card)  # Add the card to the graveyard
 
     def add_card(self, card: Card) -> None:
@@ -135,10 +390,11 @@ class Deck:
         Raises:
             ValueError: If adding the card would exceed the deck limit of 30 cards.
         """
-        if len(self.cards) >= 30:  # Check if adding a card would exceed the deck limit
+        if len(self._library) >= 30:  # Check if adding a card would exceed the deck limit
             raise ValueError("Cannot add more cards to the deck; maximum is 30.")  # Raise an error if deck exceeds limit
         card.status = CardStatus.IN_DECK  # Change the card's status to IN_DECK
-        self.cards.append(card)  # Add the card to the bottom of the deck
+        self._library.insert(0, card)  # Add the card to the bottom of the deck
+        self.zone_hash ^= zobrist_key(card.id, CardStatus.IN_DECK)  # Add the card's key
 
     def remove_card(self, card: Card) -> None:
         """
@@ -150,9 +406,10 @@ class Deck:
         Raises:
             ValueError: If the card is not found in the deck.
         """
-        if card not in self.cards:  # Check if the card is in the deck
+        if card.status != CardStatus.IN_DECK or card not in self._library:  # Check if the card is in the deck
             raise ValueError("The card is not in the deck.")  # Raise an error if card is not found in the deck
-        self.cards.remove(card)  # Remove the card from the deck
+        self._library.remove(card)  # Remove the card from the deck
+        self.zone_hash ^= zobrist_key(card.id, CardStatus.IN_DECK)  # Remove the card's key
 
     def get_cards_by_status(self, status: CardStatus) -> list[Card]:
         """
@@ -168,7 +425,9 @@ class Deck:
             return self.hand  # Return the list of cards in hand
         if status == CardStatus.ON_BOARD:  # Check if the status is ON_BOARD
             return self.board  # Return the list of cards on the board
-        return [card for card in self.cards + self.graveyard if card.status == status]  # Return all cards with the matching status from deck and graveyard
+        if status == CardStatus.IN_GRAVEYARD:  # Check if the status is IN_GRAVEYARD
+            return self.graveyard.copy()  # Return a copy of the graveyard, which only holds cards of that status
+        return self._library[::-1]  # Return a copy of the deck, from the top
     
     def reset_deck(self) -> None:
         """
@@ -177,9 +436,87 @@ class Deck:
         This method will return all cards from the graveyard and board to the deck 
         and reset their status to "IN_DECK". It clears the graveyard and the board.
         """
-        self.cards.extend(self.graveyard)  # Add all graveyard cards back to the deck
-        self.cards.extend(self.board)  # Add all board cards back to the deck
-        for card in self.cards:  # Iterate through all cards in the deck
+        self._library[:0] = self.board[::-1] + self.graveyard[::-1]  # Add all graveyard then board cards back to the bottom of the deck
+        for card in self._library:  # Iterate through all cards in the deck
             card.status = CardStatus.IN_DECK  # Reset their status to IN_DECK
         self.graveyard.clear()  # Clear the graveyard
         self.board.clear()  # Clear the board
+        self.rehash()  # Hash the new content of each zone
+
+    def clone(self) -> "Deck":
+        """
+        Returns a copy of the deck where every zone holds copies of its cards, as a deep copy would.
+        Card definitions are shared and card statuses are kept as they are. The copy's moves are not journaled.
+
+        Returns:
+            Deck: The new deck.
+        """
+        deck = Deck.__new__(Deck)  # Skips the validation and status reset of __init__
+        deck._library = [card.clone() for card in self._library]  # Copy the cards in the deck
+        deck.hand = [card.clone() for card in self.hand]  # Copy the cards in the hand
+        deck.board = [card.clone() for card in self.board]  # Copy the cards on the board
+        deck.graveyard = [card.clone() for card in self.graveyard]  # Copy the cards in the graveyard
+        deck.zone_hash = self.zone_hash  # The copies are in the same zones
+        deck.journal = None
+        return deck
+
+    def undo_move(self, card: Card, source: list[Card] | None, index: int, destination: list[Card], status: CardStatus, zone_hash: int) -> None:
+        """
+        Reverts a zone move recorded by the journal. The card is the last of its new zone, since later changes were already reverted.
+
+        Args:
+            card (Card): The moved card.
+            source (list[Card] | None): The zone the card came from (None if it was in no zone).
+            index (int): The position of the card in its former zone.
+            destination (list[Card]): The zone the card was moved to.
+            status (CardStatus): The status of the card before the move.
+            zone_hash (int): The zone hash before the move.
+        """
+        destination.pop()  # The card was appended to its new zone
+        if source is not None:
+            source.insert(index, card)  # Put the card back at its position
+        card.status = status
+        self.zone_hash = zone_hash
+
+    def undo_shuffle(self, order: list[Card]) -> None:
+        """
+        Reverts a shuffle recorded by the journal.
+
+        Args:
+            order (list[Card]): The stack of the deck before the shuffle, the top card last.
+        """
+        self._library[:] = order  # The list is kept, as other objects may hold it
+
+    def undo_edit(self, order: list[Card], zone_hash: int) -> None:
+        """
+        Reverts a change of the cards made through `cards`, recorded by the journal.
+
+        Args:
+            order (list[Card]): The stack of the deck before the change, the top card last.
+            zone_hash (int): The zone hash before the change.
+        """
+        self._library[:] = order  # The list is kept, as other objects may hold it
+        self.zone_hash = zone_hash
+
+    def _record(self) -> None:
+        """
+        Records the stack and the zone hash in the journal, before the cards are changed through `cards`.
+        """
+        if self.journal is not None:
+            self.journal.record(self.undo_edit, self._library.copy(), self.zone_hash)
+
+    def rehash(self) -> int:
+        """
+        Recomputes the zone hash from the content of each zone. Only needed after the zone lists
+        were modified directly instead of through the deck's methods.
+
+        Each card contributes the key of its id and zone, so the hash does not depend on the order of the cards.
+
+        Returns:
+            int: The zone hash.
+        """
+        self.zone_hash = 0
+        for status, zone in ((CardStatus.IN_DECK, self._library), (CardStatus.IN_HAND, self.hand), (CardStatus.ON_BOARD, self.board), (CardStatus.IN_GRAVEYARD, self.graveyard)):
+            for card in zone:
+                self.zone_hash ^= zobrist_key(card.id, status)
+        return self.zone_hash
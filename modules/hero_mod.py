@@ -1,12 +1,12 @@
 #!/usr/bin/python3
 
 # Modules Imports
-from utils.database_utils import Database
+from utils.repository_utils import CardRepository
 from enums.hero_power_enum import HeroPower, HERO_CLASS_TO_POWER
 
 # Constants Imports
 from utils.constants import (
-    DATABASE_PATH,
+    SAVED_HEROES_TABLE_NAME,
     HERO_STARTING_ATTACK,
     HERO_STARTING_HEALTH,
     HERO_STARTING_MANA,
@@ -46,6 +46,8 @@ class Hero():
         get_maximum_armor: Returns the maximum allowable armor for the hero.
         to_dict: Converts the hero object to a dictionary format for serialization or storage.
     """
+    table_name = SAVED_HEROES_TABLE_NAME  # Table where heroes are saved
+    __slots__ = ("id", "name", "description", "hero_class", "hero_power", "attack", "health", "mana", "armor")
 
     def __init__(self, 
                 id: int, 
@@ -128,18 +130,19 @@ class Hero():
         self.mana = mana  # Set the mana value
         self.armor = armor  # Set the armor value
 
-        # Save the hero's information to the database
-        self.save_to_table()
-
-    def save_to_table(self) -> None:
+    def save_to_table(self, repository: CardRepository = None) -> None:
         """
-        Saves the current hero instance to a database.
+        Saves the current hero instance to the `Heroes` table of the game database, opened with the configured backend.
 
-        This method stores the hero in the `Heroes` table of the database defined by `DATABASE_PATH`.
+        Args:
+            repository (CardRepository, optional): The unit of work to add the hero to. If None, the hero is saved immediately.
         """
-        heroes_db = Database.initialize_database(DATABASE_PATH)  # Initialize the database
-        Database.insert_data_to_table(heroes_db, "Heroes", [self.to_dict()])  # Insert hero data into the database
-        heroes_db.close()  # Close the database connection
+        if repository is not None:
+            repository.add(self)  # Saved when the repository is flushed
+            return
+
+        with CardRepository() as single_repository:
+            single_repository.add(self)  # Saved when leaving the block
 
     @property
     def get_maximum_attack(self) -> int:
@@ -29,7 +29,10 @@ class Player:
         armor (int): The player's current armor.
         hero (Hero): The hero associated with the player.
         deck (Deck): The player's deck of cards.
+        journal (Journal | None): The journal recording the changes of the player's stats, set by `GameEngine.start_journal`.
     """
+    # Fixed attributes without a per-instance __dict__, to keep players small in memory
+    __slots__ = ("name", "hero", "deck", "_attack", "max_attack", "_health", "max_health", "_mana", "max_mana", "_armor", "max_armor", "journal")
 
     def __init__(self, name: str, hero: Hero, deck: Deck) -> None:
         """
@@ -71,6 +74,8 @@ class Player:
         self._armor = hero.armor
         self.max_armor = hero.get_maximum_armor
 
+        self.journal = None  # Changes are not recorded until a game starts journaling
+
     def draw_card(self) -> Card:
         """
         Draw a card from the deck.
@@ -98,6 +103,8 @@ class Player:
             raise ValueError(f"Not enough mana to play {card.name}. Requires {card.cost} mana, but you have {self._mana}.")
         
         # Deduct the mana for playing the card and play it
+        if self.journal is not None:
+            self.journal.save(self, "_mana")
         self._mana -= card.cost
         self.deck.play_card(card)
 
@@ -108,6 +115,8 @@ class Player:
         Args:
             amount (int): The amount of damage to deal.
         """
+        if self.journal is not None:
+            self.journal.save(self, "_armor", "_health")
         self._armor -= amount  # First, damage the armor
         if self._armor < 0:  # If armor is depleted, damage health
             self._health += self._armor  # Armor might make health go below zero
@@ -142,6 +151,8 @@ class Player:
         Args:
             spell_card (object): The spell card whose effects to apply.
         """
+        if self.journal is not None:
+            self.journal.save(self, "_attack", "_health", "_armor")
         # Apply health, ensuring it doesn't exceed the maximum value
         if spell_card.health > 0:
             self._health = (min(self._health + spell_card.health, CARD_MAXIMUM_HEALTH)
@@ -176,6 +187,8 @@ class Player:
         Args:
             amount (int): The new attack value to set.
         """
+        if self.journal is not None:
+            self.journal.save(self, "_attack")
         self._attack = amount
         if self.max_attack is not None:
             self._attack = min(self._attack, self.max_attack)
@@ -198,6 +211,8 @@ class Player:
         Args:
             amount (int): The new health value to set.
         """
+        if self.journal is not None:
+            self.journal.save(self, "_health")
         self._health = amount
         if self.max_health is not None:
             self._health = min(self._health, self.max_health)
@@ -220,6 +235,8 @@ class Player:
         Args:
             amount (int): The new mana value to set.
         """
+        if self.journal is not None:
+            self.journal.save(self, "_mana")
         self._mana = amount
         if self.max_mana is not None:
             self._mana = min(self._mana, self.max_mana)
@@ -242,6 +259,8 @@ class Player:
         Args:
             amount (int): The new armor value to set.
         """
+        if self.journal is not None:
+            self.journal.save(self, "_armor")
         self._armor = amount
         if self.max_armor is not None:
             self._armor = min(self._armor, self.max_armor)
@@ -258,6 +277,49 @@ class Player:
         self.deck.hand.clear()  # Clear the hand
         self.deck.board.clear()  # Clear the board
         self.deck.graveyard.clear()  # Clear the graveyard
+        self.deck.rehash()  # Hash the emptied zones
+
+    def clone(self) -> Player:
+        """
+        Returns a copy of the player with a copy of their deck, as a deep copy would.
+        The hero is shared, since a game never modifies it, and the copy's changes are not journaled.
+
+        Returns:
+            Player: The new player.
+        """
+        player = Player.__new__(Player)  # Skips the validation of __init__
+        for attribute in Player.__slots__:
+            setattr(player, attribute, getattr(self, attribute))
+        player.deck = self.deck.clone()
+        player.journal = None
+        return player
+
+    def restore(self, snapshot: Player) -> None:
+        """
+        Sets the player back to the state of a snapshot, keeping this object so that references to it stay valid.
+        The snapshot is copied and can be restored again. Restoring is not journaled.
+
+        Args:
+            snapshot (Player): A clone of this player.
+        """
+        journal = self.journal
+        for attribute in Player.__slots__:
+            setattr(self, attribute, getattr(snapshot, attribute))
+        self.deck = snapshot.deck.clone()
+        self.journal = journal
+
+    def set_stats(self, attack: int, health: int, mana: int, armor: int) -> None:
+        """
+        Sets the player's stats to saved values, such as a replay checkpoint, without applying the bounds of the setters.
+        Spells can raise a stat above the hero's maximum, so the saved values must be restored as they are.
+
+        Args:
+            attack (int): The saved attack.
+            health (int): The saved health.
+            mana (int): The saved mana.
+            armor (int): The saved armor.
+        """
+        self._attack, self._health, self._mana, self._armor = attack, health, mana, armor
 
     def __str__(self) -> str:
         """
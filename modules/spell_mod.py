@@ -2,16 +2,15 @@
 
 # Constants Imports
 from utils.constants import (
-    DATABASE_PATH,
+    SAVED_SPELLS_TABLE_NAME,
     CARD_MAXIMUM_ATTACK,
     CARD_MAXIMUM_ARMOR,
-    CARD_MAXIMUM_HEALTH,
-    HERO_MAXIMUM_MANA
+    CARD_MAXIMUM_HEALTH
 )
 
 # Modules Imports
 from modules.card_mod import Card
-from utils.database_utils import Database
+from utils.repository_utils import CardRepository
 
 # Enum Imports
 from enums.card_class_enum import CardClass
@@ -37,6 +36,8 @@ class Spell(Card):
         health (int): Health value (default: 0, cannot be negative).
         armor (int): Armor value (default: 0, cannot be negative).
     """
+    table_name = SAVED_SPELLS_TABLE_NAME  # Table where spells are saved
+    __slots__ = ()  # A spell has no attribute besides the card's ones
 
     def __init__(self,
                 id: int, 
@@ -71,25 +72,24 @@ class Spell(Card):
         # Initialize the parent Card class with basic attributes and set the type as SPELL
         super().__init__(id, name, cost, description, card_classes, CardType.SPELL, card_rarity, status, attack, health, armor)
 
-        # Ensure the cost, attack, health, and armor do not exceed the maximum allowed values
-        self.cost = min(self.cost, HERO_MAXIMUM_MANA) if HERO_MAXIMUM_MANA is not None else self.cost
+        # Ensure the attack, health, and armor do not exceed the maximum allowed values
         self.attack = min(self.attack, CARD_MAXIMUM_ATTACK) if CARD_MAXIMUM_ATTACK is not None else self.attack
         self.health = min(self.health, CARD_MAXIMUM_HEALTH) if CARD_MAXIMUM_HEALTH is not None else self.health
         self.armor = min(self.armor, CARD_MAXIMUM_ARMOR) if CARD_MAXIMUM_ARMOR is not None else self.armor
 
-        # Save the spell card to the database
-        self.save_to_table()
-
-    def save_to_table(self) -> None:
+    def save_to_table(self, repository: CardRepository = None) -> None:
         """
-        Saves the current Spell instance to a specific table in the hearthstone_database.json file.
+        Saves the current Spell instance to the "Spells" table of the game database, opened with the configured backend.
 
-        This method accesses the database, adds the spell data as a new entry, and then closes the connection.
+        Args:
+            repository (CardRepository, optional): The unit of work to add the spell to. If None, the spell is saved immediately.
         """
-        # Initialize the database and insert the Spell card data
-        spells_db = Database.initialize_database(DATABASE_PATH)
-        Database.insert_data_to_table(spells_db, "Spells", [self.to_dict()])
-        spells_db.close()  # Close the database connection after saving
+        if repository is not None:
+            repository.add(self)  # Saved when the repository is flushed
+            return
+
+        with CardRepository() as single_repository:
+            single_repository.add(self)  # Saved when leaving the block
 
     def to_dict(self) -> dict:
         """
@@ -5,17 +5,16 @@ from typing import Union
 
 # Constants Imports
 from utils.constants import (
-    DATABASE_PATH,
+    SAVED_UNITS_TABLE_NAME,
     CARD_MAXIMUM_ATTACK,
     CARD_MAXIMUM_ARMOR,
-    CARD_MAXIMUM_HEALTH,
-    HERO_MAXIMUM_MANA
+    CARD_MAXIMUM_HEALTH
 )
 
 # Modules Imports
 from modules.card_mod import Card
 from modules.player_mod import Player
-from utils.database_utils import Database
+from utils.repository_utils import CardRepository
 
 # Enum Imports
 from enums.card_class_enum import CardClass
@@ -45,6 +44,8 @@ class Unit(Card):
         health (int): The health value of the unit.
         armor (int): The armor value of the unit.
     """
+    table_name = SAVED_UNITS_TABLE_NAME  # Table where units are saved
+    __slots__ = ()  # The race is stored in the card's definition
 
     def __init__(self, 
                 id: int, 
@@ -78,36 +79,40 @@ class Unit(Card):
         Raises:
             ValueError: If `unit_race` is not an instance of `Race`.
         """
-        super().__init__(id, name, cost, description, card_classes, CardType.UNIT, card_rarity, status, attack, health, armor)
-
         # Validate if the race is an instance of Race enum
         if not isinstance(unit_race, Race):
             raise ValueError(f"Invalid race: {unit_race}. Must be a Race enum.")
-        self.unit_race = unit_race
 
-        # Ensure cost, attack, health, and armor do not exceed the maximum allowed values
-        self.cost = min(self.cost, HERO_MAXIMUM_MANA) if HERO_MAXIMUM_MANA is not None else self.cost
+        super().__init__(id, name, cost, description, card_classes, CardType.UNIT, card_rarity, status, attack, health, armor, unit_race=unit_race)
+
+        # Ensure attack, health, and armor do not exceed the maximum allowed values
         self.attack = min(self.attack, CARD_MAXIMUM_ATTACK) if CARD_MAXIMUM_ATTACK is not None else self.attack
         self.health = min(self.health, CARD_MAXIMUM_HEALTH) if CARD_MAXIMUM_HEALTH is not None else self.health
         self.armor = min(self.armor, CARD_MAXIMUM_ARMOR) if CARD_MAXIMUM_ARMOR is not None else self.armor
 
-        # Save the card to the database
-        self.save_to_table()
-
-    def save_to_table(self) -> None:
+    @property
+    def unit_race(self) -> Race:
+        """
+        Race: The race of the unit, read from its definition.
         """
-        Saves the current Unit instance to a specific table in the hearthstone_database.json file.
+        return self.definition.unit_race
 
-        This function converts the Unit object to a dictionary and inserts it into the database.
+    def save_to_table(self, repository: CardRepository = None) -> None:
         """
-        # Initialize the database
-        units_db = Database.initialize_database(DATABASE_PATH)
+        Saves the current Unit instance to the "Units" table of the game database, opened with the configured backend.
 
-        # Insert the Unit into the "Units" table
-        Database.insert_data_to_table(units_db, "Units", [self.to_dict()])
+        Building a unit never saves it. To save many cards at once, add them to a repository
+        and flush it, so that the database is opened and written only once.
+
+        Args:
+            repository (CardRepository, optional): The unit of work to add the unit to. If None, the unit is saved immediately.
+        """
+        if repository is not None:
+            repository.add(self)  # Saved when the repository is flushed
+            return
 
-        # Close the database connection
-        units_db.close()
+        with CardRepository() as single_repository:
+            single_repository.add(self)  # Saved when leaving the block
 
     def take_damage(self, amount: int) -> None:
         """
@@ -116,6 +121,8 @@ class Unit(Card):
         Args:
             amount (int): The amount of damage to deal to the unit.
         """
+        if self.journal is not None:
+            self.journal.save(self, "armor", "health")
         self.armor -= amount  # Reduce armor first
         if self.armor < 0:
             # If armor is exhausted, apply the remaining damage to health
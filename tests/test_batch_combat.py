@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+
+# Imports
+import random
+import unittest
+import numpy as np
+
+# Core Imports
+from core.batch_combat import BatchCombat
+from core.game_engine import GameEngine, HERO_TARGET
+
+# Modules Imports
+from modules.hero_mod import Hero
+from modules.deck_mod import Deck
+from modules.unit_mod import Unit
+from modules.spell_mod import Spell
+from modules.player_mod import Player
+
+# Utils Imports
+from utils.constants import CARD_MAXIMUM_HEALTH
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+from enums.hero_power_enum import HeroPower
+from enums.rarity_enum import Rarity
+from enums.race_enum import Race
+from enums.card_status_enum import CardStatus
+
+# Class
+class TestBatchCombat(unittest.TestCase):
+    """
+    Unit tests for the BatchCombat class.
+    """
+
+    def make_unit(self, id: int, attack: int, health: int, armor: int = 0) -> Unit:
+        """
+        Creates a unit costing 1 mana.
+        """
+        return Unit(
+            id = id,
+            name = f"Unit {id}",
+            cost = 1,
+            description = "A test unit.",
+            card_classes = [CardClass.PRIEST],
+            card_rarity = Rarity.COMMON,
+            unit_race = Race.ALL,
+            attack = attack,
+            health = health,
+            armor = armor
+        )
+
+    def make_engine(self, rng: random.Random) -> GameEngine:
+        """
+        Creates a game in the first player's turn, with random units on both boards.
+        """
+        players = []
+        for name in ("Player 1", "Player 2"):
+            board = [self.make_unit(100 + index, rng.randint(1, 6), rng.randint(1, 6), rng.choice((0, 0, 2))) for index in range(rng.randint(1, 5))]
+            for unit in board:
+                unit.status = CardStatus.ON_BOARD
+            hero = Hero(
+                id = 1,
+                name = "Anduin Wrynn",
+                description = "The Light shall burn you!",
+                hero_class = CardClass.PRIEST,
+                hero_power = HeroPower.LESSER_HEAL
+            )
+            cards = [self.make_unit(index + 1, 1, 1) for index in range(10)]
+            players.append(Player(name = name, hero = hero, deck = Deck(cards = cards, board = board)))
+        players[1].armor = rng.choice((0, 3))
+
+        return GameEngine(players[0], players[1], first_player = players[0])
+
+    def assert_same_games(self, batch: BatchCombat, engines: list[GameEngine]) -> None:
+        """
+        Checks that every board and hero of the batch matches its game.
+        """
+        for game, engine in enumerate(engines):
+            for side, player in enumerate((engine.logic.player_1, engine.logic.player_2)):
+                self.assertEqual(batch.board(game, side), [(card.attack, card.health, card.armor) for card in player.deck.board])
+                self.assertEqual(batch.graveyard[game, side], len(player.deck.graveyard))
+                self.assertEqual((batch.hero_health[game, side], batch.hero_armor[game, side]), (player.health, player.armor))
+
+    def test_attacks_match_engine(self) -> None:
+        """
+        Test that rounds of attacks resolved on a batch give the same boards as the engine, attack by attack.
+        """
+        rng = random.Random(3)
+        engines = [self.make_engine(rng) for _ in range(200)]
+        batch = BatchCombat.from_engines(engines)
+        self.assert_same_games(batch, engines)
+
+        generator = np.random.default_rng(3)
+        while True:
+            games, slots, targets = batch.random_attacks(generator)
+            if len(games) == 0:
+                break
+            positions = batch.positions_of(games, batch.current[games], slots)
+            target_positions = batch.positions_of(games, 1 - batch.current[games], targets)
+            np.testing.assert_array_equal(batch.slots_of(games, 1 - batch.current[games], target_positions), targets)
+            for game, position, target in zip(games.tolist(), positions.tolist(), target_positions.tolist()):
+                engines[game].attack(position, target)
+            batch.attack_targets(games, slots, targets)
+            self.assert_same_games(batch, engines)
+
+    def test_take_damage_and_effects_match_card(self) -> None:
+        """
+        Test that damage goes through armor first and that spells are capped, as on a card.
+        """
+        batch = BatchCombat(3)
+        units = [self.make_unit(1, 2, 5, 3), self.make_unit(2, 4, 4), self.make_unit(3, 1, CARD_MAXIMUM_HEALTH - 1)]
+        for game, unit in enumerate(units):
+            batch.size[game, 0], batch.alive[game, 0, 0] = 1, True
+            batch.attack[game, 0, 0], batch.health[game, 0, 0], batch.armor[game, 0, 0] = unit.attack, unit.health, unit.armor
+        games = np.arange(3)
+
+        batch.take_damage(games, 0, 0, np.array([4, 2, 0]))
+        for unit, amount in zip(units, (4, 2, 0)):
+            unit.take_damage(amount)
+        spell = Spell(
+            id = 9,
+            name = "Power Word: Shield",
+            cost = 1,
+            description = "A test spell.",
+            card_classes = [CardClass.PRIEST],
+            card_rarity = Rarity.COMMON,
+            attack = 0,
+            health = 3,
+            armor = 1
+        )
+        batch.apply_effects(games, 0, 0, spell.attack, spell.health, spell.armor)
+        for unit in units:
+            unit.apply_effects(spell)
+        self.assertEqual([batch.board(game, 0)[0] for game in range(3)], [(unit.attack, unit.health, unit.armor) for unit in units])
+        self.assertEqual(batch.health[2, 0, 0], CARD_MAXIMUM_HEALTH)
+
+    def test_invalid_attack(self) -> None:
+        """
+        Test that attacking with an empty slot or a unit without attack raises an error.
+        """
+        batch = BatchCombat.from_engines([self.make_engine(random.Random(1))])
+        with self.assertRaises(ValueError):
+            batch.attack_targets(np.array([0]), np.array([5]), np.array([HERO_TARGET]))
+        batch.attack[0, 0, 0] = 0
+        with self.assertRaises(ValueError):
+            batch.attack_targets(np.array([0]), np.array([0]), np.array([HERO_TARGET]))
+
+if __name__ == "__main__":
+    unittest.main()
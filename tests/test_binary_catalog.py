@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+
+# Imports
+import os
+import tempfile
+import unittest
+
+# Core Imports
+from core.binary_catalog import BinaryCatalog
+from core.simulation_mod import MatchSimulator
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+from enums.race_enum import Race
+
+# Class
+class TestBinaryCatalog(unittest.TestCase):
+    """
+    Unit tests for the BinaryCatalog class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up a temporary directory for the compiled catalog.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "catalog.bin")
+
+    def tearDown(self) -> None:
+        """
+        Removes the temporary directory.
+        """
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        """
+        Test that a compiled catalog loads back with identical records, indexes and fingerprint.
+        """
+        catalog = BinaryCatalog.build(self.file_path)
+        loaded = BinaryCatalog.load(self.file_path)
+        self.assertEqual(loaded.heroes, catalog.heroes)
+        self.assertEqual(loaded.cards, catalog.cards)
+        self.assertEqual(loaded.cards_by_class(CardClass.MAGE), catalog.cards_by_class(CardClass.MAGE))
+        self.assertEqual(loaded.cards_by_race(Race.DRAGON), catalog.cards_by_race(Race.DRAGON))
+        self.assertEqual(loaded.get_hero_by_id(10), catalog.get_hero_by_id(10))
+        self.assertEqual(loaded.fingerprint(), catalog.fingerprint())
+
+    def test_compiled_file_is_compact(self) -> None:
+        """
+        Test that the compiled catalog is smaller than the data files.
+        """
+        BinaryCatalog.build(self.file_path)
+        self.assertLess(os.path.getsize(self.file_path), os.path.getsize("./database/data/units.json"))
+
+    def test_invalid_file(self) -> None:
+        """
+        Test that loading a file which is not a compiled catalog raises an error.
+        """
+        with open(self.file_path, "wb") as file:
+            file.write(b"[{\"DRUID\": []}]")
+        with self.assertRaises(ValueError):
+            BinaryCatalog.load(self.file_path)
+
+        BinaryCatalog.build(self.file_path)
+        with open(self.file_path, "r+b") as file:
+            file.truncate(os.path.getsize(self.file_path) - 1)
+        with self.assertRaises(ValueError):
+            BinaryCatalog.load(self.file_path)
+
+    def test_load_or_build(self) -> None:
+        """
+        Test that the catalog is compiled when missing and loaded afterwards.
+        """
+        self.assertFalse(os.path.exists(self.file_path))
+        catalog = BinaryCatalog.load_or_build(self.file_path)
+        self.assertTrue(os.path.exists(self.file_path))
+        self.assertEqual(BinaryCatalog.load_or_build(self.file_path).cards, catalog.cards)
+
+    def test_simulation_from_catalog_ids(self) -> None:
+        """
+        Test that the simulator builds players from catalog ids with the compiled catalog.
+        """
+        catalog = BinaryCatalog.build(self.file_path)
+        mage = ("Mage", 10, [card["id"] for card in catalog.cards_by_class(CardClass.MAGE)])
+        warrior = ("Warrior", 35, [card["id"] for card in catalog.cards_by_class(CardClass.WARRIOR)])
+        result = MatchSimulator(mage, warrior, processes = 1, catalog_path = self.file_path).run(5)
+        self.assertEqual(result.games, 5)
+
+if __name__ == "__main__":
+    unittest.main()
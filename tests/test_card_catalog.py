@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+
+# Imports
+import unittest
+
+# Core Imports
+from core.card_catalog import CardCatalog
+
+# Modules Imports
+from modules.unit_mod import Unit
+from modules.spell_mod import Spell
+from modules.hero_mod import Hero
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+from enums.card_type_enum import CardType
+from enums.hero_power_enum import HeroPower
+from enums.race_enum import Race
+from enums.rarity_enum import Rarity
+
+# Class
+class TestCardCatalog(unittest.TestCase):
+    """
+    Unit tests for the CardCatalog class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up a small catalog.
+        """
+        self.catalog = CardCatalog(
+            heroes_table = [{"MAGE": [{"id": 1, "name": "Jaina Proudmoore", "description": "", "hero_class": "MAGE", "hero_power": "FIREBLAST", "attack": 0, "health": 30, "mana": 1, "armor": 0}]}],
+            units_table = [{"MAGE": [
+                {"name": "Water Elemental", "cost": 4, "attack": 3, "health": 6, "race": "Elemental"},
+                {"name": "Mana Wyrm", "cost": 1, "attack": 1, "health": 3, "race": "Dragon", "rarity": "Rare"}
+            ], "WARRIOR": [
+                {"name": "Raging Worgen", "cost": 3, "attack": 3, "health": 3, "race": "Beast"}
+            ]}],
+            spells_table = [{"MAGE": [
+                {"name": "Arcane Intellect", "cost": 3, "description": "Gain power.", "attack": 1, "health": 1, "armor": 1}
+            ]}]
+        )
+
+    def test_catalog_ids(self) -> None:
+        """
+        Test that cards are numbered in loading order.
+        """
+        self.assertEqual([card["name"] for card in self.catalog.cards], ["Water Elemental", "Mana Wyrm", "Raging Worgen", "Arcane Intellect"])
+        self.assertEqual(self.catalog.get_card(3)["card_type"], CardType.SPELL)
+        with self.assertRaises(KeyError):
+            self.catalog.get_card(4)
+
+    def test_indexes(self) -> None:
+        """
+        Test the lookups by class, cost, race, rarity and name.
+        """
+        self.assertEqual([card["id"] for card in self.catalog.cards_by_class(CardClass.MAGE)], [0, 1, 3])
+        self.assertEqual([card["id"] for card in self.catalog.cards_by_cost(3)], [2, 3])
+        self.assertEqual([card["id"] for card in self.catalog.cards_by_race(Race.BEAST)], [2])
+        self.assertEqual([card["id"] for card in self.catalog.cards_by_rarity(Rarity.RARE)], [1])
+        self.assertEqual([card["id"] for card in self.catalog.cards_by_name("Mana Wyrm")], [1])
+        self.assertEqual(self.catalog.cards_by_class(CardClass.PRIEST), [])
+
+    def test_find(self) -> None:
+        """
+        Test that several criteria are combined.
+        """
+        self.assertEqual([card["id"] for card in self.catalog.find(cost = 3, card_class = CardClass.MAGE)], [3])
+        self.assertEqual([card["id"] for card in self.catalog.find(card_type = CardType.UNIT, rarity = Rarity.COMMON)], [0, 2])
+        self.assertEqual(len(self.catalog.find()), 4)
+
+    def test_cost_index_uses_capped_cost(self) -> None:
+        """
+        Test that a card costing more than the maximum mana is found by the cost of the cards built from it.
+        """
+        record = self.catalog.add_card("MAGE", {"name": "Colossus", "cost": 25, "attack": 9, "health": 9, "race": "Elemental"}, CardType.UNIT)
+        card = self.catalog.create_card(record, 1)
+        self.assertEqual([found["id"] for found in self.catalog.cards_by_cost(card.cost)], [record["id"]])
+        self.assertEqual(self.catalog.cards_by_cost(25), [])
+        self.assertEqual([found["id"] for found in self.catalog.find(cost = card.cost, race = Race.ELEMENTAL)], [record["id"]])
+
+    def test_units_listed_before_spells(self) -> None:
+        """
+        Test that a unit added after a spell is still listed before it in its class.
+        """
+        self.catalog.cards_by_class(CardClass.MAGE)
+        self.catalog.add_card("MAGE", {"name": "Sorcerer's Apprentice", "cost": 2, "attack": 3, "health": 2, "race": "Human"}, CardType.UNIT)
+        self.assertEqual([card["id"] for card in self.catalog.cards_by_class(CardClass.MAGE)], [0, 1, 4, 3])
+
+    def test_heroes(self) -> None:
+        """
+        Test the hero lookups and creation.
+        """
+        self.assertEqual(self.catalog.hero_classes(), [CardClass.MAGE])
+        record = self.catalog.get_hero(CardClass.MAGE, "Jaina Proudmoore")
+        hero = self.catalog.create_hero(record)
+        self.assertIsInstance(hero, Hero)
+        self.assertEqual(hero.hero_power, HeroPower.FIREBLAST)
+        self.assertIsNone(self.catalog.get_hero(CardClass.WARRIOR, "Jaina Proudmoore"))
+
+    def test_create_class_cards(self) -> None:
+        """
+        Test that the cards of a class are built and numbered from 1.
+        """
+        cards = self.catalog.create_class_cards(CardClass.MAGE)
+        self.assertEqual([card.id for card in cards], [1, 2, 3])
+        self.assertIsInstance(cards[0], Unit)
+        self.assertIsInstance(cards[2], Spell)
+        self.assertEqual(cards[0].unit_race, Race.ELEMENTAL)
+        self.assertEqual(cards[2].card_classes, [CardClass.MAGE])
+
+    def test_cards_share_record_definition(self) -> None:
+        """
+        Test that every card built from a record shares the record's definition.
+        """
+        record = self.catalog.cards_by_class(CardClass.MAGE)[0]
+        card_1 = self.catalog.create_card(record, 1)
+        card_2 = self.catalog.create_card(record, 2)
+        self.assertIs(card_1.definition, record["definition"])
+        self.assertIs(card_2.definition, record["definition"])
+        self.assertEqual(card_1.name, record["name"])
+        self.assertEqual(card_1.attack, record["attack"])
+
+    def test_from_files(self) -> None:
+        """
+        Test that the shipped data files are loaded with thirty cards per class.
+        """
+        catalog = CardCatalog.from_files()
+        for hero_class in catalog.hero_classes():
+            self.assertEqual(len(catalog.cards_by_class(hero_class)), 30)
+
+if __name__ == "__main__":
+    unittest.main()
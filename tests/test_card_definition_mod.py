@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+
+# Imports
+import copy
+import pickle
+import unittest
+
+# Modules Imports
+from modules.unit_mod import Unit
+from modules.spell_mod import Spell
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+from enums.card_type_enum import CardType
+from enums.rarity_enum import Rarity
+from enums.race_enum import Race
+from enums.card_status_enum import CardStatus
+
+# Class
+class TestCardDefinition(unittest.TestCase):
+    """
+    Unit tests for the CardDefinition class and its use by cards.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up two units printed with the same values.
+        """
+        self.unit_args = {
+            "name": "River Crocolisk",
+            "cost": 2,
+            "description": "A simple beast.",
+            "card_classes": [CardClass.NEUTRAL],
+            "card_rarity": Rarity.COMMON,
+            "unit_race": Race.BEAST,
+            "attack": 2,
+            "health": 3
+        }
+        self.unit_1 = Unit(id = 1, **self.unit_args)
+        self.unit_2 = Unit(id = 2, **self.unit_args)
+
+    def test_cards_share_definition(self) -> None:
+        """
+        Test that cards printed with the same values share one definition.
+        """
+        self.assertIs(self.unit_1.definition, self.unit_2.definition)
+        self.assertEqual(self.unit_1.definition.card_classes, (CardClass.NEUTRAL,))
+        self.assertEqual(self.unit_1.unit_race, Race.BEAST)
+
+    def test_different_cards_have_different_definitions(self) -> None:
+        """
+        Test that a card with other values gets its own definition.
+        """
+        spell = Spell(
+            id = 3,
+            name = "River Crocolisk",
+            cost = 2,
+            description = "A simple beast.",
+            card_classes = [CardClass.NEUTRAL],
+            card_rarity = Rarity.COMMON
+        )
+        self.assertIsNot(spell.definition, self.unit_1.definition)
+        self.assertEqual(spell.card_type, CardType.SPELL)
+
+    def test_mutable_state_is_per_card(self) -> None:
+        """
+        Test that damaging a card does not change the other cards or the definition.
+        """
+        self.unit_1.take_damage(2)
+        self.unit_1.status = CardStatus.ON_BOARD
+        self.assertEqual(self.unit_1.health, 1)
+        self.assertEqual(self.unit_2.health, 3)
+        self.assertEqual(self.unit_2.status, CardStatus.IN_DECK)
+        self.assertEqual(self.unit_1.definition.health, 3)
+
+    def test_definition_is_immutable(self) -> None:
+        """
+        Test that a definition and the fields read from it cannot be modified.
+        """
+        with self.assertRaises(AttributeError):
+            self.unit_1.definition.cost = 5
+        with self.assertRaises(AttributeError):
+            self.unit_1.name = "Other"
+        self.unit_1.card_classes.append(CardClass.MAGE)
+        self.assertEqual(self.unit_2.card_classes, [CardClass.NEUTRAL])
+
+    def test_from_definition(self) -> None:
+        """
+        Test that a card created from a definition gets the printed stats.
+        """
+        self.unit_1.take_damage(2)
+        unit = Unit.from_definition(self.unit_1.definition, 4)
+        self.assertIsInstance(unit, Unit)
+        self.assertEqual(unit.health, 3)
+        self.assertEqual(unit.to_dict(), {**self.unit_2.to_dict(), "id": 4})
+
+    def test_copies_keep_definition(self) -> None:
+        """
+        Test that copying or pickling a card keeps the shared definition.
+        """
+        self.assertIs(copy.copy(self.unit_1).definition, self.unit_1.definition)
+        self.assertIs(copy.deepcopy(self.unit_1).definition, self.unit_1.definition)
+        self.assertIs(pickle.loads(pickle.dumps(self.unit_1)).definition, self.unit_1.definition)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -190,5 +190,22 @@ class TestCard(unittest.TestCase):
         }
         self.assertEqual(card.to_dict(), expected_dict)
 
+    def test_card_has_no_instance_dict(self) -> None:
+        """
+        Test that cards only store their attributes in slots.
+        """
+        card = Card(
+            id = self.default_id,
+            name = self.default_name,
+            cost = self.default_cost,
+            description = self.default_description,
+            card_classes = self.default_card_classes,
+            card_type = self.default_card_type,
+            card_rarity = self.default_rarity
+        )
+        self.assertFalse(hasattr(card, "__dict__"))
+        with self.assertRaises(AttributeError):
+            card.unknown_attribute = 1
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,205 @@
+#!/usr/bin/python3
+
+# Imports
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# Core Imports
+from core.card_catalog import CardCatalog
+from core.deck_codes import DeckLibrary, encode_deck, decode_deck, deck_hash
+from core.simulation_mod import resolve_player
+
+# Utils Imports
+from utils.constants import HEROES_DB_PATH, UNITS_DB_PATH, SPELLS_DB_PATH
+from utils.database_utils import Database
+
+# Interfaces Imports
+from interfaces.player_choice_interface import PlayerChoiceInterface
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+
+# Class
+class TestDeckCodes(unittest.TestCase):
+    """
+    Unit tests for the deck codes and the deck library.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up a temporary database.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = Database.initialize_database(os.path.join(self.directory.name, "database.json"))
+
+    def tearDown(self) -> None:
+        """
+        Closes and removes the temporary database.
+        """
+        self.db.close()
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        """
+        Test that a decoded code gives back the hero and the sorted cards, whatever the order of the cards.
+        """
+        card_ids = [200, 3, 3, 0, 127, 128, 16384]
+        code = encode_deck(7, card_ids, 1 << 31)
+        self.assertEqual(decode_deck(code, 1 << 31), (7, sorted(card_ids)))
+        self.assertEqual(encode_deck(7, sorted(card_ids, reverse = True), 1 << 31), code)
+        self.assertNotEqual(deck_hash(code), deck_hash(encode_deck(8, card_ids, 1 << 31)))
+        self.assertEqual(decode_deck(encode_deck(0, [], 0), 0), (0, []))
+
+    def test_invalid_codes(self) -> None:
+        """
+        Test that truncated, miscounted, unknown versions, other catalogs and non-base64 codes raise an error.
+        """
+        code = encode_deck(1, [300, 400], 0)
+        for invalid in (code[:-2], "AQABAgU", "AgABAA", encode_deck(1, [300, 400], 1), "!!!", ""):
+            with self.assertRaises(ValueError, msg = invalid):
+                decode_deck(invalid, 0)
+        with self.assertRaises(ValueError):
+            encode_deck(1, [-1], 0)
+
+    def test_library_saves_once(self) -> None:
+        """
+        Test that a deck is saved once whatever its name, that saving a name again replaces its deck, and that decks are reloaded.
+        """
+        library = DeckLibrary(self.db, 0)
+        code = library.save("Aggro", 1, [5, 4, 3])
+        self.assertEqual(library.save("Copy", 1, [3, 4, 5]), code)
+        self.assertEqual(library.find(code), "Aggro")
+        library.save("Aggro", 1, [5, 4, 6])
+        library.save("Control", 2, [10, 11])
+        self.assertIsNone(library.find(code))
+
+        library = DeckLibrary(self.db, 0)
+        self.assertEqual(len(self.db.table("decks")), 2)
+        self.assertEqual(library.names(), ["Aggro", "Control"])
+        self.assertEqual(library.load("Aggro"), (1, [4, 5, 6]))
+        library.delete("Control")
+        with self.assertRaises(KeyError):
+            library.load("Control")
+        self.assertEqual(len(DeckLibrary(self.db, 0)), 1)
+
+    def test_replacing_a_name_keeps_copies(self) -> None:
+        """
+        Test that replacing or deleting a deck saved under two names keeps the deck found under the other name.
+        """
+        code = encode_deck(1, [3, 4], 0)
+        table = self.db.table("decks")
+        table.insert({"name": "Aggro", "code": code, "hash": deck_hash(code)})
+        table.insert({"name": "Copy", "code": code, "hash": deck_hash(code)})  # Saved by another process
+
+        library = DeckLibrary(self.db, 0)
+        library.save("Aggro", 1, [5])
+        self.assertEqual(library.find(code), "Copy")
+        self.assertEqual(library.save("Other", 1, [4, 3]), code)
+        self.assertEqual(library.names(), ["Aggro", "Copy"])
+
+        table.insert({"name": "Second", "code": code, "hash": deck_hash(code)})
+        library = DeckLibrary(self.db, 0)
+        library.delete("Copy")
+        self.assertEqual(library.find(code), "Second")
+
+    def test_library_on_sqlite(self) -> None:
+        """
+        Test that the library works the same on the SQLite backend.
+        """
+        with Database.initialize_sqlite_database(os.path.join(self.directory.name, "database.sqlite3")) as db:
+            library = DeckLibrary(db, 0)
+            library.save("Aggro", 1, [5, 4, 3])
+            library.save("Aggro", 1, [1])
+            library.save("Control", 2, [10, 11])
+            library.delete("Control")
+            self.assertEqual(DeckLibrary(db, 0).names(), ["Aggro"])
+            self.assertEqual(DeckLibrary(db, 0).load("Aggro"), (1, [1]))
+
+    def test_resolve_player_from_code(self) -> None:
+        """
+        Test that a player built from a deck code has the hero and cards of the saved deck.
+        """
+        catalog = CardCatalog.from_files()
+        hero = catalog.heroes_by_class(CardClass.MAGE)[0]
+        card_ids = [record["id"] for record in catalog.cards_by_class(CardClass.MAGE)]
+        player = resolve_player(("Jaina", encode_deck(hero["id"], card_ids, catalog.fingerprint())), catalog)
+        expected = resolve_player(("Jaina", hero["id"], sorted(card_ids)), catalog)
+        self.assertEqual(player.hero.name, hero["name"])
+        self.assertEqual([card.name for card in player.deck.cards], [card.name for card in expected.deck.cards])
+
+    def test_codes_of_another_catalog_are_rejected(self) -> None:
+        """
+        Test that once a card is removed from the data files, the codes and saved decks of the former catalog are rejected.
+        """
+        catalog = CardCatalog.from_files()
+        hero = catalog.heroes_by_class(CardClass.MAGE)[0]
+        card_ids = [record["id"] for record in catalog.cards_by_class(CardClass.MAGE)]
+        code = DeckLibrary(self.db, catalog.fingerprint()).save("Mage", hero["id"], card_ids)
+
+        tables = []
+        for path in (HEROES_DB_PATH, UNITS_DB_PATH, SPELLS_DB_PATH):
+            with open(path) as file:
+                tables.append(json.load(file))
+        heroes, units, spells = tables
+        del units[0][next(iter(units[0]))][0]  # Every following card id now points to the next card
+        edited = CardCatalog(heroes, units, spells)
+        self.assertNotEqual(edited.fingerprint(), catalog.fingerprint())
+        self.assertEqual(CardCatalog.from_files().fingerprint(), catalog.fingerprint())
+
+        with self.assertRaises(ValueError):
+            resolve_player(("Jaina", code), edited)
+        with self.assertRaises(ValueError):
+            DeckLibrary(self.db, edited.fingerprint()).load("Mage")
+        self.assertEqual(DeckLibrary(self.db, catalog.fingerprint()).load("Mage"), (hero["id"], sorted(card_ids)))
+
+    def test_interface_plays_saved_decks_and_codes(self) -> None:
+        """
+        Test that a player can play a saved deck or enter a deck code, invalid codes being asked again, and that entered codes are saved.
+        """
+        catalog = CardCatalog.from_files()
+        mage = catalog.heroes_by_class(CardClass.MAGE)[0]
+        mage_ids = [record["id"] for record in catalog.cards_by_class(CardClass.MAGE)][:10]
+        rogue = catalog.heroes_by_class(CardClass.ROGUE)[0]
+        rogue_ids = [record["id"] for record in catalog.cards_by_class(CardClass.ROGUE)][:5]
+        DeckLibrary(self.db, catalog.fingerprint()).save("Burn", mage["id"], mage_ids)
+        rogue_code = encode_deck(rogue["id"], rogue_ids, catalog.fingerprint())
+
+        answers = ["Jaina", "1", "Valeera", "C", "!!!", "C", rogue_code]
+        interface = PlayerChoiceInterface(self.db, catalog)
+        with mock.patch("interfaces.player_choice_interface.Prompt.ask", side_effect = answers), \
+             mock.patch("interfaces.player_choice_interface.time.sleep"), \
+             mock.patch("interfaces.player_choice_interface.CardRepository"):
+            jaina = interface.setup_player(player_number = 1)
+            valeera = interface.setup_player(player_number = 2)
+
+        self.assertEqual(jaina.hero.name, mage["name"])
+        self.assertEqual(sorted(card.name for card in jaina.deck.cards), sorted(catalog.get_card(card_id)["name"] for card_id in mage_ids))
+        self.assertEqual(valeera.hero.name, rogue["name"])
+        self.assertEqual(sorted(card.name for card in valeera.deck.cards), sorted(catalog.get_card(card_id)["name"] for card_id in rogue_ids))
+        self.assertEqual(DeckLibrary(self.db, catalog.fingerprint()).find(rogue_code), rogue["name"])
+
+    def test_interface_saves_cards_and_deck_in_one_database(self) -> None:
+        """
+        Test that the cards and the deck saved while setting up a player are all in the database file once it is reopened.
+        """
+        file_path = os.path.join(self.directory.name, "game.json")
+        db = Database.initialize_cached_database(file_path)
+        interface = PlayerChoiceInterface(db, CardCatalog.from_files())
+        with mock.patch("interfaces.player_choice_interface.Prompt.ask", side_effect = ["Jaina", "N", "1"]), \
+             mock.patch("interfaces.player_choice_interface.IntPrompt.ask", return_value = "1"), \
+             mock.patch("interfaces.player_choice_interface.time.sleep"), \
+             mock.patch("utils.database_utils.DATABASE_PATH", file_path):
+            player = interface.setup_player(player_number = 1)
+        db.close()
+
+        db = Database.initialize_database(file_path)
+        self.assertEqual(len(db.table("Heroes")), 1)
+        self.assertEqual(len(db.table("Units")) + len(db.table("Spells")), player.deck.remaining)
+        self.assertEqual(DeckLibrary(db, interface.catalog.fingerprint()).names(), [player.hero.name])
+        db.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 
 # Imports
+import random
 import unittest
 
 # Modules Imports
@@ -8,6 +9,9 @@ from modules.unit_mod import Unit
 from modules.spell_mod import Spell
 from modules.deck_mod import Deck
 
+# Utils Imports
+from utils.journal_utils import Journal
+
 # Constants Imports
 from utils.constants import BOARD_LIMIT
 
@@ -181,5 +185,125 @@ class TestDeck(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.deck.add_card(self.fireball)
 
+    def test_clone(self) -> None:
+        """
+        Test that a cloned deck holds copies of the cards in every zone, with their statuses.
+        """
+        self.deck.draw()
+        self.deck.play_card(self.fireball)
+        clone = self.deck.clone()
+        self.assertEqual([card.to_dict() for card in clone.board], [self.fireball.to_dict()])
+        self.assertEqual([card.to_dict() for card in clone.cards], [self.yeti.to_dict()])
+        self.assertIsNot(clone.board[0], self.fireball)
+        self.assertIs(clone.board[0].definition, self.fireball.definition)
+        clone.board[0].take_damage(10)
+        self.assertEqual(self.fireball.armor, 5)
+
+    def test_shuffle_with_generator(self) -> None:
+        """
+        Test that shuffling with seeded generators gives the same order every time.
+        """
+        orders = []
+        for _ in range(2):
+            deck = Deck(cards = list(self.deck.cards))
+            deck.shuffle(random.Random(5))
+            orders.append([card.id for card in deck.cards])
+        self.assertEqual(orders[0], orders[1])
+
+    def test_draw_order_and_zones(self) -> None:
+        """
+        Test that cards are drawn from the top of the list they were given and that each status lists its zone.
+        """
+        cards = [Spell(
+            id = 10 + index,
+            name = f"Spell {index}",
+            cost = 1,
+            description = "Card for testing.",
+            card_classes = [CardClass.MAGE],
+            card_rarity = Rarity.COMMON,
+            attack = 1,
+            health = 1,
+            armor = 1
+        ) for index in range(6)]
+        deck = Deck(cards = list(cards))
+        deck.add_card(self.yeti)
+        self.assertEqual(deck.cards, cards + [self.yeti])
+        self.assertEqual(deck.remaining, 7)
+
+        shuffled = list(deck.cards)
+        random.Random(2).shuffle(shuffled)
+        deck.shuffle(random.Random(2))
+        self.assertEqual(deck.cards, shuffled)
+
+        self.assertEqual([deck.draw() for _ in range(3)], shuffled[:3])
+        deck.play_card(shuffled[1])
+        deck.move_to_graveyard(shuffled[2])
+        deck.move_to_graveyard(shuffled[1])
+        self.assertEqual(deck.get_cards_by_status(CardStatus.IN_HAND), [shuffled[0]])
+        self.assertEqual(deck.get_cards_by_status(CardStatus.ON_BOARD), [])
+        self.assertEqual(deck.get_cards_by_status(CardStatus.IN_GRAVEYARD), [shuffled[2], shuffled[1]])
+        self.assertEqual(deck.get_cards_by_status(CardStatus.IN_DECK), shuffled[3:])
+        deck.reset_deck()
+        self.assertEqual(deck.cards, shuffled[3:] + [shuffled[2], shuffled[1]])
+
+    def test_zone_hash_is_incremental(self) -> None:
+        """
+        Test that the zone hash kept by each move equals the hash recomputed from the zones.
+        """
+        initial_hash = self.deck.zone_hash
+        self.deck.draw()
+        self.assertNotEqual(self.deck.zone_hash, initial_hash)
+        self.deck.play_card(self.fireball)
+        self.deck.draw()
+        self.deck.move_to_graveyard(self.yeti)
+        moved_hash = self.deck.zone_hash
+        self.assertEqual(self.deck.rehash(), moved_hash)
+        self.deck.reset_deck()
+        self.assertEqual(self.deck.zone_hash, initial_hash)
+
+    def test_cards_are_changed_in_place(self) -> None:
+        """
+        Test that changes made to the cards of the deck change the deck, keep its zone hash and are reverted by its journal.
+        """
+        cards = [Spell(
+            id = 10 + index,
+            name = f"Spell {index}",
+            cost = 1,
+            description = "Card for testing.",
+            card_classes = [CardClass.MAGE],
+            card_rarity = Rarity.COMMON,
+            attack = 1,
+            health = 1,
+            armor = 1
+        ) for index in range(4)]
+        deck = Deck(cards = list(cards))
+        deck.journal = Journal()
+        initial_hash = deck.zone_hash
+
+        deck.cards.append(self.yeti)
+        deck.cards.remove(cards[1])
+        deck.cards.extend([self.fireball])
+        deck.cards.insert(-1, cards[1])
+        expected = [cards[0], cards[2], cards[3], self.yeti, cards[1], self.fireball]
+        self.assertEqual(deck.cards, expected)
+        self.assertEqual(deck.cards[1:3], expected[1:3])
+        self.assertEqual(deck.cards[-1], self.fireball)
+        self.assertEqual(deck.zone_hash, Deck(cards = list(expected)).zone_hash)
+
+        random.Random(3).shuffle(deck.cards)
+        random.Random(3).shuffle(expected)
+        self.assertEqual(deck.cards, expected)
+        self.assertEqual(deck.draw(), expected[0])
+
+        deck.cards = cards[:2]
+        self.assertEqual(deck.cards + deck.hand, cards[:2] + [expected[0]])
+        self.assertEqual(deck.zone_hash, deck.rehash())
+        del deck.cards[0]
+        self.assertEqual(deck.zone_hash, deck.rehash())
+
+        deck.journal.undo()
+        self.assertEqual(deck.cards, cards)
+        self.assertEqual(deck.zone_hash, initial_hash)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,359 @@
+#!/usr/bin/python3
+
+# Imports
+import copy
+import random
+import unittest
+
+# Core Imports
+from core.game_engine import GameEngine, Action, HERO_TARGET, PASS_ACTION, USE_HERO_POWER_ACTION
+
+# Modules Imports
+from modules.hero_mod import Hero
+from modules.deck_mod import Deck
+from modules.unit_mod import Unit
+from modules.spell_mod import Spell
+from modules.player_mod import Player
+
+# Enum Imports
+from enums.action_type_enum import ActionType
+from enums.turn_phase_enum import TurnPhase
+from enums.card_class_enum import CardClass
+from enums.hero_power_enum import HeroPower
+from enums.rarity_enum import Rarity
+from enums.race_enum import Race
+from enums.card_status_enum import CardStatus
+
+# Class
+class TestGameEngine(unittest.TestCase):
+    """
+    Unit tests for the GameEngine class.
+    """
+
+    def make_player(self, name: str) -> Player:
+        """
+        Creates a player with a small deck of units and spells.
+        """
+        hero = Hero(
+            id = 1,
+            name = "Jaina Proudmoore",
+            description = "A powerful sorceress.",
+            hero_class = CardClass.MAGE,
+            hero_power = HeroPower.FIREBLAST
+        )
+        cards = []
+        for i in range(6):
+            cards.append(Unit(
+                id = len(cards) + 1,
+                name = f"Unit {i}",
+                cost = 1,
+                description = "A test unit.",
+                card_classes = [CardClass.MAGE],
+                card_rarity = Rarity.COMMON,
+                unit_race = Race.ALL,
+                attack = 3,
+                health = 2
+            ))
+            cards.append(Spell(
+                id = len(cards) + 1,
+                name = f"Spell {i}",
+                cost = 1,
+                description = "A test spell.",
+                card_classes = [CardClass.MAGE],
+                card_rarity = Rarity.COMMON,
+                attack = 1,
+                health = 1
+            ))
+        return Player(name = name, hero = hero, deck = Deck(cards = cards))
+
+    def state_of(self, engine: GameEngine) -> tuple:
+        """
+        Returns every value of a game's state, to compare two engines.
+        """
+        players = []
+        for player in (engine.logic.player_1, engine.logic.player_2):
+            zones = [[card.to_dict() for card in zone] for zone in (player.deck.cards, player.deck.hand, player.deck.board, player.deck.graveyard)]
+            players.append((player.name, player.hero.to_dict(), player.attack, player.health, player.mana, player.armor, zones))
+        current = 1 if engine.current_player is engine.logic.player_1 else 2
+        return tuple(players), current, engine.turn, engine.phase, engine.played_card, engine.played_hero_power
+
+    def setUp(self) -> None:
+        """
+        Sets up a game where player 1 starts.
+        """
+        self.player_1 = self.make_player("Player 1")
+        self.player_2 = self.make_player("Player 2")
+        self.engine = GameEngine(self.player_1, self.player_2, first_player = self.player_1)
+
+    def test_first_turn_start(self) -> None:
+        """
+        Test that the first turn adds mana, draws a card and enters the play phase.
+        """
+        self.assertIs(self.engine.current_player, self.player_1)
+        self.assertEqual(self.engine.turn, 1)
+        self.assertEqual(self.player_1.mana, 2)
+        self.assertEqual(len(self.player_1.deck.hand), 1)
+        self.assertEqual(self.engine.phase, TurnPhase.PLAY_CARD)
+        self.assertEqual(self.engine.legal_actions(), [Action(ActionType.PLAY_CARD, 0), PASS_ACTION])
+
+    def test_play_unit_ends_turn(self) -> None:
+        """
+        Test that playing a unit skips the attack phase and passes the turn to the opponent.
+        """
+        self.engine.apply(Action(ActionType.PLAY_CARD, 0))
+        self.assertEqual(len(self.player_1.deck.board), 1)
+        self.assertEqual(self.player_1.mana, 1)
+        self.assertIs(self.engine.current_player, self.player_2)
+        self.assertEqual(self.engine.turn, 2)
+
+    def test_spell_targets(self) -> None:
+        """
+        Test that a spell can target the player's hero and units, and is moved to the graveyard.
+        """
+        self.engine.apply(Action(ActionType.PLAY_CARD, 0))
+        self.engine.apply(PASS_ACTION)
+        self.assertIs(self.engine.current_player, self.player_1)
+        spell = self.player_1.deck.hand[0]
+        self.assertIsInstance(spell, Spell)
+        self.assertIn(Action(ActionType.PLAY_CARD, 0, 0), self.engine.legal_actions())
+
+        self.engine.apply(Action(ActionType.PLAY_CARD, 0, 0))
+        self.assertEqual(self.player_1.deck.board[0].attack, 4)
+        self.assertEqual(spell.status, CardStatus.IN_GRAVEYARD)
+
+    def test_attack_moves_units_to_graveyard(self) -> None:
+        """
+        Test that an attack damages the opponent and moves the attacker to the graveyard.
+        """
+        self.engine.apply(Action(ActionType.PLAY_CARD, 0))
+        self.engine.apply(PASS_ACTION)
+        self.engine.apply(PASS_ACTION)
+        self.assertEqual(self.engine.phase, TurnPhase.ATTACK)
+
+        self.engine.apply(Action(ActionType.ATTACK, 0, HERO_TARGET))
+        self.assertEqual(self.player_2.health, 27)
+        self.assertEqual(len(self.player_1.deck.board), 0)
+        self.assertEqual(len(self.player_1.deck.graveyard), 1)
+        self.assertIs(self.engine.current_player, self.player_2)
+
+    def test_hero_power(self) -> None:
+        """
+        Test that the hero power is offered with enough mana and increases the hero's attack.
+        """
+        self.player_1.mana = 5
+        self.engine.apply(PASS_ACTION)
+        self.assertEqual(self.engine.legal_actions(), [USE_HERO_POWER_ACTION, PASS_ACTION])
+        self.engine.apply(USE_HERO_POWER_ACTION)
+        self.assertEqual(self.player_1.attack, 2)
+        self.assertEqual(self.player_1.mana, 1)
+
+    def test_invalid_action(self) -> None:
+        """
+        Test that an action from another phase raises an error.
+        """
+        with self.assertRaises(ValueError):
+            self.engine.apply(Action(ActionType.ATTACK, 0, HERO_TARGET))
+
+    def test_turn_limit(self) -> None:
+        """
+        Test that the game ends in a draw once the turn limit is reached.
+        """
+        engine = GameEngine(self.make_player("A"), self.make_player("B"), turn_limit = 4)
+        while not engine.is_terminal():
+            engine.apply(PASS_ACTION)
+        self.assertEqual(engine.legal_actions(), [])
+        self.assertIsNone(engine.winner())
+
+    def test_random_games_terminate(self) -> None:
+        """
+        Test that games played with random legal actions always end with a winner.
+        """
+        rng = random.Random(42)
+        for _ in range(5):
+            engine = GameEngine(self.make_player("A"), self.make_player("B"))
+            while not engine.is_terminal():
+                engine.apply(rng.choice(engine.legal_actions()))
+            winner = engine.winner()
+            self.assertIsNotNone(winner)
+            loser = engine.logic.player_1 if winner is engine.logic.player_2 else engine.logic.player_2
+            self.assertLessEqual(loser.health, 0)
+
+    def test_clone_matches_deepcopy(self) -> None:
+        """
+        Test that a clone is identical to a deep copy, and stays so when both play the same actions.
+        """
+        rng = random.Random(3)
+        for _ in range(10):
+            self.engine.apply(rng.choice(self.engine.legal_actions()))
+        cloned = self.engine.clone()
+        deep_copied = copy.deepcopy(self.engine)
+        self.assertEqual(self.state_of(cloned), self.state_of(deep_copied))
+        while not deep_copied.is_terminal():
+            action = rng.choice(deep_copied.legal_actions())
+            deep_copied.apply(action)
+            cloned.apply(action)
+            self.assertEqual(self.state_of(cloned), self.state_of(deep_copied))
+
+    def test_clone_is_independent(self) -> None:
+        """
+        Test that playing on a clone does not change the original game.
+        """
+        state = self.state_of(self.engine)
+        cloned = self.engine.clone()
+        cloned.apply(Action(ActionType.PLAY_CARD, 0))
+        self.assertEqual(self.state_of(self.engine), state)
+        self.assertIsNot(cloned.current_player, self.player_1)
+        self.assertIs(cloned.logic.player_1.hero, self.player_1.hero)
+
+    def test_clone_has_its_own_streams(self) -> None:
+        """
+        Test that drawing from the streams of a clone does not change the values the original streams draw next.
+        """
+        self.engine.rng.stream("shuffle", 1).random()
+        cloned = self.engine.clone()
+        deep_copied = copy.deepcopy(self.engine)
+        for _ in range(5):
+            cloned.logic.rng.random()
+            cloned.rng.stream("shuffle", 1).random()
+        self.assertIs(cloned.logic.rng, cloned.rng.stream("start"))
+        self.assertEqual(self.engine.logic.rng.random(), deep_copied.logic.rng.random())
+        self.assertEqual(self.engine.rng.stream("shuffle", 1).random(), deep_copied.rng.stream("shuffle", 1).random())
+        self.assertEqual(self.engine.rng.seed, cloned.rng.seed)
+
+    def test_snapshot_restore(self) -> None:
+        """
+        Test that restoring a snapshot brings the game back to it, keeping the same players.
+        """
+        snapshot = self.engine.snapshot()
+        state = self.state_of(self.engine)
+        for _ in range(2):
+            self.engine.apply(Action(ActionType.PLAY_CARD, 0))
+            self.engine.restore(snapshot)
+            self.assertEqual(self.state_of(self.engine), state)
+        self.assertIs(self.engine.current_player, self.player_1)
+        self.assertIs(self.engine.logic.player_1, self.player_1)
+
+    def test_zobrist_hash_ignores_attack_order(self) -> None:
+        """
+        Test that attacking in a different order gives the same hash, and that a clone has the same hash.
+        """
+        for _ in range(4):
+            self.player_1.deck.draw()
+        for unit in [card for card in self.player_1.deck.hand if isinstance(card, Unit)]:
+            self.player_1.deck.play_card(unit)
+        self.engine.apply(PASS_ACTION)
+        self.assertEqual(self.engine.phase, TurnPhase.ATTACK)
+        self.assertEqual(self.engine.clone().zobrist_hash(), self.engine.zobrist_hash())
+
+        first, second = self.engine.clone(), self.engine.clone()
+        first.apply(Action(ActionType.ATTACK, 0, HERO_TARGET))
+        first.apply(Action(ActionType.ATTACK, 0, HERO_TARGET))
+        second.apply(Action(ActionType.ATTACK, 1, HERO_TARGET))
+        second.apply(Action(ActionType.ATTACK, 0, HERO_TARGET))
+        self.assertEqual(first.zobrist_hash(), second.zobrist_hash())
+
+        third = self.engine.clone()
+        third.apply(Action(ActionType.ATTACK, 0, HERO_TARGET))
+        third.apply(Action(ActionType.ATTACK, 1, HERO_TARGET))
+        self.assertNotEqual(first.zobrist_hash(), third.zobrist_hash())
+
+    def test_attacks_update_moves(self) -> None:
+        """
+        Test that an attack removes the attacker from the attackers and shifts the units after it.
+        """
+        for _ in range(4):
+            self.player_1.deck.draw()
+        for unit in [card for card in self.player_1.deck.hand if isinstance(card, Unit)]:
+            self.player_1.deck.play_card(unit)
+        self.engine.apply(PASS_ACTION)
+        units = len(self.player_1.deck.board)
+        self.assertGreaterEqual(units, 2)
+        self.assertEqual(self.engine.attackers, list(range(units)))
+        self.assertEqual(self.engine.targets, 1)
+
+        self.engine.apply(Action(ActionType.ATTACK, 1, HERO_TARGET))
+        self.assertEqual(self.engine.attackers, list(range(units - 1)))
+        self.assertEqual(self.engine.legal_actions(), [Action(ActionType.ATTACK, index, HERO_TARGET) for index in range(units - 1)] + [PASS_ACTION])
+
+    def test_incremental_moves_match_refresh(self) -> None:
+        """
+        Test that the moves kept by the engine during random games always match freshly computed ones.
+        """
+        rng = random.Random(7)
+        for _ in range(5):
+            engine = GameEngine(self.make_player("A"), self.make_player("B"))
+            while not engine.is_terminal():
+                actions = list(engine.iter_legal_actions())
+                refreshed = engine.clone()
+                refreshed.refresh_moves()
+                self.assertEqual(actions, refreshed.legal_actions())
+                self.assertTrue(all(action is again for action, again in zip(actions, engine.iter_legal_actions())))
+                engine.apply(rng.choice(actions))
+
+    def test_make_unmake_restores_state(self) -> None:
+        """
+        Test that taking back the actions of random games one by one goes through every earlier state, deck order and moves included.
+        """
+        rng = random.Random(5)
+        for _ in range(5):
+            engine = GameEngine(self.make_player("A"), self.make_player("B"))
+            engine.start_journal()
+            states = [(self.state_of(engine), engine.legal_actions(), engine.zobrist_hash())]
+            while not engine.is_terminal():
+                engine.make(rng.choice(engine.legal_actions()))
+                states.append((self.state_of(engine), engine.legal_actions(), engine.zobrist_hash()))
+            while engine.history:
+                engine.unmake()
+                states.pop()
+                self.assertEqual((self.state_of(engine), engine.legal_actions(), engine.zobrist_hash()), states[-1])
+            self.assertEqual(len(engine.journal), 0)
+
+    def test_undo_redo(self) -> None:
+        """
+        Test that undone actions are played again by redo, and forgotten when another action is applied.
+        """
+        self.engine.start_journal()
+        state = self.state_of(self.engine)
+        self.engine.apply(Action(ActionType.PLAY_CARD, 0))
+        played = self.state_of(self.engine)
+
+        self.assertEqual(self.engine.undo(), Action(ActionType.PLAY_CARD, 0))
+        self.assertEqual(self.state_of(self.engine), state)
+        self.assertEqual(self.engine.redo(), Action(ActionType.PLAY_CARD, 0))
+        self.assertEqual(self.state_of(self.engine), played)
+
+        self.engine.undo()
+        self.engine.apply(PASS_ACTION)
+        with self.assertRaises(ValueError):
+            self.engine.redo()
+        self.engine.undo()
+        with self.assertRaises(ValueError):
+            self.engine.undo()
+
+    def test_refused_action_is_not_journaled(self) -> None:
+        """
+        Test that an action refused by the engine leaves neither a change nor a journal entry.
+        """
+        self.engine.start_journal()
+        state = self.state_of(self.engine)
+        with self.assertRaises(ValueError):
+            self.engine.make(USE_HERO_POWER_ACTION)
+        self.assertEqual(self.state_of(self.engine), state)
+        self.assertEqual(len(self.engine.journal), 0)
+        self.assertEqual(self.engine.history, [])
+
+    def test_journal_is_not_cloned(self) -> None:
+        """
+        Test that a clone does not record its changes in the journal of the game it was copied from.
+        """
+        journal = self.engine.start_journal()
+        cloned = self.engine.clone()
+        cloned.apply(Action(ActionType.PLAY_CARD, 0))
+        self.assertEqual(len(journal), 0)
+        self.assertIsNone(cloned.journal)
+        self.engine.stop_journal()
+        self.engine.apply(Action(ActionType.PLAY_CARD, 0))
+        self.assertEqual(len(journal), 0)
+
+if __name__ == "__main__":
+    unittest.main()
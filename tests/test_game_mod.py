@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+
+# Imports
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+# Utils Imports
+from utils.database_utils import Database
+
+# Constants
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # The data files are read from the root of the repository
+
+# Class
+class TestGame(unittest.TestCase):
+    """
+    Unit tests for the Game class.
+    """
+
+    def test_writes_survive_process_exit(self) -> None:
+        """
+        Test that a write made to the cached database after the setup is on disk once the process running the game exits.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            database_path = os.path.join(directory, "database.json")
+            script = textwrap.dedent(f"""
+                from unittest import mock
+                from core.game_mod import Game
+
+                def start(game):
+                    game.hearthstone_db.table("decks").insert({{"name": "Aggro"}})
+
+                interface = mock.Mock(game_mode = "PVP")
+                interface.setup_players.return_value = (mock.Mock(), mock.Mock())
+                with mock.patch("utils.database_utils.DATABASE_PATH", {database_path!r}), \\
+                     mock.patch("core.game_mod.BinaryCatalog"), \\
+                     mock.patch("core.game_mod.PlayerChoiceInterface", return_value = interface), \\
+                     mock.patch("core.game_mod.GameLogic"), \\
+                     mock.patch.object(Game, "start", start):
+                    Game()
+            """)
+            environment = dict(os.environ, PYTHONPATH = ROOT_PATH)
+            subprocess.run([sys.executable, "-c", script], cwd = ROOT_PATH, env = environment, check = True)
+
+            db = Database.initialize_database(database_path)
+            self.assertEqual(db.table("decks").all(), [{"name": "Aggro"}])
+            db.close()
+
+if __name__ == "__main__":
+    unittest.main()
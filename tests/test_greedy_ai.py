@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+
+# Imports
+import unittest
+
+# Core Imports
+from core.game_engine import GameEngine, Action, HERO_TARGET, PASS_ACTION
+from core.simulation_mod import MatchSimulator
+
+# Modules Imports
+from modules.hero_mod import Hero
+from modules.deck_mod import Deck
+from modules.unit_mod import Unit
+from modules.player_mod import Player
+
+# AI Imports
+from ai.greedy_ai import GreedyAI
+from ai.random_ai import RandomAI
+
+# Enum Imports
+from enums.action_type_enum import ActionType
+from enums.turn_phase_enum import TurnPhase
+from enums.card_class_enum import CardClass
+from enums.hero_power_enum import HeroPower
+from enums.rarity_enum import Rarity
+from enums.race_enum import Race
+
+# Class
+class TestGreedyAI(unittest.TestCase):
+    """
+    Unit tests for the GreedyAI class.
+    """
+
+    def make_player(self, name: str) -> Player:
+        """
+        Creates a player with a deck of units of increasing cost.
+        """
+        hero = Hero(
+            id = 1,
+            name = "Thrall",
+            description = "For the Horde!",
+            hero_class = CardClass.SHAMAN,
+            hero_power = HeroPower.TOTEMIC_CALL
+        )
+        cards = [Unit(
+            id = i + 1,
+            name = f"Unit {i}",
+            cost = 1 + i % 4,
+            description = "A test unit.",
+            card_classes = [CardClass.SHAMAN],
+            card_rarity = Rarity.COMMON,
+            unit_race = Race.TOTEM,
+            attack = 1 + i % 5,
+            health = 1 + i % 3
+        ) for i in range(20)]
+        return Player(name = name, hero = hero, deck = Deck(cards = cards))
+
+    def test_attacks_when_lethal(self) -> None:
+        """
+        Test that the bot attacks the opponent's hero when this wins the game.
+        """
+        player_1, player_2 = self.make_player("Player 1"), self.make_player("Player 2")
+        engine = GameEngine(player_1, player_2, first_player = player_1)
+        player_1.deck.play_card(player_1.deck.draw())
+        player_2.health = player_1.deck.board[0].attack
+        engine.apply(PASS_ACTION)
+        self.assertEqual(engine.phase, TurnPhase.ATTACK)
+        self.assertEqual(GreedyAI(seed = 1).choose_action(engine), Action(ActionType.ATTACK, 0, HERO_TARGET))
+
+    def test_beats_random_bot(self) -> None:
+        """
+        Test that the bot wins more games than a random bot.
+        """
+        result = MatchSimulator(self.make_player("Player 1"), self.make_player("Player 2"), bot_1 = GreedyAI, bot_2 = RandomAI, processes = 1).run(40, seed = 3)
+        self.assertGreater(result.wins[0], result.wins[1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+
+# Imports
+import unittest
+
+# Utils Imports
+from utils.journal_utils import Journal
+
+# Class
+class TestJournal(unittest.TestCase):
+    """
+    Unit tests for the Journal class.
+    """
+
+    def test_undo_to_mark(self) -> None:
+        """
+        Test that undoing reverts the entries after the mark, newest first.
+        """
+        journal = Journal()
+        values = []
+        journal.record(values.append, 1)
+        mark = len(journal)
+        journal.record(values.append, 2)
+        journal.record(values.append, 3)
+        journal.undo(mark)
+        self.assertEqual(values, [3, 2])
+        self.assertEqual(len(journal), mark)
+        journal.undo()
+        self.assertEqual(values, [3, 2, 1])
+
+    def test_save_restores_fields(self) -> None:
+        """
+        Test that saved attributes are set back to their values.
+        """
+        class Target:
+            pass
+        target = Target()
+        target.attack, target.health = 2, 5
+        journal = Journal()
+        journal.save(target, "attack", "health")
+        target.attack, target.health = 0, -1
+        journal.save(target, "health")
+        target.health = 9
+        journal.undo()
+        self.assertEqual((target.attack, target.health), (2, 5))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+
+# Imports
+import json
+import os
+import tempfile
+import unittest
+
+# Core Imports
+from core.card_catalog import CardCatalog
+
+# Utils Imports
+from utils.constants import HEROES_DB_PATH, UNITS_DB_PATH, SPELLS_DB_PATH, UNITS_TABLE_NAME
+from utils.database_utils import Database
+from utils.json_stream_utils import ClassDocumentReader
+
+# Class
+class TestClassDocumentReader(unittest.TestCase):
+    """
+    Unit tests for the incremental reader of the data files.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up a temporary directory for the data files.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        """
+        Removes the temporary directory.
+        """
+        self.directory.cleanup()
+
+    def write_file(self, content: str) -> str:
+        """
+        Writes a data file and returns its path.
+        """
+        file_path = os.path.join(self.directory.name, "data.json")
+        with open(file_path, "w") as file:
+            file.write(content)
+        return file_path
+
+    def test_reads_data_files(self) -> None:
+        """
+        Test that the data files are read as `json.load` reads them, whatever the size of the chunks.
+        """
+        for file_path in (HEROES_DB_PATH, UNITS_DB_PATH, SPELLS_DB_PATH):
+            with open(file_path) as file:
+                expected = json.load(file)
+            for chunk_size in (1, 7, 4096):
+                self.assertEqual(list(ClassDocumentReader(file_path, chunk_size = chunk_size)), expected)
+
+    def test_splits_large_documents(self) -> None:
+        """
+        Test that documents are split into batches of rows keeping their classes and order, and that empty documents are kept.
+        """
+        file_path = self.write_file('[{"MAGE": [{"n": 1}, {"n": 2}, {"n": 3}], "ROGUE": [{"n": 4}], "PRIEST": []}, {}, {"DRUID": [{"n": 5}]}]')
+        documents = list(ClassDocumentReader(file_path, batch_rows = 2, chunk_size = 3))
+        self.assertEqual(documents, [
+            {"MAGE": [{"n": 1}, {"n": 2}]},
+            {"MAGE": [{"n": 3}], "ROGUE": [{"n": 4}]},
+            {"PRIEST": []},
+            {},
+            {"DRUID": [{"n": 5}]}
+        ])
+        self.assertEqual(list(ClassDocumentReader(self.write_file(" [ ] "))), [])
+
+    def test_invalid_files(self) -> None:
+        """
+        Test that files not grouping rows by class, truncated or followed by other data raise an error.
+        """
+        for content in ('{"MAGE": []}', '[{"MAGE": [1]}]', '[{"MAGE": {}}]', '[{"MAGE": [{"n": 1}', '[{"MAGE": [{"n": 1]}]', '[] []', ''):
+            with self.assertRaises(ValueError, msg = content):
+                list(ClassDocumentReader(self.write_file(content), chunk_size = 4))
+        with self.assertRaises(ValueError):
+            ClassDocumentReader(UNITS_DB_PATH, batch_rows = 0)
+
+    def test_streams_into_table_and_catalog(self) -> None:
+        """
+        Test that a large file inserted by batches holds all its rows, and that the catalog indexes the same cards as from whole tables.
+        """
+        with open(UNITS_DB_PATH) as file:
+            units = json.load(file)
+        large_units = [{class_name: rows * 8 for class_name, rows in document.items()} for document in units]
+        file_path = self.write_file(json.dumps(large_units))
+
+        db = Database.initialize_database(os.path.join(self.directory.name, "database.json"))
+        self.assertEqual(Database.insert_file_to_table(db, UNITS_TABLE_NAME, file_path, batch_rows = 64), 2000)
+        self.assertEqual(len(Database.search_cards(db, UNITS_TABLE_NAME, card_class = "MAGE")), 200)
+        db.close()
+
+        streamed = CardCatalog(units_table = ClassDocumentReader(file_path, batch_rows = 64))
+        loaded = CardCatalog(units_table = large_units)
+        self.assertEqual([(card["name"], card["card_class"]) for card in streamed.cards], [(card["name"], card["card_class"]) for card in loaded.cards])
+
+if __name__ == "__main__":
+    unittest.main()
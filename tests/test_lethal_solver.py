@@ -0,0 +1,147 @@
+#!/usr/bin/python3
+
+# Imports
+import random
+import unittest
+
+# Core Imports
+from core.game_engine import GameEngine, Action, HERO_TARGET, PASS_ACTION
+
+# Modules Imports
+from modules.hero_mod import Hero
+from modules.deck_mod import Deck
+from modules.unit_mod import Unit
+from modules.spell_mod import Spell
+from modules.player_mod import Player
+
+# AI Imports
+from ai.lethal_solver import LethalSolver
+
+# Enum Imports
+from enums.action_type_enum import ActionType
+from enums.turn_phase_enum import TurnPhase
+from enums.card_class_enum import CardClass
+from enums.hero_power_enum import HeroPower
+from enums.rarity_enum import Rarity
+from enums.race_enum import Race
+
+# Class
+class TestLethalSolver(unittest.TestCase):
+    """
+    Unit tests for the LethalSolver class.
+    """
+
+    def make_player(self, name: str) -> Player:
+        """
+        Creates a player whose first card is a spell giving 3 attack, followed by units.
+        """
+        hero = Hero(
+            id = 1,
+            name = "Jaina Proudmoore",
+            description = "The Kirin Tor's finest.",
+            hero_class = CardClass.MAGE,
+            hero_power = HeroPower.FIREBLAST
+        )
+        spell = Spell(
+            id = 1,
+            name = "Sharpen",
+            cost = 1,
+            description = "Gives 3 attack.",
+            card_classes = [CardClass.MAGE],
+            card_rarity = Rarity.COMMON,
+            attack = 3
+        )
+        units = [Unit(
+            id = i + 2,
+            name = f"Unit {i}",
+            cost = 1 + i % 3,
+            description = "A test unit.",
+            card_classes = [CardClass.MAGE],
+            card_rarity = Rarity.COMMON,
+            unit_race = Race.ALL,
+            attack = 1 + i % 4,
+            health = 2
+        ) for i in range(15)]
+        return Player(name = name, hero = hero, deck = Deck(cards = [spell] + units))
+
+    def brute_force(self, engine: GameEngine) -> bool:
+        """
+        Checks if the current player can win this turn by trying every sequence of legal actions.
+        """
+        for action in engine.legal_actions():
+            game = engine.clone()
+            game.apply(action)
+            if game.is_terminal():
+                if game.opponent.health <= 0:
+                    return True
+            elif game.turn == engine.turn and self.brute_force(game):
+                return True
+        return False
+
+    def setUp(self) -> None:
+        """
+        Sets up a game where player 1 starts with the spell in hand, and a solver.
+        """
+        self.player_1 = self.make_player("Player 1")
+        self.player_2 = self.make_player("Player 2")
+        self.engine = GameEngine(self.player_1, self.player_2, first_player = self.player_1)
+        self.solver = LethalSolver()
+
+    def test_spell_on_hero(self) -> None:
+        """
+        Test that a spell cast on the hero is followed by a hero attack when it is lethal.
+        """
+        self.assertIsInstance(self.player_1.deck.hand[0], Spell)
+        self.player_2.health = 3
+        plan = self.solver.find_lethal(self.engine)
+        self.assertEqual(plan, [Action(ActionType.PLAY_CARD, 0, HERO_TARGET), Action(ActionType.HERO_ATTACK, -1, HERO_TARGET)])
+        for action in plan:
+            self.engine.apply(action)
+        self.assertIs(self.engine.winner(), self.player_1)
+
+    def test_armor_and_hero_power(self) -> None:
+        """
+        Test that the opponent's armor is counted and that the hero power, which prevents the hero attack, never helps.
+        """
+        self.player_2.health = 3
+        self.player_2.armor = 1
+        self.assertFalse(self.solver.has_lethal(self.engine))
+
+        self.player_1.mana = 4  # The spell and the hero power would give 5 attack
+        self.engine.refresh_moves()
+        self.assertFalse(self.solver.has_lethal(self.engine))
+        self.player_1.attack = 1
+        self.assertTrue(self.solver.has_lethal(self.engine))
+
+    def test_board_attacks(self) -> None:
+        """
+        Test that the units attack the hero, the last ones first, when only the attack phase is left.
+        """
+        for _ in range(3):
+            self.player_1.deck.play_card(self.player_1.deck.draw())
+        self.engine.apply(PASS_ACTION)
+        self.assertEqual(self.engine.phase, TurnPhase.ATTACK)
+        self.player_2.health = sum(card.attack for card in self.player_1.deck.board)
+
+        plan = self.solver.find_lethal(self.engine)
+        self.assertEqual(plan, [Action(ActionType.ATTACK, index, HERO_TARGET) for index in (2, 1, 0)])
+        for action in plan:
+            self.engine.apply(action)
+        self.assertIs(self.engine.winner(), self.player_1)
+
+        self.assertIsNone(self.solver.find_lethal(self.engine))
+
+    def test_matches_brute_force(self) -> None:
+        """
+        Test that the solver agrees with an exhaustive search of the turn during random games.
+        """
+        rng = random.Random(5)
+        for _ in range(2):
+            engine = GameEngine(self.make_player("A"), self.make_player("B"))
+            engine.logic.player_1.health = engine.logic.player_2.health = 10
+            while not engine.is_terminal():
+                self.assertEqual(self.solver.has_lethal(engine), self.brute_force(engine))
+                engine.apply(rng.choice(engine.legal_actions()))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+
+# Imports
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# Core Imports
+from core.game_mod import Game
+
+# Utils Imports
+from utils.database_utils import Database
+from utils.manifest_utils import DatabaseManifest
+
+# Class
+class TestDatabaseManifest(unittest.TestCase):
+    """
+    Unit tests for the DatabaseManifest class and its use when seeding the database.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up a temporary database and data file.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = Database.initialize_database(os.path.join(self.directory.name, "database.json"))
+        self.data_path = os.path.join(self.directory.name, "units.json")
+        self.write_data([{"MAGE": [{"name": "Water Elemental", "cost": 4}]}])
+        self.game = Game.__new__(Game)  # Skip the interactive setup
+
+    def tearDown(self) -> None:
+        """
+        Closes and removes the temporary database.
+        """
+        self.db.close()
+        self.directory.cleanup()
+
+    def write_data(self, data: list) -> None:
+        """
+        Writes the content of the data file.
+        """
+        with open(self.data_path, "w") as file:
+            json.dump(data, file)
+
+    def test_record_and_check(self) -> None:
+        """
+        Test that a recorded file is up to date until its content changes.
+        """
+        manifest = DatabaseManifest(self.db)
+        self.assertFalse(manifest.is_up_to_date("units", self.data_path))
+        manifest.record("units", self.data_path)
+        self.assertTrue(manifest.is_up_to_date("units", self.data_path))
+
+        self.write_data([{"MAGE": [{"name": "Water Elemental", "cost": 10}]}])
+        self.assertFalse(manifest.is_up_to_date("units", self.data_path))
+
+    def test_touched_file_is_compared_by_content(self) -> None:
+        """
+        Test that a file whose modification time changed but not its content is still up to date, and is not read again afterwards.
+        """
+        manifest = DatabaseManifest(self.db)
+        manifest.record("units", self.data_path)
+        stat = os.stat(self.data_path)
+        os.utime(self.data_path, ns = (stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertTrue(manifest.is_up_to_date("units", self.data_path))
+        with mock.patch.object(DatabaseManifest, "file_hash") as file_hash:
+            self.assertTrue(manifest.is_up_to_date("units", self.data_path))
+        file_hash.assert_not_called()
+
+    def test_init_database_skips_unchanged_table(self) -> None:
+        """
+        Test that seeding an unchanged table a second time does not write to the database.
+        """
+        self.game.init_database(self.db, "units", self.data_path)
+        with mock.patch.object(Database, "insert_data_to_table") as insert_data_to_table:
+            self.game.init_database(self.db, "units", self.data_path)
+        insert_data_to_table.assert_not_called()
+        self.assertEqual(Database.fetch_all_from_table(self.db, "units"), [{"MAGE": [{"name": "Water Elemental", "cost": 4}]}])
+
+    def test_init_database_reseeds_changed_table(self) -> None:
+        """
+        Test that a table is rebuilt when its data file changes.
+        """
+        self.game.init_database(self.db, "units", self.data_path)
+        self.write_data([{"MAGE": [{"name": "Water Elemental", "cost": 10}]}])
+        self.game.init_database(self.db, "units", self.data_path)
+        self.assertEqual(Database.fetch_all_from_table(self.db, "units"), [{"MAGE": [{"name": "Water Elemental", "cost": 10}]}])
+
+if __name__ == "__main__":
+    unittest.main()
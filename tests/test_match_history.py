@@ -0,0 +1,206 @@
+#!/usr/bin/python3
+
+# Imports
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Core Imports
+from core.card_catalog import CardCatalog
+from core.match_history import MatchHistory, MatchRecord, MatchSegment, LOG_NAME
+from core.simulation_mod import play_game
+
+# Modules Imports
+from modules.deck_mod import Deck
+from modules.player_mod import Player
+
+# AI Imports
+from ai.random_ai import RandomAI
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+
+# Class
+class TestMatchHistory(unittest.TestCase):
+    """
+    Unit tests for the match history.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up a temporary directory for the history.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "history")
+
+    def tearDown(self) -> None:
+        """
+        Removes the temporary directory.
+        """
+        self.directory.cleanup()
+
+    def make_matches(self, count: int) -> list[MatchRecord]:
+        """
+        Creates matches between three players, one second apart and appended out of order.
+        """
+        names = ("Jaina", "Garrosh", "Thrall")
+        classes = (CardClass.MAGE, CardClass.WARRIOR, CardClass.SHAMAN)
+        matches = []
+        for index in range(count):
+            first, second = index % 3, (index + 1) % 3
+            matches.append(MatchRecord(
+                timestamp = 1000.0 + (index * 7) % count,
+                duration = 0.5,
+                turns = 10 + index % 5,
+                winner = index % 3,
+                players = (names[first], names[second]),
+                heroes = (f"Hero {first}", f"Hero {second}"),
+                hero_classes = (classes[first], classes[second]),
+                decks = (("Fireball", "Frostbolt"), ("Execute",) * 2)
+            ))
+        return matches
+
+    def assert_queries(self, history: MatchHistory, matches: list[MatchRecord]) -> None:
+        """
+        Checks that queries by player, hero class and time range find the matches a scan would find.
+        """
+        ordered = sorted(matches, key = lambda match: match.timestamp)
+        self.assertEqual(history.query(), ordered)
+        self.assertEqual(history.query(player = "Jaina"), [match for match in ordered if "Jaina" in match.players])
+        self.assertEqual(history.query(hero_class = CardClass.SHAMAN, start = 1010.0, end = 1020.0),
+                         [match for match in ordered if CardClass.SHAMAN in match.hero_classes and 1010.0 <= match.timestamp < 1020.0])
+        self.assertEqual(history.query(player = "Garrosh", hero_class = CardClass.MAGE),
+                         [match for match in ordered if "Garrosh" in match.players and CardClass.MAGE in match.hero_classes])
+        self.assertEqual(history.query(player = "Anduin"), [])
+
+    def test_append_and_query(self) -> None:
+        """
+        Test that appended matches are found by every query, before and after reopening the history.
+        """
+        matches = self.make_matches(30)
+        with MatchHistory(self.path) as history:
+            for match in matches:
+                history.append(match)
+            self.assert_queries(history, matches)
+        with MatchHistory(self.path) as history:
+            self.assertEqual(len(history), 30)
+            self.assertEqual(history.segments, [])
+            self.assert_queries(history, matches)
+
+    def test_compaction_and_merge(self) -> None:
+        """
+        Test that full logs are compacted into indexed segments, merged by tiers of similar size, without changing the queries.
+        """
+        matches = self.make_matches(50)
+        with MatchHistory(self.path, compact_matches = 10, segment_limit = 3) as history:
+            for match in matches[:25]:
+                history.append(match)
+            self.assertEqual(len(history.segments), 2)
+            self.assertEqual(len(history.matches), 5)
+            self.assert_queries(history, matches[:25])
+            for match in matches[25:30]:
+                history.append(match)
+            self.assertEqual([(segment.first_generation, segment.last_generation) for segment in history.segments], [(1, 3)])
+            for match in matches[30:]:
+                history.append(match)
+            self.assertEqual([(segment.first_generation, segment.last_generation) for segment in history.segments], [(1, 3), (4, 4), (5, 5)])
+            self.assertEqual(len(os.listdir(self.path)), 4)
+        with MatchHistory(self.path, compact_matches = 10, segment_limit = 3) as history:
+            self.assertEqual(len(history), 50)
+            self.assert_queries(history, matches)
+
+    def test_merges_only_similar_sizes(self) -> None:
+        """
+        Test that merges cascade through the tiers and never rewrite an older, larger segment into a smaller one.
+        """
+        matches = self.make_matches(54)
+        with MatchHistory(self.path, compact_matches = 2, segment_limit = 3) as history:
+            for match in matches:
+                history.append(match)
+                sizes = [len(segment) for segment in history.segments]
+                self.assertEqual(sizes, sorted(sizes, reverse = True))
+            self.assertEqual([(segment.first_generation, segment.last_generation) for segment in history.segments], [(1, 27)])
+            self.assert_queries(history, matches)
+            history.append(matches[0]._replace(timestamp = 2000.0))
+            history.compact()
+            self.assertEqual([len(segment) for segment in history.segments], [54, 1])
+
+    def test_interrupted_writes(self) -> None:
+        """
+        Test that a match cut short by a crash is dropped, and that a log compacted before it could be reset is not counted twice.
+        """
+        matches = self.make_matches(12)
+        with MatchHistory(self.path) as history:
+            for match in matches[:6]:
+                history.append(match)
+        log_path = os.path.join(self.path, LOG_NAME)
+        with open(log_path, "r+b") as file:
+            file.truncate(os.path.getsize(log_path) - 3)
+        with MatchHistory(self.path) as history:
+            self.assertEqual(history.query(), sorted(matches[:5], key = lambda match: match.timestamp))
+            history.append(matches[5])
+            shutil.copy(log_path, log_path + ".old")
+            history.compact()
+        os.replace(log_path + ".old", log_path)  # The crash happened before the log was reset
+        with MatchHistory(self.path) as history:
+            self.assertEqual(len(history), 6)
+            self.assertEqual(history.matches, [])
+
+    def test_append_does_not_read_segments(self) -> None:
+        """
+        Test that opening a history and appending a match reads the active log only, the segments being read by the first query.
+        """
+        matches = self.make_matches(25)
+        with MatchHistory(self.path, compact_matches = 10) as history:
+            for match in matches[:24]:
+                history.append(match)
+        with mock.patch("core.match_history.MatchSegment", wraps = MatchSegment) as segment:
+            with MatchHistory(self.path, compact_matches = 10) as history:
+                history.append(matches[24])
+                self.assertEqual(segment.call_count, 0)
+                self.assertEqual(history.ranges, [(1, 1), (2, 2)])
+                self.assert_queries(history, matches)
+                self.assertEqual(segment.call_count, 2)
+
+    def test_segment_is_indexed(self) -> None:
+        """
+        Test that a segment stores its matches by time with the matches of each player.
+        """
+        with MatchHistory(self.path, compact_matches = 12) as history:
+            for match in self.make_matches(12):
+                history.append(match)
+        segment = MatchSegment(history.segments[0].file_path)
+        self.assertEqual(segment.timestamps, sorted(segment.timestamps))
+        self.assertEqual(len(segment.players["Thrall"]), 8)
+        self.assertEqual(len(segment.classes[CardClass.MAGE]), 8)
+
+    def test_invalid_file(self) -> None:
+        """
+        Test that opening a directory whose log is not a match history log raises an error.
+        """
+        os.makedirs(self.path)
+        with open(os.path.join(self.path, LOG_NAME), "wb") as file:
+            file.write(b"HSRL\x01\x00\x00\x00\x01\x00\x00\x00")
+        with self.assertRaises(ValueError):
+            MatchHistory(self.path)
+
+    def test_play_game_records(self) -> None:
+        """
+        Test that a simulated game is appended to the history with its players, heroes and decks.
+        """
+        catalog = CardCatalog.from_files()
+        players = []
+        for name, card_class in (("Jaina", CardClass.MAGE), ("Garrosh", CardClass.WARRIOR)):
+            hero = catalog.create_hero(catalog.heroes_by_class(card_class)[0])
+            players.append(Player(name = name, hero = hero, deck = Deck(cards = catalog.create_class_cards(card_class)[:30])))
+        with MatchHistory(self.path) as history:
+            winner, turns = play_game(players[0], players[1], RandomAI, RandomAI, seed = "history", history = history)
+            match, = history.query(player = "Garrosh")
+        self.assertEqual((match.winner, match.turns), (winner, turns))
+        self.assertEqual(match.hero_classes, (CardClass.MAGE, CardClass.WARRIOR))
+        self.assertEqual(match.decks[0], tuple(sorted(card.name for card in players[0].deck.cards)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+
+# Imports
+import functools
+import unittest
+
+# Core Imports
+from core.game_engine import GameEngine, Action, HERO_TARGET, PASS_ACTION
+from core.simulation_mod import MatchSimulator
+
+# Modules Imports
+from modules.hero_mod import Hero
+from modules.deck_mod import Deck
+from modules.unit_mod import Unit
+from modules.player_mod import Player
+
+# AI Imports
+from ai.mcts_ai import MCTSAI, evaluate
+from ai.random_ai import RandomAI
+
+# Enum Imports
+from enums.action_type_enum import ActionType
+from enums.turn_phase_enum import TurnPhase
+from enums.card_class_enum import CardClass
+from enums.hero_power_enum import HeroPower
+from enums.rarity_enum import Rarity
+from enums.race_enum import Race
+
+# Class
+class TestMCTSAI(unittest.TestCase):
+    """
+    Unit tests for the MCTSAI class.
+    """
+
+    def make_player(self, name: str) -> Player:
+        """
+        Creates a player with a deck of units of increasing cost.
+        """
+        hero = Hero(
+            id = 1,
+            name = "Garrosh Hellscream",
+            description = "Victory or death!",
+            hero_class = CardClass.WARRIOR,
+            hero_power = HeroPower.ARMOR_UP
+        )
+        cards = [Unit(
+            id = i + 1,
+            name = f"Unit {i}",
+            cost = 1 + i % 4,
+            description = "A test unit.",
+            card_classes = [CardClass.WARRIOR],
+            card_rarity = Rarity.COMMON,
+            unit_race = Race.ALL,
+            attack = 2 + i % 4,
+            health = 3
+        ) for i in range(20)]
+        return Player(name = name, hero = hero, deck = Deck(cards = cards))
+
+    def setUp(self) -> None:
+        """
+        Sets up a game where player 1 starts, and a bot with an iteration budget.
+        """
+        self.player_1 = self.make_player("Player 1")
+        self.player_2 = self.make_player("Player 2")
+        self.engine = GameEngine(self.player_1, self.player_2, first_player = self.player_1)
+        self.bot = MCTSAI(seed = 1, iterations = 50, time_limit = None)
+
+    def test_invalid_budget(self) -> None:
+        """
+        Test that a bot without a positive budget cannot be created.
+        """
+        with self.assertRaises(ValueError):
+            MCTSAI(iterations = None, time_limit = None)
+        with self.assertRaises(ValueError):
+            MCTSAI(iterations = 0)
+        with self.assertRaises(ValueError):
+            MCTSAI(workers = 0)
+
+    def test_chooses_legal_action_without_modifying_game(self) -> None:
+        """
+        Test that the chosen action is legal and that searching leaves the game unchanged.
+        """
+        hand = [card.to_dict() for card in self.player_1.deck.hand]
+        cards = [card.to_dict() for card in self.player_1.deck.cards]
+        action = self.bot.choose_action(self.engine)
+        self.assertIn(action, self.engine.legal_actions())
+        self.assertEqual([card.to_dict() for card in self.player_1.deck.hand], hand)
+        self.assertEqual([card.to_dict() for card in self.player_1.deck.cards], cards)
+        self.assertEqual(self.engine.turn, 1)
+
+    def test_reuses_subtree_during_turn(self) -> None:
+        """
+        Test that the subtree of the chosen action is searched again at the bot's next decision of the turn.
+        """
+        for _ in range(2):
+            self.player_1.deck.play_card(self.player_1.deck.draw())
+        self.player_2.health = 20  # The opponent survives both attacks, so the bot searches them
+        self.engine.apply(PASS_ACTION)
+        self.assertEqual(self.engine.phase, TurnPhase.ATTACK)
+
+        action = self.bot.choose_action(self.engine)
+        self.assertEqual(action.action_type, ActionType.ATTACK)
+        kept = self.bot.root
+        kept_visits = kept.visits
+        self.engine.apply(action)
+        self.assertIs(self.engine.current_player, self.player_1)
+
+        self.bot.choose_action(self.engine)
+        self.assertEqual(kept.visits, kept_visits + 50)
+
+    def test_finds_lethal_attack(self) -> None:
+        """
+        Test that the bot attacks the opponent's hero when this wins the game.
+        """
+        self.player_2.health = 2
+        self.engine.apply(Action(ActionType.PLAY_CARD, 0))
+        self.engine.apply(PASS_ACTION)
+        self.engine.apply(PASS_ACTION)
+        self.assertEqual(self.engine.phase, TurnPhase.ATTACK)
+        self.assertEqual(self.bot.choose_action(self.engine), Action(ActionType.ATTACK, 0, HERO_TARGET))
+
+    def test_root_parallel_merges_statistics(self) -> None:
+        """
+        Test that the root statistics of every worker are summed before choosing an action.
+        """
+        bot = MCTSAI(seed = 1, iterations = 20, time_limit = None, workers = 2)
+        try:
+            action = bot.choose_action(self.engine)
+        finally:
+            bot.close()
+        self.assertIn(action, self.engine.legal_actions())
+        self.assertEqual(sum(visits for visits, _ in bot.statistics.values()), 40)
+        self.assertEqual(bot.statistics[action][0], max(visits for visits, _ in bot.statistics.values()))
+
+    def test_evaluate(self) -> None:
+        """
+        Test that a won game is evaluated as 1 for the winner and a running game between 0 and 1.
+        """
+        self.assertGreater(evaluate(self.engine), 0)
+        self.assertLess(evaluate(self.engine), 1)
+        self.player_2.health = 0
+        self.assertEqual(evaluate(self.engine), 1.0)
+
+    def test_beats_random_bot(self) -> None:
+        """
+        Test that the bot wins most games against a random bot.
+        """
+        bot = functools.partial(MCTSAI, iterations = 30, time_limit = None)
+        result = MatchSimulator(self.player_1, self.player_2, bot_1 = bot, bot_2 = RandomAI, processes = 1).run(4, seed = 3)
+        self.assertGreaterEqual(result.wins[0], 3)
+
+if __name__ == "__main__":
+    unittest.main()
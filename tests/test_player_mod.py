@@ -145,5 +145,12 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(self.player.mana, 0)
         self.assertNotIn(unit_card, self.deck.hand)
 
+    def test_player_has_no_instance_dict(self) -> None:
+        """
+        Test that the player and its hero only store their attributes in slots.
+        """
+        self.assertFalse(hasattr(self.player, "__dict__"))
+        self.assertFalse(hasattr(self.hero, "__dict__"))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,211 @@
+#!/usr/bin/python3
+
+# Imports
+import os
+import tempfile
+import unittest
+
+# Core Imports
+from core.card_catalog import CardCatalog
+from core.game_engine import GameEngine
+from core.replay_log import GameRecorder, ReplayWriter, ReplayReader, ACTIONS, ACTION_CODES, GAME_TAG, HEADER, INDEX_ENTRY, RECORD_HEADER, index_path
+from core.simulation_mod import new_player, play_game
+
+# Modules Imports
+from modules.deck_mod import Deck
+from modules.player_mod import Player
+
+# AI Imports
+from ai.random_ai import RandomAI
+
+# Utils Imports
+from utils.rng_utils import GameRandom
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+
+# Class
+class TestReplayLog(unittest.TestCase):
+    """
+    Unit tests for the replay log.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Builds two players from the catalog, with units and spells.
+        """
+        catalog = CardCatalog.from_files()
+        cls.players = []
+        for name, card_class in (("Jaina", CardClass.MAGE), ("Garrosh", CardClass.WARRIOR)):
+            hero = catalog.create_hero(catalog.heroes_by_class(card_class)[0])
+            cls.players.append(Player(name = name, hero = hero, deck = Deck(cards = catalog.create_class_cards(card_class)[:30])))
+
+    def setUp(self) -> None:
+        """
+        Sets up a temporary directory for the log.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "replays.bin")
+
+    def tearDown(self) -> None:
+        """
+        Removes the temporary directory.
+        """
+        self.directory.cleanup()
+
+    def state_of(self, engine: GameEngine) -> tuple:
+        """
+        Returns a signature of the state of a game, including the order of the cards left in each deck.
+        """
+        decks = tuple(tuple(card.id for card in player.deck.cards) for player in (engine.logic.player_1, engine.logic.player_2))
+        return engine.zobrist_hash(), decks, engine.phase, engine.legal_actions()
+
+    def record_game(self, seed: int, checkpoint_turns: int = 4) -> tuple[GameRecorder, dict[int, tuple]]:
+        """
+        Plays a recorded game between random bots, keeping the state at the first decision of each turn.
+        """
+        rng = GameRandom(seed)
+        first, second = new_player(self.players[0]), new_player(self.players[1])
+        first.deck.shuffle(rng.stream("shuffle", 1))
+        second.deck.shuffle(rng.stream("shuffle", 2))
+        engine = GameEngine(first, second, turn_limit = 60, rng = rng)
+        recorder = GameRecorder(engine, checkpoint_turns = checkpoint_turns)
+        bot = RandomAI(seed = seed)
+        states = {engine.turn: self.state_of(engine)}
+        while not engine.is_terminal():
+            recorder.apply(bot.choose_action(engine))
+            states.setdefault(engine.turn, self.state_of(engine))
+        return recorder, states
+
+    def test_action_codes(self) -> None:
+        """
+        Test that every action has a distinct one-byte code.
+        """
+        self.assertLessEqual(len(ACTIONS), 256)
+        self.assertEqual(len(ACTION_CODES), len(ACTIONS))
+
+    def test_seek_matches_live_game(self) -> None:
+        """
+        Test that seeking any turn of any recorded game restores the state the game had at that turn.
+        """
+        games = [self.record_game(seed) for seed in range(4)]
+        with ReplayWriter(self.file_path) as writer:
+            for recorder, _ in games:
+                writer.write(recorder)
+
+        reader = ReplayReader(self.file_path)
+        self.assertEqual(len(reader), 4)
+        for index, (recorder, states) in enumerate(games):
+            replay = reader.game(index)
+            self.assertEqual(replay.seed, index)
+            self.assertEqual(replay.names, ("Jaina", "Garrosh"))
+            self.assertGreater(len(replay.checkpoints), 1)
+            for turn, state in states.items():
+                self.assertEqual(self.state_of(replay.seek(turn)), state)
+            final = replay.seek(len(states) + 100)
+            self.assertTrue(final.is_terminal())
+            self.assertEqual(self.state_of(final), self.state_of(recorder.engine))
+
+    def test_seek_replays_only_the_tail(self) -> None:
+        """
+        Test that seeking starts from the nearest checkpoint at or before the turn.
+        """
+        recorder, _ = self.record_game(seed = 7, checkpoint_turns = 3)
+        with ReplayWriter(self.file_path) as writer:
+            writer.write(recorder)
+        replay = ReplayReader(self.file_path).game(0)
+        turns = [turn for turn, _, _ in replay.checkpoints]
+        self.assertEqual(turns, sorted(turns))
+        self.assertTrue(all(later - earlier >= 3 for earlier, later in zip(turns, turns[1:])))
+        self.assertEqual(replay.restore(len(turns) - 1).turn, turns[-1])
+
+    def test_append_and_truncated_record(self) -> None:
+        """
+        Test that games are appended to an existing log, sharing its definitions, and that an interrupted append is dropped.
+        """
+        recorder, _ = self.record_game(seed = 1)
+        with ReplayWriter(self.file_path) as writer:
+            writer.write(recorder)
+        size = os.path.getsize(self.file_path)
+
+        with ReplayWriter(self.file_path) as writer:
+            self.assertEqual(writer.write(recorder), 1)
+        reader = ReplayReader(self.file_path)
+        self.assertEqual(len(reader), 2)
+        self.assertEqual(len(reader.heroes), 2)
+        self.assertLess(os.path.getsize(self.file_path) - size, size)  # Definitions and heroes are not written again
+
+        with open(self.file_path, "r+b") as file:
+            file.truncate(os.path.getsize(self.file_path) - 5)
+        self.assertEqual(len(ReplayReader(self.file_path)), 1)
+        with ReplayWriter(self.file_path) as writer:
+            self.assertEqual(writer.write(recorder), 1)
+        self.assertEqual(len(ReplayReader(self.file_path)), 2)
+
+    def test_index_finds_games_without_scanning(self) -> None:
+        """
+        Test that games are found through the index, which is kept when games are appended, and that a missing or stale index is rebuilt.
+        """
+        recorders = [self.record_game(seed)[0] for seed in range(3)]
+        for recorder in recorders:
+            with ReplayWriter(self.file_path) as writer:
+                writer.write(recorder)
+        self.assertEqual(os.path.getsize(index_path(self.file_path)), HEADER.size + 3 * INDEX_ENTRY.size)
+
+        with ReplayReader(self.file_path) as reader:
+            self.assertEqual((reader.indexed, reader.tail), (3, []))
+            start = reader.entry(1)[0]
+        with open(self.file_path, "r+b") as file:  # A scan would stop at the middle game, which the index skips
+            file.seek(start - RECORD_HEADER.size)
+            file.write(bytes([GAME_TAG + 6]))
+        with ReplayReader(self.file_path) as reader:
+            seeds = [reader.game(index).seed for index in range(3)]
+        with open(self.file_path, "r+b") as file:
+            file.seek(start - RECORD_HEADER.size)
+            file.write(bytes([GAME_TAG]))
+        self.assertEqual(seeds, [0, 1, 2])
+
+        # The last entry is lost: the game is found by scanning after the indexed ones, then indexed again
+        with open(index_path(self.file_path), "r+b") as file:
+            file.truncate(HEADER.size + 2 * INDEX_ENTRY.size + 3)
+        with ReplayReader(self.file_path) as reader:
+            self.assertEqual((reader.indexed, len(reader.tail)), (2, 1))
+            self.assertEqual(reader.game(-1).seed, 2)
+        with ReplayWriter(self.file_path) as writer:
+            self.assertEqual(writer.write(recorders[0]), 3)
+
+        # Without index, the log is scanned and indexed
+        os.remove(index_path(self.file_path))
+        with ReplayWriter(self.file_path) as writer:
+            self.assertEqual(writer.games, 4)
+        with ReplayReader(self.file_path) as reader:
+            self.assertEqual((reader.indexed, reader.tail), (4, []))
+            self.assertEqual([reader.game(index).seed for index in range(4)], [0, 1, 2, 0])
+            with self.assertRaises(IndexError):
+                reader.game(4)
+
+    def test_play_game_records(self) -> None:
+        """
+        Test that a simulated game is appended to the log with one byte per action.
+        """
+        with ReplayWriter(self.file_path) as writer:
+            winner, turns = play_game(self.players[0], self.players[1], RandomAI, RandomAI, seed = "replay", writer = writer)
+        replay = ReplayReader(self.file_path).game(0)
+        self.assertEqual(replay.seed, "replay")
+        self.assertEqual(replay.winner, winner)
+        self.assertEqual(replay.seek(turns + 1).turn, turns)
+
+    def test_invalid_file(self) -> None:
+        """
+        Test that reading a file which is not a replay log raises an error.
+        """
+        with open(self.file_path, "wb") as file:
+            file.write(b"HSCC\x01\x00\x00\x00")
+        with self.assertRaises(ValueError):
+            ReplayReader(self.file_path)
+        with self.assertRaises(ValueError):
+            ReplayWriter(self.file_path)
+
+if __name__ == "__main__":
+    unittest.main()
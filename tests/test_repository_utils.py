@@ -0,0 +1,162 @@
+#!/usr/bin/python3
+
+# Imports
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# Modules Imports
+from modules.unit_mod import Unit
+from modules.spell_mod import Spell
+from modules.hero_mod import Hero
+
+# Utils Imports
+from utils.database_utils import Database
+from utils.repository_utils import CardRepository
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+from enums.hero_power_enum import HeroPower
+from enums.rarity_enum import Rarity
+from enums.race_enum import Race
+
+# Class
+class TestCardRepository(unittest.TestCase):
+    """
+    Unit tests for the CardRepository class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up a temporary database file and a few cards.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "database.json")
+        self.unit = Unit(
+            id = 1,
+            name = "Chillwind Yeti",
+            cost = 4,
+            description = "A sturdy minion.",
+            card_classes = [CardClass.NEUTRAL],
+            card_rarity = Rarity.COMMON,
+            unit_race = Race.ALL,
+            attack = 4,
+            health = 5
+        )
+        self.spell = Spell(
+            id = 2,
+            name = "Fireball",
+            cost = 4,
+            description = "Deal 6 damage.",
+            card_classes = [CardClass.MAGE],
+            card_rarity = Rarity.COMMON,
+            attack = 6
+        )
+        self.hero = Hero(
+            id = 1,
+            name = "Jaina Proudmoore",
+            description = "A powerful sorceress.",
+            hero_class = CardClass.MAGE,
+            hero_power = HeroPower.FIREBLAST
+        )
+
+    def tearDown(self) -> None:
+        """
+        Removes the temporary database file.
+        """
+        self.directory.cleanup()
+
+    def test_building_cards_does_not_open_the_database(self) -> None:
+        """
+        Test that creating cards and heroes performs no database access.
+        """
+        with mock.patch.object(Database, "initialize_database") as initialize_database:
+            Unit(
+                id = 3,
+                name = "River Crocolisk",
+                cost = 2,
+                description = "A minion.",
+                card_classes = [CardClass.NEUTRAL],
+                card_rarity = Rarity.COMMON,
+                unit_race = Race.BEAST,
+                attack = 2,
+                health = 3
+            )
+            Hero(
+                id = 2,
+                name = "Garrosh Hellscream",
+                description = "Victory or death!",
+                hero_class = CardClass.WARRIOR,
+                hero_power = HeroPower.ARMOR_UP
+            )
+        initialize_database.assert_not_called()
+
+    def test_flush_writes_all_tables_at_once(self) -> None:
+        """
+        Test that a flush opens the database once and saves every pending record in its table.
+        """
+        repository = CardRepository(self.file_path)
+        self.unit.save_to_table(repository)
+        repository.add_all([self.spell, self.hero])
+        self.assertEqual(len(repository), 3)
+
+        with mock.patch.object(Database, "initialize_database", wraps = Database.initialize_database) as initialize_database:
+            self.assertEqual(repository.flush(), 3)
+        self.assertEqual(initialize_database.call_count, 1)
+        self.assertEqual(len(repository), 0)
+
+        db = Database.initialize_database(self.file_path)
+        self.assertEqual(Database.fetch_all_from_table(db, "Units"), [self.unit.to_dict()])
+        self.assertEqual(Database.fetch_all_from_table(db, "Spells"), [self.spell.to_dict()])
+        self.assertEqual(Database.fetch_all_from_table(db, "Heroes"), [self.hero.to_dict()])
+        db.close()
+
+    def test_flush_uses_the_configured_backend(self) -> None:
+        """
+        Test that a repository without a file writes to the database of the selected backend, here SQLite.
+        """
+        sqlite_path = os.path.join(self.directory.name, "database.sqlite3")
+        with mock.patch("utils.database_utils.SQLITE_DATABASE_PATH", sqlite_path):
+            with CardRepository(backend = "sqlite") as repository:
+                repository.add_all([self.unit, self.hero])
+        self.assertFalse(os.path.exists(self.file_path))
+        with Database.initialize_sqlite_database(sqlite_path) as db:
+            self.assertEqual(Database.fetch_all_from_table(db, "Units"), [self.unit.to_dict()])
+            self.assertEqual(Database.fetch_all_from_table(db, "Heroes"), [self.hero.to_dict()])
+
+    def test_flush_uses_an_open_database(self) -> None:
+        """
+        Test that a repository given an open cached database writes through it and leaves it open.
+        """
+        db = Database.initialize_cached_database(self.file_path)
+        db.table("decks").insert({"name": "Aggro"})
+        with CardRepository(db = db) as repository:
+            repository.add(self.spell)
+        db.table("decks").insert({"name": "Control"})
+        db.close()
+
+        db = Database.initialize_database(self.file_path)
+        self.assertEqual(Database.fetch_all_from_table(db, "Spells"), [self.spell.to_dict()])
+        self.assertEqual(len(db.table("decks")), 2)
+        db.close()
+
+    def test_context_manager_discards_on_error(self) -> None:
+        """
+        Test that pending records are discarded if an error occurs inside the unit of work.
+        """
+        with self.assertRaises(RuntimeError):
+            with CardRepository(self.file_path) as repository:
+                repository.add(self.unit)
+                raise RuntimeError("Interrupted")
+        self.assertFalse(os.path.exists(self.file_path))
+
+    def test_add_invalid_object(self) -> None:
+        """
+        Test that adding an object which cannot be saved raises an error.
+        """
+        with self.assertRaises(TypeError):
+            CardRepository(self.file_path).add("Fireball")
+
+if __name__ == "__main__":
+    unittest.main()
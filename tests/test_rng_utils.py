@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+
+# Imports
+import random
+import unittest
+from unittest import mock
+
+# Core Imports
+from core.card_catalog import CardCatalog
+
+# Utils Imports
+from utils.rng_utils import GameRandom, derive_seed
+
+# Interfaces Imports
+from interfaces.player_choice_interface import PlayerChoiceInterface
+
+# Class
+class TestGameRandom(unittest.TestCase):
+    """
+    Unit tests for the GameRandom class and the derivation of seeds.
+    """
+
+    def test_streams_are_reproducible(self) -> None:
+        """
+        Test that the same seed and name always give the same stream, in a new object too.
+        """
+        first = [GameRandom(42).stream("shuffle", 1).random() for _ in range(2)]
+        self.assertEqual(first[0], first[1])
+        self.assertEqual(derive_seed(42, "shuffle", 1), derive_seed(42, "shuffle", 1))
+
+    def test_streams_are_independent(self) -> None:
+        """
+        Test that drawing from one stream does not change the draws of another.
+        """
+        rng = GameRandom(42)
+        expected = GameRandom(42).stream("shuffle", 2).random()
+        for _ in range(100):
+            rng.stream("shuffle", 1).random()
+        self.assertEqual(rng.stream("shuffle", 2).random(), expected)
+        self.assertNotEqual(GameRandom(42).stream("shuffle", 1).random(), expected)
+
+    def test_stream_is_kept(self) -> None:
+        """
+        Test that a stream is created once and then continues its sequence.
+        """
+        rng = GameRandom("seed")
+        self.assertIs(rng.stream("start"), rng.stream("start"))
+        self.assertIsInstance(rng.stream("start"), random.Random)
+
+    def test_child(self) -> None:
+        """
+        Test that the streams of a sub-part are derived from the master seed and the sub-part's name.
+        """
+        self.assertEqual(GameRandom(1).child("game", 3).seed, GameRandom(1).child("game", 3).seed)
+        self.assertNotEqual(GameRandom(1).child("game", 3).seed, GameRandom(1).child("game", 4).seed)
+
+    def test_random_seed_is_kept(self) -> None:
+        """
+        Test that streams created without a seed keep the random seed they drew, so their game can be replayed.
+        """
+        rng = GameRandom()
+        self.assertIsInstance(rng.seed, int)
+        self.assertEqual(GameRandom(rng.seed).stream("start").random(), rng.stream("start").random())
+
+    def test_ai_setup_is_reproducible(self) -> None:
+        """
+        Test that the AI's hero and the order of its deck are drawn from the game's streams, so a seed replays the setup.
+        """
+        catalog = CardCatalog.from_files()
+        setups = []
+        for _ in range(2):
+            interface = PlayerChoiceInterface(None, catalog, GameRandom(7))
+            with mock.patch("interfaces.player_choice_interface.time.sleep"), mock.patch("interfaces.player_choice_interface.CardRepository"):
+                player = interface.setup_ai_player(player_number = 2)
+            setups.append((player.hero.name, [card.name for card in player.deck.cards]))
+        self.assertEqual(setups[0], setups[1])
+
+if __name__ == "__main__":
+    unittest.main()
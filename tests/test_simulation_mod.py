@@ -0,0 +1,158 @@
+#!/usr/bin/python3
+
+# Imports
+import glob
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+# Core Imports
+from core.simulation_mod import MatchSimulator, SimulationResult, new_player, play_game, init_worker, close_pool_worker, _worker_state
+from core.replay_log import ReplayReader
+from core.match_history import MatchHistory
+
+# Modules Imports
+from modules.hero_mod import Hero
+from modules.deck_mod import Deck
+from modules.unit_mod import Unit
+from modules.player_mod import Player
+
+# AI Imports
+from ai.random_ai import RandomAI
+
+# Enum Imports
+from enums.card_class_enum import CardClass
+from enums.hero_power_enum import HeroPower
+from enums.rarity_enum import Rarity
+from enums.race_enum import Race
+from enums.card_status_enum import CardStatus
+
+# Class
+class TestMatchSimulator(unittest.TestCase):
+    """
+    Unit tests for the MatchSimulator class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up two players, the first one having stronger units.
+        """
+        self.player_1 = self.make_player("Player 1", attack = 5)
+        self.player_2 = self.make_player("Player 2", attack = 1)
+
+    def make_player(self, name: str, attack: int) -> Player:
+        """
+        Creates a player with a deck of identical units.
+        """
+        hero = Hero(
+            id = 1,
+            name = "Garrosh Hellscream",
+            description = "Victory or death!",
+            hero_class = CardClass.WARRIOR,
+            hero_power = HeroPower.ARMOR_UP
+        )
+        cards = [Unit(
+            id = i + 1,
+            name = f"Unit {i}",
+            cost = 1,
+            description = "A test unit.",
+            card_classes = [CardClass.WARRIOR],
+            card_rarity = Rarity.COMMON,
+            unit_race = Race.ALL,
+            attack = attack,
+            health = 3
+        ) for i in range(10)]
+        return Player(name = name, hero = hero, deck = Deck(cards = cards))
+
+    def test_new_player_copies_template(self) -> None:
+        """
+        Test that a new player gets copies of the template's cards.
+        """
+        self.player_1.deck.draw()
+        player = new_player(self.player_1)
+        self.assertEqual(len(player.deck.cards), 10)
+        self.assertTrue(all(card.status == CardStatus.IN_DECK for card in player.deck.cards))
+        self.assertNotIn(self.player_1.deck.hand[0], player.deck.cards)
+        self.assertEqual(self.player_1.deck.hand[0].status, CardStatus.IN_HAND)
+
+    def test_run_counts_every_game(self) -> None:
+        """
+        Test that every game is counted once.
+        """
+        result = MatchSimulator(self.player_1, self.player_2, processes = 1).run(20, seed = 1)
+        self.assertEqual(result.games, 20)
+        self.assertEqual(sum(result.wins) + result.draws, 20)
+        self.assertGreater(result.win_rate(1), result.win_rate(2))
+
+    def test_run_does_not_depend_on_processes(self) -> None:
+        """
+        Test that the same seed gives the same result with one or several processes.
+        """
+        single = MatchSimulator(self.player_1, self.player_2, processes = 1).run(12, seed = 7)
+        pooled = MatchSimulator(self.player_1, self.player_2, processes = 2).run(12, seed = 7)
+        self.assertEqual((single.wins, single.draws, single.average_turns), (pooled.wins, pooled.draws, pooled.average_turns))
+
+    def test_game_is_replayable(self) -> None:
+        """
+        Test that a game seed replays the same game, without touching the global generator.
+        """
+        random.seed(0)
+        expected = random.random()
+        random.seed(0)
+        results = [play_game(self.player_1, self.player_2, RandomAI, RandomAI, "replay") for _ in range(2)]
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(random.random(), expected)
+
+    def test_run_records_every_game(self) -> None:
+        """
+        Test that every simulated game is recorded in the replay log and the match history, one of each per worker with several processes.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            replay_path, history_path = os.path.join(directory, "replays.bin"), os.path.join(directory, "history")
+            MatchSimulator(self.player_1, self.player_2, processes = 1, replay_path = replay_path, history_path = history_path).run(5, seed = 3)
+            self.assertEqual(len(ReplayReader(replay_path)), 5)
+            with MatchHistory(history_path) as history:
+                self.assertEqual(len(history), 5)
+
+            MatchSimulator(self.player_1, self.player_2, processes = 2, replay_path = replay_path, history_path = history_path).run(12, seed = 3)
+            worker_replays = glob.glob(os.path.join(directory, "replays-*.bin"))
+            self.assertEqual(sum(len(ReplayReader(path)) for path in worker_replays), 12)
+            histories = 0
+            for path in glob.glob(os.path.join(directory, "history-*")):
+                with MatchHistory(path) as history:
+                    histories += len(history)
+            self.assertEqual(histories, 12)
+            self.assertEqual(len(ReplayReader(replay_path)), 5)
+
+    def test_pool_workers_are_closed(self) -> None:
+        """
+        Test that closing a pool's worker closes its replay log and match history before waiting for the other workers.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            barrier = mock.Mock()
+            init_worker(self.player_1, self.player_2, RandomAI, RandomAI, 10, replay_path = os.path.join(directory, "replays.bin"),
+                        history_path = os.path.join(directory, "history"), per_worker = True, barrier = barrier)
+            writer, history = _worker_state["writer"], _worker_state["history"]
+            with mock.patch.object(writer, "close", wraps = writer.close) as close_writer, mock.patch.object(history, "close", wraps = history.close) as close_history:
+                close_pool_worker(0)
+            close_writer.assert_called_once()
+            close_history.assert_called_once()
+            barrier.wait.assert_called_once()
+            self.assertNotIn("writer", _worker_state)
+
+    def test_confidence_interval(self) -> None:
+        """
+        Test that the confidence interval contains the win rate and narrows with more games.
+        """
+        small = SimulationResult(6, 4, 0, 100)
+        large = SimulationResult(600, 400, 0, 10000)
+        low, high = small.confidence_interval(1)
+        self.assertLess(low, 0.6)
+        self.assertGreater(high, 0.6)
+        large_low, large_high = large.confidence_interval(1)
+        self.assertLess(large_high - large_low, high - low)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+
+# Imports
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Core Imports
+from core.game_mod import Game
+
+# Utils Imports
+from utils.constants import UNITS_DB_PATH, UNITS_TABLE_NAME
+from utils.database_utils import Database
+from utils.sqlite_utils import SQLiteDatabase
+
+# Class
+class TestSQLiteDatabase(unittest.TestCase):
+    """
+    Unit tests for the SQLite backend of the Database helper.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up a temporary SQLite database.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "database.sqlite3")
+        self.db = Database.initialize_sqlite_database(self.file_path)
+
+    def tearDown(self) -> None:
+        """
+        Closes and removes the temporary database.
+        """
+        self.db.close()
+        self.directory.cleanup()
+
+    def test_table_methods_match_tinydb(self) -> None:
+        """
+        Test that inserting, fetching, counting and clearing a table behave as with TinyDB, across connections.
+        """
+        Database.insert_data_to_table(self.db, "players", [{"name": "Jaina"}, {"name": "Garrosh"}])
+        Database.insert_data_to_table(self.db, "players", [{"name": "Thrall"}])
+        players = Database.fetch_all_from_table(self.db, "players")
+        self.assertEqual(players, [{"name": "Jaina"}, {"name": "Garrosh"}, {"name": "Thrall"}])
+        self.assertEqual([player.doc_id for player in players], [1, 2, 3])
+
+        with SQLiteDatabase(self.file_path) as reader:
+            self.assertEqual(len(Database.initialize_table(reader, "players")), 3)
+        Database.clear_table(self.db, "players")
+        self.assertEqual(Database.fetch_all_from_table(self.db, "players"), [])
+        with self.assertRaises(ValueError):
+            Database.insert_data_to_table(self.db, "players", ["Jaina"])
+
+    def test_concurrent_inserts_get_distinct_ids(self) -> None:
+        """
+        Test that a connection inserting while another one holds the write lock waits for it and does not reuse its ids.
+        """
+        with SQLiteDatabase(self.file_path) as writer:
+            writer.connection.execute("BEGIN IMMEDIATE")
+            writer.connection.execute("INSERT INTO documents VALUES ('players', 1, ?)", (json.dumps({"name": "Jaina"}),))
+            inserted = []
+
+            def insert() -> None:
+                with SQLiteDatabase(self.file_path) as db:  # Connections are used by the thread opening them
+                    inserted.extend(db.table("players").insert_multiple([{"name": "Thrall"}]))
+
+            thread = threading.Thread(target = insert)
+            thread.start()
+            time.sleep(0.2)  # Let the other connection reach the lock
+            writer.connection.commit()
+            thread.join()
+        self.assertEqual(inserted, [2])
+        self.assertEqual(Database.fetch_all_from_table(self.db, "players"), [{"name": "Jaina"}, {"name": "Thrall"}])
+
+    def test_init_database_seeds_once(self) -> None:
+        """
+        Test that Game.init_database seeds a SQLite table from its data file and skips it while the file is unchanged.
+        """
+        game = Game.__new__(Game)  # Skip the interactive setup
+        game.init_database(self.db, UNITS_TABLE_NAME, UNITS_DB_PATH)
+        with open(UNITS_DB_PATH) as file:
+            self.assertEqual(Database.fetch_all_from_table(self.db, UNITS_TABLE_NAME), json.load(file))
+        with mock.patch.object(Database, "insert_data_to_table") as insert_data_to_table:
+            game.init_database(self.db, UNITS_TABLE_NAME, UNITS_DB_PATH)
+        insert_data_to_table.assert_not_called()
+
+    def test_indexed_search_matches_scan(self) -> None:
+        """
+        Test that searching units by class, cost or race through the indexes finds the same rows as scanning a TinyDB table.
+        """
+        with open(UNITS_DB_PATH) as file:
+            units = json.load(file)
+        Database.insert_data_to_table(self.db, UNITS_TABLE_NAME, units)
+        tinydb = Database.initialize_database(os.path.join(self.directory.name, "database.json"))
+        Database.insert_data_to_table(tinydb, UNITS_TABLE_NAME, units)
+
+        for criteria in ({"card_class": "mage"}, {"cost": 4}, {"race": "beast"}, {"card_class": "DRUID", "cost": 1}):
+            found = Database.search_cards(self.db, UNITS_TABLE_NAME, **criteria)
+            self.assertTrue(found)
+            self.assertEqual(found, Database.search_cards(tinydb, UNITS_TABLE_NAME, **criteria))
+        tinydb.close()
+
+        plan = " ".join(row[-1] for row in self.db.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT body FROM entries WHERE table_name = ? AND cost = ?", (UNITS_TABLE_NAME, 4)))
+        self.assertIn("entries_by_cost", plan)
+
+    def test_wal_mode(self) -> None:
+        """
+        Test that the database is opened in WAL mode.
+        """
+        self.assertEqual(self.db.connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertIsInstance(self.db.connection, sqlite3.Connection)
+
+    def test_open_database_backend(self) -> None:
+        """
+        Test that the configured backend selects the database, and that an unknown backend raises an error.
+        """
+        with mock.patch.object(Database, "initialize_sqlite_database", return_value = self.db) as initialize_sqlite_database:
+            self.assertIs(Database.open_database("sqlite"), self.db)
+        initialize_sqlite_database.assert_called_once()
+        with self.assertRaises(ValueError):
+            Database.open_database("mongodb")
+
+if __name__ == "__main__":
+    unittest.main()
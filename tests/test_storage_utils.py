@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+
+# Imports
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# Utils Imports
+from utils.database_utils import Database
+from utils.storage_utils import AtomicJSONStorage, BatchingMiddleware
+
+# Class
+class TestStorageUtils(unittest.TestCase):
+    """
+    Unit tests for the atomic JSON storage and the batching middleware.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up a temporary directory for the database.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "database.json")
+
+    def tearDown(self) -> None:
+        """
+        Removes the temporary directory.
+        """
+        self.directory.cleanup()
+
+    def stored(self) -> dict:
+        """
+        Returns the content of the database file.
+        """
+        with open(self.file_path) as file:
+            return json.load(file)
+
+    def test_reads_are_served_from_memory(self) -> None:
+        """
+        Test that the file is read once, however many times the tables are fetched.
+        """
+        Database.insert_data_to_table(Database.initialize_database(self.file_path), "players", [{"name": "Jaina"}])
+        db = Database.initialize_cached_database(self.file_path)
+        with mock.patch.object(AtomicJSONStorage, "read", autospec = True, side_effect = AtomicJSONStorage.read) as read:
+            for _ in range(5):
+                self.assertEqual(Database.fetch_all_from_table(db, "players"), [{"name": "Jaina"}])
+        self.assertEqual(read.call_count, 1)
+
+    def test_writes_are_batched(self) -> None:
+        """
+        Test that writes reach the file once the batch is full, on flush and on close.
+        """
+        db = Database.initialize_cached_database(self.file_path, write_batch = 3, flush_interval = None)
+        for name in ("Jaina", "Garrosh"):
+            Database.insert_data_to_table(db, "players", [{"name": name}])
+        self.assertEqual(self.stored(), {})
+        self.assertEqual(len(Database.fetch_all_from_table(db, "players")), 2)
+
+        Database.insert_data_to_table(db, "players", [{"name": "Thrall"}])
+        self.assertEqual(len(self.stored()["players"]), 3)
+
+        Database.insert_data_to_table(db, "players", [{"name": "Anduin"}])
+        Database.flush(db)
+        self.assertEqual(len(self.stored()["players"]), 4)
+
+        Database.clear_table(db, "players")
+        db.close()
+        self.assertEqual(self.stored()["players"], {})
+
+    def test_old_writes_are_flushed(self) -> None:
+        """
+        Test that a write flushes the pending ones once the oldest is older than the flush interval.
+        """
+        db = Database.initialize_cached_database(self.file_path, write_batch = 100, flush_interval = 5.0)
+        with mock.patch("utils.storage_utils.time.monotonic", side_effect = [10.0, 12.0, 15.0, 16.0]):
+            Database.insert_data_to_table(db, "players", [{"name": "Jaina"}])
+            Database.insert_data_to_table(db, "players", [{"name": "Garrosh"}])
+            self.assertEqual(self.stored(), {})
+            Database.insert_data_to_table(db, "players", [{"name": "Thrall"}])
+            self.assertEqual(len(self.stored()["players"]), 3)
+            Database.insert_data_to_table(db, "players", [{"name": "Anduin"}])
+            self.assertEqual(db.storage.pending, 1)
+
+    def test_failed_write_keeps_the_file(self) -> None:
+        """
+        Test that a write interrupted before the file is replaced leaves the previous file and no temporary file.
+        """
+        storage = AtomicJSONStorage(self.file_path)
+        storage.write({"players": {"1": {"name": "Jaina"}}})
+        with mock.patch("utils.storage_utils.os.replace", side_effect = OSError("disk full")):
+            with self.assertRaises(OSError):
+                storage.write({"players": {}})
+        self.assertEqual(storage.read(), {"players": {"1": {"name": "Jaina"}}})
+        self.assertEqual(os.listdir(self.directory.name), ["database.json"])
+
+    def test_invalid_write_batch(self) -> None:
+        """
+        Test that a batch of less than one write raises an error.
+        """
+        with self.assertRaises(ValueError):
+            BatchingMiddleware(AtomicJSONStorage, write_batch = 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+#!/usr/bin/python3
+
+# Imports
+import itertools
+import random
+import unittest
+
+# Core Imports
+from core.game_engine import GameEngine, Action, HERO_TARGET, PASS_ACTION
+
+# Modules Imports
+from modules.hero_mod import Hero
+from modules.deck_mod import Deck
+from modules.unit_mod import Unit
+from modules.player_mod import Player
+
+# AI Imports
+from ai.trade_optimizer import TradeOptimizer, LETHAL_VALUE, unit_value
+
+# Enum Imports
+from enums.action_type_enum import ActionType
+from enums.turn_phase_enum import TurnPhase
+from enums.card_class_enum import CardClass
+from enums.hero_power_enum import HeroPower
+from enums.rarity_enum import Rarity
+from enums.race_enum import Race
+from enums.card_status_enum import CardStatus
+
+# Class
+class TestTradeOptimizer(unittest.TestCase):
+    """
+    Unit tests for the TradeOptimizer class.
+    """
+
+    def make_unit(self, id: int, attack: int, health: int) -> Unit:
+        """
+        Creates a unit costing 1 mana.
+        """
+        return Unit(
+            id = id,
+            name = f"Unit {id}",
+            cost = 1,
+            description = "A test unit.",
+            card_classes = [CardClass.HUNTER],
+            card_rarity = Rarity.COMMON,
+            unit_race = Race.BEAST,
+            attack = attack,
+            health = health
+        )
+
+    def make_engine(self, board_1: list[tuple[int, int]], board_2: list[tuple[int, int]]) -> GameEngine:
+        """
+        Creates a game in the first player's attack phase, with the given (attack, health) units on each board.
+        """
+        players = []
+        for name, stats in (("Player 1", board_1), ("Player 2", board_2)):
+            board = [self.make_unit(100 + index, attack, health) for index, (attack, health) in enumerate(stats)]
+            for unit in board:
+                unit.status = CardStatus.ON_BOARD
+            hero = Hero(
+                id = 1,
+                name = "Rexxar",
+                description = "Beasts of the wild!",
+                hero_class = CardClass.HUNTER,
+                hero_power = HeroPower.STEADY_SHOT
+            )
+            cards = [self.make_unit(index + 1, 1, 1) for index in range(10)]
+            players.append(Player(name = name, hero = hero, deck = Deck(cards = cards, board = board)))
+
+        engine = GameEngine(players[0], players[1], first_player = players[0])
+        engine.apply(PASS_ACTION)
+        self.assertEqual(engine.phase, TurnPhase.ATTACK)
+        return engine
+
+    def brute_force(self, engine: GameEngine) -> float:
+        """
+        Returns the best value over every assignment of targets to the attackers.
+        """
+        board = engine.current_player.deck.board
+        enemies = [(card.attack, card.health) for card in engine.opponent.deck.board]
+        best = 0.0
+        for targets in itertools.product(range(-2, len(enemies)), repeat = len(engine.attackers)):
+            health = [enemy_health for _, enemy_health in enemies]
+            value, face = 0.0, 0
+            for index, target in zip(engine.attackers, targets):
+                if target == -2:
+                    continue
+                value -= unit_value(board[index].attack, board[index].health)
+                if target == HERO_TARGET:
+                    face += board[index].attack
+                    value += board[index].attack
+                else:
+                    health[target] -= board[index].attack
+            if face >= engine.opponent.health:
+                return LETHAL_VALUE
+            value += sum(unit_value(attack, before) - unit_value(attack, after) for (attack, before), after in zip(enemies, health))
+            best = max(best, value)
+        return best
+
+    def setUp(self) -> None:
+        """
+        Sets up an optimizer with the default value function.
+        """
+        self.optimizer = TradeOptimizer()
+
+    def test_outside_attack_phase(self) -> None:
+        """
+        Test that no attack is suggested outside of the attack phase.
+        """
+        engine = self.make_engine([(2, 1)], [(1, 1)])
+        engine.apply(PASS_ACTION)
+        self.assertNotEqual(engine.phase, TurnPhase.ATTACK)
+        self.assertEqual(self.optimizer.best_trades(engine), (0.0, []))
+
+    def test_attackers_combine(self) -> None:
+        """
+        Test that two weak units are spent together on a unit neither can kill alone, fixing the index of the second attacker.
+        """
+        engine = self.make_engine([(2, 1), (2, 1), (1, 5)], [(1, 1), (4, 4)])
+        value, actions = self.optimizer.best_trades(engine)
+        self.assertEqual(value, 2.0)
+        self.assertEqual(actions, [Action(ActionType.ATTACK, 0, 1), Action(ActionType.ATTACK, 0, 1)])
+        for action in actions:
+            engine.apply(action)
+        self.assertEqual([card.attack for card in engine.opponent.deck.board], [1])
+
+    def test_lethal(self) -> None:
+        """
+        Test that the strongest units attack the hero when they can kill them.
+        """
+        engine = self.make_engine([(2, 1), (5, 1), (4, 1)], [(6, 6)])
+        engine.opponent.health = 8
+        value, actions = self.optimizer.best_trades(engine)
+        self.assertEqual(value, LETHAL_VALUE)
+        for action in actions:
+            engine.apply(action)
+        self.assertIs(engine.winner(), engine.current_player)
+
+    def test_face_weight(self) -> None:
+        """
+        Test that the units go face when damage to the hero is valued more than the units.
+        """
+        engine = self.make_engine([(3, 1)], [(1, 9)])
+        self.assertEqual(self.optimizer.suggest(engine), [])
+        self.assertEqual(TradeOptimizer(face_weight = 2.0).suggest(engine), [Action(ActionType.ATTACK, 0, HERO_TARGET)])
+
+    def test_matches_brute_force(self) -> None:
+        """
+        Test that the optimizer finds the best assignment on random boards, and that its actions are legal.
+        """
+        rng = random.Random(11)
+        for _ in range(30):
+            board_1 = [(rng.randint(1, 6), rng.randint(1, 6)) for _ in range(rng.randint(1, 4))]
+            board_2 = [(rng.randint(1, 6), rng.randint(1, 6)) for _ in range(rng.randint(0, 4))]
+            engine = self.make_engine(board_1, board_2)
+            engine.opponent.health = rng.randint(5, 20)
+            value, actions = self.optimizer.best_trades(engine)
+            self.assertAlmostEqual(value, self.brute_force(engine))
+            for action in actions:
+                self.assertIn(action, engine.legal_actions())
+                engine.apply(action)
+
+if __name__ == "__main__":
+    unittest.main()
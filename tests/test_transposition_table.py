@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+
+# Imports
+import unittest
+
+# AI Imports
+from ai.transposition_table import TranspositionTable
+
+# Enum Imports
+from enums.replacement_policy_enum import ReplacementPolicy
+
+# Class
+class TestTranspositionTable(unittest.TestCase):
+    """
+    Unit tests for the TranspositionTable class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Sets up a small table where hashes 1, 9 and 17 share a slot.
+        """
+        self.table = TranspositionTable(capacity = 8)
+
+    def test_store_and_lookup(self) -> None:
+        """
+        Test that a stored value is found by its hash only.
+        """
+        self.assertTrue(self.table.store(1, "a"))
+        self.assertEqual(self.table.lookup(1), "a")
+        self.assertIsNone(self.table.lookup(9))
+        self.assertIn(1, self.table)
+        self.assertEqual(len(self.table), 1)
+        self.assertEqual((self.table.hits, self.table.misses), (1, 1))
+
+    def test_table_is_bounded(self) -> None:
+        """
+        Test that the table never holds more entries than its capacity.
+        """
+        for key in range(100):
+            self.table.store(key, key)
+        self.assertEqual(len(self.table), 8)
+        self.assertEqual(self.table.lookup(99), 99)
+
+    def test_depth_preferred_keeps_deeper_entry(self) -> None:
+        """
+        Test that a deeper entry of the current search is not replaced by a shallower one.
+        """
+        self.table.store(1, "deep", depth = 5)
+        self.assertFalse(self.table.store(9, "shallow", depth = 2))
+        self.assertEqual(self.table.lookup(1), "deep")
+        self.assertTrue(self.table.store(17, "deeper", depth = 6))
+        self.assertEqual(self.table.lookup(17), "deeper")
+
+    def test_depth_preferred_replaces_old_search(self) -> None:
+        """
+        Test that entries of a previous search are replaced even if they are deeper.
+        """
+        self.table.store(1, "deep", depth = 5)
+        self.table.new_search()
+        self.assertEqual(self.table.lookup(1), "deep")
+        self.assertTrue(self.table.store(9, "shallow", depth = 2))
+        self.assertIsNone(self.table.lookup(1))
+
+    def test_always_replace(self) -> None:
+        """
+        Test that the ALWAYS policy replaces any colliding entry.
+        """
+        table = TranspositionTable(capacity = 8, policy = ReplacementPolicy.ALWAYS)
+        table.store(1, "deep", depth = 5)
+        self.assertTrue(table.store(9, "shallow", depth = 2))
+        self.assertEqual(table.lookup(9), "shallow")
+
+    def test_clear(self) -> None:
+        """
+        Test that clearing the table removes every entry.
+        """
+        self.table.store(1, "a")
+        self.table.clear()
+        self.assertEqual(len(self.table), 0)
+        self.assertNotIn(1, self.table)
+
+    def test_invalid_capacity(self) -> None:
+        """
+        Test that a table must have at least one slot.
+        """
+        with self.assertRaises(ValueError):
+            TranspositionTable(capacity = 0)
+
+if __name__ == "__main__":
+    unittest.main()
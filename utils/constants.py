@@ -6,6 +6,30 @@ DATABASE_PATH = "../database/hearthstone_database.json"
 HEROES_DB_PATH = "./database/data/heroes.json"
 SPELLS_DB_PATH = "./database/data/spells.json"
 UNITS_DB_PATH = "./database/data/units.json"
+CATALOG_PATH = "./database/hearthstone_catalog.bin"  # Binary catalog compiled from the data files.
+REPLAY_PATH = "./database/replays.bin"  # Append-only log of the recorded games.
+MATCH_HISTORY_PATH = "./database/match_history"  # Directory of the log and segments of the finished games.
+SQLITE_DATABASE_PATH = "../database/hearthstone_database.sqlite3"  # Game database of the SQLite backend.
+
+# -------------------------------
+# Database Backend
+# -------------------------------
+# Storage of the game database: "tinydb" for the JSON file, "sqlite" for an indexed SQLite file.
+DATABASE_BACKEND = "tinydb"
+
+# -------------------------------
+# Database Cache
+# -------------------------------
+# When the changes of a cached database are written to its file.
+DATABASE_WRITE_BATCH = 100  # Writes kept in memory before they are flushed.
+DATABASE_FLUSH_INTERVAL = 5.0  # Seconds after which a new write flushes the pending ones (None for no limit).
+
+# -------------------------------
+# Data File Streaming
+# -------------------------------
+# Memory used while the heroes, units and spells files are read incrementally.
+DATA_STREAM_CHUNK_SIZE = 1 << 16  # Characters read from a data file at a time.
+DATA_STREAM_BATCH_ROWS = 1000  # Rows parsed before they are indexed or inserted in a table.
 
 # -------------------------------
 # Database Table Names
@@ -16,6 +40,12 @@ DECKS_TABLE_NAME = "decks"
 HEROES_TABLE_NAME = "heroes"
 SPELLS_TABLE_NAME = "spells"
 UNITS_TABLE_NAME = "units"
+MANIFEST_TABLE_NAME = "manifest"  # Signatures of the data files the tables were seeded from.
+
+# Names of the tables where the heroes and cards built during the game are saved.
+SAVED_HEROES_TABLE_NAME = "Heroes"
+SAVED_SPELLS_TABLE_NAME = "Spells"
+SAVED_UNITS_TABLE_NAME = "Units"
 
 # -------------------------------
 # Default Hero Stats
@@ -50,3 +80,51 @@ CARD_MAXIMUM_ARMOR = None  # No predefined armor limit for cards.
 # These values impose restrictions on the number of cards in hand and on the board.
 HAND_LIMIT = 10  # Maximum number of cards a player can hold in their hand.
 BOARD_LIMIT = 5  # Maximum number of cards a player can place on the board.
+
+# -------------------------------
+# Hero Power
+# -------------------------------
+# The hero power costs mana and grants the hero extra attack until their next attack.
+HERO_POWER_COST = 4  # Mana required to use the hero power.
+HERO_POWER_ATTACK = 2  # Attack gained by the hero when using the hero power.
+
+# -------------------------------
+# Simulation
+# -------------------------------
+# Limits applied to games played between bots.
+SIMULATION_TURN_LIMIT = 200  # Number of turns after which a simulated game is a draw.
+
+# -------------------------------
+# Monte Carlo Tree Search
+# -------------------------------
+# Search budget and parameters of the MCTS bot.
+MCTS_TIME_LIMIT = 0.2  # Seconds spent searching for each decision.
+MCTS_EXPLORATION = 1.4  # Exploration constant of the UCB1 formula.
+MCTS_ROLLOUT_TURNS = 6  # Turns played randomly before a rollout is evaluated.
+MCTS_WORKERS = 1  # Processes searching each decision in parallel (1 searches in the current process).
+AI_PLAYER_NAME = "AI"  # Name of the player controlled by the bot in the PVAI mode.
+
+# -------------------------------
+# Transposition Table
+# -------------------------------
+# Size of the table shared by the positions of a search.
+TRANSPOSITION_TABLE_SIZE = 1 << 16  # Number of slots of a transposition table.
+
+# -------------------------------
+# Trade Optimizer
+# -------------------------------
+# Weight of the damage dealt to the opponent's hero against the value of the units traded.
+TRADE_FACE_WEIGHT = 1.0  # Value of one point of damage dealt to the opponent's hero.
+
+# -------------------------------
+# Replays
+# -------------------------------
+# Spacing of the full-state checkpoints of a replay log.
+REPLAY_CHECKPOINT_TURNS = 4  # Turns between two checkpoints (seeking replays at most this many turns).
+
+# -------------------------------
+# Match History
+# -------------------------------
+# Compaction of the log of finished games into indexed segments.
+MATCH_HISTORY_COMPACT_MATCHES = 10000  # Matches appended to the active log before it is compacted into a segment.
+MATCH_HISTORY_SEGMENT_LIMIT = 8  # Segments of similar size merged into one (at least 2).
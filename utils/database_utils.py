@@ -5,10 +5,18 @@ import os
 from typing import Any
 from tinydb import TinyDB
 
+# Utils Imports
+from utils.constants import DATABASE_BACKEND, DATABASE_PATH, SQLITE_DATABASE_PATH, DATABASE_WRITE_BATCH, DATABASE_FLUSH_INTERVAL, DATA_STREAM_BATCH_ROWS
+from utils.storage_utils import AtomicJSONStorage, BatchingMiddleware
+from utils.sqlite_utils import SQLiteDatabase
+from utils.json_stream_utils import ClassDocumentReader
+
 # Class
 class Database:
     """
     A generic utility class for managing database initialization and interactions with TinyDB.
+
+    The table helpers also accept a `SQLiteDatabase`, which offers the same table methods with indexed rows.
     """
 
     @staticmethod
@@ -24,12 +32,13 @@ class Database:
             os.makedirs(directory, exist_ok=True)  # Creates the directory if it doesn't exist
 
     @staticmethod
-    def initialize_database(file_path: str) -> TinyDB:
+    def initialize_database(file_path: str, storage: Any = None) -> TinyDB:
         """
         Ensures the database file exists and returns a TinyDB instance.
 
         Args:
             file_path (str): Path to the TinyDB JSON file.
+            storage (Any, optional): TinyDB storage class or middleware to use. Defaults to TinyDB's JSON storage.
 
         Returns:
             TinyDB: An instance of the TinyDB database.
@@ -40,8 +49,73 @@ class Database:
             with open(file_path, 'w') as db_file:  # Creates an empty file if it doesn't exist
                 db_file.write('{}')  # Initializes the file with an empty dictionary
 
+        if storage is not None:
+            return TinyDB(file_path, storage=storage)  # Returns a TinyDB instance using the provided storage
         return TinyDB(file_path)  # Returns a TinyDB instance for the provided file path
 
+    @staticmethod
+    def initialize_cached_database(file_path: str, write_batch: int = DATABASE_WRITE_BATCH, flush_interval: float | None = DATABASE_FLUSH_INTERVAL) -> TinyDB:
+        """
+        Returns a TinyDB instance reading from memory and writing its changes in batches, with atomic file replacement.
+        Pending changes are written when `write_batch` or `flush_interval` is reached, by `flush()` and when the database is closed.
+
+        Args:
+            file_path (str): Path to the TinyDB JSON file.
+            write_batch (int): The number of writes kept in memory before they are flushed. Defaults to `DATABASE_WRITE_BATCH`.
+            flush_interval (float | None): The age in seconds of the oldest pending write that triggers a flush. Defaults to `DATABASE_FLUSH_INTERVAL`.
+
+        Returns:
+            TinyDB: An instance of the TinyDB database.
+        """
+        return Database.initialize_database(file_path, storage=BatchingMiddleware(AtomicJSONStorage, write_batch, flush_interval))
+
+    @staticmethod
+    def initialize_sqlite_database(file_path: str) -> SQLiteDatabase:
+        """
+        Ensures the directory of the database exists and opens a SQLite database in WAL mode.
+
+        Args:
+            file_path (str): Path to the SQLite file.
+
+        Returns:
+            SQLiteDatabase: An instance of the SQLite database.
+        """
+        Database.ensure_directory_exists(file_path)
+        return SQLiteDatabase(file_path)
+
+    @staticmethod
+    def open_database(backend: str = DATABASE_BACKEND) -> TinyDB | SQLiteDatabase:
+        """
+        Opens the game database with the configured backend.
+
+        Args:
+            backend (str): "tinydb" for a cached TinyDB file at `DATABASE_PATH`, or "sqlite" for a SQLite file at `SQLITE_DATABASE_PATH`.
+                Defaults to `DATABASE_BACKEND`.
+
+        Returns:
+            TinyDB | SQLiteDatabase: An instance of the database.
+
+        Raises:
+            ValueError: If the backend is unknown.
+        """
+        if backend == "tinydb":
+            return Database.initialize_cached_database(DATABASE_PATH)
+        if backend == "sqlite":
+            return Database.initialize_sqlite_database(SQLITE_DATABASE_PATH)
+        raise ValueError(f"Invalid database backend: {backend}. Must be 'tinydb' or 'sqlite'.")
+
+    @staticmethod
+    def flush(db: TinyDB | SQLiteDatabase) -> None:
+        """
+        Writes the pending changes of a database to its file. Does nothing for a database without a write cache.
+
+        Args:
+            db (TinyDB | SQLiteDatabase): An instance of the database.
+        """
+        flush = getattr(getattr(db, "storage", None), "flush", None)  # Only caching middlewares keep changes in memory
+        if flush is not None:
+            flush()
+
     @staticmethod
     def initialize_table(db: TinyDB, table_name: str) -> Any:
         """
@@ -74,9 +148,36 @@ class Database:
             raise ValueError("Data must be a list of dictionaries.")  # Raise error if the validation fails
 
         table = db.table(table_name)  # Retrieve the table with the provided name
-        table.insert_multiple(data)  # Insert multiple records into the table
+        table.insert_multiple(data)  # Insert multiple records into the table (kept in memory by a cached database until it is flushed)
 
-        # db.storage.flush()  # Optionally, you can call flush to save changes to the storage immediately (commented out)
+    @staticmethod
+    def insert_file_to_table(db: TinyDB | SQLiteDatabase, table_name: str, file_path: str, batch_rows: int = DATA_STREAM_BATCH_ROWS) -> int:
+        """
+        Inserts the documents of a data file grouping rows by class into a table, reading the file incrementally.
+        Documents are inserted by batches of about `batch_rows` rows, so the whole file is never parsed at once.
+
+        Args:
+            db (TinyDB | SQLiteDatabase): The database.
+            table_name (str): The name of the table where data will be inserted.
+            file_path (str): Path to the data file.
+            batch_rows (int): The number of rows inserted at a time. Defaults to `DATA_STREAM_BATCH_ROWS`.
+
+        Returns:
+            int: The number of rows inserted.
+
+        Raises:
+            ValueError: If the file does not group rows by class.
+        """
+        batch, batch_size, inserted = [], 0, 0
+        for document in ClassDocumentReader(file_path, batch_rows):
+            batch.append(document)
+            batch_size += sum(len(rows) for rows in document.values())
+            if batch_size >= batch_rows:
+                Database.insert_data_to_table(db, table_name, batch)
+                batch, inserted, batch_size = [], inserted + batch_size, 0
+        if batch:
+            Database.insert_data_to_table(db, table_name, batch)
+        return inserted + batch_size
 
     @staticmethod
     def fetch_all_from_table(db: TinyDB, table_name: str) -> list:
@@ -93,6 +194,35 @@ class Database:
         table = db.table(table_name)  # Retrieve the table
         return table.all()  # Return all records from the table
 
+    @staticmethod
+    def search_cards(db: TinyDB | SQLiteDatabase, table_name: str, card_class: str = None, cost: int = None, race: str = None) -> list[tuple[str, dict]]:
+        """
+        Finds the rows of a table grouping rows by class (heroes, units, spells) by class, cost or race.
+        A SQLite database uses its indexes, a TinyDB database is scanned.
+
+        Args:
+            db (TinyDB | SQLiteDatabase): An instance of the database.
+            table_name (str): The name of the table to search.
+            card_class (str, optional): The class of the rows (e.g. "MAGE"). Defaults to any class.
+            cost (int, optional): The cost of the rows. Defaults to any cost.
+            race (str, optional): The race of the rows (e.g. "Beast"). Defaults to any race.
+
+        Returns:
+            list[tuple[str, dict]]: The class and content of each matching row, in table order.
+        """
+        if isinstance(db, SQLiteDatabase):
+            return db.table(table_name).search_entries(card_class, cost, race)
+
+        found = []
+        for document in Database.fetch_all_from_table(db, table_name):
+            for row_class, rows in document.items():
+                if card_class is not None and row_class.upper() != card_class.upper():
+                    continue
+                found.extend((row_class.upper(), row) for row in rows
+                             if (cost is None or row.get("cost") == cost)
+                             and (race is None or str(row.get("race", "")).upper() == race.upper()))
+        return found
+
     @staticmethod
     def clear_table(db: TinyDB, table_name: str) -> None:
         """
@@ -108,10 +238,11 @@ class Database:
     @staticmethod
     def delete_database(file_path: str) -> None:
         """
-        Deletes the database file.
+        Deletes the database file, and the WAL files of a SQLite database.
 
         Args:
-            file_path (str): The path to the TinyDB JSON file to delete.
+            file_path (str): The path to the TinyDB JSON file or SQLite file to delete.
         """
-        if os.path.exists(file_path):  # Check if the file exists
-            os.remove(file_path)  # Delete the file
+        for path in (file_path, file_path + "-wal", file_path + "-shm"):
+            if os.path.exists(path):  # Check if the file exists
+                os.remove(path)  # Delete the file
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+
+# Imports
+from typing import Callable
+
+# Functions
+def restore_fields(target: object, fields: tuple[str, ...], values: list) -> None:
+    """
+    Sets attributes of an object back to saved values.
+
+    Args:
+        target (object): The object to restore.
+        fields (tuple[str, ...]): The names of the attributes.
+        values (list): The saved values, in the same order.
+    """
+    for field, value in zip(fields, values):
+        setattr(target, field, value)
+
+# Class
+class Journal:
+    """
+    Delta journal of a game: every mutating operation records how to revert itself, so that the game
+    can be taken back to any earlier mark in time proportional to what changed since, not to its size.
+
+    Entries are undone in the reverse order of their recording, which lets each one assume that
+    everything recorded after it was already reverted (e.g. that a moved card is the last of its new zone).
+    """
+    __slots__ = ("entries",)
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty journal.
+        """
+        self.entries: list[tuple[Callable, tuple]] = []
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of entries, to be used as a mark for `undo`.
+        """
+        return len(self.entries)
+
+    def record(self, undo: Callable, *args: object) -> None:
+        """
+        Records how to revert an operation.
+
+        Args:
+            undo (Callable): The function reverting the operation.
+            *args (object): The arguments of `undo`.
+        """
+        self.entries.append((undo, args))
+
+    def save(self, target: object, *fields: str) -> None:
+        """
+        Records the current values of attributes of an object, before they change.
+
+        Args:
+            target (object): The object about to change.
+            *fields (str): The names of the attributes about to change.
+        """
+        self.entries.append((restore_fields, (target, fields, [getattr(target, field) for field in fields])))
+
+    def undo(self, mark: int = 0) -> None:
+        """
+        Reverts every operation recorded after a mark, newest first.
+
+        Args:
+            mark (int): The length of the journal to go back to. Defaults to 0, for everything.
+        """
+        entries = self.entries
+        while len(entries) > mark:
+            undo, args = entries.pop()
+            undo(*args)
@@ -0,0 +1,192 @@
+#!/usr/bin/python3
+
+# Imports
+import json
+import re
+from typing import Iterator
+
+# Utils Imports
+from utils.constants import DATA_STREAM_CHUNK_SIZE, DATA_STREAM_BATCH_ROWS
+
+# Constants
+WHITESPACE = re.compile(r"[ \t\n\r]*")  # Whitespace allowed between JSON tokens
+
+# Class
+class ClassDocumentReader:
+    """
+    Incremental reader of a data file grouping rows by class, as the heroes, units and spells files do:
+    a list of documents such as `[{"MAGE": [{...}, ...], ...}, ...]`.
+
+    The file is read in chunks and each row is decoded as soon as it is complete, so memory is bounded
+    by one chunk and one batch of rows, whatever the size of the file. Documents holding more rows than
+    a batch are split into consecutive documents of the same classes, which the catalog and the tables read the same way.
+
+    Attributes:
+        file_path (str): Path to the data file.
+        batch_rows (int): The maximum number of rows of a yielded document.
+        chunk_size (int): The number of characters read at a time.
+    """
+
+    def __init__(self, file_path: str, batch_rows: int = DATA_STREAM_BATCH_ROWS, chunk_size: int = DATA_STREAM_CHUNK_SIZE) -> None:
+        """
+        Initializes the reader. The file is opened when the documents are iterated.
+
+        Args:
+            file_path (str): Path to the data file.
+            batch_rows (int): The maximum number of rows of a yielded document. Defaults to `DATA_STREAM_BATCH_ROWS`.
+            chunk_size (int): The number of characters read at a time. Defaults to `DATA_STREAM_CHUNK_SIZE`.
+
+        Raises:
+            ValueError: If the batch or chunk size is not positive.
+        """
+        if batch_rows < 1 or chunk_size < 1:
+            raise ValueError(f"Invalid batch of {batch_rows} rows or chunk of {chunk_size} characters. Both must be positive.")
+        self.file_path = file_path
+        self.batch_rows = batch_rows
+        self.chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._file = None
+        self._text = ""  # Characters read but not consumed yet, from `_position`
+        self._position = 0
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Reads the documents of the file.
+
+        Yields:
+            dict: A document mapping class names to at most `batch_rows` rows in total.
+
+        Raises:
+            ValueError: If the file is not a list of documents mapping class names to lists of rows.
+        """
+        with open(self.file_path, "r") as file:
+            self._file, self._text, self._position = file, "", 0
+            self._expect("[")
+            if self._peek() == "]":
+                self._position += 1
+            else:
+                while True:
+                    yield from self._read_document()
+                    if self._expect(",]") == "]":
+                        break
+            if self._peek():
+                self._fail("Unexpected data after the list of documents")
+            self._file = None
+
+    def _read_document(self) -> Iterator[dict]:
+        """
+        Reads one document, split into several when it holds more than `batch_rows` rows.
+
+        Yields:
+            dict: The parts of the document.
+        """
+        self._expect("{")
+        document, rows = {}, 0
+        if self._peek() == "}":
+            self._position += 1
+            yield document
+            return
+        while True:
+            class_name = self._decode('"')
+            if rows == self.batch_rows:  # Start the class in a new document
+                yield document
+                document, rows = {}, 0
+            self._expect(":")
+            self._expect("[")
+            class_rows = document.setdefault(class_name, [])
+            if self._peek() == "]":
+                self._position += 1
+            else:
+                while True:
+                    if rows == self.batch_rows:  # Yield the batch and continue the class in a new document
+                        yield document
+                        class_rows = []
+                        document, rows = {class_name: class_rows}, 0
+                    class_rows.append(self._decode("{"))
+                    rows += 1
+                    if self._expect(",]") == "]":
+                        break
+            if self._expect(",}") == "}":
+                break
+        yield document
+
+    def _fill(self) -> bool:
+        """
+        Reads the next chunk of the file, dropping the consumed characters.
+
+        Returns:
+            bool: False if the end of the file was reached.
+        """
+        chunk = self._file.read(self.chunk_size)
+        self._text = self._text[self._position:] + chunk
+        self._position = 0
+        return bool(chunk)
+
+    def _peek(self) -> str:
+        """
+        Skips whitespace and returns the next character without consuming it.
+
+        Returns:
+            str: The next character, or an empty string at the end of the file.
+        """
+        while True:
+            self._position = WHITESPACE.match(self._text, self._position).end()
+            if self._position < len(self._text):
+                return self._text[self._position]
+            if not self._fill():
+                return ""
+
+    def _expect(self, characters: str) -> str:
+        """
+        Consumes the next character, which must be one of the expected characters.
+
+        Args:
+            characters (str): The expected characters.
+
+        Returns:
+            str: The consumed character.
+
+        Raises:
+            ValueError: If the next character is not expected.
+        """
+        character = self._peek()
+        if not character or character not in characters:
+            self._fail(f"Expected one of {characters!r}, found {character or 'the end of the file'!r}")
+        self._position += 1
+        return character
+
+    def _decode(self, start: str) -> str | dict:
+        """
+        Decodes the next string or object, reading more of the file while it is incomplete.
+        Strings and objects end with a closing character, so a value cut by the end of a chunk always fails to decode.
+
+        Args:
+            start (str): The first character of the value, '"' for a string or '{' for an object.
+
+        Returns:
+            str | dict: The decoded value.
+
+        Raises:
+            ValueError: If the value is not a valid string or object.
+        """
+        if self._peek() != start:
+            self._fail("Expected a class name" if start == '"' else "Expected a row")
+        while True:
+            try:
+                value, self._position = self._decoder.raw_decode(self._text, self._position)
+                return value
+            except json.JSONDecodeError as error:
+                if not self._fill():
+                    self._fail(error.msg)
+
+    def _fail(self, reason: str) -> None:
+        """
+        Raises the error of an invalid data file.
+
+        Args:
+            reason (str): What is wrong with the file.
+
+        Raises:
+            ValueError: Always.
+        """
+        raise ValueError(f"Invalid data file: {self.file_path}. {reason}.")
@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+
+# Imports
+import hashlib
+import os
+from tinydb import TinyDB, Query
+
+# Utils Imports
+from utils.constants import MANIFEST_TABLE_NAME
+
+# Class
+class DatabaseManifest:
+    """
+    Keeps track of the data file each table was seeded from, so that unchanged tables are not rebuilt.
+
+    For every table, the manifest stores the modification time, size and SHA-256 hash of its source file.
+    The modification time and size are compared first, so an untouched file is never read.
+
+    Attributes:
+        db (TinyDB): The database holding the manifest table.
+        table_name (str): The name of the manifest table.
+    """
+
+    def __init__(self, db: TinyDB, table_name: str = MANIFEST_TABLE_NAME) -> None:
+        """
+        Initializes the manifest.
+
+        Args:
+            db (TinyDB): The database holding the manifest table.
+            table_name (str): The name of the manifest table. Defaults to `MANIFEST_TABLE_NAME`.
+        """
+        self.db = db
+        self.table_name = table_name
+
+    @staticmethod
+    def file_hash(file_path: str) -> str:
+        """
+        Computes the SHA-256 hash of a file.
+
+        Args:
+            file_path (str): Path to the file.
+
+        Returns:
+            str: The hexadecimal digest of the file's content.
+        """
+        with open(file_path, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+
+    def get_entry(self, table_name: str) -> dict | None:
+        """
+        Returns the manifest entry of a table.
+
+        Args:
+            table_name (str): The name of the seeded table.
+
+        Returns:
+            dict | None: The stored signature of the table's source file, or None if the table was never seeded.
+        """
+        return self.db.table(self.table_name).get(Query().table == table_name)
+
+    def is_up_to_date(self, table_name: str, table_path: str) -> bool:
+        """
+        Checks if a table was seeded from the current content of a data file.
+
+        Args:
+            table_name (str): The name of the seeded table.
+            table_path (str): Path to the table's source file.
+
+        Returns:
+            bool: True if the file did not change since the table was seeded.
+        """
+        entry = self.get_entry(table_name)
+        if entry is None or entry["source"] != table_path:
+            return False
+
+        stat = os.stat(table_path)
+        if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return True  # Untouched file, no need to read it
+        if entry["sha256"] != self.file_hash(table_path):  # The file was touched, compare its content
+            return False
+        # Same content: store the new modification time and size so that the next check does not read the file
+        self.db.table(self.table_name).upsert({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}, Query().table == table_name)
+        return True
+
+    def record(self, table_name: str, table_path: str) -> None:
+        """
+        Stores the signature of the file a table has just been seeded from.
+
+        Args:
+            table_name (str): The name of the seeded table.
+            table_path (str): Path to the table's source file.
+        """
+        stat = os.stat(table_path)
+        self.db.table(self.table_name).upsert({
+            "table": table_name,
+            "source": table_path,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": self.file_hash(table_path)
+        }, Query().table == table_name)
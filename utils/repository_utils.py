@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+
+# Imports
+from tinydb import TinyDB
+from tinydb.middlewares import CachingMiddleware
+
+# Utils Imports
+from utils.constants import DATABASE_BACKEND
+from utils.database_utils import Database
+from utils.sqlite_utils import SQLiteDatabase
+from utils.storage_utils import AtomicJSONStorage
+
+# Class
+class CardRepository:
+    """
+    Unit of work collecting heroes and cards to save, and writing them all with a single database access.
+
+    Objects are only converted to dictionaries when added, so building cards in memory never touches the disk.
+    Any object exposing a `table_name` attribute and a `to_dict()` method (Unit, Spell, Hero) can be added.
+
+    The records are written to an open database when one is given, such as the game's, so that they go through
+    the same cache as its other writes. Otherwise the database is opened for each flush, from a TinyDB JSON file
+    or with the configured backend.
+
+    Attributes:
+        file_path (str | None): Path to a TinyDB JSON file, or None for the database of the configured backend.
+        db (TinyDB | SQLiteDatabase | None): The open database to write to, or None to open one for each flush.
+        backend (str): The backend opened when neither a file nor a database is given.
+        pending (dict[str, list[dict]]): The records waiting to be written, by table name.
+    """
+
+    def __init__(self, file_path: str = None, db: TinyDB | SQLiteDatabase = None, backend: str = DATABASE_BACKEND) -> None:
+        """
+        Initializes an empty repository.
+
+        Args:
+            file_path (str, optional): Path to a TinyDB JSON file. Defaults to None, for the database of the configured backend.
+            db (TinyDB | SQLiteDatabase, optional): An open database to write to, which the repository never closes. Defaults to None.
+            backend (str): The backend opened by `Database.open_database` when neither a file nor a database is given.
+                Defaults to `DATABASE_BACKEND`.
+        """
+        self.file_path = file_path
+        self.db = db
+        self.backend = backend
+        self.pending: dict[str, list[dict]] = {}
+
+    def add(self, item: object) -> None:
+        """
+        Registers an object to be saved on the next flush.
+
+        Args:
+            item (object): The hero or card to save.
+
+        Raises:
+            TypeError: If the object cannot be saved in a table.
+        """
+        if not hasattr(item, "table_name") or not hasattr(item, "to_dict"):
+            raise TypeError(f"Expected a savable object, got {type(item).__name__}")
+        self.pending.setdefault(item.table_name, []).append(item.to_dict())
+
+    def add_all(self, items: list) -> None:
+        """
+        Registers several objects to be saved on the next flush.
+
+        Args:
+            items (list): The heroes or cards to save.
+        """
+        for item in items:
+            self.add(item)
+
+    def flush(self) -> int:
+        """
+        Writes all pending records to the database, opening and writing the file only once.
+
+        Returns:
+            int: The number of records written.
+        """
+        count = len(self)
+        if not count:
+            return 0
+
+        if self.db is not None:  # Write through the open database and its cache
+            for table_name, records in self.pending.items():
+                Database.insert_data_to_table(self.db, table_name, records)
+            Database.flush(self.db)
+        else:
+            if self.file_path is not None:
+                # The caching middleware keeps every insertion in memory until the database is closed, which replaces the file at once
+                db = Database.initialize_database(self.file_path, storage=CachingMiddleware(AtomicJSONStorage))
+            else:
+                db = Database.open_database(self.backend)  # Cached until closed as well, or a single transaction per table
+            try:
+                for table_name, records in self.pending.items():
+                    Database.insert_data_to_table(db, table_name, records)
+            finally:
+                db.close()
+        self.pending.clear()
+        return count
+
+    def rollback(self) -> None:
+        """
+        Discards all pending records.
+        """
+        self.pending.clear()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of pending records.
+
+        Returns:
+            int: The number of records waiting to be written.
+        """
+        return sum(len(records) for records in self.pending.values())
+
+    def __enter__(self) -> "CardRepository":
+        """
+        Starts a unit of work.
+
+        Returns:
+            CardRepository: The repository itself.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Ends the unit of work: flushes the pending records, or discards them if an error occurred.
+        """
+        if exc_type is None:
+            self.flush()
+        else:
+            self.rollback()
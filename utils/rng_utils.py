@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+
+# Imports
+import hashlib
+import random
+
+# Functions
+def derive_seed(seed: int | str, *name: object) -> int:
+    """
+    Derives an independent 64-bit seed from a master seed and the name of a stream.
+    Seeds are derived from their inputs only, so they are the same in every process and every run.
+
+    Args:
+        seed (int | str): The master seed.
+        *name (object): The values naming the stream, e.g. `("shuffle", 1)`.
+
+    Returns:
+        int: The seed of the stream.
+    """
+    digest = hashlib.blake2b(repr((seed,) + name).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+def copy_stream(stream: random.Random) -> random.Random:
+    """
+    Returns an independent generator in the same state as a stream, drawing the same values from now on.
+
+    Args:
+        stream (random.Random): The stream to copy.
+
+    Returns:
+        random.Random: The copy.
+    """
+    copy = random.Random.__new__(random.Random)  # Skips the seeding of __init__, replaced by the state
+    copy.setstate(stream.getstate())
+    return copy
+
+# Class
+class GameRandom:
+    """
+    Random streams of one game, all derived from a single master seed.
+
+    Each part of the game draws from its own named stream (who starts, the shuffle of each
+    player's deck, each bot), so the draws of one part never shift those of another and a game
+    is replayed bit-for-bit from its seed alone, whatever the process playing it.
+
+    Attributes:
+        seed (int | str): The master seed of the game.
+    """
+    __slots__ = ("seed", "_streams")
+
+    def __init__(self, seed: int | str = None) -> None:
+        """
+        Initializes the streams of a game.
+
+        Args:
+            seed (int | str, optional): The master seed. Defaults to None, for a random 64-bit seed that is kept in `seed`.
+        """
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        self._streams: dict[tuple, random.Random] = {}
+
+    def stream(self, *name: object) -> random.Random:
+        """
+        Returns a named stream, created on first use.
+
+        Args:
+            *name (object): The values naming the stream, e.g. `("shuffle", 1)`.
+
+        Returns:
+            random.Random: The generator of the stream.
+        """
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = random.Random(derive_seed(self.seed, *name))
+        return stream
+
+    def child(self, *name: object) -> "GameRandom":
+        """
+        Returns the streams of a sub-part, such as one game of a simulation, with their own master seed.
+
+        Args:
+            *name (object): The values naming the sub-part, e.g. `("game", 12)`.
+
+        Returns:
+            GameRandom: The streams of the sub-part.
+        """
+        return GameRandom(derive_seed(self.seed, *name))
+
+    def clone(self) -> "GameRandom":
+        """
+        Returns independent copies of the streams, in their current states, as `copy.deepcopy` would.
+        Drawing from a copy does not change the values the original streams draw next.
+
+        Returns:
+            GameRandom: The copied streams.
+        """
+        clone = GameRandom.__new__(GameRandom)  # Skips the drawing of a seed
+        clone.seed = self.seed
+        clone._streams = {name: copy_stream(stream) for name, stream in self._streams.items()}
+        return clone
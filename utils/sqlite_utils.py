@@ -0,0 +1,287 @@
+#!/usr/bin/python3
+
+# Imports
+import json
+import sqlite3
+from typing import Callable, Mapping
+from tinydb.table import Document
+
+# Constants
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    table_name TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (table_name, doc_id)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    table_name TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    card_class TEXT NOT NULL,
+    name TEXT,
+    cost INTEGER,
+    race TEXT,
+    body TEXT NOT NULL,
+    FOREIGN KEY (table_name, doc_id) REFERENCES documents (table_name, doc_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS entries_by_class ON entries (table_name, card_class);
+CREATE INDEX IF NOT EXISTS entries_by_cost ON entries (table_name, cost);
+CREATE INDEX IF NOT EXISTS entries_by_race ON entries (table_name, race);
+CREATE INDEX IF NOT EXISTS entries_by_document ON entries (table_name, doc_id);
+"""
+
+# Functions
+def class_entries(document: Mapping) -> list[tuple[str, int, dict]]:
+    """
+    Returns the rows of a document grouping rows by class, as the heroes, units and spells tables do (e.g. {"MAGE": [...]}).
+
+    Args:
+        document (Mapping): A document of a table.
+
+    Returns:
+        list[tuple[str, int, dict]]: The class, position and content of each row, or an empty list if the document does not group rows by class.
+    """
+    entries = []
+    for card_class, rows in document.items():
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            return []  # Not a document of rows grouped by class
+        entries.extend((card_class.upper(), position, row) for position, row in enumerate(rows))
+    return entries
+
+# Class
+class SQLiteTable:
+    """
+    A table of a `SQLiteDatabase`, with the methods of TinyDB tables used by the `Database` helper and the manifest.
+
+    Documents are stored as JSON with their id. The rows of documents grouping rows by class are also stored
+    in an indexed table, so that `search_entries` finds them by class, cost or race without reading the whole table.
+
+    Attributes:
+        db (SQLiteDatabase): The database holding the table.
+        name (str): The name of the table.
+    """
+
+    def __init__(self, db: "SQLiteDatabase", name: str) -> None:
+        """
+        Initializes the table.
+
+        Args:
+            db (SQLiteDatabase): The database holding the table.
+            name (str): The name of the table.
+        """
+        self.db = db
+        self.name = name
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of documents in the table.
+        """
+        return self.db.connection.execute("SELECT COUNT(*) FROM documents WHERE table_name = ?", (self.name,)).fetchone()[0]
+
+    def all(self) -> list[Document]:
+        """
+        Returns all documents of the table, in insertion order.
+
+        Returns:
+            list[Document]: The documents, with their ids.
+        """
+        rows = self.db.connection.execute("SELECT doc_id, body FROM documents WHERE table_name = ? ORDER BY doc_id", (self.name,))
+        return [Document(json.loads(body), doc_id) for doc_id, body in rows]
+
+    def insert(self, document: Mapping) -> int:
+        """
+        Inserts a document.
+
+        Args:
+            document (Mapping): The document.
+
+        Returns:
+            int: The id of the document.
+        """
+        return self.insert_multiple([document])[0]
+
+    def insert_multiple(self, documents: list[Mapping]) -> list[int]:
+        """
+        Inserts several documents in a single transaction. The transaction takes the write lock before the last id
+        is read, so that another connection inserting at the same time waits instead of reusing the same ids.
+
+        Args:
+            documents (list[Mapping]): The documents.
+
+        Returns:
+            list[int]: The ids of the documents.
+        """
+        connection = self.db.connection
+        with connection:
+            if not connection.in_transaction:
+                connection.execute("BEGIN IMMEDIATE")  # Lock the database before reading the last id
+            last = connection.execute("SELECT MAX(doc_id) FROM documents WHERE table_name = ?", (self.name,)).fetchone()[0] or 0
+            doc_ids = list(range(last + 1, last + 1 + len(documents)))
+            for doc_id, document in zip(doc_ids, documents):
+                self._write(doc_id, document)
+        return doc_ids
+
+    def _write(self, doc_id: int, document: Mapping) -> None:
+        """
+        Writes a document and its indexed rows, replacing the document of the same id. Must run in a transaction.
+
+        Args:
+            doc_id (int): The id of the document.
+            document (Mapping): The document.
+        """
+        connection = self.db.connection
+        connection.execute("DELETE FROM entries WHERE table_name = ? AND doc_id = ?", (self.name, doc_id))
+        connection.execute("INSERT OR REPLACE INTO documents VALUES (?, ?, ?)", (self.name, doc_id, json.dumps(document)))
+        connection.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (
+            (self.name, doc_id, position, card_class, row.get("name"), row.get("cost"),
+             row["race"].upper() if isinstance(row.get("race"), str) else None, json.dumps(row))
+            for card_class, position, row in class_entries(document)
+        ))
+
+    def search(self, cond: Callable[[Mapping], bool]) -> list[Document]:
+        """
+        Returns the documents matching a condition, such as a TinyDB query. The whole table is read.
+
+        Args:
+            cond (Callable[[Mapping], bool]): The condition.
+
+        Returns:
+            list[Document]: The matching documents.
+        """
+        return [document for document in self.all() if cond(document)]
+
+    def get(self, cond: Callable[[Mapping], bool]) -> Document | None:
+        """
+        Returns the first document matching a condition.
+
+        Args:
+            cond (Callable[[Mapping], bool]): The condition.
+
+        Returns:
+            Document | None: The document, or None if no document matches.
+        """
+        return next(iter(self.search(cond)), None)
+
+    def upsert(self, document: Mapping, cond: Callable[[Mapping], bool]) -> list[int]:
+        """
+        Replaces the documents matching a condition by a document, or inserts it if none matches.
+        As with TinyDB, the fields of the matching documents that the new document lacks are kept.
+
+        Args:
+            document (Mapping): The document.
+            cond (Callable[[Mapping], bool]): The condition.
+
+        Returns:
+            list[int]: The ids of the updated or inserted documents.
+        """
+        matches = self.search(cond)
+        if not matches:
+            return self.insert_multiple([document])
+        with self.db.connection:
+            for match in matches:
+                self._write(match.doc_id, {**match, **document})
+        return [match.doc_id for match in matches]
+
+    def remove(self, cond: Callable[[Mapping], bool]) -> list[int]:
+        """
+        Removes the documents matching a condition, with their indexed rows.
+
+        Args:
+            cond (Callable[[Mapping], bool]): The condition.
+
+        Returns:
+            list[int]: The ids of the removed documents.
+        """
+        doc_ids = [document.doc_id for document in self.search(cond)]
+        with self.db.connection:
+            self.db.connection.executemany("DELETE FROM documents WHERE table_name = ? AND doc_id = ?",
+                                           ((self.name, doc_id) for doc_id in doc_ids))
+        return doc_ids
+
+    def truncate(self) -> None:
+        """
+        Removes all documents of the table.
+        """
+        with self.db.connection:
+            self.db.connection.execute("DELETE FROM entries WHERE table_name = ?", (self.name,))
+            self.db.connection.execute("DELETE FROM documents WHERE table_name = ?", (self.name,))
+
+    def search_entries(self, card_class: str = None, cost: int = None, race: str = None) -> list[tuple[str, dict]]:
+        """
+        Returns the rows of the class-grouped documents matching the given criteria, through the indexes.
+
+        Args:
+            card_class (str, optional): The class of the rows (e.g. "MAGE"). Defaults to any class.
+            cost (int, optional): The cost of the rows. Defaults to any cost.
+            race (str, optional): The race of the rows (e.g. "Beast"). Defaults to any race.
+
+        Returns:
+            list[tuple[str, dict]]: The class and content of each row, in table order.
+        """
+        query = "SELECT card_class, body FROM entries WHERE table_name = ?"
+        parameters = [self.name]
+        for column, value in (("card_class", card_class), ("cost", cost), ("race", race)):
+            if value is not None:
+                query += f" AND {column} = ?"
+                parameters.append(value.upper() if isinstance(value, str) else value)
+        query += " ORDER BY doc_id, card_class, position"
+        return [(found_class, json.loads(body)) for found_class, body in self.db.connection.execute(query, parameters)]
+
+class SQLiteDatabase:
+    """
+    SQLite database usable in place of a TinyDB instance by the `Database` helper, `Game.init_database` and the manifest.
+
+    The database is opened in WAL mode, so that readers in other processes are not blocked by a writer,
+    and every write is committed in its own transaction.
+
+    Attributes:
+        file_path (str): Path to the SQLite file.
+        connection (sqlite3.Connection): The connection to the database.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Opens the database, creating its file and schema if needed.
+
+        Args:
+            file_path (str): Path to the SQLite file.
+        """
+        self.file_path = file_path
+        self.connection = sqlite3.connect(file_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")  # Safe in WAL mode, and commits do not wait for the disk
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+
+    def table(self, name: str) -> SQLiteTable:
+        """
+        Returns a table of the database, which exists as soon as a document is inserted in it.
+
+        Args:
+            name (str): The name of the table.
+
+        Returns:
+            SQLiteTable: The table.
+        """
+        return SQLiteTable(self, name)
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database.
+        """
+        self.connection.close()
+
+    def __enter__(self) -> "SQLiteDatabase":
+        """
+        Returns:
+            SQLiteDatabase: The database itself.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Closes the database.
+        """
+        self.close()
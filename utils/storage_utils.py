@@ -0,0 +1,138 @@
+#!/usr/bin/python3
+
+# Imports
+import json
+import os
+import tempfile
+import time
+from typing import Any
+from tinydb.middlewares import CachingMiddleware
+from tinydb.storages import Storage
+
+# Utils Imports
+from utils.constants import DATABASE_WRITE_BATCH, DATABASE_FLUSH_INTERVAL
+
+# Class
+class AtomicJSONStorage(Storage):
+    """
+    TinyDB storage writing the whole database to a temporary file and then replacing the JSON file with it.
+
+    The replacement is atomic, so a crash in the middle of a write leaves the previous version of the file
+    intact instead of a truncated one, which `JSONStorage` could leave as it rewrites the file in place.
+
+    Attributes:
+        path (str): Path to the JSON file.
+        encoding (str | None): The encoding of the file.
+        kwargs (dict): The options given to `json.dumps` (e.g. `indent`).
+    """
+
+    def __init__(self, path: str, encoding: str = None, **kwargs: Any) -> None:
+        """
+        Initializes the storage, creating the file if it does not exist.
+
+        Args:
+            path (str): Path to the JSON file.
+            encoding (str, optional): The encoding of the file. Defaults to the platform's encoding.
+            **kwargs (Any): The options given to `json.dumps`.
+        """
+        super().__init__()
+        self.path = path
+        self.encoding = encoding
+        self.kwargs = kwargs
+        if not os.path.exists(path):
+            self.write({})
+
+    def read(self) -> dict | None:
+        """
+        Reads the database from the file.
+
+        Returns:
+            dict | None: The tables of the database, or None if the file is empty.
+        """
+        with open(self.path, "r", encoding=self.encoding) as file:
+            content = file.read()
+        return json.loads(content) if content else None
+
+    def write(self, data: dict) -> None:
+        """
+        Writes the database to a temporary file in the same directory, then moves it over the JSON file.
+
+        Args:
+            data (dict): The tables of the database.
+        """
+        serialized = json.dumps(data, **self.kwargs)
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w", encoding=self.encoding) as file:
+                file.write(serialized)
+                file.flush()
+                os.fsync(file.fileno())  # The data is on the disk before the file replaces the old one
+            os.replace(temporary_path, self.path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+class BatchingMiddleware(CachingMiddleware):
+    """
+    TinyDB middleware serving reads from memory and coalescing writes.
+
+    The database is read from the storage once and then kept in memory. Writes only update the memory
+    and are written to the storage together once `write_batch` of them are pending, or on the first write
+    made `flush_interval` seconds after the oldest pending one, or when `flush()` or `close()` is called.
+
+    Attributes:
+        write_batch (int): The number of pending writes that triggers a flush.
+        flush_interval (float | None): The age in seconds of the oldest pending write that triggers a flush (None for no limit).
+        pending_since (float | None): The time of the oldest pending write, or None if there is none.
+    """
+
+    def __init__(self, storage_cls: type = AtomicJSONStorage, write_batch: int = DATABASE_WRITE_BATCH, flush_interval: float | None = DATABASE_FLUSH_INTERVAL) -> None:
+        """
+        Initializes the middleware.
+
+        Args:
+            storage_cls (type): The TinyDB storage class holding the data. Defaults to `AtomicJSONStorage`.
+            write_batch (int): The number of pending writes that triggers a flush. Defaults to `DATABASE_WRITE_BATCH`.
+            flush_interval (float | None): The age of the oldest pending write that triggers a flush. Defaults to `DATABASE_FLUSH_INTERVAL`.
+
+        Raises:
+            ValueError: If `write_batch` is not positive.
+        """
+        if write_batch < 1:
+            raise ValueError(f"Invalid write batch: {write_batch}. Must be at least 1.")
+        super().__init__(storage_cls)
+        self.WRITE_CACHE_SIZE = write_batch  # Read by CachingMiddleware.write
+        self.write_batch = write_batch
+        self.flush_interval = flush_interval
+        self.pending_since = None
+
+    @property
+    def pending(self) -> int:
+        """
+        Getter for the number of writes not yet written to the storage.
+
+        Returns:
+            int: The number of pending writes.
+        """
+        return self._cache_modified_count
+
+    def write(self, data: dict) -> None:
+        """
+        Stores the database in memory, flushing it if the batch is full or the oldest pending write is too old.
+
+        Args:
+            data (dict): The tables of the database.
+        """
+        now = time.monotonic()
+        if self.pending_since is None:
+            self.pending_since = now
+        super().write(data)  # Flushes when the batch is full
+        if self.pending and self.flush_interval is not None and now - self.pending_since >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the pending changes to the storage.
+        """
+        super().flush()
+        self.pending_since = None
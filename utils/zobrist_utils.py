@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+
+# Imports
+import hashlib
+
+# Constants
+HASH_MASK = (1 << 64) - 1  # Zobrist hashes are 64-bit integers
+
+# Keys already derived, by feature
+_keys: dict[tuple, int] = {}
+
+# Functions
+def zobrist_key(*feature: object) -> int:
+    """
+    Returns the random 64-bit key of a feature of a game state, such as a card in a zone.
+    Keys are derived from the feature itself, so they are the same in every process and every run.
+
+    Args:
+        *feature (object): The values describing the feature, e.g. `(card id, CardStatus.IN_HAND)`.
+
+    Returns:
+        int: The key of the feature.
+    """
+    key = _keys.get(feature)
+    if key is None:
+        digest = hashlib.blake2b(repr(feature).encode("utf-8"), digest_size=8).digest()
+        key = _keys[feature] = int.from_bytes(digest, "little")
+    return key
+
+def rotate(value: int, bits: int) -> int:
+    """
+    Rotates a 64-bit hash to the left, to combine hashes built from the same keys without them cancelling out.
+
+    Args:
+        value (int): The hash to rotate.
+        bits (int): The number of bits to rotate by (0 to 63).
+
+    Returns:
+        int: The rotated hash.
+    """
+    return ((value << bits) | (value >> (64 - bits))) & HASH_MASK